@@ -0,0 +1,32 @@
+"""Cross-asset analysis.
+
+Engines that read aligned liquidity and market series and derive signals for
+dashboards and alerts: rolling correlation matrices and liquidity regimes,
+each updated online per point with a vectorized batch mode for history.
+"""
+
+from liquidity.analysis.correlation import (
+    DEFAULT_THRESHOLD,
+    DEFAULT_WINDOWS,
+    CorrelationShift,
+    RollingCorrelation,
+)
+from liquidity.analysis.regime import (
+    REGIME_INDEXES,
+    Regime,
+    RegimeClassifier,
+    regime_index_name,
+)
+
+__all__ = [
+    # Correlation
+    "RollingCorrelation",
+    "CorrelationShift",
+    "DEFAULT_WINDOWS",
+    "DEFAULT_THRESHOLD",
+    # Regime
+    "Regime",
+    "RegimeClassifier",
+    "REGIME_INDEXES",
+    "regime_index_name",
+]
@@ -0,0 +1,367 @@
+"""Online rolling correlation matrices across assets.
+
+Rolling 30/90-bar correlations (BTC vs Net Liquidity, SPX vs Global
+Liquidity, a heatmap across major assets) computed pairwise with
+``rolling().corr()`` cost O(pairs x window x n). This engine instead keeps,
+per window, running pairwise sums over the aligned wide frame:
+- count, sum, sum of squares and cross-product matrices (N x N each,
+  pairwise-complete so a NaN in one asset only drops that asset's pairs)
+- a ring buffer of the last ``window`` bars to retire the oldest one
+
+Each new bar updates every window's full N x N matrix with a few outer
+products, O(N^2) per bar independent of the window length. Sums are rebuilt
+from the ring buffer once per window length to stop floating-point drift,
+and values are shifted by a per-column reference to avoid cancellation.
+
+``batch`` computes the same matrices for a whole history at once from
+cumulative sums (vectorized, no loop over bars). Streaming updates raise a
+``CorrelationShift`` when a pair moves more than ``threshold`` away from its
+last reference value (the roadmap's ">0.3 change" correlation alert).
+"""
+
+import logging
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOWS = (30, 90)
+DEFAULT_THRESHOLD = 0.3
+
+# Relative variance below which a series counts as constant (correlation NaN)
+_VARIANCE_EPS = 1e-12
+
+
+@dataclass(frozen=True)
+class CorrelationShift:
+    """A pair's rolling correlation moved past the threshold.
+
+    Attributes:
+        timestamp: Bar that triggered the event.
+        window: Window length in bars.
+        left: First asset.
+        right: Second asset.
+        previous: Reference correlation before the move.
+        current: Correlation at ``timestamp`` (the new reference).
+    """
+
+    timestamp: pd.Timestamp
+    window: int
+    left: str
+    right: str
+    previous: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """Signed move from the reference."""
+        return self.current - self.previous
+
+
+CorrelationCallback = Callable[[list[CorrelationShift]], None]
+
+
+def _correlation(
+    count: np.ndarray,
+    sx: np.ndarray,
+    sxx: np.ndarray,
+    sxy: np.ndarray,
+    min_periods: int,
+) -> np.ndarray:
+    """Pearson correlation from pairwise sums (any leading dimensions).
+
+    ``sx[..., i, j]`` is the sum of asset i over bars where both i and j are
+    present; the transposes give asset j's sums.
+    """
+    sy = np.swapaxes(sx, -1, -2)
+    syy = np.swapaxes(sxx, -1, -2)
+    cov = count * sxy - sx * sy
+    var_x = count * sxx - sx * sx
+    var_y = count * syy - sy * sy
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = cov / np.sqrt(var_x * var_y)
+        flat = (var_x <= _VARIANCE_EPS * count * sxx) | (var_y <= _VARIANCE_EPS * count * syy)
+    corr[(count < min_periods) | flat] = np.nan
+    result: np.ndarray = np.clip(corr, -1.0, 1.0)
+    return result
+
+
+class _WindowState:
+    """Running pairwise sums over the last ``window`` bars."""
+
+    def __init__(self, window: int, n_columns: int) -> None:
+        self.window = window
+        self.buffer = np.full((window, n_columns), np.nan)
+        self.position = 0
+        self.filled = 0
+        self.since_rebuild = 0
+        shape = (n_columns, n_columns)
+        self.count = np.zeros(shape)
+        self.sx = np.zeros(shape)
+        self.sxx = np.zeros(shape)
+        self.sxy = np.zeros(shape)
+
+    def push(self, x: np.ndarray) -> None:
+        """Add a bar, retiring the oldest one once the window is full."""
+        if self.filled == self.window:
+            self._add(self.buffer[self.position], -1.0)
+        else:
+            self.filled += 1
+        self.buffer[self.position] = x
+        self._add(x, 1.0)
+        self.position = (self.position + 1) % self.window
+        self.since_rebuild += 1
+        if self.since_rebuild >= self.window:
+            self.rebuild()
+
+    def _add(self, x: np.ndarray, sign: float) -> None:
+        present = ~np.isnan(x)
+        m = present.astype("float64")
+        x0 = np.where(present, x, 0.0)
+        self.count += sign * np.outer(m, m)
+        self.sx += sign * np.outer(x0, m)
+        self.sxx += sign * np.outer(x0 * x0, m)
+        self.sxy += sign * np.outer(x0, x0)
+
+    def rebuild(self) -> None:
+        """Recompute the sums exactly from the buffered bars."""
+        rows = self.buffer if self.filled == self.window else self.buffer[: self.filled]
+        present = ~np.isnan(rows)
+        m = present.astype("float64")
+        x0 = np.where(present, rows, 0.0)
+        self.count = m.T @ m
+        self.sx = x0.T @ m
+        self.sxx = (x0 * x0).T @ m
+        self.sxy = x0.T @ x0
+        self.since_rebuild = 0
+
+
+class RollingCorrelation:
+    """Rolling N x N correlation matrices for several windows.
+
+    Example:
+        wide = align_asof(df, ["BTC", "SPX", "net_liquidity"], calendar_grid(start, end))
+        engine = RollingCorrelation(wide.columns, windows=(30, 90))
+        history = engine.batch(wide)  # long frame for the heatmap
+        engine.prime(wide)
+        engine.subscribe(alert)
+
+        shifts = engine.update(ts, {"BTC": 97_000.0, "SPX": 6_000.0, ...})
+    """
+
+    def __init__(
+        self,
+        columns: Sequence[str],
+        windows: Sequence[int] = DEFAULT_WINDOWS,
+        threshold: float = DEFAULT_THRESHOLD,
+        min_periods: int | None = None,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            columns: Asset names (columns of the aligned wide frame).
+            windows: Window lengths in bars.
+            threshold: Absolute correlation move that raises a shift event.
+            min_periods: Minimum pairwise-complete bars for a correlation.
+                Defaults to the full window; capped at each window's length.
+
+        Raises:
+            ValueError: If there are fewer than two columns or a window is
+                shorter than two bars.
+        """
+        self.columns = [str(column) for column in columns]
+        if len(self.columns) < 2:
+            raise ValueError("Correlation needs at least two columns")
+        if any(window < 2 for window in windows):
+            raise ValueError(f"Windows must be at least 2 bars: {list(windows)}")
+        self.windows = tuple(windows)
+        self.threshold = threshold
+        self.min_periods = min_periods
+        self._index = {column: i for i, column in enumerate(self.columns)}
+        self._upper = np.triu_indices(len(self.columns), k=1)
+        self._states = {window: _WindowState(window, len(self.columns)) for window in self.windows}
+        # Per-column shift (first observed value) and per-window event references
+        self._shift = np.full(len(self.columns), np.nan)
+        self._reference = {
+            window: np.full((len(self.columns), len(self.columns)), np.nan)
+            for window in self.windows
+        }
+        self._subscribers: list[CorrelationCallback] = []
+
+    def _min_periods(self, window: int) -> int:
+        return window if self.min_periods is None else min(self.min_periods, window)
+
+    def subscribe(self, callback: CorrelationCallback) -> None:
+        """Register a callback invoked with every non-empty list of shift events."""
+        self._subscribers.append(callback)
+
+    def update(
+        self, timestamp: pd.Timestamp, values: Mapping[str, float] | np.ndarray
+    ) -> list[CorrelationShift]:
+        """Add one bar and return the shift events it raises.
+
+        Args:
+            timestamp: Bar timestamp.
+            values: Value per column (missing keys or NaN: asset absent),
+                or an array in column order.
+
+        Returns:
+            Shift events, one per pair and window past the threshold.
+        """
+        x = self._vector(values)
+        unseen = np.isnan(self._shift) & ~np.isnan(x)
+        self._shift[unseen] = x[unseen]
+        x = x - self._shift
+
+        shifts: list[CorrelationShift] = []
+        for window, state in self._states.items():
+            state.push(x)
+            shifts.extend(self._check(pd.Timestamp(timestamp), window, self._matrix(state)))
+
+        if shifts:
+            logger.info(
+                "Correlation shift: %s",
+                ", ".join(
+                    f"{s.left}/{s.right} {s.window} bars {s.previous:+.2f}->{s.current:+.2f}"
+                    for s in shifts
+                ),
+            )
+            for callback in self._subscribers:
+                callback(shifts)
+        return shifts
+
+    def prime(self, wide: pd.DataFrame) -> None:
+        """Load the latest bars of a history without raising events.
+
+        Only the last ``max(windows)`` rows matter; event references are set
+        to the resulting correlations.
+
+        Args:
+            wide: Aligned frame with (at least) the engine's columns.
+        """
+        values = wide.reindex(columns=self.columns).to_numpy(dtype="float64")
+        if not len(values):
+            return
+        present = ~np.isnan(values)
+        unseen = np.isnan(self._shift) & present.any(axis=0)
+        first = np.where(present.any(axis=0), present.argmax(axis=0), 0)
+        self._shift[unseen] = values[first, np.arange(len(self.columns))][unseen]
+        shifted = values - self._shift
+
+        for window, state in self._states.items():
+            tail = shifted[-window:]
+            state.buffer[:] = np.nan
+            state.buffer[: len(tail)] = tail
+            state.filled = len(tail)
+            state.position = len(tail) % window
+            state.rebuild()
+            reference = self._reference[window]
+            matrix = self._matrix(state)
+            reference[:] = np.where(np.isnan(matrix), reference, matrix)
+
+    def matrix(self, window: int) -> pd.DataFrame:
+        """Current correlation matrix of one window.
+
+        Raises:
+            KeyError: If ``window`` is not one of the engine's windows.
+        """
+        return pd.DataFrame(
+            self._matrix(self._states[window]), index=self.columns, columns=self.columns
+        )
+
+    def pair(self, left: str, right: str, window: int) -> float:
+        """Current correlation of two assets in one window."""
+        value = self._matrix(self._states[window])[self._index[left], self._index[right]]
+        return float(value)
+
+    def batch(self, wide: pd.DataFrame) -> pd.DataFrame:
+        """Rolling correlations of every pair over a whole history (vectorized).
+
+        Args:
+            wide: Aligned frame indexed by timestamp with the engine's columns.
+
+        Returns:
+            Long DataFrame with timestamp, window, left, right, correlation for
+            every bar, window and pair (left before right in column order);
+            NaN where a pair has fewer than ``min_periods`` bars.
+        """
+        values = wide.reindex(columns=self.columns).to_numpy(dtype="float64")
+        # Centring keeps the cumulative sums small relative to the variances
+        with np.errstate(invalid="ignore"):
+            centre = np.nanmean(values, axis=0) if len(values) else np.zeros(len(self.columns))
+        present = ~np.isnan(values)
+        m = present.astype("float64")
+        x0 = np.where(present, values - np.nan_to_num(centre), 0.0)
+
+        def cumulative(left: np.ndarray, right: np.ndarray) -> np.ndarray:
+            # Leading zero row so window sums are cs[t + 1] - cs[t + 1 - w]
+            products = left[:, :, None] * right[:, None, :]
+            return np.concatenate([np.zeros((1, *products.shape[1:])), products.cumsum(axis=0)])
+
+        sums = [cumulative(m, m), cumulative(x0, m), cumulative(x0 * x0, m), cumulative(x0, x0)]
+        rows = np.arange(1, len(values) + 1)
+        i, j = self._upper
+        frames = []
+        for window in self.windows:
+            start = np.maximum(rows - window, 0)
+            count, sx, sxx, sxy = (cs[rows] - cs[start] for cs in sums)
+            corr = _correlation(count, sx, sxx, sxy, self._min_periods(window))
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "timestamp": np.repeat(wide.index.to_numpy(), len(i)),
+                        "window": window,
+                        "left": np.tile(np.asarray(self.columns)[i], len(values)),
+                        "right": np.tile(np.asarray(self.columns)[j], len(values)),
+                        "correlation": corr[:, i, j].reshape(-1),
+                    }
+                )
+            )
+        return pd.concat(frames, ignore_index=True)
+
+    def _vector(self, values: Mapping[str, float] | np.ndarray) -> np.ndarray:
+        if isinstance(values, Mapping):
+            return np.array(
+                [values.get(column, np.nan) for column in self.columns], dtype="float64"
+            )
+        return np.asarray(values, dtype="float64").reshape(len(self.columns))
+
+    def _matrix(self, state: _WindowState) -> np.ndarray:
+        return _correlation(
+            state.count, state.sx, state.sxx, state.sxy, self._min_periods(state.window)
+        )
+
+    def _check(
+        self, timestamp: pd.Timestamp, window: int, matrix: np.ndarray
+    ) -> list[CorrelationShift]:
+        """Compare the upper triangle with the references; move references on events."""
+        reference = self._reference[window]
+        i, j = self._upper
+        current, previous = matrix[i, j], reference[i, j]
+
+        # First valid value of a pair only sets its reference
+        fresh = np.isnan(previous) & ~np.isnan(current)
+        moved = np.abs(current - previous) > self.threshold
+        reference[i[fresh], j[fresh]] = current[fresh]
+        reference[i[moved], j[moved]] = current[moved]
+
+        return [
+            CorrelationShift(
+                timestamp=timestamp,
+                window=window,
+                left=self.columns[a],
+                right=self.columns[b],
+                previous=float(before),
+                current=float(after),
+            )
+            for a, b, before, after in zip(
+                i[moved], j[moved], previous[moved], current[moved], strict=True
+            )
+        ]
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"RollingCorrelation(columns={len(self.columns)}, windows={list(self.windows)})"
@@ -0,0 +1,369 @@
+"""Incremental liquidity regime classifier.
+
+Classifies each new Net Liquidity / Global Liquidity point as Expansionary,
+Neutral or Contractionary from the momentum of the index:
+- signal: change of the index over ``periods`` points (e.g. 4 weekly prints)
+- score: z-score of that change against its rolling mean and standard
+  deviation over the last ``window`` changes (including the current one)
+- hysteresis: a regime is entered when |score| reaches ``enter`` and held
+  until the score falls back inside ``exit`` (or crosses the opposite
+  ``enter``), so the regime does not flicker around a single threshold
+
+Streaming keeps, per index, the last ``periods`` values, the last ``window``
+changes and sliding-window Welford mean/variance, so each point is
+classified in O(1) without re-reading history. ``batch`` reproduces the same
+regimes for a whole history with vectorized rolling statistics and a
+forward-fill formulation of the hysteresis.
+
+Regime transitions are written to liquidity_indexes under their own
+index_name (``net_liquidity_regime`` for net_liquidity), with the point's
+value and the ``regime`` column, so the engines upserting the index rows
+themselves (which carry no regime) never reset a transition.
+"""
+
+import logging
+from collections import deque
+from collections.abc import Callable, Sequence
+from enum import StrEnum
+
+import numpy as np
+import pandas as pd
+
+from liquidity.storage.backend import Storage
+from liquidity.storage.schemas import LIQUIDITY_INDEXES_TABLE
+
+logger = logging.getLogger(__name__)
+
+
+class Regime(StrEnum):
+    """Liquidity regime."""
+
+    EXPANSIONARY = "expansionary"
+    NEUTRAL = "neutral"
+    CONTRACTIONARY = "contractionary"
+
+
+# Indexes classified by default (index_name in liquidity_indexes)
+REGIME_INDEXES = ("net_liquidity", "global_liquidity")
+# One year of weekly changes, each over four weekly prints
+DEFAULT_WINDOW = 52
+DEFAULT_PERIODS = 4
+# Hysteresis thresholds on the momentum z-score
+ENTER_Z = 1.0
+EXIT_Z = 0.5
+# index_name suffix of stored transitions
+REGIME_SUFFIX = "_regime"
+
+RegimeCallback = Callable[[pd.DataFrame], None]
+
+_TRANSITION_COLUMNS = ["timestamp", "index_name", "value", "score", "regime", "previous"]
+
+
+def regime_index_name(index_name: str) -> str:
+    """Return the liquidity_indexes index_name holding an index's transitions."""
+    return f"{index_name}{REGIME_SUFFIX}"
+
+
+class _IndexState:
+    """Rolling state of one index."""
+
+    def __init__(self, window: int, periods: int) -> None:
+        self.values: deque[float] = deque(maxlen=periods + 1)
+        self.changes: deque[float] = deque()
+        self.window = window
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.up = False
+        self.down = False
+        self.regime: Regime | None = None
+        self.last: pd.Timestamp | None = None
+
+    def push(self, value: float) -> float | None:
+        """Add a point; return its change over ``periods`` once available."""
+        self.values.append(value)
+        if len(self.values) < (self.values.maxlen or 0):
+            return None
+        change = value - self.values[0]
+        if len(self.changes) == self.window:
+            self._remove(self.changes.popleft())
+        self.changes.append(change)
+        self._add(change)
+        return change
+
+    def _add(self, x: float) -> None:
+        # Welford update for the new count (len(changes) already includes x)
+        n = len(self.changes)
+        delta = x - self.mean
+        self.mean += delta / n
+        self.m2 += delta * (x - self.mean)
+
+    def _remove(self, x: float) -> None:
+        # Inverse Welford update (len(changes) already excludes x)
+        n = len(self.changes)
+        if n == 0:
+            self.mean, self.m2 = 0.0, 0.0
+            return
+        delta = x - self.mean
+        self.mean -= delta / n
+        self.m2 = max(self.m2 - delta * (x - self.mean), 0.0)
+
+    def reset_stats(self) -> None:
+        """Recompute mean and M2 exactly from the buffered changes."""
+        changes = np.asarray(self.changes, dtype="float64")
+        self.mean = float(changes.mean()) if len(changes) else 0.0
+        self.m2 = float(((changes - self.mean) ** 2).sum()) if len(changes) else 0.0
+
+
+class RegimeClassifier:
+    """Classify liquidity indexes into regimes, point by point or in batch.
+
+    Example:
+        classifier = RegimeClassifier(storage=storage)
+        classifier.prime(storage.load_frame("liquidity_indexes", list(REGIME_INDEXES)))
+        graph.subscribe(classifier.update)  # DependencyGraph output
+
+        classifier.current("net_liquidity")  # Regime.EXPANSIONARY
+    """
+
+    def __init__(
+        self,
+        storage: Storage | None = None,
+        indexes: Sequence[str] = REGIME_INDEXES,
+        window: int = DEFAULT_WINDOW,
+        periods: int = DEFAULT_PERIODS,
+        enter: float = ENTER_Z,
+        exit: float = EXIT_Z,
+        min_periods: int | None = None,
+    ) -> None:
+        """Initialize the classifier.
+
+        Args:
+            storage: Optional storage; transitions are written to
+                liquidity_indexes as ``{index_name}_regime`` rows.
+            indexes: Index names to classify; other rows are ignored.
+            window: Number of changes in the rolling statistics.
+            periods: Points between the values whose difference is the signal.
+            enter: |z| at which Expansionary/Contractionary is entered.
+            exit: |z| below which the regime falls back to Neutral.
+            min_periods: Changes required before scoring. Defaults to ``window``.
+
+        Raises:
+            ValueError: If the thresholds or windows are inconsistent.
+        """
+        if not 0 <= exit <= enter:
+            raise ValueError(f"Need 0 <= exit <= enter, got exit={exit}, enter={enter}")
+        if window < 2 or periods < 1:
+            raise ValueError("window must be at least 2 and periods at least 1")
+        self.storage = storage
+        self.indexes = tuple(indexes)
+        self.window = window
+        self.periods = periods
+        self.enter = enter
+        self.exit = exit
+        self.min_periods = window if min_periods is None else max(min(min_periods, window), 2)
+        self._states = {name: _IndexState(window, periods) for name in self.indexes}
+        self._subscribers: list[RegimeCallback] = []
+
+    def subscribe(self, callback: RegimeCallback) -> None:
+        """Register a callback invoked with every non-empty batch of transitions."""
+        self._subscribers.append(callback)
+
+    def current(self, index_name: str) -> Regime | None:
+        """Latest regime of an index (None before the first scored point)."""
+        return self._states[index_name].regime
+
+    def update(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Classify new index points in O(1) each.
+
+        Points at or before an index's latest classified timestamp (revisions)
+        are skipped; rebuild with ``batch`` and ``prime`` after revisions.
+
+        Args:
+            df: Long rows (timestamp, index_name, value), e.g. DependencyGraph
+                output, or wide calculator output with a column per index.
+
+        Returns:
+            DataFrame with timestamp, index_name, value, score, regime and
+            previous (regime) for each transition.
+        """
+        rows = self._long(df).sort_values("timestamp", kind="stable")
+        transitions = []
+        for ts, name, value in zip(
+            rows["timestamp"], rows["index_name"], rows["value"].tolist(), strict=True
+        ):
+            state = self._states[name]
+            if state.last is not None and ts <= state.last:
+                logger.debug("Skipping %s point at %s (not after %s)", name, ts, state.last)
+                continue
+            state.last = ts
+            score = self._score(state, state.push(value))
+            regime = self._step(state, score)
+            if regime is not None and regime != state.regime:
+                transitions.append((ts, name, value, score, regime, state.regime))
+                state.regime = regime
+
+        result = pd.DataFrame(transitions, columns=_TRANSITION_COLUMNS)
+        if not result.empty:
+            self._emit(result)
+        return result
+
+    def batch(self, df: pd.DataFrame, persist: bool = False) -> pd.DataFrame:
+        """Classify a whole history (vectorized).
+
+        Produces the same regimes as feeding the points to ``update`` in
+        timestamp order.
+
+        Args:
+            df: Long rows (timestamp, index_name, value) or wide calculator
+                output.
+            persist: Also write the transitions to liquidity_indexes.
+
+        Returns:
+            DataFrame with timestamp, index_name, value, score, regime for
+            every point (sorted by index then timestamp); score and regime
+            are missing until ``min_periods`` changes are available.
+
+        Raises:
+            ValueError: If persist is set without a storage.
+        """
+        rows = self._long(df)
+        frames = []
+        for name in self.indexes:
+            series = rows[rows["index_name"] == name].sort_values("timestamp", kind="stable")
+            series = series.drop_duplicates("timestamp", keep="last")
+            values = series["value"].astype("float64")
+            change = values - values.shift(self.periods)
+            rolling = change.rolling(self.window, min_periods=self.min_periods)
+            std = rolling.std()
+            score = ((change - rolling.mean()) / std.where(std > 0)).to_numpy()
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "timestamp": series["timestamp"].to_numpy(),
+                        "index_name": name,
+                        "value": values.to_numpy(),
+                        "score": score,
+                        "regime": self._classify(score),
+                    }
+                )
+            )
+        result = pd.concat(frames, ignore_index=True)
+
+        if persist:
+            if self.storage is None:
+                raise ValueError("persist=True requires a storage")
+            scored = result.dropna(subset=["regime"])
+            previous = scored.groupby("index_name", sort=False)["regime"].shift()
+            changed = scored[scored["regime"] != previous]
+            if not changed.empty:
+                self._persist(changed)
+        return result
+
+    def prime(self, df: pd.DataFrame) -> None:
+        """Load history so streaming continues exactly where ``batch`` ends.
+
+        Args:
+            df: Long rows (timestamp, index_name, value) or wide calculator
+                output.
+        """
+        history = self.batch(df)
+        for name, group in history.groupby("index_name", sort=False):
+            state = _IndexState(self.window, self.periods)
+            values = group["value"].to_numpy()
+            state.values.extend(values[-(self.periods + 1) :].tolist())
+            changes = values[self.periods :] - values[: -self.periods] if len(values) else []
+            state.changes.extend(np.asarray(changes)[-self.window :].tolist())
+            state.reset_stats()
+            scored = group.dropna(subset=["regime"])
+            if not scored.empty:
+                state.regime = Regime(scored["regime"].iloc[-1])
+            # The hysteresis carries on only from a scored latest point
+            if pd.notna(group["regime"].iloc[-1]):
+                state.up = state.regime is Regime.EXPANSIONARY
+                state.down = state.regime is Regime.CONTRACTIONARY
+            state.last = group["timestamp"].iloc[-1]
+            self._states[str(name)] = state
+
+    def _long(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Normalize input to long rows of tracked indexes."""
+        if "index_name" not in df.columns:
+            present = [name for name in self.indexes if name in df.columns]
+            df = df.melt(
+                id_vars="timestamp",
+                value_vars=present,
+                var_name="index_name",
+                value_name="value",
+            )
+        rows = df.loc[df["index_name"].isin(self.indexes), ["timestamp", "index_name", "value"]]
+        return rows.dropna(subset=["value"])
+
+    def _score(self, state: _IndexState, change: float | None) -> float:
+        """z-score of the latest change (NaN until enough changes)."""
+        n = len(state.changes)
+        if change is None or n < self.min_periods:
+            return float("nan")
+        std = (state.m2 / (n - 1)) ** 0.5
+        return (change - state.mean) / std if std > 0 else float("nan")
+
+    def _step(self, state: _IndexState, score: float) -> Regime | None:
+        """Apply the hysteresis to one score (None: not scored yet)."""
+        if np.isnan(score):
+            state.up = state.down = False
+            return None
+        state.up = score >= self.enter or (state.up and score >= self.exit)
+        state.down = score <= -self.enter or (state.down and score <= -self.exit)
+        if state.up:
+            return Regime.EXPANSIONARY
+        if state.down:
+            return Regime.CONTRACTIONARY
+        return Regime.NEUTRAL
+
+    def _classify(self, score: np.ndarray) -> np.ndarray:
+        """Vectorized hysteresis: 1 on entry, 0 on exit, carried forward otherwise."""
+        scored = ~np.isnan(score)
+        with np.errstate(invalid="ignore"):
+            hold_up = scored & (score >= self.exit)
+            hold_down = scored & (score <= -self.exit)
+            up = np.where(score >= self.enter, 1.0, np.where(hold_up, np.nan, 0.0))
+            down = np.where(score <= -self.enter, 1.0, np.where(hold_down, np.nan, 0.0))
+        up = pd.Series(up).ffill().fillna(0.0).to_numpy(dtype=bool)
+        down = pd.Series(down).ffill().fillna(0.0).to_numpy(dtype=bool)
+        regimes = np.full(len(score), Regime.NEUTRAL.value, dtype=object)
+        regimes[up] = Regime.EXPANSIONARY.value
+        regimes[down] = Regime.CONTRACTIONARY.value
+        regimes[~scored] = None
+        return regimes
+
+    def _persist(self, transitions: pd.DataFrame) -> None:
+        """Write transitions as ``{index_name}_regime`` rows of liquidity_indexes."""
+        if self.storage is None:
+            return
+        self.storage.ingest_dataframe(
+            LIQUIDITY_INDEXES_TABLE,
+            pd.DataFrame(
+                {
+                    "timestamp": transitions["timestamp"].to_numpy(),
+                    "index_name": transitions["index_name"].astype(str).map(regime_index_name),
+                    "value": transitions["value"].to_numpy(),
+                    "regime": transitions["regime"].astype(str),
+                }
+            ),
+        )
+
+    def _emit(self, transitions: pd.DataFrame) -> None:
+        for row in transitions.itertuples(index=False):
+            logger.info(
+                "Regime change %s: %s -> %s (score=%.2f) at %s",
+                row.index_name,
+                row.previous,
+                row.regime,
+                row.score,
+                row.timestamp,
+            )
+        self._persist(transitions)
+        for callback in self._subscribers:
+            callback(transitions)
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"RegimeClassifier(indexes={list(self.indexes)}, window={self.window})"
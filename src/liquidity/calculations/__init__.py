@@ -0,0 +1,86 @@
+"""Derived liquidity calculations.
+
+Engines that turn collected series into derived indexes: vectorized as-of
+alignment of mixed-frequency inputs, declarative expressions evaluated in one
+pass, and incremental updates as new observations arrive (a dependency graph
+recomputing only the affected series and time ranges) instead of recomputing
+history. Net Liquidity is also nowcast daily from the daily TGA and RRP
+releases, reconciled to each weekly H.4.1 print. The Stealth QE score and
+volatility panel are computed for a whole history in a few array operations
+and then bar by bar, and the stress panel (levels, spreads, rolling
+percentiles, threshold breaches) in one pass over its aligned inputs.
+"""
+
+from liquidity.calculations.alignment import (
+    align_asof,
+    anchor_grid,
+    asof_lookup,
+    calendar_grid,
+)
+from liquidity.calculations.expressions import (
+    DERIVED_SERIES,
+    MAX_STALENESS,
+    CompiledExpression,
+    DerivedSeries,
+    ExpressionError,
+    compile_expression,
+    evaluate,
+)
+from liquidity.calculations.global_liquidity import (
+    CB_SERIES,
+    FX_QUOTES,
+    GlobalLiquidityCalculator,
+)
+from liquidity.calculations.graph import DependencyGraph
+from liquidity.calculations.net_liquidity import (
+    INPUT_SERIES,
+    NetLiquidityEngine,
+)
+from liquidity.calculations.nowcast import NetLiquidityNowcast
+from liquidity.calculations.observations import DirtyRange, Observations
+from liquidity.calculations.stealth_qe import (
+    STEALTH_QE_ACTIVATED,
+    StealthQEEngine,
+    VolSignal,
+)
+from liquidity.calculations.stress import (
+    STRESS_INDICATORS,
+    StressEngine,
+    StressIndicator,
+)
+
+__all__ = [
+    # Alignment
+    "align_asof",
+    "anchor_grid",
+    "asof_lookup",
+    "calendar_grid",
+    # Derived series expressions
+    "DerivedSeries",
+    "DERIVED_SERIES",
+    "MAX_STALENESS",
+    "CompiledExpression",
+    "ExpressionError",
+    "compile_expression",
+    "evaluate",
+    # Dependency graph
+    "DependencyGraph",
+    "DirtyRange",
+    "Observations",
+    # Global Liquidity
+    "GlobalLiquidityCalculator",
+    "CB_SERIES",
+    "FX_QUOTES",
+    # Net Liquidity
+    "NetLiquidityEngine",
+    "INPUT_SERIES",
+    "NetLiquidityNowcast",
+    # Stealth QE score
+    "StealthQEEngine",
+    "VolSignal",
+    "STEALTH_QE_ACTIVATED",
+    # Stress indicators
+    "StressEngine",
+    "StressIndicator",
+    "STRESS_INDICATORS",
+]
@@ -0,0 +1,424 @@
+"""Declarative derived series.
+
+A derived series is an arithmetic expression over collected series, e.g.
+``"WALCL - WLRRAL - WDTGAL"``. Each expression is:
+- parsed once with ``ast`` (only numbers, series names, + - * / and unary
+  minus are accepted, so no code is ever executed)
+- validated against the collectors' SERIES_MAP/UNIT_MAP: every name must be
+  a known series id (or an internal SERIES_MAP name such as ``rrp``), and
+  the unit dimensions must be consistent (no adding USD to percent)
+- compiled into a closure of numpy ufuncs over whole columns
+
+Series enter expressions in the base unit of their dimension (millions for
+currency amounts, percent for rates), converted from the rows' ``unit``
+column through the unit registry, so expressions carry no scale factors: a
+literal power of ten multiplying or dividing a unit-bearing operand (e.g.
+``"WLRRAL*1e3"``) is rejected, since it would scale an already converted
+series a second time. The output unit of a ``DerivedSeries`` sets its scale.
+
+``evaluate`` aligns the union of all referenced series once and evaluates
+any number of definitions over that shared frame. Adding a metric is a new
+``DerivedSeries`` entry, not new pandas code.
+"""
+
+import ast
+import math
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+
+import numpy as np
+import pandas as pd
+
+from liquidity.calculations.alignment import Staleness, align_asof, anchor_grid
+from liquidity.units import UnitError, base_scales, get_unit
+
+# Whole-column values keyed by series id
+Columns = Mapping[str, np.ndarray]
+Evaluator = Callable[[Columns], np.ndarray | float]
+
+_BINARY_OPS: dict[type[ast.operator], Callable[..., np.ndarray | float]] = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.divide,
+}
+
+_UNARY_OPS: dict[type[ast.unaryop], Callable[..., np.ndarray | float]] = {
+    ast.USub: np.negative,
+    ast.UAdd: np.positive,
+}
+
+
+class ExpressionError(ValueError):
+    """Invalid derived-series expression (syntax, unknown series or units)."""
+
+    pass
+
+
+@lru_cache(maxsize=1)
+def known_series() -> dict[str, str]:
+    """Return the unit of every collected series id (collector UNIT_MAPs)."""
+    # Imported lazily: collectors import the calculations package
+    from liquidity.collectors import boc, boe, fred, nyfed, pboc, snb, treasury
+
+    units: dict[str, str] = {}
+    for module in (fred, boc, boe, pboc, snb, treasury, nyfed):
+        units.update(module.UNIT_MAP)
+    return units
+
+
+@lru_cache(maxsize=1)
+def series_aliases() -> dict[str, str]:
+    """Return internal series names mapped to series ids (collector SERIES_MAPs)."""
+    from liquidity.collectors import (
+        BOC_SERIES_MAP,
+        SERIES_MAP,
+        BOECollector,
+        NYFedCollector,
+        PBOCCollector,
+        SNBCollector,
+        TreasuryCollector,
+    )
+
+    aliases: dict[str, str] = {}
+    for series_map in (
+        SERIES_MAP,
+        BOC_SERIES_MAP,
+        BOECollector.SERIES_MAP,
+        PBOCCollector.SERIES_MAP,
+        SNBCollector.SERIES_MAP,
+        TreasuryCollector.SERIES_MAP,
+        NYFedCollector.SERIES_MAP,
+    ):
+        aliases.update(series_map)
+    return aliases
+
+
+@dataclass(frozen=True)
+class CompiledExpression:
+    """A validated expression ready to evaluate.
+
+    Attributes:
+        expression: Source text.
+        inputs: Referenced series ids, in order of first appearance.
+        dimension: Unit dimension of the result (None: dimensionless).
+        evaluate: Closure computing the result from base-unit columns.
+    """
+
+    expression: str
+    inputs: tuple[str, ...]
+    dimension: str | None
+    evaluate: Evaluator
+
+
+def compile_expression(
+    expression: str,
+    units: Mapping[str, str] | None = None,
+    aliases: Mapping[str, str] | None = None,
+) -> CompiledExpression:
+    """Parse, validate and compile an expression.
+
+    Args:
+        expression: Arithmetic over series names, e.g. "DGS10 - DGS2".
+        units: Known series ids and their units. Defaults to ``known_series()``.
+        aliases: Internal names accepted for series ids. Defaults to
+            ``series_aliases()``.
+
+    Returns:
+        CompiledExpression.
+
+    Raises:
+        ExpressionError: On a syntax error, unsupported syntax, an unknown
+            series or inconsistent unit dimensions.
+    """
+    units = known_series() if units is None else units
+    aliases = series_aliases() if aliases is None else aliases
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as e:
+        raise ExpressionError(f"Invalid expression '{expression}': {e.msg}") from e
+
+    inputs: list[str] = []
+
+    def build(node: ast.expr) -> tuple[Evaluator, str | None]:
+        if isinstance(node, ast.Constant) and isinstance(node.value, int | float):
+            if isinstance(node.value, bool):
+                raise ExpressionError(f"Unsupported constant {node.value} in '{expression}'")
+            constant = float(node.value)
+            return (lambda _: constant), None
+
+        if isinstance(node, ast.Name):
+            series_id = aliases.get(node.id, node.id)
+            if series_id not in units:
+                raise ExpressionError(f"Unknown series '{node.id}' in '{expression}'")
+            try:
+                series_dim = get_unit(units[series_id]).dimension
+            except UnitError as e:
+                raise ExpressionError(f"{series_id}: {e}") from e
+            if series_id not in inputs:
+                inputs.append(series_id)
+            return (lambda columns: columns[series_id]), series_dim
+
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+            unary = _UNARY_OPS[type(node.op)]
+            operand, operand_dim = build(node.operand)
+            return (lambda columns: unary(operand(columns))), operand_dim
+
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+            binary = _BINARY_OPS[type(node.op)]
+            left, left_dim = build(node.left)
+            right, right_dim = build(node.right)
+            if isinstance(node.op, ast.Mult | ast.Div):
+                _reject_scale_factor(node, left_dim, right_dim, expression)
+            return (lambda columns: binary(left(columns), right(columns))), _combine(
+                node.op, left_dim, right_dim, expression
+            )
+
+        raise ExpressionError(
+            f"Unsupported syntax '{ast.unparse(node)}' in '{expression}'"
+        )
+
+    evaluator, dimension = build(tree.body)
+    if not inputs:
+        raise ExpressionError(f"Expression '{expression}' references no series")
+    return CompiledExpression(expression, tuple(inputs), dimension, evaluator)
+
+
+def _is_scale_literal(node: ast.expr) -> bool:
+    """Return whether a node is a literal power of ten other than 1 (e.g. 1e3, 0.001)."""
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub | ast.UAdd):
+        node = node.operand
+    if not isinstance(node, ast.Constant) or not isinstance(node.value, int | float):
+        return False
+    magnitude = abs(float(node.value))
+    if magnitude in (0.0, 1.0):
+        return False
+    exponent = math.log10(magnitude)
+    return math.isclose(exponent, round(exponent), abs_tol=1e-9)
+
+
+def _reject_scale_factor(
+    node: ast.BinOp, left: str | None, right: str | None, expression: str
+) -> None:
+    """Reject a literal scale factor applied to a unit-bearing operand."""
+    for literal, dimension in ((node.left, right), (node.right, left)):
+        if dimension is not None and _is_scale_literal(literal):
+            raise ExpressionError(
+                f"Literal scale factor {ast.unparse(literal)} applied to a {dimension} "
+                f"operand in '{expression}': series enter in base units, declare the "
+                f"output unit instead"
+            )
+
+
+def _combine(
+    op: ast.operator, left: str | None, right: str | None, expression: str
+) -> str | None:
+    """Dimension of a binary operation (constants take the other side's)."""
+    if isinstance(op, ast.Add | ast.Sub):
+        if left is not None and right is not None and left != right:
+            raise ExpressionError(
+                f"Cannot add or subtract {left} and {right} in '{expression}'"
+            )
+        return left if left is not None else right
+    if isinstance(op, ast.Mult):
+        if left is None or right is None:
+            return left if left is not None else right
+        return f"{left}*{right}"
+    # Division: same dimensions cancel
+    if right is None:
+        return left
+    if left == right:
+        return None
+    return f"{left or 1}/{right}"
+
+
+@dataclass(frozen=True)
+class DerivedSeries:
+    """A named derived series.
+
+    Attributes:
+        name: Output name (index_name in liquidity_indexes).
+        expression: Arithmetic over series names.
+        unit: Registered unit of the result; its dimension must match the
+            expression's ("index" for dimensionless ratios).
+        anchor: Series whose timestamps define the output points. Defaults
+            to the first series in the expression.
+    """
+
+    name: str
+    expression: str
+    unit: str
+    anchor: str | None = None
+
+    @cached_property
+    def compiled(self) -> CompiledExpression:
+        """Compile against the collector catalog on first use.
+
+        Raises:
+            ExpressionError: If the expression is invalid or its dimension
+                does not match ``unit``.
+        """
+        return self.compile()
+
+    def compile(self, units: Mapping[str, str] | None = None) -> CompiledExpression:
+        """Compile against a series catalog.
+
+        Args:
+            units: Series ids and their units (e.g. the collector catalog
+                plus other derived series). Defaults to ``known_series()``.
+
+        Raises:
+            ExpressionError: If the expression is invalid or its dimension
+                does not match ``unit``.
+        """
+        compiled = compile_expression(self.expression, units)
+        dimension = get_unit(self.unit).dimension
+        if (compiled.dimension or "index") != dimension:
+            raise ExpressionError(
+                f"{self.name}: expression is in {compiled.dimension or 'dimensionless'} "
+                f"units, declared unit '{self.unit}' is {dimension}"
+            )
+        if self.anchor is not None and self.anchor not in compiled.inputs:
+            raise ExpressionError(f"{self.name}: anchor {self.anchor} is not an input")
+        return compiled
+
+    def anchor_of(self, compiled: CompiledExpression) -> str:
+        """Series whose observation timestamps are the output points."""
+        return self.anchor or compiled.inputs[0]
+
+    def calculate(self, df: pd.DataFrame, max_staleness: Staleness = None) -> pd.DataFrame:
+        """Evaluate this series alone.
+
+        Args:
+            df: Long-format rows (timestamp, series_id, value, unit).
+            max_staleness: Staleness limits for the inputs.
+
+        Returns:
+            DataFrame with timestamp, ``name`` and unit columns; points with a
+            missing input are dropped.
+        """
+        wide = evaluate([self], df, max_staleness=max_staleness)
+        return pd.DataFrame(
+            {
+                "timestamp": wide.index,
+                self.name: wide[self.name].to_numpy(),
+                "unit": self.unit,
+            }
+        ).dropna()
+
+
+# Built-in definitions
+DERIVED_SERIES: dict[str, DerivedSeries] = {
+    series.name: series
+    for series in (
+        # Hayes formula: Fed assets minus RRP and TGA drains
+        DerivedSeries("net_liquidity", "WALCL - WLRRAL - WDTGAL", "millions_usd"),
+        DerivedSeries("yield_spread", "DGS10 - DGS2", "percent"),
+    )
+}
+
+# Oldest observation accepted when aligning an input as-of a derived series
+# timestamp (weekly H.4.1 prints: one week; daily yields: a long weekend)
+MAX_STALENESS: dict[str, pd.Timedelta] = {
+    "WLRRAL": pd.Timedelta(days=7),
+    "WDTGAL": pd.Timedelta(days=7),
+    "DGS2": pd.Timedelta(days=4),
+}
+
+
+def evaluate(
+    definitions: Sequence[DerivedSeries],
+    df: pd.DataFrame,
+    grid: pd.DatetimeIndex | None = None,
+    max_staleness: Staleness = None,
+    units: Mapping[str, str] | None = None,
+) -> pd.DataFrame:
+    """Evaluate several derived series over one shared aligned frame.
+
+    The union of all inputs is converted to base units and aligned as-of in a
+    single pass; each definition is then a handful of ufunc calls over the
+    aligned columns.
+
+    Args:
+        definitions: Series to evaluate.
+        df: Long-format rows (timestamp, series_id, value and, optionally,
+            unit; without it the catalog unit is assumed).
+        grid: Output timestamps shared by all definitions. Defaults to the
+            union of the anchors' timestamps, each definition only taking
+            values at its own anchor's points.
+        max_staleness: Staleness limits for the inputs (see ``align_asof``).
+        units: Series catalog used to compile the definitions and check row
+            units. Defaults to ``known_series()``.
+
+    Returns:
+        Wide float64 DataFrame indexed by timestamp, one column per
+        definition in its declared unit (NaN where an input is missing).
+
+    Raises:
+        ExpressionError: If a definition is invalid.
+        ValueError: If a definition's inputs are absent from ``df``.
+        UnitError: If a row's unit is unknown or of the wrong dimension.
+    """
+    if units is None:
+        catalog = known_series()
+        compiled = [definition.compiled for definition in definitions]
+    else:
+        catalog = dict(units)
+        frozen = tuple(sorted(catalog.items()))
+        compiled = [_compile_with(definition, frozen) for definition in definitions]
+    inputs = list(dict.fromkeys(s for c in compiled for s in c.inputs))
+    rows = df[df["series_id"].isin(inputs)]
+    available = set(rows["series_id"].unique())
+    for definition, expression in zip(definitions, compiled, strict=True):
+        missing = set(expression.inputs) - available
+        if missing:
+            raise ValueError(f"Missing required series for {definition.name}: {sorted(missing)}")
+
+    rows = _to_base_units(rows, catalog)
+    anchor_ids = [d.anchor_of(c) for d, c in zip(definitions, compiled, strict=True)]
+    anchors: dict[str, pd.DatetimeIndex] = {}
+    if grid is None:
+        anchors = {series_id: anchor_grid(rows, series_id) for series_id in anchor_ids}
+        grid = pd.DatetimeIndex(
+            np.unique(np.concatenate([a.to_numpy() for a in anchors.values()])),
+            name="timestamp",
+        )
+    wide = align_asof(rows, inputs, grid=grid, max_staleness=max_staleness)
+    columns = {series_id: wide[series_id].to_numpy() for series_id in inputs}
+
+    result: dict[str, np.ndarray] = {}
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for definition, expression, anchor in zip(
+            definitions, compiled, anchor_ids, strict=True
+        ):
+            values = np.broadcast_to(expression.evaluate(columns), len(grid)).astype("float64")
+            values /= get_unit(definition.unit).scale
+            if anchors:
+                values[~grid.isin(anchors[anchor])] = np.nan
+            result[definition.name] = values
+    return pd.DataFrame(result, index=wide.index)
+
+
+@lru_cache(maxsize=256)
+def _compile_with(
+    definition: DerivedSeries, units: tuple[tuple[str, str], ...]
+) -> CompiledExpression:
+    """Compile a definition against a custom catalog once per catalog."""
+    return definition.compile(dict(units))
+
+
+def _to_base_units(rows: pd.DataFrame, catalog: Mapping[str, str]) -> pd.DataFrame:
+    """Scale every row to the base unit of its dimension.
+
+    Raises:
+        UnitError: If a series' unit is unknown or not of its catalog dimension.
+    """
+    if "unit" not in rows.columns:
+        rows = rows.assign(unit=rows["series_id"].map(catalog))
+    pairs = rows[["series_id", "unit"]].drop_duplicates()
+    for series_id, unit in zip(pairs["series_id"], pairs["unit"], strict=True):
+        expected = get_unit(catalog[series_id]).dimension
+        if get_unit(unit).dimension != expected:
+            raise UnitError(f"{series_id} has unit '{unit}', expected a {expected} unit")
+    return rows.assign(value=rows["value"].to_numpy(dtype="float64") * base_scales(rows["unit"]))
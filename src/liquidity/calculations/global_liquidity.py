@@ -0,0 +1,223 @@
+"""Global Liquidity Index: central bank balance sheets summed in USD.
+
+Each central bank total-assets series is reported in its own currency and
+scale (millions EUR, 100 million JPY, ...). The calculator:
+- aligns every bank series and the matching FX series as-of on one calendar
+  grid (weekly on Wednesdays by default, like the H.4.1)
+- converts all banks and dates in a single broadcast numpy expression
+  (value * unit scale * USD rate, with the rate inverted for currencies
+  quoted per USD)
+- sums the banks into a millions-USD index, written to liquidity_indexes as
+  index_name "global_liquidity"
+
+A grid point is only emitted when every included bank has a fresh enough
+observation and FX rate, so the index never jumps because one input is
+missing.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from liquidity.calculations.alignment import align_asof, calendar_grid
+from liquidity.storage.backend import Storage
+from liquidity.storage.schemas import LIQUIDITY_INDEXES_TABLE
+from liquidity.units import UnitError, get_unit
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "global_liquidity"
+
+
+@dataclass(frozen=True)
+class FXQuote:
+    """FRED FX series used to convert a currency to USD.
+
+    Attributes:
+        series_id: FRED H.10 series.
+        usd_per_unit: True if quoted as USD per currency unit (DEXUSEU),
+            False if quoted as currency units per USD (DEXJPUS).
+    """
+
+    series_id: str
+    usd_per_unit: bool
+
+
+FX_QUOTES: dict[str, FXQuote] = {
+    "EUR": FXQuote("DEXUSEU", True),
+    "JPY": FXQuote("DEXJPUS", False),
+    "GBP": FXQuote("DEXUSUK", True),
+    "CHF": FXQuote("DEXSZUS", False),
+    "CAD": FXQuote("DEXCAUS", False),
+    "CNY": FXQuote("DEXCHUS", False),
+}
+
+# Central bank total assets in the index -> oldest observation carried forward
+# (two periods: weekly balance sheets 14 days, monthly ones 62 days)
+CB_SERIES: dict[str, pd.Timedelta] = {
+    "WALCL": pd.Timedelta(days=14),  # Fed
+    "ECBASSETSW": pd.Timedelta(days=14),  # ECB
+    "JPNASSETS": pd.Timedelta(days=62),  # BoJ
+    "BOE_TOTAL_ASSETS": pd.Timedelta(days=14),  # BoE
+    "SNB_TOTAL_ASSETS": pd.Timedelta(days=62),  # SNB
+    "V36610": pd.Timedelta(days=14),  # BoC
+    "PBOC_TOTAL_ASSETS": pd.Timedelta(days=62),  # PBoC
+}
+
+# Daily FX rates: a week covers holidays
+FX_MAX_STALENESS = pd.Timedelta(days=7)
+
+class GlobalLiquidityCalculator:
+    """Compute the Global Liquidity Index from long-format CB and FX rows.
+
+    Example:
+        fred = FredCollector()
+        df = pd.concat([
+            await fred.collect_global_cb_totals(start),
+            await fred.collect_fx_rates(start),
+            await BOECollector().collect(start_date=start),
+        ])
+        calculator = GlobalLiquidityCalculator(storage=storage)
+        gli = calculator.calculate(df, persist=True)
+    """
+
+    def __init__(self, storage: Storage | None = None) -> None:
+        """Initialize the calculator.
+
+        Args:
+            storage: Optional storage used when persisting the index.
+        """
+        self.storage = storage
+
+    def components(
+        self,
+        df: pd.DataFrame,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        freq: str = "W-WED",
+    ) -> pd.DataFrame:
+        """Convert every central bank series to millions USD on a common grid.
+
+        Banks without rows in ``df`` are left out; their FX series are not
+        required.
+
+        Args:
+            df: Long-format rows (timestamp, series_id, value, unit) holding
+                CB totals and the FX series of their currencies.
+            start: First grid point. Defaults to the earliest CB observation.
+            end: Last grid point. Defaults to the latest CB observation.
+            freq: Grid frequency (pandas alias).
+
+        Returns:
+            Wide DataFrame indexed by timestamp with one millions-USD column
+            per included bank (NaN where an input is missing or stale).
+
+        Raises:
+            ValueError: If no bank is present or a needed FX series is missing.
+            UnitError: If a bank's unit is unknown or not a supported currency.
+        """
+        rows = df[df["series_id"].isin(CB_SERIES)]
+        banks = [series_id for series_id in CB_SERIES if series_id in set(rows["series_id"])]
+        if not banks:
+            raise ValueError(
+                f"No central bank series for Global Liquidity: need any of {list(CB_SERIES)}"
+            )
+
+        # Unit registry: dimension is the currency, scale converts to millions
+        last_units = rows.groupby("series_id")["unit"].last()
+        units = [get_unit(last_units[bank]) for bank in banks]
+        currencies = [unit.dimension for unit in units]
+        unsupported = sorted(set(currencies) - {"USD", *FX_QUOTES})
+        if unsupported:
+            raise UnitError(f"Unsupported currency for Global Liquidity: {unsupported}")
+        scales = [unit.scale for unit in units]
+
+        foreign = sorted({currency for currency in currencies if currency != "USD"})
+        fx_ids = [FX_QUOTES[currency].series_id for currency in foreign]
+        missing = set(fx_ids) - set(df["series_id"])
+        if missing:
+            raise ValueError(f"Missing FX series for Global Liquidity: {sorted(missing)}")
+
+        timestamps = pd.to_datetime(rows["timestamp"])
+        grid = calendar_grid(start or timestamps.min(), end or timestamps.max(), freq)
+        assets = align_asof(df, banks, grid, max_staleness=CB_SERIES).to_numpy()
+        fx = align_asof(df, fx_ids, grid, max_staleness=FX_MAX_STALENESS).to_numpy()
+
+        # Rate columns: [1 (USD) | quoted rates | inverted rates]; each bank picks one
+        k = len(fx_ids)
+        with np.errstate(divide="ignore"):
+            rates = np.hstack([np.ones((len(grid), 1)), fx, 1.0 / fx])
+        column = np.array(
+            [
+                0 if currency == "USD" else 1 + foreign.index(currency) + (
+                    0 if FX_QUOTES[currency].usd_per_unit else k
+                )
+                for currency in currencies
+            ]
+        )
+        usd = assets * np.asarray(scales) * rates[:, column]
+        return pd.DataFrame(usd, index=grid, columns=banks)
+
+    def calculate(
+        self,
+        df: pd.DataFrame,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        freq: str = "W-WED",
+        persist: bool = False,
+    ) -> pd.DataFrame:
+        """Compute the Global Liquidity Index.
+
+        Args:
+            df: Long-format CB and FX rows (see ``components``).
+            start: First grid point.
+            end: Last grid point.
+            freq: Grid frequency (pandas alias).
+            persist: Also write the index to liquidity_indexes.
+
+        Returns:
+            DataFrame with timestamp, global_liquidity, unit ("millions_usd").
+
+        Raises:
+            ValueError: If inputs are missing (see ``components``) or
+                persist is set without a storage.
+        """
+        usd = self.components(df, start, end, freq)
+        values = usd.to_numpy()
+        complete = ~np.isnan(values).any(axis=1)
+        result = pd.DataFrame(
+            {
+                "timestamp": usd.index[complete],
+                "global_liquidity": values[complete].sum(axis=1),
+                "unit": "millions_usd",
+            }
+        )
+
+        if persist and not result.empty:
+            if self.storage is None:
+                raise ValueError("persist=True requires a storage")
+            self.storage.ingest_dataframe(
+                LIQUIDITY_INDEXES_TABLE,
+                pd.DataFrame(
+                    {
+                        "timestamp": result["timestamp"],
+                        "index_name": INDEX_NAME,
+                        "value": result["global_liquidity"],
+                    }
+                ),
+            )
+
+        logger.info(
+            "Calculated Global Liquidity from %d banks: %d points, latest=%.0f (millions USD)",
+            usd.shape[1],
+            len(result),
+            result["global_liquidity"].iloc[-1] if len(result) > 0 else 0,
+        )
+        return result
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"GlobalLiquidityCalculator(storage={self.storage!r})"
@@ -0,0 +1,331 @@
+"""Dependency-graph recomputation of derived series.
+
+Every raw ``series_id`` in raw_data and every derived series written to
+liquidity_indexes is a node; each ``DerivedSeries`` adds edges from the
+series its expression references (raw or derived) to itself. Each node
+tracks a dirty time range:
+- ingesting raw rows marks a raw node dirty over the timestamps whose values
+  are new or changed
+- a dirty range on an input spreads to its dependents up to the input's next
+  observation (as-of matching cannot reach past it)
+- nodes are recomputed in topological order, each only over its own dirty
+  range, and only points whose value changes are written and spread further
+
+Work per update therefore grows with the size of the change, not with the
+number of definitions: a new SOFR print never touches Net Liquidity, and a
+new WALCL print recomputes one Net Liquidity point.
+"""
+
+import logging
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from graphlib import CycleError, TopologicalSorter
+
+import numpy as np
+import pandas as pd
+
+from liquidity.calculations.alignment import Staleness
+from liquidity.calculations.expressions import (
+    DERIVED_SERIES,
+    CompiledExpression,
+    DerivedSeries,
+    ExpressionError,
+    evaluate,
+    known_series,
+)
+from liquidity.calculations.observations import OPEN_END, DirtyRange, Observations
+from liquidity.frames import naive_utc_ns
+from liquidity.scheduler import ReleaseEvent
+from liquidity.storage.backend import Storage
+from liquidity.storage.schemas import LIQUIDITY_INDEXES_TABLE
+from liquidity.units import conversion_factors
+
+logger = logging.getLogger(__name__)
+
+GraphCallback = Callable[[pd.DataFrame], None]
+
+@dataclass
+class _Node:
+    """One series in the graph."""
+
+    name: str
+    unit: str
+    dependents: list[str] = field(default_factory=list)
+    observations: Observations = field(default_factory=Observations)
+    dirty: DirtyRange | None = None
+
+
+class DependencyGraph:
+    """Recompute derived series incrementally from raw series changes.
+
+    Example:
+        graph = DependencyGraph(storage=storage, max_staleness=MAX_STALENESS)
+        graph.prime(storage.load_frame("raw_data", graph.raw_series))
+        scheduler.subscribe(graph.on_release)
+
+        # Or feed collector output directly; returns only changed points
+        changed = graph.ingest(df)
+    """
+
+    def __init__(
+        self,
+        definitions: Iterable[DerivedSeries] | None = None,
+        storage: Storage | None = None,
+        max_staleness: Staleness = None,
+    ) -> None:
+        """Build the graph.
+
+        Args:
+            definitions: Derived series to maintain. Defaults to
+                ``DERIVED_SERIES``. Expressions may reference raw series or
+                other definitions by name.
+            storage: Optional storage; changed points are written to
+                liquidity_indexes with the definition name as index_name.
+            max_staleness: Staleness limits for as-of matching of inputs.
+
+        Raises:
+            ExpressionError: If a definition is invalid, duplicated or part
+                of a dependency cycle.
+        """
+        definitions = list(DERIVED_SERIES.values() if definitions is None else definitions)
+        self.storage = storage
+        self.max_staleness = max_staleness
+        self._subscribers: list[GraphCallback] = []
+
+        names = [definition.name for definition in definitions]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ExpressionError(f"Duplicate derived series: {duplicates}")
+        self._units = {
+            **known_series(),
+            **{definition.name: definition.unit for definition in definitions},
+        }
+
+        # Derived series and their expressions compiled against raw + derived units
+        self._derived: dict[str, tuple[DerivedSeries, CompiledExpression]] = {
+            definition.name: (definition, definition.compile(self._units))
+            for definition in definitions
+        }
+        self._nodes: dict[str, _Node] = {
+            name: _Node(name, definition.unit) for name, (definition, _) in self._derived.items()
+        }
+        for name, (_, compiled) in self._derived.items():
+            for series_id in compiled.inputs:
+                node = self._nodes.setdefault(
+                    series_id, _Node(series_id, self._units[series_id])
+                )
+                node.dependents.append(name)
+
+        sorter = TopologicalSorter(
+            {name: compiled.inputs for name, (_, compiled) in self._derived.items()}
+        )
+        try:
+            self._order = list(sorter.static_order())
+        except CycleError as e:
+            raise ExpressionError(f"Dependency cycle in derived series: {e.args[1]}") from e
+
+    @property
+    def raw_series(self) -> list[str]:
+        """Raw series ids the graph depends on."""
+        return [name for name in self._order if name not in self._derived]
+
+    @property
+    def order(self) -> list[str]:
+        """All nodes in topological (evaluation) order."""
+        return list(self._order)
+
+    def dependents(self, series_id: str) -> set[str]:
+        """Derived series affected, directly or transitively, by ``series_id``."""
+        result: set[str] = set()
+        pending = list(self._nodes[series_id].dependents) if series_id in self._nodes else []
+        while pending:
+            name = pending.pop()
+            if name not in result:
+                result.add(name)
+                pending.extend(self._nodes[name].dependents)
+        return result
+
+    def rows(self, names: Iterable[str]) -> pd.DataFrame:
+        """Stored observations of nodes as long-format rows.
+
+        Raw series are in their catalog units, derived series in their
+        declared units.
+
+        Args:
+            names: Raw or derived series in the graph.
+
+        Returns:
+            DataFrame with timestamp, series_id, value, unit, by series then
+            timestamp.
+
+        Raises:
+            KeyError: If a name is not a node of the graph.
+        """
+        frames = [
+            pd.DataFrame(
+                {
+                    "timestamp": self._nodes[name].observations.times.view("datetime64[ns]"),
+                    "series_id": name,
+                    "value": self._nodes[name].observations.values,
+                    "unit": self._nodes[name].unit,
+                }
+            )
+            for name in names
+        ]
+        if not frames:
+            return pd.DataFrame(columns=["timestamp", "series_id", "value", "unit"])
+        return pd.concat(frames, ignore_index=True)
+
+    def dirty(self) -> dict[str, DirtyRange]:
+        """Nodes currently marked dirty."""
+        return {name: node.dirty for name, node in self._nodes.items() if node.dirty}
+
+    def subscribe(self, callback: GraphCallback) -> None:
+        """Register a callback invoked with every non-empty batch of changed points."""
+        self._subscribers.append(callback)
+
+    def mark_dirty(self, name: str, start: pd.Timestamp, end: pd.Timestamp = OPEN_END) -> None:
+        """Force a derived series to be recomputed over a range (e.g. after a fix).
+
+        Raises:
+            KeyError: If ``name`` is not a derived series in the graph.
+        """
+        if name not in self._derived:
+            raise KeyError(f"{name} is not a derived series")
+        node = self._nodes[name]
+        node.dirty = DirtyRange(pd.Timestamp(start), pd.Timestamp(end)).union(node.dirty)
+
+    def prime(self, df: pd.DataFrame) -> None:
+        """Load history and compute every derived series without writing or notifying.
+
+        Args:
+            df: Long-format raw rows (timestamp, series_id, value, unit).
+        """
+        self._apply(df)
+        self._recompute(emit=False)
+
+    def ingest(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply raw rows and recompute only the derived points they change.
+
+        Rows for series outside the graph are ignored.
+
+        Args:
+            df: Long-format raw rows (timestamp, series_id, value, unit).
+
+        Returns:
+            DataFrame with timestamp, index_name, value for new or changed
+            derived points, in topological then timestamp order.
+
+        Raises:
+            UnitError: If a row's unit is not of its series' dimension.
+        """
+        self._apply(df)
+        return self._recompute(emit=True)
+
+    def recompute_dirty(self) -> pd.DataFrame:
+        """Recompute nodes marked with ``mark_dirty`` (see ``ingest``)."""
+        return self._recompute(emit=True)
+
+    async def on_release(self, event: ReleaseEvent) -> None:
+        """Scheduler handler: ingest a release's rows."""
+        if event.series_id in self._nodes:
+            self.ingest(event.data)
+
+    def _apply(self, df: pd.DataFrame) -> None:
+        """Upsert raw rows (in catalog units) and mark changed ranges dirty."""
+        rows = df[df["series_id"].isin(self.raw_series) & df["value"].notna()]
+        for series_id, group in rows.groupby("series_id", sort=False, observed=True):
+            node = self._nodes[str(series_id)]
+            times = naive_utc_ns(group["timestamp"])
+            values = group["value"].to_numpy(dtype="float64")
+            if "unit" in group.columns:
+                values = values * conversion_factors(group["unit"], node.unit)
+            changed = node.observations.upsert(times, values)
+            if len(changed):
+                node.dirty = DirtyRange(
+                    pd.Timestamp(int(changed.min())), pd.Timestamp(int(changed.max()))
+                ).union(node.dirty)
+
+    def _recompute(self, emit: bool) -> pd.DataFrame:
+        """Walk the graph in topological order, recomputing dirty nodes."""
+        frames: list[pd.DataFrame] = []
+        for name in self._order:
+            node = self._nodes[name]
+            if node.dirty is None:
+                continue
+            dirty, node.dirty = node.dirty, None
+            if name not in self._derived:
+                # Raw node: its dirty range holds the changed observations
+                changed = node.observations.between(dirty)
+            else:
+                changed = self._evaluate(name, dirty)
+                if len(changed):
+                    idx = np.searchsorted(node.observations.times, changed)
+                    frames.append(
+                        pd.DataFrame(
+                            {
+                                "timestamp": changed.view("datetime64[ns]"),
+                                "index_name": name,
+                                "value": node.observations.values[idx],
+                            }
+                        )
+                    )
+            if len(changed):
+                reach = node.observations.reach(changed)
+                for dependent in node.dependents:
+                    target = self._nodes[dependent]
+                    target.dirty = reach.union(target.dirty)
+
+        if not frames:
+            return pd.DataFrame(columns=["timestamp", "index_name", "value"])
+        result = pd.concat(frames, ignore_index=True)
+        if emit:
+            logger.info(
+                "Derived series updated: %s",
+                result.groupby("index_name", sort=False).size().to_dict(),
+            )
+            if self.storage is not None:
+                self.storage.ingest_dataframe(LIQUIDITY_INDEXES_TABLE, result)
+            for callback in self._subscribers:
+                callback(result)
+        return result
+
+    def _evaluate(self, name: str, dirty: DirtyRange) -> np.ndarray:
+        """Recompute a derived node over ``dirty``; return the changed timestamps."""
+        definition, compiled = self._derived[name]
+        anchor = self._nodes[definition.anchor_of(compiled)]
+        points = anchor.observations.between(dirty)
+        if not len(points):
+            return points
+
+        frames = []
+        for series_id in compiled.inputs:
+            times, values = self._nodes[series_id].observations.window(dirty)
+            if not len(times):
+                # No observation of this input up to the range yet: no point exists
+                return points[:0]
+            frames.append(
+                pd.DataFrame(
+                    {
+                        "timestamp": times.view("datetime64[ns]"),
+                        "series_id": series_id,
+                        "value": values,
+                        "unit": self._units[series_id],
+                    }
+                )
+            )
+        grid = pd.DatetimeIndex(points.view("datetime64[ns]"), name="timestamp")
+        values = evaluate(
+            [definition],
+            pd.concat(frames, ignore_index=True),
+            grid=grid,
+            max_staleness=self.max_staleness,
+            units=self._units,
+        )[name].to_numpy()
+        valid = ~np.isnan(values)
+        return self._nodes[name].observations.upsert(points[valid], values[valid])
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        derived = len(self._derived)
+        return f"DependencyGraph(raw={len(self._nodes) - derived}, derived={derived})"
@@ -0,0 +1,160 @@
+"""Incremental (streaming) Hayes Net Liquidity.
+
+Net Liquidity = WALCL - WLRRAL - WDTGAL, in millions USD, on WALCL timestamps
+with RRP and TGA matched as-of (latest observation at or before each WALCL
+timestamp, within MAX_STALENESS). This is ``DERIVED_SERIES["net_liquidity"]``,
+the definition FredCollector.calculate_net_liquidity and DependencyGraph
+evaluate, so all of them write the same "net_liquidity" values.
+
+NetLiquidityEngine is a DependencyGraph holding only that definition. Every
+new observation recomputes only the Net Liquidity points it affects:
+- A WALCL observation affects exactly its own point
+- An RRP/TGA observation affects the WALCL points from its timestamp up to
+  its next observation, which for in-order data is at most the latest point
+
+Only new or changed points are emitted, written to liquidity_indexes and
+pushed to subscribers. ``recompute`` rebuilds the full history with one
+vectorized evaluation of the definition for verification.
+"""
+
+import logging
+from collections.abc import Callable
+
+import pandas as pd
+
+from liquidity.calculations.alignment import Staleness
+from liquidity.calculations.expressions import DERIVED_SERIES, MAX_STALENESS
+from liquidity.calculations.graph import DependencyGraph
+from liquidity.scheduler import ReleaseEvent
+from liquidity.storage.backend import Storage
+from liquidity.storage.schemas import LIQUIDITY_INDEXES_TABLE
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "net_liquidity"
+NET_LIQUIDITY = DERIVED_SERIES[INDEX_NAME]
+ASSETS_SERIES = "WALCL"
+# Series subtracted from Fed assets (matched as-of to WALCL timestamps)
+DRAIN_SERIES = ("WLRRAL", "WDTGAL")
+INPUT_SERIES = (ASSETS_SERIES, *DRAIN_SERIES)
+
+NetLiquidityCallback = Callable[[pd.DataFrame], None]
+
+
+def _result_frame(timestamps: pd.Series, values: pd.Series) -> pd.DataFrame:
+    """Build the standard Net Liquidity output frame."""
+    return pd.DataFrame(
+        {
+            "timestamp": pd.DatetimeIndex(timestamps).as_unit("ns"),
+            "net_liquidity": values.to_numpy(dtype="float64"),
+            "unit": NET_LIQUIDITY.unit,
+        }
+    )
+
+
+class NetLiquidityEngine:
+    """Streaming Net Liquidity calculator.
+
+    Example:
+        engine = NetLiquidityEngine(storage=storage)
+        engine.prime(storage.load_frame("raw_data", ["WALCL", "WLRRAL", "WDTGAL"]))
+        scheduler.subscribe(engine.on_release)
+
+        # Or feed collector output directly; returns only new/changed points
+        changed = engine.update(df)
+    """
+
+    def __init__(
+        self, storage: Storage | None = None, max_staleness: Staleness = MAX_STALENESS
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            storage: Optional storage; emitted points are written to
+                liquidity_indexes as index_name "net_liquidity".
+            max_staleness: Staleness limits for as-of matching of RRP and
+                TGA. Defaults to the limits the collectors use.
+        """
+        self.storage = storage
+        self.max_staleness = max_staleness
+        self._graph = DependencyGraph([NET_LIQUIDITY], max_staleness=max_staleness)
+        self._subscribers: list[NetLiquidityCallback] = []
+
+    def subscribe(self, callback: NetLiquidityCallback) -> None:
+        """Register a callback invoked with every non-empty batch of changed points."""
+        self._subscribers.append(callback)
+
+    def prime(self, df: pd.DataFrame) -> None:
+        """Load history without emitting, writing or notifying.
+
+        Use on startup with rows already stored, so later updates only emit
+        points that actually change.
+
+        Args:
+            df: Long-format rows (timestamp, series_id, value, unit).
+        """
+        self._graph.prime(df)
+
+    def update(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply new observations and return the Net Liquidity points they change.
+
+        Rows for other series are ignored. Several rows for the same
+        timestamp in one batch (e.g. a whole H.4.1 release) yield at most one
+        point per timestamp.
+
+        Args:
+            df: Long-format rows (timestamp, series_id, value, unit).
+
+        Returns:
+            DataFrame with timestamp, net_liquidity, unit ("millions_usd") for
+            new or changed points only, sorted by timestamp.
+
+        Raises:
+            UnitError: If an input row is not a USD amount.
+        """
+        changed = self._graph.ingest(df)
+        result = _result_frame(changed["timestamp"], changed["value"])
+        if result.empty:
+            return result
+
+        logger.info(
+            "Net Liquidity updated: %d point(s), latest=%.0f (millions USD)",
+            len(result),
+            result["net_liquidity"].iloc[-1],
+        )
+        if self.storage is not None:
+            self.storage.ingest_dataframe(
+                LIQUIDITY_INDEXES_TABLE,
+                pd.DataFrame(
+                    {
+                        "timestamp": result["timestamp"],
+                        "index_name": INDEX_NAME,
+                        "value": result["net_liquidity"],
+                    }
+                ),
+            )
+        for callback in self._subscribers:
+            callback(result)
+        return result
+
+    async def on_release(self, event: ReleaseEvent) -> None:
+        """Scheduler handler: update from a release's rows."""
+        if event.series_id in INPUT_SERIES:
+            self.update(event.data)
+
+    def recompute(self) -> pd.DataFrame:
+        """Recompute the full history from the engine's inputs (vectorized).
+
+        Returns:
+            DataFrame with timestamp, net_liquidity, unit for every WALCL
+            timestamp that has RRP and TGA observations within the staleness
+            limits at or before it.
+        """
+        full = NET_LIQUIDITY.calculate(
+            self._graph.rows(INPUT_SERIES), max_staleness=self.max_staleness
+        )
+        return _result_frame(full["timestamp"], full[INDEX_NAME])
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"NetLiquidityEngine(points={len(self._graph.rows([INDEX_NAME]))})"
@@ -0,0 +1,278 @@
+"""Daily Net Liquidity nowcast.
+
+The weekly Net Liquidity (WALCL - WLRRAL - WDTGAL) is known only once the
+H.4.1 is published, up to a week after the Wednesday it describes. The TGA
+and RRP drains are published daily (Daily Treasury Statement, NY Fed ON RRP
+results), so the nowcast combines the latest WALCL, matched as-of, with the
+daily drains:
+
+    nowcast(d) = WALCL(d) - [RRP_DAILY(d) + basis_rrp(d)] - [TGA_DAILY(d) + basis_tga(d)]
+
+The daily and weekly drains differ in coverage (WLRRAL includes the foreign
+official repo pool, which ON RRP results do not), so each H.4.1 print
+reconciles the nowcast: the basis of each drain (weekly print minus the daily
+value as of the same Wednesday) is carried forward to every later day. On a
+print date the nowcast therefore equals the official weekly figure, and the
+difference from the value nowcast before the print is recorded as the
+nowcast error. Where a daily series has no observation yet the weekly drain
+is used as-is.
+
+All inputs are converted to millions USD. ``update`` recomputes only the days
+from the earliest new or revised observation.
+"""
+
+import logging
+from collections.abc import Callable, Mapping
+
+import numpy as np
+import pandas as pd
+
+from liquidity.calculations.alignment import asof_lookup
+from liquidity.calculations.observations import Observations
+from liquidity.frames import naive_utc_ns
+from liquidity.scheduler import ReleaseEvent
+from liquidity.storage.backend import Storage
+from liquidity.storage.schemas import LIQUIDITY_INDEXES_TABLE
+from liquidity.units import conversion_factors
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "net_liquidity_nowcast"
+ASSETS_SERIES = "WALCL"
+# Weekly H.4.1 drains and the daily series that nowcast them
+DAILY_DRAINS: dict[str, str] = {
+    "WLRRAL": "RRP_DAILY",
+    "WDTGAL": "TGA_DAILY",
+}
+INPUT_SERIES = (ASSETS_SERIES, *DAILY_DRAINS, *DAILY_DRAINS.values())
+
+NowcastCallback = Callable[[pd.DataFrame], None]
+
+
+def _input_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """Input rows with int64 ns timestamps and values in millions USD."""
+    rows = df[df["series_id"].isin(INPUT_SERIES) & df["value"].notna()]
+    values = rows["value"].to_numpy(dtype="float64")
+    if "unit" in rows.columns:
+        values = values * conversion_factors(rows["unit"], "millions_usd")
+    return pd.DataFrame(
+        {"timestamp": naive_utc_ns(rows["timestamp"]), "series_id": rows["series_id"], "value": values}
+    )
+
+
+def _asof(observations: Observations, grid: pd.DatetimeIndex) -> np.ndarray:
+    """Sample one input onto the grid as-of."""
+    return asof_lookup(observations.times.view("datetime64[ns]"), observations.values, grid)
+
+
+def _compute(times: np.ndarray, series: Mapping[str, Observations]) -> pd.DataFrame:
+    """Nowcast at ``times`` (int64 ns) from every input's full history."""
+    grid = pd.DatetimeIndex(times.view("datetime64[ns]"), name="timestamp")
+    drains: list[np.ndarray] = []
+    for weekly_id, daily_id in DAILY_DRAINS.items():
+        weekly, daily = series[weekly_id], series[daily_id]
+        prints = pd.DatetimeIndex(weekly.times.view("datetime64[ns]"))
+        basis = weekly.values - _asof(daily, prints)
+        known = ~np.isnan(basis)
+        carried = asof_lookup(prints[known], basis[known], grid)
+        daily_now = _asof(daily, grid)
+        drains.append(
+            np.where(np.isnan(daily_now), _asof(weekly, grid), daily_now + np.nan_to_num(carried))
+        )
+
+    assets = _asof(series[ASSETS_SERIES], grid)
+    rrp, tga = drains
+    return pd.DataFrame(
+        {
+            "timestamp": grid,
+            "walcl": assets,
+            "rrp": rrp,
+            "tga": tga,
+            "value": assets - rrp - tga,
+            "official": np.isin(times, series[ASSETS_SERIES].times),
+        }
+    )
+
+
+class NetLiquidityNowcast:
+    """Daily Net Liquidity from daily TGA/RRP and the latest weekly WALCL.
+
+    Example:
+        nowcast = NetLiquidityNowcast(storage=storage)
+        history = nowcast.batch(pd.concat([fred_df, treasury_df, nyfed_df]))
+
+        nowcast.prime(stored_rows)
+        scheduler.subscribe(nowcast.on_release)
+        nowcast.value  # latest nowcast, hours after the daily releases
+        nowcast.errors  # nowcast vs H.4.1 on each reconciled print
+    """
+
+    def __init__(self, storage: Storage | None = None) -> None:
+        """Initialize the engine.
+
+        Args:
+            storage: Optional storage; recomputed days are written to
+                liquidity_indexes as index_name "net_liquidity_nowcast".
+        """
+        self.storage = storage
+        self._observations = {series_id: Observations() for series_id in INPUT_SERIES}
+        # Nowcast days (int64 ns), values and whether each is an H.4.1 print date
+        self._grid = np.empty(0, dtype="int64")
+        self._values = np.empty(0, dtype="float64")
+        self._official = np.empty(0, dtype=bool)
+        # Print date -> (value nowcast before the print, official value)
+        self._errors: dict[int, tuple[float, float]] = {}
+        self._subscribers: list[NowcastCallback] = []
+
+    @property
+    def value(self) -> float | None:
+        """Latest nowcast in millions USD (None before any day)."""
+        return float(self._values[-1]) if len(self._values) else None
+
+    @property
+    def errors(self) -> pd.DataFrame:
+        """Nowcast error on each reconciled print: timestamp, nowcast, official, error."""
+        times = np.fromiter(self._errors, dtype="int64", count=len(self._errors))
+        pairs = np.array(list(self._errors.values()), dtype="float64").reshape(-1, 2)
+        order = np.argsort(times)
+        return pd.DataFrame(
+            {
+                "timestamp": times[order].view("datetime64[ns]"),
+                "nowcast": pairs[order, 0],
+                "official": pairs[order, 1],
+                "error": pairs[order, 1] - pairs[order, 0],
+            }
+        )
+
+    def subscribe(self, callback: NowcastCallback) -> None:
+        """Register a callback invoked with every non-empty batch of recomputed days."""
+        self._subscribers.append(callback)
+
+    def batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Compute the nowcast for a whole history (engine state untouched).
+
+        Args:
+            df: Long-format rows of WALCL, WLRRAL, WDTGAL, RRP_DAILY and
+                TGA_DAILY (timestamp, series_id, value, unit).
+
+        Returns:
+            DataFrame with one row per day from the first WALCL print:
+            timestamp, walcl, rrp, tga (drains after reconciliation), value
+            and official (True on H.4.1 print dates).
+        """
+        rows = _input_rows(df)
+        series = {series_id: Observations() for series_id in INPUT_SERIES}
+        for series_id, group in rows.groupby("series_id", sort=False, observed=True):
+            series[str(series_id)].upsert(
+                group["timestamp"].to_numpy(), group["value"].to_numpy()
+            )
+        return _compute(self._days(series, None), series)
+
+    def prime(self, df: pd.DataFrame) -> None:
+        """Load history without writing or notifying.
+
+        Args:
+            df: Long-format input rows.
+        """
+        self._apply(df)
+
+    def update(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply new observations and return the days they change.
+
+        A daily release changes its own day (and any later days); a weekly
+        print changes the days from its Wednesday, each now reconciled to it.
+
+        Args:
+            df: Long-format input rows.
+
+        Returns:
+            Recomputed days with the ``batch`` columns (empty if nothing changed).
+        """
+        result = self._apply(df)
+        if result.empty:
+            return result
+
+        logger.info(
+            "Net Liquidity nowcast updated: %d day(s), latest=%.0f",
+            len(result),
+            result["value"].iloc[-1],
+        )
+        if self.storage is not None:
+            valid = result["value"].notna()
+            self.storage.ingest_dataframe(
+                LIQUIDITY_INDEXES_TABLE,
+                pd.DataFrame(
+                    {
+                        "timestamp": result["timestamp"][valid],
+                        "index_name": INDEX_NAME,
+                        "value": result["value"][valid],
+                    }
+                ),
+            )
+        for callback in self._subscribers:
+            callback(result)
+        return result
+
+    async def on_release(self, event: ReleaseEvent) -> None:
+        """Scheduler handler: update from a release's rows."""
+        if event.series_id in INPUT_SERIES:
+            self.update(event.data)
+
+    @staticmethod
+    def _days(series: Mapping[str, Observations], first: int | None) -> np.ndarray:
+        """Observation days of any input from the first WALCL print (and ``first``)."""
+        assets = series[ASSETS_SERIES].times
+        if not len(assets):
+            return np.empty(0, dtype="int64")
+        start = max(int(assets[0]), first if first is not None else int(assets[0]))
+        return np.unique(
+            np.concatenate(
+                [obs.times[np.searchsorted(obs.times, start) :] for obs in series.values()]
+            )
+        )
+
+    def _apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Merge rows, recompute the days from the earliest change and reconcile prints."""
+        rows = _input_rows(df)
+        changes = []
+        for series_id, group in rows.groupby("series_id", sort=False, observed=True):
+            changed = self._observations[str(series_id)].upsert(
+                group["timestamp"].to_numpy(), group["value"].to_numpy()
+            )
+            if len(changed):
+                changes.append(int(changed.min()))
+        if not changes:
+            return _compute(np.empty(0, dtype="int64"), self._observations)
+
+        first = min(changes)
+        kept = int(np.searchsorted(self._grid, first))
+        days = _compute(self._days(self._observations, first), self._observations)
+
+        # Days nowcast before this update that are now H.4.1 print dates
+        times = days["timestamp"].to_numpy().view("int64")
+        values = days["value"].to_numpy()
+        official = days["official"].to_numpy()
+        previous = np.searchsorted(self._grid, times)
+        found = previous < len(self._grid)
+        found[found] = self._grid[previous[found]] == times[found]
+        for i in np.flatnonzero(official & found):
+            ts, value = int(times[i]), float(values[i])
+            if ts in self._errors:
+                self._errors[ts] = (self._errors[ts][0], value)
+            elif not self._official[previous[i]]:
+                nowcast = float(self._values[previous[i]])
+                self._errors[ts] = (nowcast, value)
+                logger.info(
+                    "Nowcast reconciled with H.4.1 print of %s: error=%.0f",
+                    pd.Timestamp(ts).date(),
+                    value - nowcast,
+                )
+
+        self._grid = np.concatenate([self._grid[:kept], times])
+        self._values = np.concatenate([self._values[:kept], values])
+        self._official = np.concatenate([self._official[:kept], official])
+        return days
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"NetLiquidityNowcast(days={len(self._grid)}, value={self.value})"
@@ -0,0 +1,90 @@
+"""Sorted per-series observations for the incremental engines.
+
+Each engine keeps the observations of its inputs as parallel int64 ns /
+float64 arrays, upserts new rows with one ``searchsorted`` and learns which
+timestamps actually changed, so it recomputes only what those changes reach.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+# Open end of a dirty range (recompute through the latest point)
+OPEN_END = pd.Timestamp.max
+
+
+@dataclass(frozen=True)
+class DirtyRange:
+    """Inclusive time range of a node that needs recomputing.
+
+    Attributes:
+        start: First affected timestamp (naive UTC).
+        end: Last affected timestamp; ``OPEN_END`` for "through the latest".
+    """
+
+    start: pd.Timestamp
+    end: pd.Timestamp
+
+    def union(self, other: "DirtyRange | None") -> "DirtyRange":
+        """Smallest range covering both."""
+        if other is None:
+            return self
+        return DirtyRange(min(self.start, other.start), max(self.end, other.end))
+
+
+class Observations:
+    """Sorted observations of one series as int64 ns / float64 arrays.
+
+    Shared by the incremental engines (DependencyGraph, StealthQEEngine,
+    NetLiquidityNowcast) to merge new rows and find what changed.
+    """
+
+    def __init__(self) -> None:
+        self.times = np.empty(0, dtype="int64")
+        self.values = np.empty(0, dtype="float64")
+
+    def upsert(self, times: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Insert or replace observations; return the timestamps that changed (sorted)."""
+        if not len(times):
+            return times
+        order = np.argsort(times, kind="stable")
+        times, values = times[order], values[order]
+        # Last row of a duplicate timestamp wins
+        last = np.append(times[1:] != times[:-1], True)
+        times, values = times[last], values[last]
+
+        idx = np.searchsorted(self.times, times)
+        exists = np.zeros(len(times), dtype=bool)
+        same = np.zeros(len(times), dtype=bool)
+        if len(self.times):
+            clipped = np.minimum(idx, len(self.times) - 1)
+            exists = (idx < len(self.times)) & (self.times[clipped] == times)
+            same = exists & (self.values[clipped] == values)
+
+        replace = exists & ~same
+        self.values[idx[replace]] = values[replace]
+        insert = ~exists
+        self.times = np.insert(self.times, idx[insert], times[insert])
+        self.values = np.insert(self.values, idx[insert], values[insert])
+        changed: np.ndarray = times[~same]
+        return changed
+
+    def reach(self, changed: np.ndarray) -> DirtyRange:
+        """Range of as-of points affected by changes at ``changed`` timestamps."""
+        i = np.searchsorted(self.times, changed.max(), side="right")
+        end = OPEN_END if i >= len(self.times) else pd.Timestamp(int(self.times[i]) - 1)
+        return DirtyRange(pd.Timestamp(int(changed.min())), end)
+
+    def window(self, dirty: DirtyRange) -> tuple[np.ndarray, np.ndarray]:
+        """Observations inside ``dirty`` plus the last one before it."""
+        lo = max(int(np.searchsorted(self.times, dirty.start.value, side="right")) - 1, 0)
+        hi = int(np.searchsorted(self.times, dirty.end.value, side="right"))
+        return self.times[lo:hi], self.values[lo:hi]
+
+    def between(self, dirty: DirtyRange) -> np.ndarray:
+        """Observation timestamps inside ``dirty``."""
+        lo = np.searchsorted(self.times, dirty.start.value, side="left")
+        hi = np.searchsorted(self.times, dirty.end.value, side="right")
+        result: np.ndarray = self.times[lo:hi]
+        return result
@@ -0,0 +1,395 @@
+"""Vectorized Stealth QE score and volatility panel.
+
+Port of the spreadsheet tracker (Apps Script v3.4.1, ``calculateRMPMetrics``
+and ``downloadVolatilityData``) to whole-history array operations over one
+as-of aligned frame of FRED (WALCL, WLRRAL, WDTGAL, VIXCLS, VXVCLS) and Yahoo
+(^MOVE) rows. The grid is the union of all observation timestamps, each series
+carried forward to every grid point, as the script's forward fill does.
+
+Volatility panel, per VIX / VIX3M / MOVE:
+- deltas over 1, 3, 7 and 14 bars
+- z-score of the current value against the mean and population standard
+  deviation of the previous 20 bars (a window with too few observations gives
+  NaN; a flat window gives 0)
+- VIX/VIX3M ratio and a volatility signal from fixed thresholds
+
+Stealth QE score (0-100), from the change over 7 bars of:
+- RRP velocity (percent change of the RRP facility): 40% weight, full at -20%
+- TGA spending (drawdown of the TGA, billions USD): 40% weight, full at 200
+- Fed total assets growth (billions USD): 20% weight, full at 100
+The score moves at most 25 points per bar once it is positive.
+
+Deltas, z-scores (via a strided window view) and components are computed for
+all bars in a few numpy operations; only the 25-point rate limit is a running
+recurrence, a single pass over floats. ``update`` recomputes just the bars
+from the earliest new observation (plus the 20-bar lookback), so a new daily
+bar or a late H.4.1 print costs the same whatever the length of the history.
+"""
+
+import logging
+from collections.abc import Callable
+from enum import StrEnum
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from liquidity.calculations.alignment import asof_lookup
+from liquidity.calculations.observations import Observations
+from liquidity.frames import naive_utc_ns
+from liquidity.scheduler import ReleaseEvent
+from liquidity.storage.backend import Storage
+from liquidity.storage.schemas import LIQUIDITY_INDEXES_TABLE
+from liquidity.units import conversion_factors
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "stealth_qe"
+
+# Volatility inputs by output column prefix (FRED series ids, Yahoo symbol)
+VOLATILITY_SERIES: dict[str, str] = {
+    "vix": "VIXCLS",
+    "vix3m": "VXVCLS",
+    "move": "^MOVE",
+}
+# Fed balance sheet inputs (converted to billions USD)
+FED_SERIES = "WALCL"
+RRP_SERIES = "WLRRAL"
+TGA_SERIES = "WDTGAL"
+LIQUIDITY_SERIES = (FED_SERIES, RRP_SERIES, TGA_SERIES)
+INPUT_SERIES = (*LIQUIDITY_SERIES, *VOLATILITY_SERIES.values())
+
+# Volatility settings (VOL_CONFIG)
+ZSCORE_WINDOW = 20
+DELTA_PERIODS = (1, 3, 7, 14)
+# Minimum observations in the z-score window (80%, 30% for the sparser MOVE)
+MIN_ZSCORE_OBS: dict[str, int] = {"VIXCLS": 16, "VXVCLS": 16, "^MOVE": 6}
+
+# Stealth QE score settings (SCORE_CONFIG)
+SCORE_LAG = 7
+RRP_VELOCITY_MAX = 20.0  # percent drop for a full RRP component
+TGA_SPENDING_MAX = 200.0  # billions USD drawdown for a full TGA component
+FED_CHANGE_MAX = 100.0  # billions USD growth for a full Fed component
+WEIGHT_RRP = 0.40
+WEIGHT_TGA = 0.40
+WEIGHT_FED = 0.20
+MAX_DAILY_CHANGE = 25.0
+# RRP below this level (billions USD) is treated as drained
+RRP_FLOOR = 0.5
+# Score above which Stealth QE is considered active (ALERTS)
+STEALTH_QE_ACTIVATED = 60.0
+
+# Volatility signal thresholds
+VIX_SPIKE = 30.0
+VIX_ZSCORE_EXTREME = 2.0
+VIX_HIGH = 25.0
+VIX_RATIO_BACKWARDATION = 1.05
+VIX_COMPLACENCY = 13.0
+VIX_ZSCORE_COMPLACENCY = -1.5
+VIX_RISK_ON = 18.0
+VIX_RATIO_RISK_ON = 0.95
+
+# Bars needed before the first recomputed bar to reproduce its outputs
+LOOKBACK = max(ZSCORE_WINDOW, *DELTA_PERIODS, SCORE_LAG)
+
+StealthQECallback = Callable[[pd.DataFrame], None]
+
+
+class VolSignal(StrEnum):
+    """Overall volatility signal."""
+
+    HIGH_FEAR = "high_fear"
+    CAUTION = "caution"
+    COMPLACENCY = "complacency"
+    RISK_ON = "risk_on"
+    NEUTRAL = "neutral"
+
+
+def _deltas(values: np.ndarray, period: int) -> np.ndarray:
+    """Change over ``period`` bars (NaN for the first bars)."""
+    result = np.full(len(values), np.nan)
+    if len(values) > period:
+        result[period:] = values[period:] - values[:-period]
+    return result
+
+
+def _zscores(values: np.ndarray, window: int, min_obs: int) -> np.ndarray:
+    """z-score of each bar against the ``window`` bars before it."""
+    result = np.full(len(values), np.nan)
+    if len(values) <= window:
+        return result
+    # Row j holds bars j .. j + window - 1, the window of bar j + window
+    windows = sliding_window_view(values[:-1], window)
+    valid = ~np.isnan(windows)
+    count = valid.sum(axis=1)
+    current = values[window:]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(valid, windows, 0.0).sum(axis=1) / count
+        deviations = np.where(valid, windows - mean[:, None], 0.0)
+        std = np.sqrt((deviations * deviations).sum(axis=1) / count)
+        z = np.where(std == 0, 0.0, (current - mean) / std)
+    z[(count < min_obs) | np.isnan(current)] = np.nan
+    result[window:] = z
+    return result
+
+
+def _component(signal: np.ndarray, full: float) -> np.ndarray:
+    """Positive part of a signal as a percentage of ``full``, capped at 100."""
+    with np.errstate(invalid="ignore"):
+        return np.where(signal > 0, np.minimum(100.0, signal / full * 100.0), 0.0)
+
+
+def _rate_limited(raw: np.ndarray, previous: float) -> np.ndarray:
+    """Clip to 0-100, moving at most MAX_DAILY_CHANGE from a positive score."""
+    result = np.empty(len(raw))
+    for i, value in enumerate(raw.tolist()):
+        if previous > 0:
+            value = min(max(value, previous - MAX_DAILY_CHANGE), previous + MAX_DAILY_CHANGE)
+        previous = min(max(value, 0.0), 100.0)
+        result[i] = previous
+    return result
+
+
+def _compute(grid: pd.DatetimeIndex, aligned: np.ndarray, previous: float) -> pd.DataFrame:
+    """Panel and score for aligned bars (columns in INPUT_SERIES order).
+
+    Args:
+        grid: Bar timestamps.
+        aligned: float64 array of shape (bars, len(INPUT_SERIES)).
+        previous: Score of the bar before ``grid[0]`` (0 if none).
+    """
+    columns = dict(zip(INPUT_SERIES, aligned.T, strict=True))
+    panel: dict[str, np.ndarray] = {}
+    for name, series_id in VOLATILITY_SERIES.items():
+        values = columns[series_id]
+        panel[name] = values
+        for period in DELTA_PERIODS:
+            panel[f"{name}_d{period}"] = _deltas(values, period)
+        panel[f"{name}_z"] = _zscores(values, ZSCORE_WINDOW, MIN_ZSCORE_OBS[series_id])
+
+    vix, vix_z = panel["vix"], panel["vix_z"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ratio = vix / panel["vix3m"]
+        signal = np.select(
+            [
+                np.isnan(vix),
+                (vix > VIX_SPIKE) | (vix_z > VIX_ZSCORE_EXTREME),
+                (vix > VIX_HIGH) | (ratio > VIX_RATIO_BACKWARDATION),
+                (vix < VIX_COMPLACENCY) & (vix_z < VIX_ZSCORE_COMPLACENCY),
+                (vix < VIX_RISK_ON) & (ratio < VIX_RATIO_RISK_ON),
+            ],
+            [
+                VolSignal.NEUTRAL,
+                VolSignal.HIGH_FEAR,
+                VolSignal.CAUTION,
+                VolSignal.COMPLACENCY,
+                VolSignal.RISK_ON,
+            ],
+            default=VolSignal.NEUTRAL,
+        )
+    panel["vix_ratio"] = ratio
+
+    rrp = columns[RRP_SERIES]
+    prior_rrp = rrp - _deltas(rrp, SCORE_LAG)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        velocity = np.where(
+            prior_rrp > RRP_FLOOR,
+            (rrp - prior_rrp) / prior_rrp * 100.0,
+            np.where(rrp < RRP_FLOOR, 0.0, np.nan),
+        )
+    velocity[np.isnan(prior_rrp)] = np.nan
+    spending = -_deltas(columns[TGA_SERIES], SCORE_LAG)
+    fed_change = _deltas(columns[FED_SERIES], SCORE_LAG)
+    raw = (
+        WEIGHT_RRP * _component(-velocity, RRP_VELOCITY_MAX)
+        + WEIGHT_TGA * _component(spending, TGA_SPENDING_MAX)
+        + WEIGHT_FED * _component(fed_change, FED_CHANGE_MAX)
+    )
+
+    return pd.DataFrame(
+        {
+            "timestamp": grid,
+            **panel,
+            "vol_signal": signal,
+            "rrp_velocity": velocity,
+            "tga_spending": spending,
+            "fed_change": fed_change,
+            "score": _rate_limited(raw, previous),
+        }
+    )
+
+
+def _input_rows(df: pd.DataFrame) -> pd.DataFrame:
+    """Input rows keyed by series_id (Yahoo rows carry ``symbol``), liquidity in billions USD."""
+    keys = df["series_id"] if "series_id" in df.columns else pd.Series(np.nan, index=df.index)
+    if "symbol" in df.columns:
+        keys = keys.fillna(df["symbol"])
+    rows = df.assign(series_id=keys)
+    rows = rows[rows["series_id"].isin(INPUT_SERIES) & rows["value"].notna()]
+    values = rows["value"].to_numpy(dtype="float64")
+    liquidity = rows["series_id"].isin(LIQUIDITY_SERIES).to_numpy()
+    if liquidity.any():
+        values = values.copy()
+        values[liquidity] *= conversion_factors(rows["unit"][liquidity], "billions_usd")
+    return pd.DataFrame(
+        {"timestamp": naive_utc_ns(rows["timestamp"]), "series_id": rows["series_id"], "value": values}
+    )
+
+
+def _series_arrays(rows: pd.DataFrame, series_id: str) -> tuple[np.ndarray, np.ndarray]:
+    """int64 ns timestamps and values of one series' input rows."""
+    group = rows[rows["series_id"] == series_id]
+    return group["timestamp"].to_numpy(), group["value"].to_numpy()
+
+
+class StealthQEEngine:
+    """Stealth QE score and volatility panel, in batch or bar by bar.
+
+    Example:
+        engine = StealthQEEngine(storage=storage)
+        history = engine.batch(pd.concat([fred_df, yahoo_df]))  # all bars
+
+        engine.prime(stored_rows)
+        scheduler.subscribe(engine.on_release)
+        bars = engine.update(new_rows)  # only the recomputed bars
+    """
+
+    def __init__(self, storage: Storage | None = None) -> None:
+        """Initialize the engine.
+
+        Args:
+            storage: Optional storage; recomputed scores are written to
+                liquidity_indexes as index_name "stealth_qe".
+        """
+        self.storage = storage
+        self._observations = {series_id: Observations() for series_id in INPUT_SERIES}
+        # Bar timestamps (int64 ns) and their scores
+        self._grid = np.empty(0, dtype="int64")
+        self._scores = np.empty(0, dtype="float64")
+        self._subscribers: list[StealthQECallback] = []
+
+    @property
+    def score(self) -> float | None:
+        """Score of the latest bar (None before any bar)."""
+        return float(self._scores[-1]) if len(self._scores) else None
+
+    def subscribe(self, callback: StealthQECallback) -> None:
+        """Register a callback invoked with every non-empty batch of recomputed bars."""
+        self._subscribers.append(callback)
+
+    def batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Compute the panel and score for a whole history (engine state untouched).
+
+        Args:
+            df: Long-format FRED and Yahoo rows (timestamp, series_id or
+                symbol, value, unit); other series are ignored.
+
+        Returns:
+            DataFrame with one row per bar: timestamp, vix/vix3m/move levels,
+            their ``_d1``/``_d3``/``_d7``/``_d14`` deltas and ``_z`` z-scores,
+            vix_ratio, vol_signal, rrp_velocity, tga_spending, fed_change and
+            score.
+        """
+        rows = _input_rows(df)
+        times = np.unique(rows["timestamp"].to_numpy())
+        grid = pd.DatetimeIndex(times.view("datetime64[ns]"), name="timestamp")
+        aligned = np.empty((len(grid), len(INPUT_SERIES)))
+        for i, series_id in enumerate(INPUT_SERIES):
+            observations = Observations()
+            observations.upsert(*_series_arrays(rows, series_id))
+            aligned[:, i] = asof_lookup(
+                observations.times.view("datetime64[ns]"), observations.values, grid
+            )
+        return _compute(grid, aligned, 0.0)
+
+    def prime(self, df: pd.DataFrame) -> None:
+        """Load history without emitting, writing or notifying.
+
+        Args:
+            df: Long-format FRED and Yahoo rows.
+        """
+        self._apply(df)
+
+    def update(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply new observations and return the bars they change.
+
+        Only bars from the earliest new or revised observation onwards are
+        recomputed: normally just the latest bar, or the bars since a late
+        weekly print.
+
+        Args:
+            df: Long-format FRED and Yahoo rows.
+
+        Returns:
+            Recomputed bars with the ``batch`` columns (empty if nothing changed).
+        """
+        result = self._apply(df)
+        if result.empty:
+            return result
+
+        logger.info(
+            "Stealth QE updated: %d bar(s), latest score=%.1f", len(result), result["score"].iloc[-1]
+        )
+        if self.storage is not None:
+            self.storage.ingest_dataframe(
+                LIQUIDITY_INDEXES_TABLE,
+                pd.DataFrame(
+                    {
+                        "timestamp": result["timestamp"],
+                        "index_name": INDEX_NAME,
+                        "value": result["score"],
+                    }
+                ),
+            )
+        for callback in self._subscribers:
+            callback(result)
+        return result
+
+    async def on_release(self, event: ReleaseEvent) -> None:
+        """Scheduler handler: update from a release's rows."""
+        if event.series_id in INPUT_SERIES:
+            self.update(event.data)
+
+    def _apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Merge rows and recompute the bars from the earliest change."""
+        rows = _input_rows(df)
+        changed = [
+            observations.upsert(*_series_arrays(rows, series_id))
+            for series_id, observations in self._observations.items()
+        ]
+        starts = [int(times[0]) for times in changed if len(times)]
+        if not starts:
+            return _compute(
+                pd.DatetimeIndex([], name="timestamp"), np.empty((0, len(INPUT_SERIES))), 0.0
+            )
+        first = min(starts)
+
+        # Bars before the first change keep their timestamps; later ones are rebuilt
+        kept = int(np.searchsorted(self._grid, first))
+        tail = np.unique(
+            np.concatenate(
+                [
+                    obs.times[np.searchsorted(obs.times, first) :]
+                    for obs in self._observations.values()
+                ]
+            )
+        )
+        start = max(0, kept - LOOKBACK)
+        times = np.concatenate([self._grid[start:kept], tail])
+        grid = pd.DatetimeIndex(times.view("datetime64[ns]"), name="timestamp")
+        aligned = np.column_stack(
+            [
+                asof_lookup(obs.times.view("datetime64[ns]"), obs.values, grid)
+                for obs in self._observations.values()
+            ]
+        )
+        previous = float(self._scores[start - 1]) if start else 0.0
+        bars = _compute(grid, aligned, previous).iloc[kept - start :].reset_index(drop=True)
+
+        self._grid = np.concatenate([self._grid[:kept], tail])
+        self._scores = np.concatenate([self._scores[:kept], bars["score"].to_numpy()])
+        return bars
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"StealthQEEngine(bars={len(self._grid)}, score={self.score})"
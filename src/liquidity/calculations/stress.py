@@ -0,0 +1,363 @@
+"""Single-pass stress indicator panel.
+
+Each stress indicator is a ``DerivedSeries`` (a level such as SOFR or HY OAS,
+or a spread such as DGS10 - DGS2) with an optional threshold. The whole panel
+is computed from one as-of aligned frame of its inputs:
+- values: every definition evaluated in one ``evaluate`` pass
+- percentiles: rank of each value within its trailing window of observations
+  (share of the window at or below it, 0-100), from a strided window view
+- breaches: value beyond the indicator's threshold (above it, or below it for
+  indicators where low values signal stress, such as an inverted curve)
+
+New indicators (SOFR-OIS, FRA-OIS, cross-currency basis) are new definitions,
+not new code. ``update`` feeds rows through a dependency graph so only
+changed points are re-evaluated, then re-ranks only the points whose window
+includes a change; ``lookup`` serves the latest panel from memory.
+"""
+
+import logging
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from liquidity.calculations.alignment import Staleness
+from liquidity.calculations.expressions import DERIVED_SERIES, DerivedSeries, evaluate
+from liquidity.calculations.graph import DependencyGraph
+from liquidity.scheduler import ReleaseEvent
+from liquidity.storage.backend import Storage
+from liquidity.storage.schemas import LIQUIDITY_INDEXES_TABLE
+
+logger = logging.getLogger(__name__)
+
+# Trailing observations ranked for the percentile (one year of business days)
+DEFAULT_WINDOW = 252
+# Observations needed before a percentile is reported
+DEFAULT_MIN_PERIODS = 20
+
+# liquidity_indexes names of an indicator's percentile and breach state (1 in breach, else 0)
+PERCENTILE_SUFFIX = "_percentile"
+BREACH_SUFFIX = "_breach"
+
+StressCallback = Callable[[pd.DataFrame], None]
+
+
+@dataclass(frozen=True)
+class StressIndicator:
+    """A stress indicator and its alert threshold.
+
+    Attributes:
+        series: Definition of the indicator (name, expression, unit).
+        threshold: Level beyond which the indicator is in breach, in the
+            series' unit; None for indicators tracked by percentile only.
+        higher_is_stress: True if values above ``threshold`` are a breach,
+            False if values below it are (e.g. an inverted yield curve).
+    """
+
+    series: DerivedSeries
+    threshold: float | None = None
+    higher_is_stress: bool = True
+
+    @property
+    def name(self) -> str:
+        """Indicator name (index_name in liquidity_indexes)."""
+        return self.series.name
+
+    def breaches(self, values: np.ndarray) -> np.ndarray:
+        """Boolean mask of values beyond the threshold."""
+        if self.threshold is None:
+            return np.zeros(len(values), dtype=bool)
+        if self.higher_is_stress:
+            return values > self.threshold
+        return values < self.threshold
+
+
+# Built-in panel from the FRED collector's series
+STRESS_INDICATORS: dict[str, StressIndicator] = {
+    indicator.name: indicator
+    for indicator in (
+        StressIndicator(DerivedSeries("sofr", "SOFR", "percent")),
+        # 2s10s curve: inversion below zero
+        StressIndicator(DERIVED_SERIES["yield_spread"], threshold=0.0, higher_is_stress=False),
+        StressIndicator(DerivedSeries("hy_oas", "BAMLH0A0HYM2", "bps"), threshold=500.0),
+        StressIndicator(DerivedSeries("ig_oas", "BAMLC0A0CM", "bps"), threshold=150.0),
+        StressIndicator(DerivedSeries("hy_ig_spread", "BAMLH0A0HYM2 - BAMLC0A0CM", "bps")),
+    )
+}
+
+
+def _percentiles(values: np.ndarray, window: int, min_periods: int, start: int = 0) -> np.ndarray:
+    """Percentile rank of ``values[start:]`` within their trailing windows."""
+    padded = np.concatenate([np.full(window - 1, np.nan), values])
+    # Row j holds the window ending at values[start + j]
+    windows = sliding_window_view(padded[start:], window)
+    current = values[start:]
+    count = (~np.isnan(windows)).sum(axis=1)
+    below = (windows <= current[:, None]).sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        result: np.ndarray = below / count * 100.0
+    result[count < min_periods] = np.nan
+    return result
+
+
+def _panel(
+    indicator: StressIndicator, times: np.ndarray, values: np.ndarray, percentiles: np.ndarray
+) -> pd.DataFrame:
+    """Long panel rows of one indicator."""
+    return pd.DataFrame(
+        {
+            "timestamp": times.view("datetime64[ns]"),
+            "indicator": indicator.name,
+            "value": values,
+            "percentile": percentiles,
+            "breach": indicator.breaches(values),
+        }
+    )
+
+
+def _empty_panel() -> pd.DataFrame:
+    """Panel with no rows."""
+    return pd.DataFrame(
+        {
+            "timestamp": pd.Series(dtype="datetime64[ns]"),
+            "indicator": pd.Series(dtype=object),
+            "value": pd.Series(dtype="float64"),
+            "percentile": pd.Series(dtype="float64"),
+            "breach": pd.Series(dtype=bool),
+        }
+    )
+
+
+class _History:
+    """Observations and percentiles of one indicator as int64 ns / float64 arrays."""
+
+    def __init__(self) -> None:
+        self.times = np.empty(0, dtype="int64")
+        self.values = np.empty(0, dtype="float64")
+        self.percentiles = np.empty(0, dtype="float64")
+
+    def merge(
+        self, times: np.ndarray, values: np.ndarray, window: int, min_periods: int
+    ) -> slice:
+        """Upsert changed points, re-rank the points they affect; return those positions."""
+        keep = ~np.isin(self.times, times)
+        merged_times = np.concatenate([self.times[keep], times])
+        order = np.argsort(merged_times, kind="stable")
+        self.times = merged_times[order]
+        self.values = np.concatenate([self.values[keep], values])[order]
+        old = np.concatenate([self.percentiles[keep], np.full(len(times), np.nan)])[order]
+
+        # A point's rank changes if a change falls inside its window
+        changed = np.searchsorted(self.times, times)
+        lo = int(changed.min())
+        hi = min(int(changed.max()) + window, len(self.times))
+        old[lo:hi] = _percentiles(self.values[:hi], window, min_periods, start=lo)
+        self.percentiles = old
+        return slice(lo, hi)
+
+
+class StressEngine:
+    """Stress indicator panel, in batch or incrementally.
+
+    Example:
+        engine = StressEngine(storage=storage, max_staleness=MAX_STALENESS)
+        history = engine.batch(fred_df)  # whole panel, one pass
+
+        engine.prime(stored_rows)
+        scheduler.subscribe(engine.on_release)
+        engine.lookup()  # latest panel, served without computation
+    """
+
+    def __init__(
+        self,
+        indicators: Iterable[StressIndicator] | None = None,
+        storage: Storage | None = None,
+        window: int = DEFAULT_WINDOW,
+        min_periods: int = DEFAULT_MIN_PERIODS,
+        max_staleness: Staleness = None,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            indicators: Indicators to maintain. Defaults to ``STRESS_INDICATORS``.
+            storage: Optional storage; changed points are written to
+                liquidity_indexes, the value as the indicator name, the
+                percentile as ``{name}_percentile`` and, for indicators with
+                a threshold, the breach state as ``{name}_breach`` (1 or 0).
+            window: Observations in the trailing percentile window.
+            min_periods: Observations needed before a percentile is reported.
+            max_staleness: Staleness limits for as-of matching of inputs.
+
+        Raises:
+            ValueError: If ``min_periods`` is not between 1 and ``window``.
+            ExpressionError: If an indicator's definition is invalid.
+        """
+        if not 1 <= min_periods <= window:
+            raise ValueError(f"min_periods must be between 1 and window, got {min_periods}")
+        self.indicators = {
+            indicator.name: indicator
+            for indicator in (STRESS_INDICATORS.values() if indicators is None else indicators)
+        }
+        self.storage = storage
+        self.window = window
+        self.min_periods = min_periods
+        self.max_staleness = max_staleness
+        self._graph = DependencyGraph(
+            [indicator.series for indicator in self.indicators.values()],
+            max_staleness=max_staleness,
+        )
+        self._history = {name: _History() for name in self.indicators}
+        self._subscribers: list[StressCallback] = []
+
+    def subscribe(self, callback: StressCallback) -> None:
+        """Register a callback invoked with every non-empty batch of changed panel rows."""
+        self._subscribers.append(callback)
+
+    def batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Compute the panel for a whole history (engine state untouched).
+
+        Indicators whose inputs are absent from ``df`` are skipped.
+
+        Args:
+            df: Long-format rows (timestamp, series_id, value, unit).
+
+        Returns:
+            Long DataFrame with timestamp, indicator, value, percentile and
+            breach, by indicator then timestamp.
+        """
+        available = set(df["series_id"].unique())
+        indicators = [
+            indicator
+            for indicator in self.indicators.values()
+            if set(indicator.series.compiled.inputs) <= available
+        ]
+        if not indicators:
+            return _empty_panel()
+        wide = evaluate(
+            [indicator.series for indicator in indicators], df, max_staleness=self.max_staleness
+        )
+        times = wide.index.to_numpy().astype("datetime64[ns]").view("int64")
+        frames = []
+        for indicator in indicators:
+            values = wide[indicator.name].to_numpy()
+            valid = ~np.isnan(values)
+            percentiles = _percentiles(values[valid], self.window, self.min_periods)
+            frames.append(_panel(indicator, times[valid], values[valid], percentiles))
+        return pd.concat(frames, ignore_index=True)
+
+    def prime(self, df: pd.DataFrame) -> None:
+        """Load history without writing or notifying.
+
+        Args:
+            df: Long-format raw rows.
+        """
+        self._apply(df)
+
+    def update(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Apply new observations and return the panel rows they change.
+
+        Only points whose value changed are re-evaluated, and only points
+        whose percentile window contains a change are re-ranked.
+
+        Args:
+            df: Long-format raw rows (timestamp, series_id, value, unit).
+
+        Returns:
+            Changed rows with the ``batch`` columns (empty if nothing changed).
+        """
+        result = self._apply(df)
+        if result.empty:
+            return result
+
+        logger.info(
+            "Stress panel updated: %s, breaches=%s",
+            result.groupby("indicator", sort=False).size().to_dict(),
+            sorted(set(result.loc[result["breach"], "indicator"])),
+        )
+        if self.storage is not None:
+            percentile = result["percentile"].notna().to_numpy()
+            thresholded = [
+                name for name, indicator in self.indicators.items() if indicator.threshold is not None
+            ]
+            breach = result["indicator"].isin(thresholded).to_numpy()
+            self.storage.ingest_dataframe(
+                LIQUIDITY_INDEXES_TABLE,
+                pd.concat(
+                    [
+                        pd.DataFrame(
+                            {
+                                "timestamp": result["timestamp"],
+                                "index_name": result["indicator"],
+                                "value": result["value"],
+                            }
+                        ),
+                        pd.DataFrame(
+                            {
+                                "timestamp": result["timestamp"][percentile],
+                                "index_name": result["indicator"][percentile]
+                                + PERCENTILE_SUFFIX,
+                                "value": result["percentile"][percentile],
+                            }
+                        ),
+                        pd.DataFrame(
+                            {
+                                "timestamp": result["timestamp"][breach],
+                                "index_name": result["indicator"][breach] + BREACH_SUFFIX,
+                                "value": result["breach"][breach].astype("float64"),
+                            }
+                        ),
+                    ],
+                    ignore_index=True,
+                ),
+            )
+        for callback in self._subscribers:
+            callback(result)
+        return result
+
+    def lookup(self) -> pd.DataFrame:
+        """Latest panel: one row per indicator with data (``batch`` columns)."""
+        frames = [
+            _panel(
+                self.indicators[name],
+                history.times[-1:],
+                history.values[-1:],
+                history.percentiles[-1:],
+            )
+            for name, history in self._history.items()
+            if len(history.times)
+        ]
+        return pd.concat(frames, ignore_index=True) if frames else _empty_panel()
+
+    async def on_release(self, event: ReleaseEvent) -> None:
+        """Scheduler handler: update from a release's rows."""
+        if event.series_id in self._graph.raw_series:
+            self.update(event.data)
+
+    def _apply(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Ingest rows into the graph and re-rank the changed indicators."""
+        changed = self._graph.ingest(df)
+        frames = []
+        for name, group in changed.groupby("index_name", sort=False):
+            history = self._history[str(name)]
+            affected = history.merge(
+                group["timestamp"].to_numpy().view("int64"),
+                group["value"].to_numpy(),
+                self.window,
+                self.min_periods,
+            )
+            frames.append(
+                _panel(
+                    self.indicators[str(name)],
+                    history.times[affected],
+                    history.values[affected],
+                    history.percentiles[affected],
+                )
+            )
+        return pd.concat(frames, ignore_index=True) if frames else _empty_panel()
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        points = sum(len(history.times) for history in self._history.values())
+        return f"StressEngine(indicators={len(self.indicators)}, points={points})"
@@ -14,9 +14,11 @@ from liquidity.collectors.boc import SERIES_MAP as BOC_SERIES_MAP
 from liquidity.collectors.boc import BOCCollector
 from liquidity.collectors.boe import BOECollector
 from liquidity.collectors.fred import SERIES_MAP, FredCollector
+from liquidity.collectors.nyfed import NYFedCollector
 from liquidity.collectors.pboc import PBOCCollector
 from liquidity.collectors.registry import CollectorRegistry, registry
 from liquidity.collectors.snb import SNBCollector
+from liquidity.collectors.treasury import TreasuryCollector
 from liquidity.collectors.yahoo import SYMBOLS as YAHOO_SYMBOLS
 from liquidity.collectors.yahoo import YahooCollector
 
@@ -44,4 +46,7 @@ __all__ = [
     "BOECollector",
     # PBoC
     "PBOCCollector",
+    # Daily TGA (Treasury) and RRP (NY Fed)
+    "TreasuryCollector",
+    "NYFedCollector",
 ]
@@ -1,9 +1,14 @@
 """Bank of Canada collector using Valet API.
 
 Fetches BoC balance sheet data via the official Valet API (no auth required).
+Several series are fetched in one request (Valet accepts comma-separated
+series IDs) and parsed column-wise: the response is decoded with orjson when
+available, the date and value arrays are pulled out of the observations in
+one pass, and all dates are converted with a single ``to_datetime``.
 """
 
 import logging
+from collections.abc import Sequence
 from datetime import datetime
 from typing import Any
 
@@ -13,6 +18,12 @@ import pandas as pd
 from liquidity.collectors.base import BaseCollector
 from liquidity.collectors.registry import registry
 from liquidity.config import Settings, get_settings
+from liquidity.frames import concat_frames, empty_frame, series_frame
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - orjson is optional
+    from json import loads as _json_loads  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +40,22 @@ UNIT_MAP: dict[str, str] = {
 
 BOC_VALET_BASE_URL = "https://www.bankofcanada.ca/valet/observations"
 
+# Valet date format (observation key "d")
+VALET_DATE_FORMAT = "%Y-%m-%d"
+
+
+def _series_ids(series_id: str | Sequence[str]) -> list[str]:
+    """Series IDs from one ID, a comma-separated string or a sequence."""
+    if isinstance(series_id, str):
+        return [part.strip() for part in series_id.split(",") if part.strip()]
+    return list(series_id)
+
+
+def decode_valet(content: bytes) -> dict[str, Any]:
+    """Decode a Valet JSON response body."""
+    data: dict[str, Any] = _json_loads(content)
+    return data
+
 
 class BOCCollector(BaseCollector[pd.DataFrame]):
     """Bank of Canada collector using Valet API."""
@@ -39,6 +66,7 @@ class BOCCollector(BaseCollector[pd.DataFrame]):
         self,
         name: str = "boc",
         settings: Settings | None = None,
+        base_url: str = BOC_VALET_BASE_URL,
         **kwargs: Any,
     ) -> None:
         """Initialize BoC collector.
@@ -46,21 +74,25 @@ class BOCCollector(BaseCollector[pd.DataFrame]):
         Args:
             name: Collector name for circuit breaker.
             settings: Optional settings override.
+            base_url: Valet observations endpoint (overridable for tests).
             **kwargs: Additional arguments passed to BaseCollector.
         """
         super().__init__(name=name, settings=settings, **kwargs)
         self._settings = settings or get_settings()
+        self.base_url = base_url.rstrip("/")
 
     async def collect(
         self,
-        series_id: str = "V36610",
+        series_id: str | Sequence[str] = "V36610",
         start_date: datetime | None = None,
         end_date: datetime | None = None,
     ) -> pd.DataFrame:
         """Collect BoC data via Valet API.
 
         Args:
-            series_id: Valet series ID to fetch. Defaults to V36610 (total assets).
+            series_id: Valet series ID(s) to fetch, as one ID, a comma-separated
+                string or a sequence; all are fetched in one request. Defaults
+                to V36610 (total assets).
             start_date: Start date for data fetch.
             end_date: End date for data fetch.
 
@@ -70,29 +102,30 @@ class BOCCollector(BaseCollector[pd.DataFrame]):
         Raises:
             CollectorFetchError: If data fetch fails after retries.
         """
+        series_ids = _series_ids(series_id)
 
         async def _fetch() -> pd.DataFrame:
-            return await self._fetch_async(series_id, start_date, end_date)
+            return await self._fetch_async(series_ids, start_date, end_date)
 
         return await self.fetch_with_retry(_fetch)
 
     async def _fetch_async(
         self,
-        series_id: str,
+        series_ids: list[str],
         start_date: datetime | None,
         end_date: datetime | None,
     ) -> pd.DataFrame:
         """Async fetch using httpx.
 
         Args:
-            series_id: Valet series ID.
+            series_ids: Valet series IDs.
             start_date: Start date.
             end_date: End date.
 
         Returns:
             Normalized DataFrame.
         """
-        url = f"{BOC_VALET_BASE_URL}/{series_id}/json"
+        url = f"{self.base_url}/{','.join(series_ids)}/json"
 
         params: dict[str, str] = {}
         if start_date:
@@ -100,55 +133,56 @@ class BOCCollector(BaseCollector[pd.DataFrame]):
         if end_date:
             params["end_date"] = end_date.strftime("%Y-%m-%d")
 
-        logger.info("Fetching BoC series %s from Valet API", series_id)
+        logger.info("Fetching BoC series %s from Valet API", ", ".join(series_ids))
 
         async with httpx.AsyncClient(timeout=30.0) as client:
             response = await client.get(url, params=params if params else None)
             response.raise_for_status()
-            data = response.json()
+            data = decode_valet(response.content)
 
-        return self._parse_response(data, series_id)
+        return self._parse_response(data, series_ids)
 
-    def _parse_response(self, data: dict[str, Any], series_id: str) -> pd.DataFrame:
+    def _parse_response(
+        self, data: dict[str, Any], series_id: str | Sequence[str]
+    ) -> pd.DataFrame:
         """Parse Valet API JSON response.
 
         Args:
             data: JSON response from Valet API.
-            series_id: Series ID for column naming.
+            series_id: Series ID(s) to extract from each observation.
 
         Returns:
-            Normalized DataFrame with standard columns.
+            Normalized DataFrame with standard columns, sorted by timestamp.
         """
+        series_ids = _series_ids(series_id)
         observations = data.get("observations", [])
 
         if not observations:
-            logger.warning("No observations returned from BoC for series %s", series_id)
-            return pd.DataFrame(
-                columns=["timestamp", "series_id", "source", "value", "unit"]
+            logger.warning("No observations returned from BoC for series %s", series_ids)
+            return empty_frame()
+
+        # One pass per column; values are nested as {"<series>": {"v": "..."}}
+        timestamps = pd.to_datetime(
+            [obs.get("d") for obs in observations], format=VALET_DATE_FORMAT, errors="coerce"
+        )
+        frames = []
+        for sid in series_ids:
+            values = pd.to_numeric(
+                [(obs.get(sid) or {}).get("v") for obs in observations], errors="coerce"
             )
-
-        records = []
-        for obs in observations:
-            date_str = obs.get("d")  # Date key
-            value = obs.get(series_id, {}).get("v")  # Value nested under series_id
-
-            if date_str and value is not None:
-                records.append(
-                    {
-                        "timestamp": pd.to_datetime(date_str),
-                        "series_id": series_id,
-                        "source": "boc",
-                        "value": float(value),
-                        "unit": UNIT_MAP.get(series_id, "unknown"),
-                    }
+            valid = ~(pd.isna(values) | timestamps.isna())
+            frames.append(
+                series_frame(
+                    timestamps[valid], values[valid], sid, "boc", UNIT_MAP.get(sid, "unknown")
                 )
+            )
 
-        df = pd.DataFrame(records)
-        df = df.sort_values("timestamp").reset_index(drop=True)
+        df = concat_frames(frames)
+        df = df.sort_values("timestamp", kind="stable").reset_index(drop=True)
 
         logger.info("Fetched %d data points from BoC Valet API", len(df))
 
-        return df[["timestamp", "series_id", "source", "value", "unit"]]
+        return df
 
     async def collect_total_assets(
         self,
@@ -16,6 +16,7 @@ from bs4 import BeautifulSoup
 from liquidity.collectors.base import BaseCollector, CollectorFetchError
 from liquidity.collectors.registry import registry
 from liquidity.config import Settings, get_settings
+from liquidity.frames import series_frame
 
 logger = logging.getLogger(__name__)
 
@@ -157,14 +158,8 @@ class BOECollector(BaseCollector[pd.DataFrame]):
         if total_assets is None:
             raise CollectorFetchError("Could not parse total assets from weekly report")
 
-        return pd.DataFrame(
-            {
-                "timestamp": [report_date],
-                "series_id": ["BOE_TOTAL_ASSETS"],
-                "source": ["boe_scraping"],
-                "value": [total_assets],
-                "unit": ["millions_gbp"],
-            }
+        return series_frame(
+            [report_date], [total_assets], "BOE_TOTAL_ASSETS", "boe_scraping", "millions_gbp"
         )
 
     async def _collect_via_fred_proxy(
@@ -182,27 +177,24 @@ class BOECollector(BaseCollector[pd.DataFrame]):
 
         # Scale M4 to estimate BoE total assets
         # M4 ~3 trillion GBP, BoE assets ~850 billion = ~28% ratio
-        df = df.copy()
-        df["value"] = df["value"] * 0.28
-        df["series_id"] = "BOE_TOTAL_ASSETS"
-        df["source"] = "fred_proxy"
-        df["unit"] = "millions_gbp"
-
         logger.info("Using FRED UK M4 as BoE proxy (correlation-based)")
-        return df[["timestamp", "series_id", "source", "value", "unit"]]
+        return series_frame(
+            df["timestamp"],
+            df["value"].to_numpy() * 0.28,
+            "BOE_TOTAL_ASSETS",
+            "fred_proxy",
+            "millions_gbp",
+        )
 
     def _get_cached_baseline(self) -> pd.DataFrame:
         """Tier 3: Return cached baseline (GUARANTEED)."""
-        return pd.DataFrame(
-            {
-                "timestamp": [pd.to_datetime(self.BASELINE_DATE)],
-                "series_id": ["BOE_TOTAL_ASSETS"],
-                "source": ["cached_baseline"],
-                "value": [float(self.BASELINE_VALUE)],
-                "unit": ["millions_gbp"],
-                "stale": [True],
-            }
-        )
+        return series_frame(
+            [self.BASELINE_DATE],
+            [float(self.BASELINE_VALUE)],
+            "BOE_TOTAL_ASSETS",
+            "cached_baseline",
+            "millions_gbp",
+        ).assign(stale=True)
 
 
 # Register collector
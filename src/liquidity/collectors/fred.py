@@ -19,9 +19,11 @@ from typing import Any
 import pandas as pd
 from openbb import obb
 
+from liquidity.calculations.expressions import DERIVED_SERIES, MAX_STALENESS
 from liquidity.collectors.base import BaseCollector, CollectorFetchError
 from liquidity.collectors.registry import registry
 from liquidity.config import Settings, get_settings
+from liquidity.frames import empty_frame, series_frame
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +75,13 @@ SERIES_MAP: dict[str, str] = {
     # Phase 2: Global CB totals via FRED
     "ecb_total_assets": "ECBASSETSW",  # Weekly, millions EUR
     "boj_total_assets": "JPNASSETS",  # Monthly, 100 million JPY (not millions!)
+    # FX rates for Global Liquidity USD conversion (H.10, daily noon buying rates)
+    "usd_eur": "DEXUSEU",  # USD per EUR
+    "jpy_usd": "DEXJPUS",  # JPY per USD
+    "usd_gbp": "DEXUSUK",  # USD per GBP
+    "chf_usd": "DEXSZUS",  # CHF per USD
+    "cad_usd": "DEXCAUS",  # CAD per USD
+    "cny_usd": "DEXCHUS",  # CNY per USD
 }
 
 # Unit conversions for standardization
@@ -96,9 +105,15 @@ UNIT_MAP: dict[str, str] = {
     # Global CB totals (Phase 2)
     "ECBASSETSW": "millions_eur",
     "JPNASSETS": "100_millions_jpy",  # FRED unit is "100 Million Yen"
+    # FX rates (quote currency per base currency)
+    "DEXUSEU": "usd_per_eur",
+    "DEXJPUS": "jpy_per_usd",
+    "DEXUSUK": "usd_per_gbp",
+    "DEXSZUS": "chf_per_usd",
+    "DEXCAUS": "cad_per_usd",
+    "DEXCHUS": "cny_per_usd",
 }
 
-
 class FredCollector(BaseCollector[pd.DataFrame]):
     """FRED data collector using OpenBB SDK.
 
@@ -204,9 +219,7 @@ class FredCollector(BaseCollector[pd.DataFrame]):
 
         if df.empty:
             logger.warning("No data returned from FRED for symbols: %s", symbols)
-            return pd.DataFrame(
-                columns=["timestamp", "series_id", "source", "value", "unit"]
-            )
+            return empty_frame()
 
         # Find date column
         date_col = _find_date_column(df)
@@ -216,9 +229,7 @@ class FredCollector(BaseCollector[pd.DataFrame]):
 
         if not value_vars:
             logger.warning("No value columns found matching symbols: %s", symbols)
-            return pd.DataFrame(
-                columns=["timestamp", "series_id", "source", "value", "unit"]
-            )
+            return empty_frame()
 
         df_long = df.melt(
             id_vars=[date_col],
@@ -227,22 +238,21 @@ class FredCollector(BaseCollector[pd.DataFrame]):
             value_name="value",
         )
 
-        # Normalize columns
-        df_long = df_long.rename(columns={date_col: "timestamp"})
-        df_long["timestamp"] = pd.to_datetime(df_long["timestamp"])
-        df_long["source"] = "fred"
-        df_long["unit"] = df_long["series_id"].map(UNIT_MAP).fillna("unknown")
-
-        # Clean and sort
-        df_long = (
-            df_long.dropna(subset=["value"])
-            .sort_values("timestamp")
-            .reset_index(drop=True)
+        # Clean and sort, then build the canonical frame (symbol columns as
+        # categoricals, so the repeated series/source/unit strings are stored once)
+        df_long = df_long.dropna(subset=["value"]).sort_values(date_col, kind="stable")
+        series_ids = df_long["series_id"].astype("category")
+        frame = series_frame(
+            df_long[date_col].to_numpy(),
+            df_long["value"].to_numpy(),
+            series_ids,
+            "fred",
+            series_ids.map(lambda series_id: UNIT_MAP.get(series_id, "unknown")),
         )
 
-        logger.info("Fetched %d data points from FRED", len(df_long))
+        logger.info("Fetched %d data points from FRED", len(frame))
 
-        return df_long[["timestamp", "series_id", "source", "value", "unit"]]
+        return frame
 
     @staticmethod
     def calculate_net_liquidity(df: pd.DataFrame) -> pd.DataFrame:
@@ -251,37 +261,25 @@ class FredCollector(BaseCollector[pd.DataFrame]):
         Net Liquidity = WALCL - WLRRAL - WDTGAL
 
         Note: WLRRAL and WDTGAL are in billions, WALCL in millions.
-        Converts all to millions USD before calculation.
+        Converts all to millions USD (from the ``unit`` column) before
+        calculation.
+
+        Points follow WALCL timestamps; RRP and TGA are matched as-of (latest
+        observation at or before, within MAX_STALENESS), so inputs printed on
+        different days still combine.
 
         Args:
-            df: DataFrame with timestamp, series_id, value columns.
+            df: DataFrame with timestamp, series_id, value, unit columns.
 
         Returns:
             DataFrame with timestamp, net_liquidity columns (in millions USD).
-        """
-        required = {"WALCL", "WLRRAL", "WDTGAL"}
-        available = set(df["series_id"].unique())
-
-        if not required.issubset(available):
-            missing = required - available
-            raise ValueError(f"Missing required series for Net Liquidity: {missing}")
-
-        # Pivot to wide format for calculation
-        pivot = df.pivot(index="timestamp", columns="series_id", values="value")
 
-        # Convert units: WLRRAL and WDTGAL are in billions, convert to millions
-        # Hayes formula: WALCL - RRP - TGA
-        net_liquidity = (
-            pivot["WALCL"] - (pivot["WLRRAL"] * 1000) - (pivot["WDTGAL"] * 1000)
-        )
-
-        result = pd.DataFrame(
-            {
-                "timestamp": net_liquidity.index,
-                "net_liquidity": net_liquidity.values,
-                "unit": "millions_usd",
-            }
-        ).dropna()
+        Raises:
+            ValueError: If a required series is missing.
+            UnitError: If an input's unit is not a USD amount.
+        """
+        # Inputs are converted to millions USD from their unit column
+        result = DERIVED_SERIES["net_liquidity"].calculate(df, max_staleness=MAX_STALENESS)
 
         logger.info(
             "Calculated Net Liquidity: min=%.0f, max=%.0f, latest=%.0f (millions USD)",
@@ -299,6 +297,7 @@ class FredCollector(BaseCollector[pd.DataFrame]):
         Yield Spread = DGS10 - DGS2
 
         Useful for custom calculations if T10Y2Y is unavailable or for validation.
+        Points follow DGS10 timestamps with DGS2 matched as-of.
 
         Args:
             df: DataFrame with timestamp, series_id, value columns.
@@ -306,24 +305,7 @@ class FredCollector(BaseCollector[pd.DataFrame]):
         Returns:
             DataFrame with timestamp, yield_spread columns (in percent).
         """
-        required = {"DGS10", "DGS2"}
-        available = set(df["series_id"].unique())
-
-        if not required.issubset(available):
-            missing = required - available
-            raise ValueError(f"Missing required series for yield spread: {missing}")
-
-        # Pivot to wide format for calculation
-        pivot = df.pivot(index="timestamp", columns="series_id", values="value")
-        yield_spread = pivot["DGS10"] - pivot["DGS2"]
-
-        result = pd.DataFrame(
-            {
-                "timestamp": yield_spread.index,
-                "yield_spread": yield_spread.values,
-                "unit": "percent",
-            }
-        ).dropna()
+        result = DERIVED_SERIES["yield_spread"].calculate(df, max_staleness=MAX_STALENESS)
 
         logger.info(
             "Calculated Yield Spread: min=%.2f, max=%.2f, latest=%.2f (percent)",
@@ -455,6 +437,30 @@ class FredCollector(BaseCollector[pd.DataFrame]):
             ["WALCL", "ECBASSETSW", "JPNASSETS"], start_date, end_date
         )
 
+    async def collect_fx_rates(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> pd.DataFrame:
+        """Convenience method to collect FX rates for USD conversion.
+
+        Fetches DEXUSEU, DEXJPUS, DEXUSUK, DEXSZUS, DEXCAUS and DEXCHUS
+        (H.10 noon buying rates, daily). Quote conventions differ: DEXUSEU
+        and DEXUSUK are USD per unit, the others are units per USD.
+
+        Args:
+            start_date: Start date for data fetch. Defaults to 30 days ago.
+            end_date: End date for data fetch. Defaults to today.
+
+        Returns:
+            DataFrame with FX rate data.
+        """
+        return await self.collect(
+            ["DEXUSEU", "DEXJPUS", "DEXUSUK", "DEXSZUS", "DEXCAUS", "DEXCHUS"],
+            start_date,
+            end_date,
+        )
+
 
 # Register collector with the registry
 registry.register("fred", FredCollector)
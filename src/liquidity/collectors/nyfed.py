@@ -0,0 +1,143 @@
+"""New York Fed collector for daily overnight reverse repo usage.
+
+Fetches ON RRP operation results from the NY Fed Markets Data API (no auth
+required). Results are published around 13:15 ET on the operation day, while
+the weekly H.4.1 (WLRRAL) reports the Wednesday level a day later.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any
+
+import httpx
+import pandas as pd
+
+from liquidity.collectors.base import BaseCollector
+from liquidity.collectors.registry import registry
+from liquidity.config import Settings, get_settings
+from liquidity.frames import empty_frame, series_frame
+
+logger = logging.getLogger(__name__)
+
+NYFED_MARKETS_BASE_URL = "https://markets.newyorkfed.org"
+RRP_SEARCH_PATH = "/api/rp/reverserepo/propositions/search.json"
+RRP_LATEST_PATH = "/api/rp/reverserepo/propositions/lastTwoWeeks.json"
+
+RRP_OPERATION_TYPE = "Reverse Repo"
+# Accepted amounts are reported in USD
+USD_PER_MILLION = 1_000_000.0
+
+SERIES_MAP: dict[str, str] = {
+    "rrp_daily": "RRP_DAILY",  # ON RRP accepted - Daily, Millions USD
+}
+
+UNIT_MAP: dict[str, str] = {
+    "RRP_DAILY": "millions_usd",
+}
+
+
+class NYFedCollector(BaseCollector[pd.DataFrame]):
+    """Daily ON RRP usage from NY Fed operation results."""
+
+    SERIES_MAP = SERIES_MAP
+
+    def __init__(
+        self,
+        name: str = "nyfed",
+        settings: Settings | None = None,
+        base_url: str = NYFED_MARKETS_BASE_URL,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize NY Fed collector.
+
+        Args:
+            name: Collector name for circuit breaker.
+            settings: Optional settings override.
+            base_url: Markets Data API root (overridable for tests).
+            **kwargs: Additional arguments passed to BaseCollector.
+        """
+        super().__init__(name=name, settings=settings, **kwargs)
+        self._settings = settings or get_settings()
+        self.base_url = base_url.rstrip("/")
+
+    async def collect(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> pd.DataFrame:
+        """Collect daily ON RRP accepted amounts.
+
+        Args:
+            start_date: First operation date to fetch. Defaults to the last
+                two weeks of operations.
+            end_date: Last operation date to fetch. Defaults to today.
+
+        Returns:
+            DataFrame with columns: timestamp, series_id, source, value, unit
+
+        Raises:
+            CollectorFetchError: If data fetch fails after retries.
+        """
+
+        async def _fetch() -> pd.DataFrame:
+            return await self._fetch_async(start_date, end_date)
+
+        return await self.fetch_with_retry(_fetch)
+
+    async def _fetch_async(
+        self,
+        start_date: datetime | None,
+        end_date: datetime | None,
+    ) -> pd.DataFrame:
+        """Fetch operation results for a date range (or the last two weeks)."""
+        params: dict[str, str] = {}
+        if start_date:
+            path = RRP_SEARCH_PATH
+            params["startDate"] = start_date.strftime("%Y-%m-%d")
+            params["endDate"] = (end_date or datetime.now()).strftime("%Y-%m-%d")
+        else:
+            path = RRP_LATEST_PATH
+
+        logger.info("Fetching ON RRP results from NY Fed Markets API")
+
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            response = await client.get(f"{self.base_url}{path}", params=params or None)
+            response.raise_for_status()
+            data = response.json()
+
+        return self._parse_response(data, end_date)
+
+    def _parse_response(
+        self, data: dict[str, Any], end_date: datetime | None = None
+    ) -> pd.DataFrame:
+        """Sum accepted amounts per operation date (up to ``end_date``), in millions USD."""
+        operations = data.get("repo", {}).get("operations", [])
+        if not operations:
+            logger.warning("No ON RRP operations returned from NY Fed")
+            return empty_frame()
+
+        raw = pd.DataFrame.from_records(operations)
+        raw = raw[raw["operationType"] == RRP_OPERATION_TYPE]
+        accepted = (
+            pd.to_numeric(raw["totalAmtAccepted"], errors="coerce")
+            .groupby(pd.to_datetime(raw["operationDate"]))
+            .sum(min_count=1)
+            .dropna()
+        )
+        if end_date is not None:
+            accepted = accepted[accepted.index <= pd.Timestamp(end_date)]
+        df = series_frame(
+            accepted.index,
+            accepted.to_numpy() / USD_PER_MILLION,
+            "RRP_DAILY",
+            "nyfed",
+            UNIT_MAP["RRP_DAILY"],
+        )
+
+        logger.info("Fetched %d ON RRP results from NY Fed", len(df))
+
+        return df
+
+
+# Register collector
+registry.register("nyfed", NYFedCollector)
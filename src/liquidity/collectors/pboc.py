@@ -17,6 +17,7 @@ from bs4 import BeautifulSoup
 from liquidity.collectors.base import BaseCollector, CollectorFetchError
 from liquidity.collectors.registry import registry
 from liquidity.config import Settings, get_settings
+from liquidity.frames import series_frame
 
 logger = logging.getLogger(__name__)
 
@@ -160,14 +161,12 @@ class PBOCCollector(BaseCollector[pd.DataFrame]):
         if total_assets is None:
             raise CollectorFetchError("Could not extract total assets from PBoC HTML")
 
-        return pd.DataFrame(
-            {
-                "timestamp": [report_date],
-                "series_id": ["PBOC_TOTAL_ASSETS"],
-                "source": ["pboc_scraping"],
-                "value": [total_assets],
-                "unit": ["hundreds_millions_cny"],
-            }
+        return series_frame(
+            [report_date],
+            [total_assets],
+            "PBOC_TOTAL_ASSETS",
+            "pboc_scraping",
+            "hundreds_millions_cny",
         )
 
     async def _collect_via_fred(
@@ -184,26 +183,21 @@ class PBOCCollector(BaseCollector[pd.DataFrame]):
         if df.empty:
             raise CollectorFetchError("FRED China foreign reserves returned no data")
 
-        # Relabel for PBoC context
-        df = df.copy()
-        df["series_id"] = "CHINA_FOREIGN_RESERVES"
-        df["source"] = "fred_proxy"
-
         logger.info("Using FRED China foreign reserves as PBoC proxy")
-        return df[["timestamp", "series_id", "source", "value", "unit"]]
+        # Relabel for PBoC context
+        return series_frame(
+            df["timestamp"], df["value"], "CHINA_FOREIGN_RESERVES", "fred_proxy", df["unit"]
+        )
 
     def _get_cached_baseline(self) -> pd.DataFrame:
         """Tier 3: Return cached baseline (GUARANTEED)."""
-        return pd.DataFrame(
-            {
-                "timestamp": [pd.to_datetime(self.BASELINE_DATE)],
-                "series_id": ["PBOC_TOTAL_ASSETS"],
-                "source": ["cached_baseline"],
-                "value": [float(self.BASELINE_VALUE)],
-                "unit": ["hundreds_millions_cny"],
-                "stale": [True],
-            }
-        )
+        return series_frame(
+            [self.BASELINE_DATE],
+            [float(self.BASELINE_VALUE)],
+            "PBOC_TOTAL_ASSETS",
+            "cached_baseline",
+            "hundreds_millions_cny",
+        ).assign(stale=True)
 
 
 # Register collector
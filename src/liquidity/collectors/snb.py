@@ -2,10 +2,18 @@
 
 SNB publishes balance sheet data at https://data.snb.ch
 Direct CSV download with no authentication required.
+
+The balance sheet cube holds every balance sheet item for every month, of
+which only the total (``D0`` item ``T0``) in the requested range is kept. The
+response is streamed line by line through a filter, so neither the whole CSV
+nor the discarded items are ever held in memory or parsed: lines without the
+item code are skipped by a substring check, and months (``YYYY-MM``, which
+sort as strings) are compared without parsing dates.
 """
 
 import io
 import logging
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any
 
@@ -15,6 +23,7 @@ import pandas as pd
 from liquidity.collectors.base import BaseCollector, CollectorFetchError
 from liquidity.collectors.registry import registry
 from liquidity.config import Settings, get_settings
+from liquidity.frames import series_frame
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +34,92 @@ UNIT_MAP: dict[str, str] = {
     "SNB_TOTAL_ASSETS": "millions_chf",
 }
 
+# Balance sheet item holding total assets
+TOTAL_ASSETS_ITEM = "T0"
+
+
+def _fields(line: str) -> list[str]:
+    """Fields of one semicolon-separated CSV line, unquoted."""
+    return [field.strip().strip('"') for field in line.split(";")]
+
+
+def _first_month(start_date: datetime) -> str:
+    """First month (YYYY-MM) whose first day is on or after ``start_date``."""
+    year, month = start_date.year, start_date.month
+    if start_date.replace(tzinfo=None) > datetime(year, month, 1):
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return f"{year:04d}-{month:02d}"
+
+
+class _CubeFilter:
+    """Incremental filter of SNB cube CSV lines down to one item in a month range.
+
+    Only the date and value strings of kept rows are retained.
+    """
+
+    def __init__(
+        self,
+        item: str = TOTAL_ASSETS_ITEM,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> None:
+        self.item = item
+        self.first = _first_month(start_date) if start_date else None
+        self.last = end_date.strftime("%Y-%m") if end_date else None
+        # Positions of Date, D0 and Value, set once the header is seen
+        self.positions: tuple[int, int, int] | None = None
+        self.matched = 0
+        self.dates: list[str] = []
+        self.values: list[str] = []
+
+    def feed(self, line: str) -> None:
+        """Consume one line (metadata, header or data)."""
+        if self.positions is None:
+            # Metadata lines (CubeId, PublishingDate) precede the data header
+            if line.lstrip('"').startswith("Date"):
+                self._header(_fields(line))
+            return
+        if self.item not in line:
+            return
+        fields = _fields(line)
+        date_at, item_at, value_at = self.positions
+        if len(fields) <= max(self.positions) or fields[item_at] != self.item:
+            return
+        self.matched += 1
+        date = fields[date_at]
+        if (self.first is not None and date < self.first) or (
+            self.last is not None and date > self.last
+        ):
+            return
+        self.dates.append(date)
+        self.values.append(fields[value_at])
+
+    def _header(self, columns: list[str]) -> None:
+        logger.debug("SNB CSV columns: %s", columns)
+        if "D0" not in columns or "Value" not in columns:
+            raise CollectorFetchError(f"Expected 'D0' column in SNB data. Got: {columns}")
+        self.positions = (columns.index("Date"), columns.index("D0"), columns.index("Value"))
+
+    def frame(self) -> pd.DataFrame:
+        """Kept rows as a canonical frame, sorted by timestamp.
+
+        Raises:
+            CollectorFetchError: If no header or no row of the item was seen.
+        """
+        if self.positions is None:
+            raise CollectorFetchError("Could not find data header in SNB CSV")
+        if not self.matched:
+            raise CollectorFetchError("No total assets (T0) found in SNB data")
+
+        result = series_frame(
+            pd.to_datetime(self.dates, format="%Y-%m"),
+            pd.to_numeric(pd.Series(self.values, dtype=object), errors="coerce"),
+            "SNB_TOTAL_ASSETS",
+            "snb",
+            UNIT_MAP["SNB_TOTAL_ASSETS"],
+        )
+        return result.sort_values("timestamp", kind="stable").reset_index(drop=True)
+
 
 class SNBCollector(BaseCollector[pd.DataFrame]):
     """Swiss National Bank collector via data portal CSV."""
@@ -37,23 +132,42 @@ class SNBCollector(BaseCollector[pd.DataFrame]):
         self,
         name: str = "snb",
         settings: Settings | None = None,
+        data_url: str = SNB_DATA_URL,
         **kwargs: Any,
     ) -> None:
+        """Initialize SNB collector.
+
+        Args:
+            name: Collector name for circuit breaker.
+            settings: Optional settings override.
+            data_url: Balance sheet cube CSV URL (overridable for tests).
+            **kwargs: Additional arguments passed to BaseCollector.
+        """
         super().__init__(name=name, settings=settings, **kwargs)
         self._settings = settings or get_settings()
+        self.data_url = data_url
 
     async def collect(
         self,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
     ) -> pd.DataFrame:
-        """Collect SNB balance sheet data."""
+        """Collect SNB balance sheet data.
+
+        The CSV is filtered while it streams in, so memory stays
+        proportional to the months kept.
+        """
 
         async def _fetch() -> pd.DataFrame:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(SNB_DATA_URL)
+            rows = _CubeFilter(TOTAL_ASSETS_ITEM, start_date, end_date)
+            async with (
+                httpx.AsyncClient(timeout=30.0) as client,
+                client.stream("GET", self.data_url) as response,
+            ):
                 response.raise_for_status()
-                return self._parse_csv(response.text, start_date, end_date)
+                async for line in response.aiter_lines():
+                    rows.feed(line)
+            return self._result(rows)
 
         try:
             return await self.fetch_with_retry(_fetch)
@@ -63,7 +177,7 @@ class SNBCollector(BaseCollector[pd.DataFrame]):
 
     def _parse_csv(
         self,
-        csv_text: str,
+        csv_text: str | Iterable[str],
         start_date: datetime | None,
         end_date: datetime | None,
     ) -> pd.DataFrame:
@@ -77,59 +191,33 @@ class SNBCollector(BaseCollector[pd.DataFrame]):
         - Code 'T0' = Total (total assets)
         - Date column is 'Date' in YYYY-MM format
         - Value column is 'Value'
-        """
-        # SNB CSV has metadata lines before the actual data
-        # Skip lines until we find the header row with "Date";"D0";"Value"
-        lines = csv_text.split("\n")
-        header_idx = None
-        for i, line in enumerate(lines):
-            if line.startswith('"Date";"D0"'):
-                header_idx = i
-                break
-
-        if header_idx is None:
-            raise CollectorFetchError("Could not find data header in SNB CSV")
-
-        # Read CSV starting from the header row
-        data_text = "\n".join(lines[header_idx:])
-        df = pd.read_csv(io.StringIO(data_text), sep=";")
-
-        logger.debug("SNB CSV columns: %s", df.columns.tolist())
-
-        # Filter for Total (T0) row - this is the total assets
-        if "D0" not in df.columns:
-            raise CollectorFetchError(
-                f"Expected 'D0' column in SNB data. Got: {df.columns.tolist()}"
-            )
 
-        total_df = df[df["D0"] == "T0"].copy()
+        Args:
+            csv_text: Whole CSV text, or its lines.
+            start_date: Keep months starting on or after this date.
+            end_date: Keep months starting on or before this date.
 
-        if total_df.empty:
-            raise CollectorFetchError("No total assets (T0) found in SNB data")
+        Returns:
+            DataFrame with columns: timestamp, series_id, source, value, unit
 
-        # Parse dates (YYYY-MM format)
-        total_df["timestamp"] = pd.to_datetime(total_df["Date"], format="%Y-%m")
-
-        # Filter by date range if specified
-        if start_date:
-            total_df = total_df[total_df["timestamp"] >= pd.to_datetime(start_date)]
-        if end_date:
-            total_df = total_df[total_df["timestamp"] <= pd.to_datetime(end_date)]
-
-        # Normalize to standard format
-        result = pd.DataFrame(
-            {
-                "timestamp": total_df["timestamp"],
-                "series_id": "SNB_TOTAL_ASSETS",
-                "source": "snb",
-                "value": total_df["Value"].astype(float),
-                "unit": "millions_chf",
-            }
+        Raises:
+            CollectorFetchError: If the header or the T0 item is missing.
+        """
+        rows = _CubeFilter(TOTAL_ASSETS_ITEM, start_date, end_date)
+        for line in io.StringIO(csv_text) if isinstance(csv_text, str) else csv_text:
+            rows.feed(line)
+        return self._result(rows)
+
+    @staticmethod
+    def _result(rows: _CubeFilter) -> pd.DataFrame:
+        """Frame of the filtered rows."""
+        result = rows.frame()
+        logger.info(
+            "Fetched %d SNB data points (%d %s rows in cube)",
+            len(result),
+            rows.matched,
+            rows.item,
         )
-
-        result = result.sort_values("timestamp").reset_index(drop=True)
-        logger.info("Fetched %d SNB data points", len(result))
-
         return result
 
     async def collect_total_assets(
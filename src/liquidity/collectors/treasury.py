@@ -0,0 +1,151 @@
+"""U.S. Treasury collector for the daily TGA balance.
+
+Fetches the Treasury General Account closing balance from the Daily Treasury
+Statement (DTS) via the Fiscal Data API (no auth required). The DTS is
+published around 16:00 ET on the business day after the record date, days
+before the same balance appears in the weekly H.4.1 (WDTGAL).
+"""
+
+import logging
+from datetime import datetime
+from typing import Any
+
+import httpx
+import pandas as pd
+
+from liquidity.collectors.base import BaseCollector
+from liquidity.collectors.registry import registry
+from liquidity.config import Settings, get_settings
+from liquidity.frames import empty_frame, series_frame
+
+logger = logging.getLogger(__name__)
+
+FISCALDATA_BASE_URL = "https://api.fiscaldata.treasury.gov/services/api/fiscal_service"
+DTS_CASH_BALANCE_PATH = "/v1/accounting/dts/operating_cash_balance"
+
+# DTS row holding the TGA closing balance (statement format since October 2021).
+# The Fiscal Data API reports that row's amount in the open_today_bal field.
+TGA_CLOSING_ACCOUNT = "Treasury General Account (TGA) Closing Balance"
+TGA_BALANCE_FIELD = "open_today_bal"
+
+# Rows per API page (the API maximum)
+PAGE_SIZE = 10_000
+
+SERIES_MAP: dict[str, str] = {
+    "tga_daily": "TGA_DAILY",  # TGA closing balance - Daily, Millions USD
+}
+
+UNIT_MAP: dict[str, str] = {
+    "TGA_DAILY": "millions_usd",
+}
+
+
+class TreasuryCollector(BaseCollector[pd.DataFrame]):
+    """Daily TGA balance from the Daily Treasury Statement."""
+
+    SERIES_MAP = SERIES_MAP
+
+    def __init__(
+        self,
+        name: str = "treasury",
+        settings: Settings | None = None,
+        base_url: str = FISCALDATA_BASE_URL,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize Treasury collector.
+
+        Args:
+            name: Collector name for circuit breaker.
+            settings: Optional settings override.
+            base_url: Fiscal Data API root (overridable for tests).
+            **kwargs: Additional arguments passed to BaseCollector.
+        """
+        super().__init__(name=name, settings=settings, **kwargs)
+        self._settings = settings or get_settings()
+        self.base_url = base_url.rstrip("/")
+
+    async def collect(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ) -> pd.DataFrame:
+        """Collect the daily TGA closing balance.
+
+        Args:
+            start_date: First record date to fetch. Defaults to the full history
+                of the current statement format.
+            end_date: Last record date to fetch.
+
+        Returns:
+            DataFrame with columns: timestamp, series_id, source, value, unit
+
+        Raises:
+            CollectorFetchError: If data fetch fails after retries.
+        """
+
+        async def _fetch() -> pd.DataFrame:
+            return await self._fetch_async(start_date, end_date)
+
+        return await self.fetch_with_retry(_fetch)
+
+    async def _fetch_async(
+        self,
+        start_date: datetime | None,
+        end_date: datetime | None,
+    ) -> pd.DataFrame:
+        """Fetch every page of TGA closing balances."""
+        filters = [f"account_type:eq:{TGA_CLOSING_ACCOUNT}"]
+        if start_date:
+            filters.append(f"record_date:gte:{start_date.strftime('%Y-%m-%d')}")
+        if end_date:
+            filters.append(f"record_date:lte:{end_date.strftime('%Y-%m-%d')}")
+        params: dict[str, str | int] = {
+            "fields": f"record_date,account_type,{TGA_BALANCE_FIELD}",
+            "filter": ",".join(filters),
+            "sort": "record_date",
+            "page[size]": PAGE_SIZE,
+        }
+
+        logger.info("Fetching TGA balance from the Daily Treasury Statement")
+
+        records: list[dict[str, Any]] = []
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            page, pages = 1, 1
+            while page <= pages:
+                response = await client.get(
+                    f"{self.base_url}{DTS_CASH_BALANCE_PATH}",
+                    params={**params, "page[number]": page},
+                )
+                response.raise_for_status()
+                payload = response.json()
+                records.extend(payload.get("data", []))
+                pages = int(payload.get("meta", {}).get("total-pages", 1))
+                page += 1
+
+        return self._parse_records(records)
+
+    def _parse_records(self, records: list[dict[str, Any]]) -> pd.DataFrame:
+        """Normalize DTS rows (string-typed fields) to the standard columns."""
+        if not records:
+            logger.warning("No TGA balances returned from the Daily Treasury Statement")
+            return empty_frame()
+
+        raw = pd.DataFrame.from_records(records)
+        raw = raw[raw["account_type"] == TGA_CLOSING_ACCOUNT]
+        df = series_frame(
+            raw["record_date"],
+            # Missing amounts are reported as the string "null"
+            pd.to_numeric(raw[TGA_BALANCE_FIELD], errors="coerce"),
+            "TGA_DAILY",
+            "treasury",
+            UNIT_MAP["TGA_DAILY"],
+        )
+        df = df.dropna(subset=["value"]).sort_values("timestamp").reset_index(drop=True)
+
+        logger.info("Fetched %d TGA balances from the Daily Treasury Statement", len(df))
+
+        return df
+
+
+# Register collector
+registry.register("treasury", TreasuryCollector)
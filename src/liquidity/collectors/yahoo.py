@@ -18,6 +18,7 @@ from openbb import obb
 from liquidity.collectors.base import BaseCollector, CollectorFetchError
 from liquidity.collectors.registry import registry
 from liquidity.config import Settings, get_settings
+from liquidity.frames import concat_frames, empty_frame, series_frame
 
 logger = logging.getLogger(__name__)
 
@@ -170,14 +171,13 @@ class YahooCollector(BaseCollector[pd.DataFrame]):
                 )
 
                 # Vectorized normalization instead of row iteration
-                normalized = pd.DataFrame(
-                    {
-                        "timestamp": pd.to_datetime(df[date_col]),
-                        "symbol": symbol,
-                        "source": "yahoo",
-                        "value": df.get("close", df.get("adj_close")),
-                        "unit": "index",
-                    }
+                normalized = series_frame(
+                    df[date_col],
+                    df.get("close", df.get("adj_close")),
+                    symbol,
+                    "yahoo",
+                    "index",
+                    key_column="symbol",
                 )
                 all_data.append(normalized)
 
@@ -192,11 +192,9 @@ class YahooCollector(BaseCollector[pd.DataFrame]):
             logger.warning(
                 "No data fetched from Yahoo Finance for symbols: %s", symbols
             )
-            return pd.DataFrame(
-                columns=["timestamp", "symbol", "source", "value", "unit"]
-            )
+            return empty_frame(key_column="symbol")
 
-        result_df = pd.concat(all_data, ignore_index=True)
+        result_df = concat_frames(all_data, key_column="symbol")
         result_df = (
             result_df.dropna(subset=["value"])
             .sort_values("timestamp")
@@ -49,6 +49,25 @@ class RetrySettings(BaseSettings):
     )
 
 
+class SchedulerSettings(BaseSettings):
+    """Release-aware refresh scheduler configuration."""
+
+    model_config = SettingsConfigDict(env_prefix="LIQUIDITY_SCHEDULER_")
+
+    dense_interval: int = Field(
+        default=300,
+        description="Seconds between polls inside an expected release window",
+    )
+    max_interval: int = Field(
+        default=21600,
+        description="Maximum seconds between polls when a release is late",
+    )
+    jitter: float = Field(
+        default=0.1,
+        description="Random jitter as a fraction of each poll interval",
+    )
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables.
 
@@ -85,6 +104,64 @@ class Settings(BaseSettings):
         default=9000,
         description="QuestDB HTTP port for queries",
     )
+    questdb_pg_pool_size: int = Field(
+        default=4,
+        description="Maximum pooled PGWire connections per QuestDBStorage",
+    )
+    questdb_statement_cache_size: int = Field(
+        default=16,
+        description="Prepared statements cached per async PGWire connection",
+    )
+
+    # Storage backend selection
+    storage_backend: str = Field(
+        default="questdb",
+        description="Storage backend: 'questdb' or 'duckdb' (embedded, no services)",
+    )
+    duckdb_dir: str = Field(
+        default="data/duckdb",
+        description="Root directory of the embedded DuckDB/Parquet backend",
+    )
+
+    # Local snapshot store (read-through tier in front of QuestDB). Off by default:
+    # snapshot_dir is relative to the working directory, so processes only write
+    # there (and read through it) once a deployment opts in.
+    snapshot_enabled: bool = Field(
+        default=False,
+        description="Mirror ingested data to the local snapshot store (opt-in)",
+    )
+    snapshot_dir: str = Field(
+        default="data/snapshots",
+        description="Root directory of the local Arrow snapshot store",
+    )
+
+    # Durable ingest spool (write-ahead for failed QuestDB ingestion)
+    spool_enabled: bool = Field(
+        default=False,
+        description="Spool batches QuestDB cannot accept and replay them later (opt-in)",
+    )
+    spool_dir: str = Field(
+        default="data/spool",
+        description="Directory of append-only spool segments",
+    )
+    spool_max_bytes: int = Field(
+        default=512 * 1024 * 1024,
+        description="Disk budget for the spool; oldest segments are dropped beyond it",
+    )
+    spool_max_attempts: int = Field(
+        default=3,
+        description="Replays QuestDB may reject (while healthy) before a segment is quarantined",
+    )
+
+    # Downsampled rollup tables (business-day, weekly, monthly)
+    rollups_enabled: bool = Field(
+        default=True,
+        description="Maintain rollup tables after ingest and read them for downsampled queries",
+    )
+    rollup_refresh_delay: float = Field(
+        default=1.0,
+        description="Seconds ingests are batched before rollups are refreshed in the background",
+    )
 
     # Redis configuration
     redis_url: str = Field(
@@ -107,6 +184,10 @@ class Settings(BaseSettings):
         default_factory=RetrySettings,
         description="Retry configuration",
     )
+    scheduler: SchedulerSettings = Field(
+        default_factory=SchedulerSettings,
+        description="Refresh scheduler configuration",
+    )
 
     # Logging
     log_level: str = Field(
@@ -131,6 +212,8 @@ class Settings(BaseSettings):
             self.circuit_breaker = CircuitBreakerSettings()
         if self.retry is None:
             self.retry = RetrySettings()
+        if self.scheduler is None:
+            self.scheduler = SchedulerSettings()
 
 
 @lru_cache
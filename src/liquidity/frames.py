@@ -0,0 +1,186 @@
+"""Canonical normalized frame emitted by collectors.
+
+Every collector returns long-format rows: timestamp, a series key
+(``series_id``, or ``symbol`` for Yahoo), source, value and unit. Built the
+obvious way, the three symbol columns repeat a string on every row, so a
+multi-decade backfill of dozens of series spends most of its memory on copies
+of "fred" and "millions_usd". The canonical frame instead uses:
+- ``timestamp``: datetime64[ns, UTC] (naive inputs are taken as UTC)
+- symbol columns: pandas categoricals (int8 codes plus one copy of each
+  distinct string), which convert to Arrow dictionary arrays without
+  re-encoding and which QuestDB's ILP sender writes as SYMBOL columns
+- ``value``: float64
+
+A canonical row takes 19 bytes instead of 60 or more. ``series_frame`` builds
+one from per-series constants without materializing repeated strings;
+``normalize_frame`` converts any long frame and returns canonical frames
+unchanged, so storage can ingest collector output without copying it.
+
+Storage and the engines work in naive UTC (QuestDB's convention);
+``naive_utc`` and ``naive_utc_ns`` are the one conversion they all use, so
+stored rows (naive) and collector frames (UTC) can be mixed freely.
+"""
+
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+SYMBOL_COLUMNS = ("source", "unit")
+TIMESTAMP_DTYPE = pd.DatetimeTZDtype("ns", "UTC")
+
+
+def frame_columns(key_column: str = "series_id") -> list[str]:
+    """Standard column order of a collector frame."""
+    return ["timestamp", key_column, "source", "value", "unit"]
+
+
+def _symbols(values: Any, length: int) -> pd.Categorical:
+    """Categorical of a scalar (repeated ``length`` times) or of per-row values."""
+    if isinstance(values, str):
+        dtype = pd.CategoricalDtype([values])
+        return pd.Categorical.from_codes(np.zeros(length, dtype="int8"), dtype=dtype)
+    if isinstance(values, pd.Series) and isinstance(values.dtype, pd.CategoricalDtype):
+        return values.array  # type: ignore[return-value]
+    return pd.Categorical(np.asarray(values, dtype=object))
+
+
+def _utc(timestamps: Any) -> pd.DatetimeIndex:
+    """datetime64[ns, UTC] timestamps (naive inputs are taken as UTC)."""
+    if not pd.api.types.is_datetime64_any_dtype(timestamps):
+        # Strings, dates or mixed values: one vectorized parse
+        timestamps = pd.to_datetime(timestamps, utc=True)
+    index = pd.DatetimeIndex(timestamps)
+    index = index.tz_localize("UTC") if index.tz is None else index.tz_convert("UTC")
+    return index.as_unit("ns")
+
+
+def naive_utc(timestamps: Any) -> pd.DatetimeIndex:
+    """datetime64[ns] naive-UTC timestamps (naive inputs are taken as UTC).
+
+    Accepts naive, aware or mixed datetime-likes, strings and dates.
+    """
+    return _utc(timestamps).tz_localize(None)
+
+
+def naive_utc_ns(timestamps: Any) -> np.ndarray:
+    """Naive-UTC timestamps as int64 nanoseconds (see ``naive_utc``)."""
+    result: np.ndarray = naive_utc(timestamps).to_numpy().view("int64")
+    return result
+
+
+def series_frame(
+    timestamps: Any,
+    values: Any,
+    series_id: str | Sequence[str] | pd.Series,
+    source: str | Sequence[str] | pd.Series,
+    unit: str | Sequence[str] | pd.Series,
+    key_column: str = "series_id",
+) -> pd.DataFrame:
+    """Build a canonical frame.
+
+    Args:
+        timestamps: Observation timestamps (datetime-like, strings or dates).
+        values: Observation values (converted to float64).
+        series_id: Series key, one for all rows or one per row.
+        source: Source label, one for all rows or one per row.
+        unit: Unit symbol, one for all rows or one per row.
+        key_column: Name of the series key column ("symbol" for Yahoo).
+
+    Returns:
+        DataFrame with ``frame_columns(key_column)`` in canonical dtypes.
+    """
+    index = _utc(timestamps)
+    length = len(index)
+    return pd.DataFrame(
+        {
+            "timestamp": index,
+            key_column: _symbols(series_id, length),
+            "source": _symbols(source, length),
+            "value": np.asarray(values, dtype="float64"),
+            "unit": _symbols(unit, length),
+        }
+    )
+
+
+def empty_frame(key_column: str = "series_id") -> pd.DataFrame:
+    """Canonical frame with no rows."""
+    return series_frame([], [], [], [], [], key_column=key_column)
+
+
+def is_normalized(df: pd.DataFrame, key_column: str = "series_id") -> bool:
+    """Whether a frame already has the canonical dtypes."""
+    dtypes = df.dtypes
+    return (
+        all(column in df.columns for column in frame_columns(key_column))
+        and dtypes["timestamp"] == TIMESTAMP_DTYPE
+        and dtypes["value"] == np.dtype("float64")
+        and all(
+            isinstance(dtypes[column], pd.CategoricalDtype)
+            for column in (key_column, *SYMBOL_COLUMNS)
+        )
+    )
+
+
+def normalize_frame(df: pd.DataFrame, key_column: str = "series_id") -> pd.DataFrame:
+    """Convert a long frame to canonical dtypes.
+
+    Canonical frames are returned as-is; otherwise only the columns that need
+    converting are replaced (other columns are shared, not copied). Extra
+    columns (e.g. ``stale``) are kept after the standard ones.
+
+    Args:
+        df: Long-format rows with the standard columns.
+        key_column: Name of the series key column.
+
+    Returns:
+        Frame with canonical dtypes.
+    """
+    if is_normalized(df, key_column):
+        return df
+    columns = frame_columns(key_column)
+    converted: dict[str, Any] = {}
+    if df["timestamp"].dtype != TIMESTAMP_DTYPE:
+        converted["timestamp"] = pd.Series(_utc(df["timestamp"]), index=df.index)
+    if df["value"].dtype != np.dtype("float64"):
+        converted["value"] = pd.to_numeric(df["value"], errors="coerce").astype("float64")
+    for column in (key_column, *SYMBOL_COLUMNS):
+        if not isinstance(df[column].dtype, pd.CategoricalDtype):
+            converted[column] = df[column].astype("category")
+    extra = [column for column in df.columns if column not in columns]
+    return df.assign(**converted)[columns + extra]
+
+
+def concat_frames(frames: Iterable[pd.DataFrame], key_column: str = "series_id") -> pd.DataFrame:
+    """Concatenate canonical frames, merging their categories.
+
+    ``pd.concat`` keeps a categorical column only when every frame has the same
+    categories, so each symbol column is first widened to the union.
+
+    Args:
+        frames: Frames to concatenate.
+        key_column: Name of the series key column.
+
+    Returns:
+        Canonical frame with a fresh RangeIndex.
+    """
+    parts = [normalize_frame(frame, key_column) for frame in frames]
+    if not parts:
+        return empty_frame(key_column)
+    widened: dict[str, list[str]] = {}
+    for column in (key_column, *SYMBOL_COLUMNS):
+        categories: dict[str, None] = {}
+        for part in parts:
+            categories.update(dict.fromkeys(part[column].cat.categories))
+        widened[column] = list(categories)
+    parts = [
+        part.assign(
+            **{
+                column: part[column].cat.set_categories(categories)
+                for column, categories in widened.items()
+            }
+        )
+        for part in parts
+    ]
+    return pd.concat(parts, ignore_index=True)
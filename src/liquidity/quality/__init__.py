@@ -0,0 +1,19 @@
+"""Data-quality checks on collected series.
+
+A streaming stage between collection and ingest that flags jumps, missing
+releases and timestamp anomalies, and records them in the data_quality table.
+"""
+
+from liquidity.quality.detector import (
+    DEFAULT_THRESHOLD,
+    DEFAULT_WINDOW,
+    AnomalyDetector,
+    Issue,
+)
+
+__all__ = [
+    "AnomalyDetector",
+    "Issue",
+    "DEFAULT_WINDOW",
+    "DEFAULT_THRESHOLD",
+]
@@ -0,0 +1,392 @@
+"""Streaming anomaly and gap detection for collected series.
+
+A data-quality stage between collection and ingest. Every batch of collector
+rows is checked before it lands in raw_data, and flags are written to the
+data_quality table:
+- outlier: the change from the previous observation is more than
+  ``threshold`` standard deviations from the mean of the previous ``window``
+  changes of the series
+- gap: expected observations (from the release calendar cadence) are missing
+  between two observations, e.g. a skipped weekly H.4.1 print; daily series
+  tolerate a few missing business days for holidays
+- fetch_time: a calendar series observation carries a time of day, i.e. the
+  collector stamped it with the fetch time instead of the observation date
+  (scrapers falling back to ``now()`` when no report date is found)
+- future: an observation is dated after the time it was checked
+
+Checks are vectorized per series over whole batches; streaming keeps only the
+last ``window`` + 1 observations of each series, so checking a new release
+costs the same whatever the history length, and ``audit`` runs the same
+checks over a full history in one pass. ``overdue`` flags releases that the
+calendar says should have arrived but have not.
+"""
+
+import logging
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import StrEnum
+from zoneinfo import ZoneInfo
+
+import numpy as np
+import pandas as pd
+
+from liquidity.scheduler import RELEASE_CALENDAR, Cadence, ReleaseEvent, ReleaseSchedule
+from liquidity.storage.backend import Storage
+from liquidity.storage.schemas import DATA_QUALITY_COLUMNS, DATA_QUALITY_TABLE
+
+logger = logging.getLogger(__name__)
+
+
+class Issue(StrEnum):
+    """Data-quality issue."""
+
+    OUTLIER = "outlier"
+    GAP = "gap"
+    FETCH_TIME = "fetch_time"
+    FUTURE = "future"
+
+
+# Rolling window (observations) and threshold of the jump test
+DEFAULT_WINDOW = 52
+DEFAULT_THRESHOLD = 3.0
+DEFAULT_MIN_PERIODS = 20
+# Missing expected observations tolerated before a gap is flagged (holidays)
+GAP_TOLERANCE: dict[Cadence, int] = {
+    Cadence.DAILY: 2,
+    Cadence.WEEKLY: 0,
+    Cadence.MONTHLY: 0,
+}
+
+QualityCallback = Callable[[pd.DataFrame], None]
+
+
+def _wall_time(timestamps: pd.Series) -> pd.Series:
+    """Timestamps as naive wall-clock time in their own time zone."""
+    if timestamps.dtype == object:
+        # Mixed naive and aware rows (e.g. several scrapers in one batch)
+        timestamps = timestamps.map(lambda ts: pd.Timestamp(ts).replace(tzinfo=None))
+    ts = pd.to_datetime(timestamps)
+    if ts.dt.tz is not None:
+        ts = ts.dt.tz_localize(None)
+    return ts.dt.as_unit("ns")
+
+
+def _weekmask(schedule: ReleaseSchedule) -> str:
+    """numpy busday weekmask of the observation dates of a daily or weekly series."""
+    if schedule.cadence == Cadence.DAILY:
+        return "1111100"
+    weekday = ((schedule.weekday or 0) - schedule.observation_lag.days) % 7
+    return "".join("1" if day == weekday else "0" for day in range(7))
+
+
+def _missing(schedule: ReleaseSchedule, days: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Expected observations missing between consecutive observation dates.
+
+    Args:
+        schedule: Release schedule of the series.
+        days: Sorted observation dates (datetime64[D]).
+
+    Returns:
+        Number of expected dates strictly between each observation and the
+        previous one (0 for the first), and the first missing date.
+    """
+    previous, current = days[:-1], days[1:]
+    if schedule.cadence == Cadence.MONTHLY:
+        months = previous.astype("datetime64[M]")
+        count = current.astype("datetime64[M]") - months - 1
+        first = (months + 1).astype("datetime64[D]") + (previous - months.astype("datetime64[D]"))
+        count = count.astype("int64")
+    else:
+        mask = _weekmask(schedule)
+        start = previous + 1
+        count = np.busday_count(start, current, weekmask=mask)
+        first = np.busday_offset(start, 0, roll="forward", weekmask=mask)
+    return np.r_[0, count], np.r_[days[:1], first]
+
+
+def _jump_scores(values: np.ndarray, window: int, min_periods: int) -> np.ndarray:
+    """z-score of each change against the ``window`` changes before it (NaN first)."""
+    changes = pd.Series(np.diff(values))
+    rolling = changes.rolling(window, min_periods=min_periods)
+    mean = rolling.mean().shift(1).to_numpy()
+    std = rolling.std().shift(1).to_numpy()
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scores: np.ndarray = (changes.to_numpy() - mean) / np.where(std > 0, std, np.nan)
+    return np.concatenate([[np.nan], scores])
+
+
+@dataclass
+class _SeriesTail:
+    """Last observations of one series (enough to check the next batch)."""
+
+    times: deque[pd.Timestamp] = field(default_factory=deque)
+    values: deque[float] = field(default_factory=deque)
+
+
+class AnomalyDetector:
+    """Streaming data-quality checks on collected rows.
+
+    Example:
+        detector = AnomalyDetector(storage=storage)
+        detector.prime(storage.load_frame("raw_data", series_ids))
+
+        # Subscribed before the ingest handler, so flags are raised first
+        scheduler.subscribe(detector.on_release)
+        scheduler.subscribe(ingest_release)
+
+        # Full-history audit
+        flags = detector.audit(history)
+    """
+
+    def __init__(
+        self,
+        storage: Storage | None = None,
+        schedules: Iterable[ReleaseSchedule] | None = None,
+        window: int = DEFAULT_WINDOW,
+        threshold: float = DEFAULT_THRESHOLD,
+        min_periods: int = DEFAULT_MIN_PERIODS,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        """Initialize the detector.
+
+        Args:
+            storage: Optional storage; flags are written to data_quality.
+            schedules: Release schedules giving each series' cadence.
+                Defaults to RELEASE_CALENDAR; series without a schedule get
+                only the outlier and future checks.
+            window: Number of previous changes in the jump statistics.
+            threshold: |z-score| of a change flagged as an outlier.
+            min_periods: Changes required before jumps are scored.
+            clock: Returns the current UTC time (injectable for tests).
+
+        Raises:
+            ValueError: If ``min_periods`` exceeds ``window``.
+        """
+        if not 2 <= min_periods <= window:
+            raise ValueError("min_periods must be between 2 and window")
+        self.storage = storage
+        self.schedules = {
+            schedule.series_id: schedule
+            for schedule in (RELEASE_CALENDAR.values() if schedules is None else schedules)
+        }
+        self.window = window
+        self.threshold = threshold
+        self.min_periods = min_periods
+        self._clock = clock or (lambda: datetime.now(UTC))
+        self._tails: dict[str, _SeriesTail] = {}
+        self._subscribers: list[QualityCallback] = []
+
+    def subscribe(self, callback: QualityCallback) -> None:
+        """Register a callback invoked with every non-empty batch of flags."""
+        self._subscribers.append(callback)
+
+    def audit(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Check a full history without touching the streaming state.
+
+        Args:
+            df: Long-format rows (timestamp, series_id, value).
+
+        Returns:
+            Flags with timestamp, series_id, issue, value, score (z-score of
+            the jump, or number of missing observations for gaps).
+        """
+        return self._check(df, self._clock(), update=False)
+
+    def prime(self, df: pd.DataFrame) -> None:
+        """Load history into the streaming state without flagging.
+
+        Args:
+            df: Long-format rows already stored.
+        """
+        self._check(df, self._clock(), update=True)
+
+    def check(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Check newly collected rows against each series' recent history.
+
+        Rows at or before a series' latest observation (revisions) only get
+        the timestamp checks.
+
+        Args:
+            df: Long-format collector rows (timestamp, series_id, value).
+
+        Returns:
+            Flags raised by the batch (see ``audit``), also written to
+            data_quality and pushed to subscribers.
+        """
+        flags = self._check(df, self._clock(), update=True)
+        self._emit(flags)
+        return flags
+
+    def overdue(self, now: datetime | None = None) -> pd.DataFrame:
+        """Flag expected releases that have not arrived.
+
+        A release counts as overdue once its polling window has passed
+        without its observation reaching the detector.
+
+        Args:
+            now: Reference time. Defaults to the detector clock.
+
+        Returns:
+            One gap flag per overdue series, dated at the first missing
+            observation, with the number of missing observations as score.
+        """
+        now = now or self._clock()
+        rows = []
+        for series_id, tail in self._tails.items():
+            schedule = self.schedules.get(series_id)
+            if schedule is None or not tail.times:
+                continue
+            release = schedule.previous_release(now - schedule.window)
+            local = release.astimezone(ZoneInfo(schedule.tz)).date()
+            expected = np.datetime64(local - schedule.observation_lag, "D")
+            last = tail.times[-1].to_datetime64().astype("datetime64[D]")
+            if expected <= last:
+                continue
+            count, first = _missing(schedule, np.array([last, expected + 1]))
+            if count[1] > GAP_TOLERANCE[schedule.cadence]:
+                rows.append((pd.Timestamp(first[1]), series_id, Issue.GAP, np.nan, count[1]))
+        flags = self._frame(rows)
+        self._emit(flags)
+        return flags
+
+    async def on_release(self, event: ReleaseEvent) -> None:
+        """Scheduler handler: check a release's rows."""
+        self.check(event.data)
+
+    def _check(self, df: pd.DataFrame, now: datetime, update: bool) -> pd.DataFrame:
+        """Run all checks on a batch; optionally extend the streaming state."""
+        if df.empty:
+            return self._frame([])
+        timestamps = _wall_time(df["timestamp"])
+        series_ids = df["series_id"].astype(str)
+        values = df["value"].to_numpy(dtype="float64")
+        utc = pd.to_datetime(df["timestamp"], utc=True)
+        scheduled = series_ids.isin(self.schedules).to_numpy()
+
+        flagged: list[pd.DataFrame] = []
+        issue_masks = {
+            Issue.FETCH_TIME: scheduled & (timestamps != timestamps.dt.normalize()).to_numpy(),
+            Issue.FUTURE: (utc > pd.Timestamp(now)).to_numpy(),
+        }
+        for issue, mask in issue_masks.items():
+            if mask.any():
+                flagged.append(
+                    pd.DataFrame(
+                        {
+                            "timestamp": timestamps[mask],
+                            "series_id": series_ids[mask],
+                            "issue": issue,
+                            "value": values[mask],
+                            "score": np.nan,
+                        }
+                    )
+                )
+
+        frame = pd.DataFrame(
+            {"timestamp": timestamps, "series_id": series_ids, "value": values}
+        ).dropna(subset=["value"])
+        for series_id, rows in frame.groupby("series_id", sort=False):
+            flagged.extend(self._check_series(str(series_id), rows, update))
+
+        flags = pd.concat([self._frame([]), *flagged], ignore_index=True)
+        return self._unique(flags)
+
+    def _check_series(self, series_id: str, rows: pd.DataFrame, update: bool) -> list[pd.DataFrame]:
+        """Jump and gap checks of one series' new rows, preceded by its tail."""
+        rows = rows.sort_values("timestamp", kind="stable").drop_duplicates(
+            "timestamp", keep="last"
+        )
+        tail = self._tails.get(series_id, _SeriesTail()) if update else _SeriesTail()
+        if tail.times:
+            rows = rows[rows["timestamp"] > tail.times[-1]]
+        if rows.empty:
+            return []
+
+        times = np.concatenate(
+            [np.array(tail.times, dtype="datetime64[ns]"), rows["timestamp"].to_numpy()]
+        )
+        values = np.concatenate([np.array(tail.values, dtype="float64"), rows["value"].to_numpy()])
+        new = slice(len(tail.times), None)
+
+        flagged: list[pd.DataFrame] = []
+        scores = _jump_scores(values, self.window, self.min_periods)[new]
+        with np.errstate(invalid="ignore"):
+            jumps = np.abs(scores) > self.threshold
+        if jumps.any():
+            flagged.append(
+                pd.DataFrame(
+                    {
+                        "timestamp": times[new][jumps],
+                        "series_id": series_id,
+                        "issue": Issue.OUTLIER,
+                        "value": values[new][jumps],
+                        "score": scores[jumps],
+                    }
+                )
+            )
+
+        schedule = self.schedules.get(series_id)
+        if schedule is not None and len(times) > 1:
+            count, first = _missing(schedule, times.astype("datetime64[D]"))
+            gaps = count[new] > GAP_TOLERANCE[schedule.cadence]
+            if gaps.any():
+                flagged.append(
+                    pd.DataFrame(
+                        {
+                            "timestamp": first[new][gaps].astype("datetime64[ns]"),
+                            "series_id": series_id,
+                            "issue": Issue.GAP,
+                            "value": np.nan,
+                            "score": count[new][gaps].astype("float64"),
+                        }
+                    )
+                )
+
+        if update:
+            # One more observation than changes in the window
+            keep = self.window + 1
+            self._tails[series_id] = _SeriesTail(
+                deque(pd.DatetimeIndex(times[-keep:]), maxlen=keep),
+                deque(values[-keep:].tolist(), maxlen=keep),
+            )
+        return flagged
+
+    @staticmethod
+    def _unique(flags: pd.DataFrame) -> pd.DataFrame:
+        """One row per (timestamp, series_id, issue), the data_quality dedup keys."""
+        if flags.empty:
+            return flags
+        flags = flags.sort_values(["series_id", "timestamp", "issue"], kind="stable")
+        unique = flags.drop_duplicates(["series_id", "timestamp", "issue"], keep="last")
+        return unique.reset_index(drop=True)[DATA_QUALITY_COLUMNS]
+
+    @staticmethod
+    def _frame(rows: list[tuple[pd.Timestamp, str, Issue, float, float]]) -> pd.DataFrame:
+        """Build a flag frame from tuples."""
+        frame = pd.DataFrame(rows, columns=DATA_QUALITY_COLUMNS)
+        frame["timestamp"] = pd.to_datetime(frame["timestamp"]).dt.as_unit("ns")
+        frame["series_id"] = frame["series_id"].astype(str)
+        frame["issue"] = frame["issue"].astype(str)
+        frame["value"] = frame["value"].astype("float64")
+        frame["score"] = frame["score"].astype("float64")
+        return frame
+
+    def _emit(self, flags: pd.DataFrame) -> None:
+        """Log, persist and publish a batch of flags."""
+        if flags.empty:
+            return
+        logger.warning(
+            "Data quality: %d flag(s) (%s)",
+            len(flags),
+            ", ".join(f"{issue}={count}" for issue, count in flags["issue"].value_counts().items()),
+        )
+        if self.storage is not None:
+            self.storage.ingest_dataframe(DATA_QUALITY_TABLE, flags)
+        for callback in self._subscribers:
+            callback(flags)
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"AnomalyDetector(series={len(self._tails)}, window={self.window})"
@@ -0,0 +1,29 @@
+"""Release-calendar aware refresh scheduling.
+
+Polls each series around its expected publication time instead of a flat cron,
+and emits release events that trigger downstream recomputation.
+"""
+
+from liquidity.scheduler.calendar import (
+    RELEASE_CALENDAR,
+    Cadence,
+    ReleaseSchedule,
+)
+from liquidity.scheduler.scheduler import (
+    RefreshScheduler,
+    ReleaseEvent,
+    SeriesState,
+    collect_release,
+)
+
+__all__ = [
+    # Calendar
+    "Cadence",
+    "ReleaseSchedule",
+    "RELEASE_CALENDAR",
+    # Scheduler
+    "RefreshScheduler",
+    "ReleaseEvent",
+    "SeriesState",
+    "collect_release",
+]
@@ -0,0 +1,281 @@
+"""Release calendar for collected series.
+
+Each series publishes on a known cadence (daily, weekly, monthly) at a roughly
+known time of day. The calendar turns that knowledge into expected release
+datetimes so the scheduler can poll densely around a release and stay idle
+elsewhere.
+
+Publication times are approximate and expressed in the publisher's local time zone:
+- H.4.1 (WALCL, WLRRAL, WDTGAL, WRESBAL): Thursdays 16:30 ET
+- SOFR: business days 08:00 ET
+- TGA_DAILY: Daily Treasury Statement, next business day 16:00 ET
+- RRP_DAILY: NY Fed ON RRP results, business days 13:15 ET
+- VIXCLS, VXVCLS, ICE BofA OAS: next business day morning on FRED
+- DGS2, DGS10, T10Y2Y: business days 16:15 ET (H.15)
+- ECBASSETSW: Tuesdays 15:00 CET (weekly financial statement)
+- JPNASSETS: monthly, mid-month on FRED
+- SNB balance sheet cube: monthly, early in the month
+- PBoC balance sheet: monthly, with a one-month lag
+"""
+
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+from enum import StrEnum
+from zoneinfo import ZoneInfo
+
+
+class Cadence(StrEnum):
+    """Release cadence of a series."""
+
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+
+
+# Typical spacing between releases, used to size lookback windows
+CADENCE_PERIOD: dict[Cadence, timedelta] = {
+    Cadence.DAILY: timedelta(days=1),
+    Cadence.WEEKLY: timedelta(days=7),
+    Cadence.MONTHLY: timedelta(days=31),
+}
+
+
+@dataclass(frozen=True)
+class ReleaseSchedule:
+    """Publication schedule of a single series.
+
+    Attributes:
+        series_id: Series identifier as stored in raw_data.
+        collector: Registered collector name used to fetch the series.
+        cadence: Release cadence.
+        release_time: Expected publication time of day in ``tz``.
+        tz: IANA time zone of the publisher.
+        weekday: Release weekday for weekly series (0=Monday).
+        day_of_month: Release day for monthly series (rolled forward past weekends).
+        window: How long after the expected release to poll densely.
+        observation_lag: Delay between the observation date and its publication.
+        alternates: Other series ids that carry the same release, e.g. the
+            proxy series a collector emits from its fallback tier.
+    """
+
+    series_id: str
+    collector: str
+    cadence: Cadence
+    release_time: time
+    tz: str = "America/New_York"
+    weekday: int | None = None
+    day_of_month: int | None = None
+    window: timedelta = timedelta(hours=2)
+    observation_lag: timedelta = timedelta(0)
+    alternates: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        """Validate cadence-specific fields."""
+        if self.cadence == Cadence.WEEKLY and self.weekday is None:
+            raise ValueError(f"Weekly schedule for {self.series_id} requires weekday")
+        if self.cadence == Cadence.MONTHLY and not 1 <= (self.day_of_month or 0) <= 28:
+            raise ValueError(
+                f"Monthly schedule for {self.series_id} requires day_of_month in 1..28"
+            )
+
+    @property
+    def series_ids(self) -> tuple[str, ...]:
+        """Scheduled series id followed by its alternates."""
+        return (self.series_id, *self.alternates)
+
+    @property
+    def lookback(self) -> timedelta:
+        """Window to fetch when no previous observation is known."""
+        return CADENCE_PERIOD[self.cadence] * 4 + self.observation_lag
+
+    def _release_on(self, day: date) -> datetime | None:
+        """Return the release datetime (UTC) on a given local date, if any."""
+        if self.cadence == Cadence.DAILY:
+            if day.weekday() >= 5:
+                return None
+        elif self.cadence == Cadence.WEEKLY:
+            if day.weekday() != self.weekday:
+                return None
+        else:
+            if day != _monthly_release_date(day.year, day.month, self.day_of_month or 1):
+                return None
+
+        local = datetime.combine(day, self.release_time, tzinfo=ZoneInfo(self.tz))
+        return local.astimezone(UTC)
+
+    def next_release(self, after: datetime) -> datetime:
+        """Return the first expected release strictly after ``after``.
+
+        Args:
+            after: Timezone-aware reference datetime.
+
+        Returns:
+            Expected release datetime in UTC.
+        """
+        local_day = after.astimezone(ZoneInfo(self.tz)).date()
+        # Monthly releases are at most ~31 days apart (plus a weekend roll)
+        for offset in range(40):
+            release = self._release_on(local_day + timedelta(days=offset))
+            if release is not None and release > after:
+                return release
+        raise RuntimeError(f"No release found for {self.series_id} after {after}")
+
+    def previous_release(self, before: datetime) -> datetime:
+        """Return the last expected release at or before ``before``.
+
+        Args:
+            before: Timezone-aware reference datetime.
+
+        Returns:
+            Expected release datetime in UTC.
+        """
+        local_day = before.astimezone(ZoneInfo(self.tz)).date()
+        for offset in range(40):
+            release = self._release_on(local_day - timedelta(days=offset))
+            if release is not None and release <= before:
+                return release
+        raise RuntimeError(f"No release found for {self.series_id} before {before}")
+
+    def expected_releases(self, start: datetime, end: datetime) -> list[datetime]:
+        """List expected releases in the half-open interval ``(start, end]``.
+
+        Args:
+            start: Interval start (exclusive).
+            end: Interval end (inclusive).
+
+        Returns:
+            Expected release datetimes in UTC, ascending.
+        """
+        releases: list[datetime] = []
+        current = self.next_release(start)
+        while current <= end:
+            releases.append(current)
+            current = self.next_release(current)
+        return releases
+
+
+def _monthly_release_date(year: int, month: int, day_of_month: int) -> date:
+    """Resolve a monthly release day, rolling weekends forward to Monday."""
+    release = date(year, month, day_of_month)
+    while release.weekday() >= 5:
+        release += timedelta(days=1)
+    return release
+
+
+def _h41(series_id: str) -> ReleaseSchedule:
+    """H.4.1 weekly balance sheet release (Thursday 16:30 ET)."""
+    return ReleaseSchedule(
+        series_id=series_id,
+        collector="fred",
+        cadence=Cadence.WEEKLY,
+        release_time=time(16, 30),
+        weekday=3,
+        observation_lag=timedelta(days=1),
+    )
+
+
+def _fred_daily(series_id: str, release_time: time, lag_days: int = 0) -> ReleaseSchedule:
+    """Daily FRED series published on business days."""
+    return ReleaseSchedule(
+        series_id=series_id,
+        collector="fred",
+        cadence=Cadence.DAILY,
+        release_time=release_time,
+        observation_lag=timedelta(days=lag_days),
+    )
+
+
+# Default release calendar keyed by series_id
+RELEASE_CALENDAR: dict[str, ReleaseSchedule] = {
+    schedule.series_id: schedule
+    for schedule in [
+        # Fed balance sheet (H.4.1)
+        _h41("WALCL"),
+        _h41("WLRRAL"),
+        _h41("WDTGAL"),
+        _h41("WRESBAL"),
+        # Daily TGA and RRP (Net Liquidity nowcast)
+        ReleaseSchedule(
+            series_id="TGA_DAILY",
+            collector="treasury",
+            cadence=Cadence.DAILY,
+            release_time=time(16, 0),
+            observation_lag=timedelta(days=1),
+        ),
+        ReleaseSchedule(
+            series_id="RRP_DAILY",
+            collector="nyfed",
+            cadence=Cadence.DAILY,
+            release_time=time(13, 15),
+        ),
+        # Rates, volatility, curve and credit (daily)
+        _fred_daily("SOFR", time(8, 0)),
+        _fred_daily("VIXCLS", time(8, 0), lag_days=1),
+        _fred_daily("VXVCLS", time(8, 0), lag_days=1),
+        _fred_daily("DGS2", time(16, 15)),
+        _fred_daily("DGS10", time(16, 15)),
+        _fred_daily("T10Y2Y", time(16, 15)),
+        _fred_daily("BAMLH0A0HYM2", time(8, 0), lag_days=1),
+        _fred_daily("BAMLC0A0CM", time(8, 0), lag_days=1),
+        # Global CB totals via FRED
+        ReleaseSchedule(
+            series_id="ECBASSETSW",
+            collector="fred",
+            cadence=Cadence.WEEKLY,
+            release_time=time(15, 0),
+            tz="Europe/Berlin",
+            weekday=1,
+            observation_lag=timedelta(days=4),
+        ),
+        ReleaseSchedule(
+            series_id="JPNASSETS",
+            collector="fred",
+            cadence=Cadence.MONTHLY,
+            release_time=time(9, 0),
+            day_of_month=15,
+            window=timedelta(hours=12),
+            observation_lag=timedelta(days=15),
+        ),
+        # Direct CB sources
+        ReleaseSchedule(
+            series_id="V36610",
+            collector="boc",
+            cadence=Cadence.WEEKLY,
+            release_time=time(12, 0),
+            tz="America/Toronto",
+            weekday=4,
+            observation_lag=timedelta(days=2),
+        ),
+        ReleaseSchedule(
+            series_id="SNB_TOTAL_ASSETS",
+            collector="snb",
+            cadence=Cadence.MONTHLY,
+            release_time=time(9, 0),
+            tz="Europe/Zurich",
+            day_of_month=5,
+            window=timedelta(hours=12),
+            observation_lag=timedelta(days=5),
+        ),
+        ReleaseSchedule(
+            series_id="BOE_TOTAL_ASSETS",
+            collector="boe",
+            cadence=Cadence.WEEKLY,
+            release_time=time(15, 0),
+            tz="Europe/London",
+            weekday=3,
+            observation_lag=timedelta(days=1),
+        ),
+        ReleaseSchedule(
+            series_id="PBOC_TOTAL_ASSETS",
+            collector="pboc",
+            cadence=Cadence.MONTHLY,
+            release_time=time(9, 0),
+            tz="Asia/Shanghai",
+            day_of_month=15,
+            window=timedelta(hours=24),
+            observation_lag=timedelta(days=45),
+            # FRED tier of the PBoC collector (China foreign reserves proxy)
+            alternates=("CHINA_FOREIGN_RESERVES",),
+        ),
+    ]
+}
@@ -0,0 +1,342 @@
+"""Release-aware refresh scheduler.
+
+Replaces a flat cron with per-series polling driven by the release calendar:
+- Idle until the next expected release of each series
+- Poll densely inside the release window
+- Exponential back-off when a release is late (holidays, publisher delays)
+- Random jitter on every interval to avoid thundering herds
+- Event-driven: each detected release is pushed to subscribers so downstream
+  recomputation starts as soon as data lands
+"""
+
+import asyncio
+import logging
+import random
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+import pandas as pd
+
+from liquidity.config import Settings, get_settings
+from liquidity.scheduler.calendar import RELEASE_CALENDAR, ReleaseSchedule
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ReleaseEvent:
+    """A newly detected release of a series.
+
+    Attributes:
+        series_id: Series that published new data.
+        collector: Collector that fetched it.
+        observation_time: Latest observation timestamp in the release (UTC).
+        detected_at: When the scheduler detected the release (UTC).
+        data: New rows for the series (standard collector columns).
+    """
+
+    series_id: str
+    collector: str
+    observation_time: datetime
+    detected_at: datetime
+    data: pd.DataFrame
+
+
+@dataclass
+class SeriesState:
+    """Polling state of a single series."""
+
+    schedule: ReleaseSchedule
+    pending_release: datetime
+    next_poll: datetime
+    last_observation: datetime | None = None
+    last_poll: datetime | None = None
+    misses: int = 0
+
+
+# (collector name, series ids, fetch start) -> long-format DataFrame
+Fetcher = Callable[[str, list[str], datetime], Awaitable[pd.DataFrame]]
+ReleaseHandler = Callable[[ReleaseEvent], Awaitable[None]]
+
+
+def _to_utc(ts: datetime | pd.Timestamp) -> datetime:
+    """Convert a (possibly naive) timestamp to an aware UTC datetime."""
+    stamp = pd.Timestamp(ts)
+    if stamp.tzinfo is None:
+        stamp = stamp.tz_localize(UTC)
+    result: datetime = stamp.tz_convert(UTC).to_pydatetime()
+    return result
+
+
+async def collect_release(
+    collector_name: str, series_ids: list[str], since: datetime
+) -> pd.DataFrame:
+    """Default fetcher: collect series through the collector registry.
+
+    Series sharing a collector are fetched together so one FRED call covers
+    the whole H.4.1 release.
+
+    Args:
+        collector_name: Registered collector name.
+        series_ids: Series to fetch.
+        since: Fetch start date.
+
+    Returns:
+        Long-format DataFrame with timestamp, series_id, source, value, unit.
+    """
+    # Importing the package registers all collectors
+    from liquidity.collectors import registry
+
+    collector = registry.get(collector_name)(name=collector_name)
+    df: pd.DataFrame
+    if collector_name == "fred":
+        df = await collector.collect(series_ids, start_date=since)
+        return df
+    if collector_name == "boc":
+        frames: list[pd.DataFrame] = [
+            await collector.collect(sid, start_date=since) for sid in series_ids
+        ]
+        return pd.concat(frames, ignore_index=True)
+
+    df = await collector.collect(start_date=since)
+    # Cached baselines are not releases
+    if "stale" in df.columns:
+        df = df[~df["stale"].fillna(False).astype(bool)]
+    return df
+
+
+class RefreshScheduler:
+    """Calendar-driven refresh scheduler.
+
+    Example:
+        scheduler = RefreshScheduler()
+
+        async def on_release(event: ReleaseEvent) -> None:
+            storage.ingest_dataframe("raw_data", event.data)
+
+        scheduler.subscribe(on_release)
+        await scheduler.run()
+    """
+
+    def __init__(
+        self,
+        fetcher: Fetcher | None = None,
+        schedules: Iterable[ReleaseSchedule] | None = None,
+        settings: Settings | None = None,
+        clock: Callable[[], datetime] | None = None,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            fetcher: Async fetch function. Defaults to the collector registry.
+            schedules: Release schedules to track. Defaults to RELEASE_CALENDAR.
+            settings: Optional settings override.
+            clock: Returns the current UTC time (injectable for tests).
+            rng: Random generator used for jitter (injectable for tests).
+        """
+        self._settings = settings or get_settings()
+        config = self._settings.scheduler
+        self.dense_interval = timedelta(seconds=config.dense_interval)
+        self.max_interval = timedelta(seconds=config.max_interval)
+        self.jitter = config.jitter
+
+        self._fetcher = fetcher or collect_release
+        self._clock = clock or (lambda: datetime.now(UTC))
+        self._rng = rng or random.Random()
+        self._handlers: list[ReleaseHandler] = []
+
+        if schedules is None:
+            schedules = RELEASE_CALENDAR.values()
+
+        now = self._clock()
+        self._states: dict[str, SeriesState] = {
+            schedule.series_id: SeriesState(
+                schedule=schedule,
+                pending_release=schedule.previous_release(now),
+                next_poll=now,
+            )
+            for schedule in schedules
+        }
+
+    @property
+    def states(self) -> dict[str, SeriesState]:
+        """Polling state per series_id."""
+        return self._states
+
+    def subscribe(self, handler: ReleaseHandler) -> None:
+        """Register an async handler invoked for every detected release."""
+        self._handlers.append(handler)
+
+    def set_last_observation(self, series_id: str, timestamp: datetime) -> None:
+        """Seed the latest known observation (e.g. from storage on startup).
+
+        Args:
+            series_id: Series identifier.
+            timestamp: Latest stored observation timestamp.
+        """
+        self._states[series_id].last_observation = _to_utc(timestamp)
+
+    def next_wakeup(self) -> datetime:
+        """Return the earliest scheduled poll across all series."""
+        return min(state.next_poll for state in self._states.values())
+
+    def _jittered(self, interval: timedelta) -> timedelta:
+        """Apply symmetric random jitter to an interval."""
+        factor = 1.0 + self._rng.uniform(-self.jitter, self.jitter)
+        return interval * factor
+
+    def _after_release(self, release: datetime) -> datetime:
+        """First poll time for an upcoming release (never before it)."""
+        delay = self.dense_interval * self._rng.uniform(0.0, self.jitter)
+        return release + delay
+
+    def _reschedule(self, state: SeriesState, now: datetime, released: bool) -> None:
+        """Compute the next poll time after a poll.
+
+        Args:
+            state: Series state to update.
+            now: Poll time.
+            released: Whether the poll found a new observation.
+        """
+        schedule = state.schedule
+        state.last_poll = now
+
+        if released:
+            state.misses = 0
+            state.pending_release = schedule.next_release(now)
+            state.next_poll = self._after_release(state.pending_release)
+            return
+
+        following = schedule.next_release(state.pending_release)
+        if now >= following:
+            # Release skipped (holiday): wait for the most recent expected one
+            state.pending_release = schedule.previous_release(now)
+            state.misses = 0
+            following = schedule.next_release(state.pending_release)
+
+        if now < state.pending_release:
+            state.next_poll = self._after_release(state.pending_release)
+        elif now < state.pending_release + schedule.window:
+            state.next_poll = now + self._jittered(self.dense_interval)
+        else:
+            # Late release: back off exponentially, but never past the next release
+            state.misses += 1
+            backoff = min(self.dense_interval * 2**state.misses, self.max_interval)
+            state.next_poll = min(
+                now + self._jittered(backoff), self._after_release(following)
+            )
+
+    async def poll_once(self, now: datetime | None = None) -> list[ReleaseEvent]:
+        """Poll every series that is due and emit events for new releases.
+
+        Args:
+            now: Poll time. Defaults to the scheduler clock.
+
+        Returns:
+            Release events detected in this pass.
+        """
+        now = now or self._clock()
+        due: dict[str, list[SeriesState]] = defaultdict(list)
+        for state in self._states.values():
+            if state.next_poll <= now:
+                due[state.schedule.collector].append(state)
+
+        events: list[ReleaseEvent] = []
+        for collector_name, states in due.items():
+            since = min(
+                state.last_observation or now - state.schedule.lookback
+                for state in states
+            )
+            series_ids = [state.schedule.series_id for state in states]
+            try:
+                df = await self._fetcher(collector_name, series_ids, since)
+            except Exception as e:
+                logger.warning(
+                    "Scheduler poll of %s %s failed: %s", collector_name, series_ids, e
+                )
+                df = pd.DataFrame(columns=["timestamp", "series_id", "value"])
+
+            for state in states:
+                event = self._detect_release(state, collector_name, df, now)
+                self._reschedule(state, now, released=event is not None)
+                if event is not None:
+                    events.append(event)
+
+        for event in events:
+            await self._dispatch(event)
+
+        return events
+
+    def _detect_release(
+        self,
+        state: SeriesState,
+        collector_name: str,
+        df: pd.DataFrame,
+        now: datetime,
+    ) -> ReleaseEvent | None:
+        """Compare fetched rows against the last known observation."""
+        series_id = state.schedule.series_id
+        if df.empty or "series_id" not in df.columns:
+            return None
+
+        rows = df[df["series_id"].isin(state.schedule.series_ids)]
+        if rows.empty:
+            return None
+
+        timestamps = pd.to_datetime(rows["timestamp"], utc=True)
+        latest = _to_utc(timestamps.max())
+        if state.last_observation is not None:
+            if latest <= state.last_observation:
+                return None
+            rows = rows[timestamps > pd.Timestamp(state.last_observation)]
+
+        state.last_observation = latest
+        logger.info(
+            "Release detected: %s observation %s (expected %s)",
+            series_id,
+            latest.isoformat(),
+            state.pending_release.isoformat(),
+        )
+        return ReleaseEvent(
+            series_id=series_id,
+            collector=collector_name,
+            observation_time=latest,
+            detected_at=now,
+            data=rows.reset_index(drop=True),
+        )
+
+    async def _dispatch(self, event: ReleaseEvent) -> None:
+        """Deliver an event to all subscribers, isolating handler failures."""
+        for handler in self._handlers:
+            try:
+                await handler(event)
+            except Exception:
+                logger.exception("Release handler failed for %s", event.series_id)
+
+    async def run(self, stop: asyncio.Event | None = None) -> None:
+        """Run the polling loop until ``stop`` is set.
+
+        Args:
+            stop: Optional event that terminates the loop.
+        """
+        stop = stop or asyncio.Event()
+        logger.info("Refresh scheduler started for %d series", len(self._states))
+
+        while not stop.is_set():
+            wait = (self.next_wakeup() - self._clock()).total_seconds()
+            if wait > 0:
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=wait)
+                    break
+                except TimeoutError:
+                    pass
+            await self.poll_once()
+
+        logger.info("Refresh scheduler stopped")
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"RefreshScheduler(series={len(self._states)})"
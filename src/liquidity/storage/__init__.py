@@ -1,8 +1,16 @@
 """Storage layer for liquidity data.
 
-Provides QuestDB storage with ILP ingestion for high-performance time-series storage.
+Provides QuestDB storage with ILP ingestion for high-performance time-series storage,
+fronted by a local Arrow snapshot store for fast and offline reads, and backed by
+a durable spool so storage outages never lose collected data. AsyncQuestDBStorage
+exposes the same operations without blocking the event loop, and an embedded
+DuckDB/Parquet backend implements the Storage interface with no services.
 """
 
+from liquidity.storage.async_questdb import AsyncQuestDBStorage
+from liquidity.storage.backend import Storage, StorageError, create_storage
+from liquidity.storage.delta import DeltaResult, compute_delta
+from liquidity.storage.embedded import DuckDBStorage, DuckDBStorageError
 from liquidity.storage.questdb import (
     QuestDBConnectionError,
     QuestDBIngestionError,
@@ -11,20 +19,47 @@ from liquidity.storage.questdb import (
 )
 from liquidity.storage.schemas import (
     ALL_SCHEMAS,
+    DATA_QUALITY_SCHEMA,
+    DATA_QUALITY_SYMBOLS,
+    DATA_QUALITY_TABLE,
     LIQUIDITY_INDEXES_SCHEMA,
     LIQUIDITY_INDEXES_SYMBOLS,
     LIQUIDITY_INDEXES_TABLE,
     RAW_DATA_SCHEMA,
     RAW_DATA_SYMBOLS,
     RAW_DATA_TABLE,
+    TABLE_COLUMN_TYPES,
+    TABLE_COLUMNS,
+    TABLE_DEDUP_KEYS,
+    TABLE_KEYS,
 )
+from liquidity.storage.snapshot import SnapshotStore, SnapshotStoreError
+from liquidity.storage.spool import IngestSpool, SpoolError, SpoolReplayer
 
 __all__ = [
+    # Storage interface
+    "Storage",
+    "StorageError",
+    "create_storage",
     # QuestDB storage
     "QuestDBStorage",
     "QuestDBStorageError",
     "QuestDBConnectionError",
     "QuestDBIngestionError",
+    "AsyncQuestDBStorage",
+    # Embedded storage
+    "DuckDBStorage",
+    "DuckDBStorageError",
+    # Delta ingestion
+    "DeltaResult",
+    "compute_delta",
+    # Snapshot store
+    "SnapshotStore",
+    "SnapshotStoreError",
+    # Ingest spool
+    "IngestSpool",
+    "SpoolError",
+    "SpoolReplayer",
     # Schemas
     "ALL_SCHEMAS",
     "RAW_DATA_TABLE",
@@ -33,4 +68,11 @@ __all__ = [
     "LIQUIDITY_INDEXES_TABLE",
     "LIQUIDITY_INDEXES_SCHEMA",
     "LIQUIDITY_INDEXES_SYMBOLS",
+    "DATA_QUALITY_TABLE",
+    "DATA_QUALITY_SCHEMA",
+    "DATA_QUALITY_SYMBOLS",
+    "TABLE_COLUMNS",
+    "TABLE_COLUMN_TYPES",
+    "TABLE_KEYS",
+    "TABLE_DEDUP_KEYS",
 ]
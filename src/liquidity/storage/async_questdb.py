@@ -0,0 +1,312 @@
+"""Async facade over QuestDB storage for use inside the collector event loop.
+
+- PGWire queries run on an asyncpg connection pool, so reads never block
+  the loop while HTTP fetches are in flight
+- Each pooled connection keeps a small cache of server-side prepared
+  statements; the hot shapes (latest, range, freshness) have one stable text
+  per table, so repeated calls skip parsing and planning
+- ILP ingestion (a blocking socket flush) is offloaded to a dedicated
+  single-thread executor: batches are written in submission order and never
+  compete with the default executor used by other libraries
+- Snapshot mirroring and spooling behave exactly as in QuestDBStorage
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from types import TracebackType
+from typing import Any
+
+import asyncpg
+import pandas as pd
+
+from liquidity.config import Settings
+from liquidity.storage.delta import DeltaResult
+from liquidity.storage.questdb import (
+    QuestDBConnectionError,
+    QuestDBStorage,
+    QuestDBStorageError,
+)
+from liquidity.storage.schemas import RAW_DATA_TABLE
+from liquidity.storage.statements import (
+    bind_timestamp,
+    freshness_sql,
+    key_column,
+    latest_sql,
+    range_sql,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncQuestDBStorage:
+    """Non-blocking QuestDB storage API.
+
+    Example:
+        async with AsyncQuestDBStorage() as storage:
+            df = await collector.collect(["WALCL", "WDTGAL"])
+            # Flush runs on the ILP thread; the loop keeps serving fetches
+            ingest = asyncio.create_task(storage.ingest_dataframe("raw_data", df))
+            latest = await storage.get_latest("WALCL")
+            await ingest
+    """
+
+    def __init__(
+        self,
+        storage: QuestDBStorage | None = None,
+        settings: Settings | None = None,
+        min_pool_size: int = 1,
+        max_pool_size: int = 4,
+    ) -> None:
+        """Initialize the async facade.
+
+        Args:
+            storage: Synchronous storage used for ILP ingestion and connection
+                parameters. Defaults to a new QuestDBStorage.
+            settings: Optional settings override (when storage is not given).
+            min_pool_size: Minimum PGWire connections kept open.
+            max_pool_size: Maximum concurrent PGWire connections.
+        """
+        self.storage = storage or QuestDBStorage(settings=settings)
+        self.min_pool_size = min_pool_size
+        self.max_pool_size = max_pool_size
+        self.statement_cache_size = self.storage._settings.questdb_statement_cache_size
+        self._pool: asyncpg.Pool | None = None
+        self._pool_lock = asyncio.Lock()
+        # One writer thread keeps ILP batches (and spool replay) in order
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="questdb-ilp")
+
+    async def _get_pool(self) -> asyncpg.Pool:
+        """Create the PGWire connection pool on first use.
+
+        Raises:
+            QuestDBConnectionError: If QuestDB cannot be reached.
+        """
+        if self._pool is not None:
+            return self._pool
+        async with self._pool_lock:
+            if self._pool is None:
+                try:
+                    self._pool = await asyncpg.create_pool(
+                        host=self.storage.host,
+                        port=self.storage.pg_port,
+                        user="admin",
+                        password="quest",
+                        database="qdb",
+                        min_size=self.min_pool_size,
+                        max_size=self.max_pool_size,
+                        statement_cache_size=self.statement_cache_size,
+                    )
+                except (OSError, asyncpg.PostgresError) as e:
+                    logger.error("Failed to connect to QuestDB via PGWire: %s", e)
+                    raise QuestDBConnectionError(
+                        f"Failed to connect to QuestDB: {e}"
+                    ) from e
+        return self._pool
+
+    async def _run_ilp(self, func: Any, *args: Any) -> Any:
+        """Run a blocking storage call on the ILP executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+
+    async def create_tables(self) -> None:
+        """Create all required tables if they don't exist."""
+        await self._run_ilp(self.storage.create_tables)
+
+    async def ingest_dataframe(
+        self,
+        table: str,
+        df: pd.DataFrame,
+        timestamp_col: str = "timestamp",
+        symbols: list[str] | None = None,
+    ) -> int:
+        """Ingest a DataFrame over ILP without blocking the event loop.
+
+        Args:
+            table: Target table name.
+            df: DataFrame to ingest.
+            timestamp_col: Name of the timestamp column.
+            symbols: SYMBOL columns, as for QuestDBStorage.ingest_dataframe.
+
+        Returns:
+            Number of rows ingested (0 if the batch was spooled).
+
+        Raises:
+            QuestDBIngestionError: If ingestion fails and cannot be spooled.
+        """
+        rows: int = await self._run_ilp(
+            self.storage.ingest_dataframe, table, df, timestamp_col, symbols
+        )
+        return rows
+
+    async def ingest_delta(
+        self,
+        table: str,
+        df: pd.DataFrame,
+        timestamp_col: str = "timestamp",
+        symbols: list[str] | None = None,
+    ) -> DeltaResult:
+        """Ingest only new or revised rows without blocking the event loop.
+
+        Args:
+            table: Target table name (raw_data or liquidity_indexes).
+            df: DataFrame to ingest.
+            timestamp_col: Name of the timestamp column.
+            symbols: SYMBOL columns.
+
+        Returns:
+            DeltaResult with the delta rows, counts and rows sent (0 if spooled).
+        """
+        result: DeltaResult = await self._run_ilp(
+            self.storage.ingest_delta, table, df, timestamp_col, symbols
+        )
+        return result
+
+    async def query(self, sql: str, *args: Any) -> list[dict[str, Any]]:
+        """Execute a SQL query over PGWire and return rows as dicts.
+
+        Args:
+            sql: SQL query; positional parameters use ``$1``, ``$2``, ...
+            *args: Bind parameter values.
+
+        Returns:
+            List of dictionaries, one per row.
+
+        Raises:
+            QuestDBStorageError: If the query fails.
+        """
+        pool = await self._get_pool()
+        try:
+            async with pool.acquire() as conn:
+                records = await conn.fetch(sql, *args)
+        except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) as e:
+            logger.error("Query failed: %s", e)
+            raise QuestDBStorageError(f"Query failed: {e}") from e
+        return [dict(record) for record in records]
+
+    async def get_latest(
+        self, series_id: str, table: str = RAW_DATA_TABLE
+    ) -> dict[str, Any] | None:
+        """Get the latest data point for a series.
+
+        Args:
+            series_id: The series key (series_id or index_name).
+            table: Table to query. Defaults to raw_data.
+
+        Returns:
+            Dict with latest data point, or None if not found.
+
+        Raises:
+            ValueError: If the table is unknown.
+        """
+        result = await self.query(latest_sql(table, "numeric"), series_id)
+        return result[0] if result else None
+
+    async def read_range(
+        self,
+        series_ids: list[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+        table: str = RAW_DATA_TABLE,
+    ) -> list[dict[str, Any]]:
+        """Read the rows of several series within optional time bounds.
+
+        Args:
+            series_ids: Series keys (series_id or index_name).
+            start: Inclusive start timestamp.
+            end: Inclusive end timestamp.
+            table: Table to query. Defaults to raw_data.
+
+        Returns:
+            List of row dicts.
+
+        Raises:
+            ValueError: If the table is unknown.
+            QuestDBStorageError: If the query fails.
+        """
+        params: list[Any] = list(series_ids)
+        if start is not None:
+            params.append(bind_timestamp(start))
+        if end is not None:
+            params.append(bind_timestamp(end))
+        sql = range_sql(table, len(series_ids), start is not None, end is not None, "numeric")
+        return await self.query(sql, *params)
+
+    async def get_freshness(self, table: str = RAW_DATA_TABLE) -> dict[str, datetime]:
+        """Get the newest timestamp of every series in a table in one query.
+
+        Args:
+            table: Table to query. Defaults to raw_data.
+
+        Returns:
+            Mapping of series key -> latest timestamp.
+
+        Raises:
+            ValueError: If the table is unknown.
+            QuestDBStorageError: If the query fails.
+        """
+        column = key_column(table)
+        return {
+            str(row[column]): pd.Timestamp(row["timestamp"]).to_pydatetime()
+            for row in await self.query(freshness_sql(table))
+            if row["timestamp"] is not None
+        }
+
+    async def get_latest_timestamp(
+        self, series_id: str, table: str = RAW_DATA_TABLE
+    ) -> datetime | None:
+        """Get the timestamp of the latest data point for a series.
+
+        Args:
+            series_id: The series key.
+            table: Table to query.
+
+        Returns:
+            Latest timestamp as datetime, or None if no data.
+        """
+        latest = await self.get_latest(series_id, table)
+        if latest and "timestamp" in latest:
+            ts = latest["timestamp"]
+            return (
+                ts if isinstance(ts, datetime) else pd.to_datetime(ts).to_pydatetime()
+            )
+        return None
+
+    async def health_check(self) -> bool:
+        """Check if QuestDB is accessible and healthy.
+
+        Returns:
+            True if QuestDB is healthy, False otherwise.
+        """
+        try:
+            result = await self.query("SELECT 1 as health")
+            return len(result) > 0 and result[0].get("health") == 1
+        except Exception as e:
+            logger.warning("QuestDB health check failed: %s", e)
+            return False
+
+    async def close(self) -> None:
+        """Close the connection pool and wait for pending ILP flushes."""
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+        await asyncio.to_thread(self._executor.shutdown, True)
+
+    async def __aenter__(self) -> "AsyncQuestDBStorage":
+        """Enter async context."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Exit async context, releasing connections and the ILP thread."""
+        await self.close()
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"AsyncQuestDBStorage(storage={self.storage!r})"
@@ -0,0 +1,109 @@
+"""Storage interface shared by all backends.
+
+Backends:
+- QuestDBStorage: QuestDB server (ILP ingestion, PGWire queries)
+- DuckDBStorage: embedded DuckDB over Parquet files, no services required
+
+Both implement the raw_data / liquidity_indexes schemas with upsert-on
+(timestamp, key) semantics, so callers can be written against ``Storage``
+and run unchanged on a laptop or in CI. Raw SQL passed to ``query`` is
+backend-specific, including its placeholders: build portable statements
+with ``statements`` and the backend's ``paramstyle``, or use ``load_frame``.
+"""
+
+from datetime import datetime
+from typing import Any, Protocol, runtime_checkable
+
+import pandas as pd
+
+from liquidity.config import Settings, get_settings
+from liquidity.storage.schemas import RAW_DATA_TABLE
+from liquidity.storage.statements import ParamStyle
+
+
+class StorageError(Exception):
+    """Base exception for all storage backends."""
+
+    pass
+
+
+@runtime_checkable
+class Storage(Protocol):
+    """Operations every storage backend provides."""
+
+    # Placeholder style of ``query``: "pyformat" (%s, QuestDB) or "qmark" (?, DuckDB)
+    paramstyle: ParamStyle
+
+    def create_tables(self) -> None:
+        """Create all required tables if they don't exist."""
+        ...
+
+    def ingest_dataframe(
+        self,
+        table: str,
+        df: pd.DataFrame,
+        timestamp_col: str = "timestamp",
+        symbols: list[str] | None = None,
+    ) -> int:
+        """Upsert a DataFrame into a table, returning rows written."""
+        ...
+
+    def query(self, sql: str, params: list[Any] | None = None) -> list[dict[str, Any]]:
+        """Execute SQL with ``paramstyle`` bind parameters and return rows as dicts."""
+        ...
+
+    def load_frame(
+        self,
+        table: str,
+        keys: list[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> pd.DataFrame:
+        """Return long-format rows of some keys within inclusive time bounds."""
+        ...
+
+    def get_latest(
+        self, series_id: str, table: str = RAW_DATA_TABLE
+    ) -> dict[str, Any] | None:
+        """Return the latest row for a series, or None."""
+        ...
+
+    def get_latest_timestamp(
+        self, series_id: str, table: str = RAW_DATA_TABLE
+    ) -> datetime | None:
+        """Return the latest timestamp for a series, or None."""
+        ...
+
+    def health_check(self) -> bool:
+        """Return True if the backend is usable."""
+        ...
+
+
+def create_storage(settings: Settings | None = None) -> Storage:
+    """Create the storage backend selected by the storage_backend setting.
+
+    Args:
+        settings: Optional settings override.
+
+    Returns:
+        A QuestDBStorage or DuckDBStorage instance.
+
+    Raises:
+        ValueError: If storage_backend is not a known backend.
+    """
+    settings = settings or get_settings()
+    backend = settings.storage_backend.lower()
+
+    # Imported lazily so each backend only loads its own driver
+    if backend == "questdb":
+        from liquidity.storage.questdb import QuestDBStorage
+
+        return QuestDBStorage(settings=settings)
+    if backend == "duckdb":
+        from liquidity.storage.embedded import DuckDBStorage
+
+        return DuckDBStorage(settings=settings)
+
+    raise ValueError(
+        f"Unknown storage backend '{settings.storage_backend}'. Use 'questdb' or 'duckdb'"
+    )
@@ -0,0 +1,131 @@
+"""Client-side delta filter applied before ILP ingestion.
+
+Refreshes re-fetch overlapping windows (e.g. 30 days of FRED data to pick up
+one weekly point). Sending those rows again makes QuestDB's WAL rewrite them
+under DEDUP UPSERT KEYS even though nothing changed. The delta filter compares
+an incoming batch against the stored tail of each series and keeps only rows
+that are new (unseen (timestamp, key)) or revised (stored value differs).
+"""
+
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from liquidity.frames import naive_utc
+
+logger = logging.getLogger(__name__)
+
+# Relative tolerance under which float values count as unchanged
+DEFAULT_RTOL = 1e-12
+
+
+@dataclass
+class DeltaResult:
+    """Outcome of a delta comparison.
+
+    Attributes:
+        rows: Rows to send (new and revised), in incoming order.
+        new: Rows whose (timestamp, key) is not stored yet.
+        revised: Rows whose stored values differ.
+        unchanged: Rows skipped because the stored values match.
+        sent: Rows that reached storage once ingested (0 if the delta was
+            spooled for replay instead).
+    """
+
+    rows: pd.DataFrame
+    new: int
+    revised: int
+    unchanged: int
+    sent: int = 0
+
+    @property
+    def total(self) -> int:
+        """Number of incoming rows compared."""
+        return self.new + self.revised + self.unchanged
+
+
+def _values_differ(incoming: pd.Series, stored: pd.Series, rtol: float) -> np.ndarray:
+    """Element-wise inequality treating NaN/None pairs as equal."""
+    incoming_na = incoming.isna().to_numpy()
+    stored_na = stored.isna().to_numpy()
+    if pd.api.types.is_numeric_dtype(incoming) and pd.api.types.is_numeric_dtype(stored):
+        a = incoming.to_numpy(dtype="float64")
+        b = stored.to_numpy(dtype="float64")
+        same = np.isclose(a, b, rtol=rtol, atol=0.0, equal_nan=True)
+    else:
+        same = (incoming.astype(object).to_numpy() == stored.astype(object).to_numpy()) | (
+            incoming_na & stored_na
+        )
+    return np.asarray(~same, dtype=bool)
+
+
+def compute_delta(
+    incoming: pd.DataFrame,
+    stored: pd.DataFrame,
+    key_col: str,
+    timestamp_col: str = "timestamp",
+    rtol: float = DEFAULT_RTOL,
+) -> DeltaResult:
+    """Split an incoming batch into new, revised and unchanged rows.
+
+    Args:
+        incoming: Batch about to be ingested.
+        stored: Stored rows covering (at least) the batch's keys and time range.
+        key_col: Series key column (series_id or index_name).
+        timestamp_col: Timestamp column.
+        rtol: Relative tolerance for float comparisons.
+
+    Returns:
+        DeltaResult with the rows to send and per-category counts.
+    """
+    if incoming.empty:
+        return DeltaResult(rows=incoming, new=0, revised=0, unchanged=0)
+    if stored.empty:
+        return DeltaResult(rows=incoming, new=len(incoming), revised=0, unchanged=0)
+
+    compare_cols = [
+        col
+        for col in incoming.columns
+        if col not in (timestamp_col, key_col) and col in stored.columns
+    ]
+
+    left = pd.DataFrame(
+        {
+            "_ts": naive_utc(incoming[timestamp_col]),
+            "_key": incoming[key_col].astype(str).to_numpy(),
+            "_pos": np.arange(len(incoming)),
+        }
+    )
+    right = pd.DataFrame(
+        {
+            "_ts": naive_utc(stored[timestamp_col]),
+            "_key": stored[key_col].astype(str).to_numpy(),
+            "_row": np.arange(len(stored)),
+        }
+    ).drop_duplicates(subset=["_ts", "_key"], keep="last")
+
+    matched = left.merge(right, on=["_ts", "_key"], how="left").sort_values("_pos")
+    is_new = matched["_row"].isna().to_numpy()
+
+    is_revised = np.zeros(len(incoming), dtype=bool)
+    hit_pos = matched.loc[~is_new, "_pos"].to_numpy()
+    hit_row = matched.loc[~is_new, "_row"].to_numpy(dtype="int64")
+    for col in compare_cols:
+        differ = _values_differ(
+            incoming[col].iloc[hit_pos].reset_index(drop=True),
+            stored[col].iloc[hit_row].reset_index(drop=True),
+            rtol,
+        )
+        is_revised[hit_pos[differ]] = True
+
+    keep = is_new | is_revised
+    new = int(is_new.sum())
+    revised = int(is_revised.sum())
+    return DeltaResult(
+        rows=incoming[keep],
+        new=new,
+        revised=revised,
+        unchanged=len(incoming) - new - revised,
+    )
@@ -0,0 +1,381 @@
+"""Embedded DuckDB/Parquet storage backend.
+
+Implements the same raw_data / liquidity_indexes schemas as QuestDB without
+any running service:
+- One Parquet file per (table, month): ``{root}/raw_data/month=2024-01/data.parquet``
+- DEDUP UPSERT KEYS semantics: rows are upserted on (timestamp, key), the
+  latest write wins, and only the months touched by a batch are rewritten
+- Atomic file replacement so concurrent readers never see partial files
+- In-process vectorized SQL: each table is a DuckDB view over its Parquet
+  files, so ``query`` runs locally with no network hop
+"""
+
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+from liquidity.config import Settings, get_settings
+from liquidity.frames import naive_utc
+from liquidity.storage.backend import StorageError
+from liquidity.storage.schemas import (
+    RAW_DATA_TABLE,
+    TABLE_COLUMN_TYPES,
+    TABLE_COLUMNS,
+    TABLE_DEDUP_KEYS,
+    TABLE_KEYS,
+)
+from liquidity.storage.statements import ParamStyle, bind_timestamp, range_sql
+
+logger = logging.getLogger(__name__)
+
+PARQUET_FILE = "data.parquet"
+
+
+class DuckDBStorageError(StorageError):
+    """Error in the embedded DuckDB/Parquet backend."""
+
+    pass
+
+
+def _sql_string(value: str | Path) -> str:
+    """Quote a value as a SQL string literal."""
+    escaped = str(value).replace("'", "''")
+    return f"'{escaped}'"
+
+
+class DuckDBStorage:
+    """Embedded storage backend built on DuckDB over Parquet.
+
+    Example:
+        storage = DuckDBStorage("data/duckdb")
+        storage.create_tables()
+        storage.ingest_dataframe("raw_data", df)
+
+        # Vectorized SQL in-process
+        rows = storage.query(
+            "SELECT series_id, max(timestamp) AS latest FROM raw_data GROUP BY series_id"
+        )
+    """
+
+    # DuckDB binds positional ``?`` placeholders
+    paramstyle: ParamStyle = "qmark"
+
+    def __init__(
+        self,
+        root: str | Path | None = None,
+        settings: Settings | None = None,
+    ) -> None:
+        """Initialize the embedded backend.
+
+        Args:
+            root: Data directory. Defaults to the duckdb_dir setting.
+            settings: Optional settings override.
+        """
+        self._settings = settings or get_settings()
+        self.root = Path(root or self._settings.duckdb_dir)
+        self._con = duckdb.connect(":memory:")
+        self._lock = threading.Lock()
+        self._refresh_views()
+
+    @staticmethod
+    def _key_column(table: str) -> str:
+        """Return the dedup key column of a table."""
+        try:
+            return TABLE_KEYS[table]
+        except KeyError as e:
+            raise DuckDBStorageError(f"Unknown table '{table}'") from e
+
+    def _table_glob(self, table: str) -> Path:
+        """Return the glob matching all Parquet files of a table."""
+        return self.root / table / "month=*" / PARQUET_FILE
+
+    def _partition_path(self, table: str, month: str) -> Path:
+        """Return the Parquet file of a (table, month) partition."""
+        return self.root / table / f"month={month}" / PARQUET_FILE
+
+    def _refresh_view(self, table: str) -> None:
+        """(Re)create the view exposing a table's Parquet files."""
+        column_types = TABLE_COLUMN_TYPES[table]
+        columns = ", ".join(column_types)
+        if any((self.root / table).glob(f"month=*/{PARQUET_FILE}")):
+            source = (
+                f"SELECT {columns} FROM read_parquet("
+                f"{_sql_string(self._table_glob(table))}, union_by_name = true)"
+            )
+        else:
+            typed_nulls = ", ".join(
+                f"CAST(NULL AS {sql_type}) AS {column}"
+                for column, sql_type in column_types.items()
+            )
+            source = f"SELECT {typed_nulls} WHERE false"
+        self._con.execute(f"CREATE OR REPLACE VIEW {table} AS {source}")
+
+    def _refresh_views(self) -> None:
+        """(Re)create the views of all tables."""
+        for table in TABLE_COLUMN_TYPES:
+            self._refresh_view(table)
+
+    def create_tables(self) -> None:
+        """Create the table directories and views.
+
+        Raises:
+            DuckDBStorageError: If the directories cannot be created.
+        """
+        try:
+            for table in TABLE_COLUMN_TYPES:
+                (self.root / table).mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            raise DuckDBStorageError(f"Failed to create tables: {e}") from e
+        with self._lock:
+            self._refresh_views()
+        logger.info("Table creation complete (%s)", self.root)
+
+    def _normalize(
+        self,
+        table: str,
+        df: pd.DataFrame,
+        timestamp_col: str,
+        symbols: list[str],
+    ) -> pd.DataFrame:
+        """Project a frame onto the table columns with canonical dtypes."""
+        if timestamp_col != "timestamp":
+            df = df.rename(columns={timestamp_col: "timestamp"})
+        batch = pd.DataFrame(index=df.index)
+        for column in TABLE_COLUMNS[table]:
+            batch[column] = df[column] if column in df.columns else None
+        batch["timestamp"] = naive_utc(batch["timestamp"])
+        for column, sql_type in TABLE_COLUMN_TYPES[table].items():
+            values = batch[column]
+            if sql_type == "DOUBLE":
+                batch[column] = values.astype("float64")
+            elif sql_type == "VARCHAR":
+                # SYMBOL columns are stored as plain strings (Parquet dictionary-encodes them)
+                batch[column] = values.where(values.isna(), values.astype(str)).astype(object)
+        for column in symbols:
+            if column not in batch.columns:
+                raise DuckDBStorageError(f"Symbol column '{column}' not in table '{table}'")
+        batch["_seq"] = np.arange(len(batch), dtype="int64")
+        return batch.reset_index(drop=True)
+
+    def ingest_dataframe(
+        self,
+        table: str,
+        df: pd.DataFrame,
+        timestamp_col: str = "timestamp",
+        symbols: list[str] | None = None,
+    ) -> int:
+        """Upsert a DataFrame, rewriting only the months it touches.
+
+        Rows are deduplicated on the table's DEDUP UPSERT KEYS like QuestDB:
+        within a batch the last row wins, and batch rows replace stored rows.
+
+        Args:
+            table: Target table name (raw_data or liquidity_indexes).
+            df: DataFrame to ingest.
+            timestamp_col: Name of the timestamp column.
+            symbols: SYMBOL columns (validated; stored as strings).
+
+        Returns:
+            Number of rows ingested.
+
+        Raises:
+            DuckDBStorageError: If the table is unknown or the write fails.
+        """
+        if df.empty:
+            logger.warning("Empty DataFrame, nothing to ingest")
+            return 0
+
+        key_column = self._key_column(table)
+        dedup_keys = ", ".join(TABLE_DEDUP_KEYS[table])
+        batch = self._normalize(table, df, timestamp_col, symbols or [])
+        months = batch["timestamp"].dt.strftime("%Y-%m")
+        columns = ", ".join(TABLE_COLUMNS[table])
+
+        with self._lock:
+            cursor = self._con.cursor()
+            try:
+                for month, part in batch.groupby(months, sort=True):
+                    path = self._partition_path(table, str(month))
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    cursor.register("batch", part)
+                    source = f"SELECT {columns}, 1 AS _new, _seq FROM batch"
+                    if path.exists():
+                        source = (
+                            f"SELECT {columns}, 0 AS _new, 0 AS _seq "
+                            f"FROM read_parquet({_sql_string(path)}) "
+                            f"UNION ALL BY NAME {source}"
+                        )
+                    tmp_path = path.with_suffix(".tmp")
+                    cursor.execute(
+                        f"""
+                        COPY (
+                            SELECT {columns} FROM ({source})
+                            QUALIFY row_number() OVER (
+                                PARTITION BY {dedup_keys}
+                                ORDER BY _new DESC, _seq DESC
+                            ) = 1
+                            ORDER BY timestamp, {key_column}
+                        ) TO {_sql_string(tmp_path)} (FORMAT parquet)
+                        """
+                    )
+                    cursor.unregister("batch")
+                    tmp_path.replace(path)
+                self._refresh_view(table)
+            except (duckdb.Error, OSError) as e:
+                logger.error("Failed to ingest data to %s: %s", table, e)
+                raise DuckDBStorageError(f"Ingestion failed: {e}") from e
+            finally:
+                cursor.close()
+
+        logger.info("Ingested %d rows to table '%s'", len(batch), table)
+        return len(batch)
+
+    def query(self, sql: str, params: list[Any] | None = None) -> list[dict[str, Any]]:
+        """Execute a SQL query in-process and return rows as dicts.
+
+        Args:
+            sql: SQL query (DuckDB dialect).
+            params: Optional positional bind parameters (``?``).
+
+        Returns:
+            List of dictionaries, one per row.
+
+        Raises:
+            DuckDBStorageError: If the query fails.
+        """
+        with self._lock:
+            cursor = self._con.cursor()
+            try:
+                cursor.execute(sql, params)
+                columns = [desc[0] for desc in cursor.description or []]
+                rows = cursor.fetchall()
+            except duckdb.Error as e:
+                logger.error("Query failed: %s", e)
+                raise DuckDBStorageError(f"Query failed: {e}") from e
+            finally:
+                cursor.close()
+        return [dict(zip(columns, row, strict=False)) for row in rows]
+
+    def query_df(self, sql: str, params: list[Any] | None = None) -> pd.DataFrame:
+        """Execute a SQL query and return a DataFrame (columnar, no row dicts).
+
+        Args:
+            sql: SQL query (DuckDB dialect).
+            params: Optional positional bind parameters (``?``).
+
+        Returns:
+            Query result as a DataFrame.
+
+        Raises:
+            DuckDBStorageError: If the query fails.
+        """
+        with self._lock:
+            cursor = self._con.cursor()
+            try:
+                df: pd.DataFrame = cursor.execute(sql, params).df()
+            except duckdb.Error as e:
+                logger.error("Query failed: %s", e)
+                raise DuckDBStorageError(f"Query failed: {e}") from e
+            finally:
+                cursor.close()
+        return df
+
+    def load_frame(
+        self,
+        table: str,
+        keys: list[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> pd.DataFrame:
+        """Load long-format rows of a set of keys.
+
+        Args:
+            table: Table name (raw_data or liquidity_indexes).
+            keys: Series keys (series_id or index_name) to load.
+            start: Inclusive start timestamp.
+            end: Inclusive end timestamp.
+
+        Returns:
+            Long-format DataFrame with the table columns, sorted by timestamp.
+
+        Raises:
+            DuckDBStorageError: If the table is unknown or the query fails.
+        """
+        key_column = self._key_column(table)
+        columns = TABLE_COLUMNS[table]
+        if not keys:
+            return pd.DataFrame(columns=columns)
+        params: list[Any] = list(keys)
+        if start is not None:
+            params.append(bind_timestamp(start))
+        if end is not None:
+            params.append(bind_timestamp(end))
+        sql = range_sql(table, len(keys), start is not None, end is not None, "qmark")
+        df = self.query_df(sql, params)
+        return df.sort_values(["timestamp", key_column]).reset_index(drop=True)[columns]
+
+    def get_latest(
+        self, series_id: str, table: str = RAW_DATA_TABLE
+    ) -> dict[str, Any] | None:
+        """Get the latest data point for a series.
+
+        Args:
+            series_id: The series key (series_id or index_name).
+            table: Table to query. Defaults to raw_data.
+
+        Returns:
+            Dict with latest data point, or None if not found.
+        """
+        key_column = self._key_column(table)
+        result = self.query(
+            f"SELECT * FROM {table} WHERE {key_column} = ? ORDER BY timestamp DESC LIMIT 1",
+            [series_id],
+        )
+        return result[0] if result else None
+
+    def get_latest_timestamp(
+        self, series_id: str, table: str = RAW_DATA_TABLE
+    ) -> datetime | None:
+        """Get the timestamp of the latest data point for a series.
+
+        Args:
+            series_id: The series key.
+            table: Table to query.
+
+        Returns:
+            Latest timestamp as datetime, or None if no data.
+        """
+        latest = self.get_latest(series_id, table)
+        if latest and latest.get("timestamp") is not None:
+            ts = latest["timestamp"]
+            return (
+                ts if isinstance(ts, datetime) else pd.to_datetime(ts).to_pydatetime()
+            )
+        return None
+
+    def health_check(self) -> bool:
+        """Check that the embedded database answers queries.
+
+        Returns:
+            True if healthy, False otherwise.
+        """
+        try:
+            result = self.query("SELECT 1 AS health")
+            return len(result) > 0 and result[0].get("health") == 1
+        except Exception as e:
+            logger.warning("DuckDB health check failed: %s", e)
+            return False
+
+    def close(self) -> None:
+        """Close the in-process connection."""
+        self._con.close()
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"DuckDBStorage(root={str(self.root)!r})"
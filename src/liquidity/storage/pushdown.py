@@ -0,0 +1,140 @@
+"""Server-side (query pushdown) SQL for derived liquidity series.
+
+Builds QuestDB queries that compute derived series next to the data instead
+of pulling raw rows into pandas:
+- Each input series is a filtered (optionally SAMPLE BY resampled) leg of
+  raw_data, converted to the target unit in SQL from its stored ``unit``
+- Legs are aligned with ASOF JOIN (latest right-hand value at or before each
+  left-hand timestamp), so series on different release days still combine
+- Only the final series crosses the wire
+
+Builders return ``(sql, params)``: series ids and time bounds are bound as
+``%s`` parameters; only identifiers, the validated SAMPLE BY interval and the
+unit conversion constants of the registry are part of the text.
+"""
+
+from datetime import datetime
+from typing import Any
+
+from liquidity.storage.schemas import RAW_DATA_TABLE
+from liquidity.storage.statements import bind_timestamp
+from liquidity.units import scales_to
+
+# Multipliers to millions USD, keyed by the raw_data unit symbol
+MILLIONS_USD_SCALE: dict[str, float] = scales_to("millions_usd")
+
+
+def _scale_expr(scale: dict[str, float] | None) -> str:
+    """SQL expression converting ``value`` by its unit (NULL if unknown)."""
+    if scale is None:
+        return "value"
+    cases = " ".join(f"WHEN '{unit}' THEN {factor!r}" for unit, factor in scale.items())
+    return f"value * CASE unit {cases} ELSE NULL END"
+
+
+def series_leg(
+    series_id: str,
+    alias: str,
+    start: datetime | None = None,
+    end: datetime | None = None,
+    freq: str | None = None,
+    scale: dict[str, float] | None = None,
+) -> tuple[str, list[Any]]:
+    """Build a timestamped subquery for one raw_data series.
+
+    Args:
+        series_id: Series to select.
+        alias: Output column name for the converted value.
+        start: Inclusive start timestamp (omit on ASOF right-hand legs so the
+            first rows can match earlier observations).
+        end: Inclusive end timestamp.
+        freq: Optional SAMPLE BY interval (last value per bucket, FILL(PREV)).
+        scale: Unit multipliers applied in SQL, or None to keep values as-is.
+
+    Returns:
+        Parenthesised subquery with a designated ``timestamp`` column, and
+        its bind parameters.
+    """
+    conditions = ["series_id = %s"]
+    params: list[Any] = [series_id]
+    if start is not None:
+        conditions.append("timestamp >= %s")
+        params.append(bind_timestamp(start))
+    if end is not None:
+        conditions.append("timestamp <= %s")
+        params.append(bind_timestamp(end))
+    where = " AND ".join(conditions)
+    value = _scale_expr(scale)
+
+    if freq is None:
+        sql = (
+            f"(SELECT timestamp, {value} AS {alias} FROM {RAW_DATA_TABLE} "
+            f"WHERE {where}) timestamp(timestamp)"
+        )
+    else:
+        sql = (
+            f"(SELECT timestamp, last({value}) AS {alias} FROM {RAW_DATA_TABLE} "
+            f"WHERE {where} SAMPLE BY {freq} FILL(PREV) ALIGN TO CALENDAR) timestamp(timestamp)"
+        )
+    return sql, params
+
+
+def net_liquidity_sql(
+    start: datetime | None = None,
+    end: datetime | None = None,
+    freq: str | None = None,
+) -> tuple[str, list[Any]]:
+    """Build the Hayes Net Liquidity query (WALCL - WLRRAL - WDTGAL).
+
+    Every leg is converted to millions USD in SQL. Output rows follow WALCL
+    timestamps; RRP and TGA are matched as-of.
+
+    Args:
+        start: Inclusive start timestamp.
+        end: Inclusive end timestamp.
+        freq: Optional SAMPLE BY interval applied to every leg.
+
+    Returns:
+        SQL returning ``timestamp, value`` in millions USD, and its parameters.
+    """
+    walcl, walcl_params = series_leg("WALCL", "walcl", start, end, freq, MILLIONS_USD_SCALE)
+    rrp, rrp_params = series_leg("WLRRAL", "rrp", None, end, freq, MILLIONS_USD_SCALE)
+    tga, tga_params = series_leg("WDTGAL", "tga", None, end, freq, MILLIONS_USD_SCALE)
+    sql = f"""
+        SELECT timestamp, value FROM (
+            SELECT a.timestamp AS timestamp, a.walcl - b.rrp - c.tga AS value
+            FROM {walcl} a
+            ASOF JOIN {rrp} b
+            ASOF JOIN {tga} c
+        ) WHERE value != NULL
+        ORDER BY timestamp
+    """
+    return sql, walcl_params + rrp_params + tga_params
+
+
+def yield_spread_sql(
+    start: datetime | None = None,
+    end: datetime | None = None,
+    freq: str | None = None,
+) -> tuple[str, list[Any]]:
+    """Build the DGS10 - DGS2 yield spread query.
+
+    Args:
+        start: Inclusive start timestamp.
+        end: Inclusive end timestamp.
+        freq: Optional SAMPLE BY interval applied to both legs.
+
+    Returns:
+        SQL returning ``timestamp, value`` in percent, and its parameters.
+    """
+    dgs10, dgs10_params = series_leg("DGS10", "dgs10", start, end, freq)
+    dgs2, dgs2_params = series_leg("DGS2", "dgs2", None, end, freq)
+    sql = f"""
+        SELECT timestamp, value FROM (
+            SELECT a.timestamp AS timestamp, a.dgs10 - b.dgs2 AS value
+            FROM {dgs10} a
+            ASOF JOIN {dgs2} b
+        ) WHERE value != NULL
+        ORDER BY timestamp
+    """
+    return sql, dgs10_params + dgs2_params
@@ -4,29 +4,81 @@ Provides high-performance time-series storage using QuestDB:
 - ILP (InfluxDB Line Protocol) for fast DataFrame ingestion (28-92x faster than SQL)
 - PGWire for schema management and queries
 - Automatic timestamp conversion and SYMBOL column handling
+- Optional local Arrow snapshot mirror used as a read-through tier
+- Optional durable spool for batches QuestDB cannot accept, replayed in order
+- Delta ingestion that skips rows already stored with the same values
+- Server-side derived series (Net Liquidity, yield spread) via ASOF JOIN
+- Incrementally maintained rollup tables serving downsampled reads
+- Pooled PGWire connections; values are bound as parameters, never
+  interpolated into SQL
 """
 
 import logging
-from datetime import datetime
+import re
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
 from typing import Any
 
 import pandas as pd
 import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
 from questdb.ingress import Sender
 
 from liquidity.config import Settings, get_settings
+from liquidity.frames import naive_utc
+from liquidity.storage.backend import StorageError
+from liquidity.storage.delta import DeltaResult, compute_delta
+from liquidity.storage.pushdown import (
+    net_liquidity_sql,
+    yield_spread_sql,
+)
+from liquidity.storage.rollups import (
+    ROLLUPS,
+    RollupRefresher,
+    changed_since,
+    refresh_sql,
+    select_rollup,
+)
 from liquidity.storage.schemas import (
     ALL_SCHEMAS,
+    DATA_QUALITY_SYMBOLS,
+    DATA_QUALITY_TABLE,
     LIQUIDITY_INDEXES_SYMBOLS,
     LIQUIDITY_INDEXES_TABLE,
     RAW_DATA_SYMBOLS,
     RAW_DATA_TABLE,
+    ROLLUP_BASE_TABLES,
+    TABLE_COLUMNS,
+    TABLE_KEYS,
+)
+from liquidity.storage.snapshot import SnapshotStore, SnapshotStoreError
+from liquidity.storage.spool import IngestSpool, SpoolError, SpoolReplayer
+from liquidity.storage.statements import (
+    ParamStyle,
+    bind_timestamp,
+    freshness_sql,
+    latest_sql,
+    range_sql,
 )
 
 logger = logging.getLogger(__name__)
 
+# QuestDB SAMPLE BY interval, e.g. "1d", "1w", "1M"
+SAMPLE_BY_PATTERN = re.compile(r"^\d+[UTsmhdwMy]$")
+
+# read_series fill option -> SAMPLE BY FILL mode
+SAMPLE_FILLS: dict[str | None, str] = {
+    "ffill": "PREV",
+    "null": "NULL",
+    None: "NONE",
+    "linear": "LINEAR",
+}
 
-class QuestDBStorageError(Exception):
+
+class QuestDBStorageError(StorageError):
     """Base exception for QuestDB storage errors."""
 
     pass
@@ -67,15 +119,26 @@ class QuestDBStorage:
         storage.ingest_dataframe("raw_data", df, symbols=["series_id", "source", "unit"])
 
         # Query data
-        result = storage.query("SELECT * FROM raw_data WHERE series_id = 'WALCL' LIMIT 10")
+        result = storage.query("SELECT * FROM raw_data WHERE series_id = %s LIMIT 10", ["WALCL"])
+
+        # Aligned wide frame, resampled weekly server-side
+        wide = storage.read_series(["WALCL", "WDTGAL"], start=datetime(2020, 1, 1), freq="1w")
+
+        # Read through the local snapshot (falls back to QuestDB)
+        walcl = storage.load_frame("raw_data", ["WALCL"], start=datetime(2020, 1, 1))
     """
 
+    # psycopg2 binds ``%s`` placeholders
+    paramstyle: ParamStyle = "pyformat"
+
     def __init__(
         self,
         host: str | None = None,
         ilp_port: int | None = None,
         pg_port: int | None = None,
         settings: Settings | None = None,
+        snapshot: SnapshotStore | None = None,
+        spool: IngestSpool | None = None,
     ) -> None:
         """Initialize QuestDB storage.
 
@@ -84,11 +147,34 @@ class QuestDBStorage:
             ilp_port: ILP port (9009 by default). Defaults to settings value.
             pg_port: PostgreSQL wire port (8812 by default). Defaults to 8812.
             settings: Optional settings override.
+            snapshot: Optional local snapshot store. Defaults to one under
+                snapshot_dir when snapshot_enabled is set (off by default).
+            spool: Optional ingest spool. Defaults to one under spool_dir when
+                spool_enabled is set (off by default).
         """
         self._settings = settings or get_settings()
         self.host = host or self._settings.questdb_host
         self.ilp_port = ilp_port or self._settings.questdb_port
         self.pg_port = pg_port or 8812  # Default PGWire port
+        if snapshot is None and self._settings.snapshot_enabled:
+            snapshot = SnapshotStore(settings=self._settings)
+        self.snapshot = snapshot
+        if spool is None and self._settings.spool_enabled:
+            spool = IngestSpool(settings=self._settings)
+        self.spool = spool
+        self.rollups_enabled = self._settings.rollups_enabled
+        # (table, key) -> earliest timestamp whose rollup buckets are stale
+        self._dirty_rollups: dict[tuple[str, str], datetime] = {}
+        # Buckets a refresh is rebuilding right now (stale until it finishes)
+        self._refreshing_rollups: dict[tuple[str, str], datetime] = {}
+        self._rollup_lock = threading.Lock()
+        self._rollup_refresher: RollupRefresher | None = None
+        # Pooled PGWire connections; the semaphore makes callers wait for a
+        # free connection instead of failing when the pool is exhausted
+        self.pg_pool_size = self._settings.questdb_pg_pool_size
+        self._pg_pool: ThreadedConnectionPool | None = None
+        self._pg_pool_lock = threading.Lock()
+        self._pg_slots = threading.BoundedSemaphore(self.pg_pool_size)
 
     def _get_pg_connection(self) -> psycopg2.extensions.connection:
         """Get a PostgreSQL wire protocol connection.
@@ -111,6 +197,59 @@ class QuestDBStorage:
             logger.error("Failed to connect to QuestDB via PGWire: %s", e)
             raise QuestDBConnectionError(f"Failed to connect to QuestDB: {e}") from e
 
+    def _get_pg_pool(self) -> ThreadedConnectionPool:
+        """Create the PGWire connection pool on first use.
+
+        Connections are opened lazily, so creating the pool never blocks on
+        an unreachable server.
+        """
+        with self._pg_pool_lock:
+            if self._pg_pool is None:
+                self._pg_pool = ThreadedConnectionPool(
+                    0,
+                    self.pg_pool_size,
+                    host=self.host,
+                    port=self.pg_port,
+                    user="admin",
+                    password="quest",
+                    database="qdb",
+                )
+            return self._pg_pool
+
+    @contextmanager
+    def _pooled_connection(self) -> Iterator[psycopg2.extensions.connection]:
+        """Borrow an autocommit connection from the pool.
+
+        Connections that were closed while in use (server restart, network
+        error) are discarded instead of being returned to the pool.
+
+        Raises:
+            QuestDBConnectionError: If a new connection cannot be opened.
+        """
+        with self._pg_slots:
+            pool = self._get_pg_pool()
+            try:
+                conn = pool.getconn()
+                conn.autocommit = True
+            except psycopg2.Error as e:
+                logger.error("Failed to connect to QuestDB via PGWire: %s", e)
+                raise QuestDBConnectionError(f"Failed to connect to QuestDB: {e}") from e
+            try:
+                yield conn
+            finally:
+                pool.putconn(conn, close=bool(conn.closed))
+
+    def close(self) -> None:
+        """Stop the background rollup refresher and close pooled PGWire connections."""
+        with self._rollup_lock:
+            refresher, self._rollup_refresher = self._rollup_refresher, None
+        if refresher is not None:
+            refresher.stop()
+        with self._pg_pool_lock:
+            if self._pg_pool is not None:
+                self._pg_pool.closeall()
+                self._pg_pool = None
+
     def create_tables(self) -> None:
         """Create all required tables if they don't exist.
 
@@ -149,6 +288,12 @@ class QuestDBStorage:
 
         ILP is 28-92x faster than row-by-row SQL inserts for bulk data.
 
+        Failures raise unless a spool is configured (spool_enabled, off by
+        default, or an explicit ``spool``). With a spool, a batch QuestDB
+        rejects is written to the spool and 0 is returned instead of raising,
+        and batches arriving while the spool holds data are queued behind it
+        so replay preserves ingest order.
+
         Args:
             table: Target table name.
             df: DataFrame to ingest.
@@ -157,10 +302,11 @@ class QuestDBStorage:
                 If None, uses default symbols for known tables.
 
         Returns:
-            Number of rows ingested.
+            Number of rows ingested (0 if the batch was spooled).
 
         Raises:
-            QuestDBIngestionError: If ingestion fails.
+            QuestDBIngestionError: If ingestion fails and the batch could not be
+                spooled (or no spool is configured).
         """
         if df.empty:
             logger.warning("Empty DataFrame, nothing to ingest")
@@ -171,27 +317,610 @@ class QuestDBStorage:
             symbols = {
                 RAW_DATA_TABLE: RAW_DATA_SYMBOLS,
                 LIQUIDITY_INDEXES_TABLE: LIQUIDITY_INDEXES_SYMBOLS,
+                DATA_QUALITY_TABLE: DATA_QUALITY_SYMBOLS,
             }.get(table, [])
 
-        # Ensure timestamp column is datetime
-        if timestamp_col in df.columns:
-            df = df.copy()
-            df[timestamp_col] = pd.to_datetime(df[timestamp_col])
+        # Ensure timestamp column is datetime (collector frames already are, and
+        # are sent as-is rather than copied)
+        if timestamp_col in df.columns and not pd.api.types.is_datetime64_any_dtype(
+            df[timestamp_col]
+        ):
+            df = df.assign(**{timestamp_col: pd.to_datetime(df[timestamp_col])})
+
+        spool = self.spool
+        if spool is None:
+            return self._send(table, df, timestamp_col, symbols)
 
+        # Preserve ordering: new batches queue behind anything already spooled
+        try:
+            if spool.has_pending():
+                spool.replay(self._send, self.health_check)
+            pending = spool.has_pending()
+        except (SpoolError, OSError) as e:
+            # A broken spool must not stop new data from reaching QuestDB
+            logger.error("Spool replay failed, sending '%s' batch directly: %s", table, e)
+            pending = False
+        if pending:
+            return self._spool_batch(spool, table, df, timestamp_col, symbols, "deferred")
+
+        try:
+            return self._send(table, df, timestamp_col, symbols)
+        except QuestDBIngestionError:
+            return self._spool_batch(spool, table, df, timestamp_col, symbols, "failed")
+
+    def ingest_delta(
+        self,
+        table: str,
+        df: pd.DataFrame,
+        timestamp_col: str = "timestamp",
+        symbols: list[str] | None = None,
+    ) -> DeltaResult:
+        """Ingest only the rows of a DataFrame that are new or revised.
+
+        The stored tail covering the batch's keys and time range is loaded
+        once (snapshot first, then a single bulk QuestDB query) and compared
+        against the batch, so overlapping refresh windows do not make the
+        WAL rewrite unchanged rows. If the stored tail cannot be loaded, the
+        whole batch is sent.
+
+        Args:
+            table: Target table name (raw_data or liquidity_indexes).
+            df: DataFrame to ingest.
+            timestamp_col: Name of the timestamp column.
+            symbols: SYMBOL columns, as for ingest_dataframe.
+
+        Returns:
+            DeltaResult with the delta rows, new/revised/unchanged counts and
+            the number of rows that reached QuestDB (0 if they were spooled).
+
+        Raises:
+            QuestDBIngestionError: If ingestion of the delta fails.
+        """
+        key_column = TABLE_KEYS[table]
+        if df.empty:
+            return compute_delta(df, df, key_column, timestamp_col)
+
+        timestamps = pd.to_datetime(df[timestamp_col])
+        keys = sorted(df[key_column].astype(str).unique())
+        try:
+            stored = self.load_frame(
+                table, keys, start=timestamps.min(), end=timestamps.max()
+            )
+        except QuestDBStorageError as e:
+            logger.warning("Delta tail unavailable for %s, sending full batch: %s", table, e)
+            stored = pd.DataFrame(columns=TABLE_COLUMNS[table])
+
+        result = compute_delta(df, stored, key_column, timestamp_col)
+        logger.info(
+            "Delta ingest to '%s': %d new, %d revised, %d unchanged",
+            table,
+            result.new,
+            result.revised,
+            result.unchanged,
+        )
+        if not result.rows.empty:
+            result.sent = self.ingest_dataframe(table, result.rows, timestamp_col, symbols)
+            if not result.sent:
+                logger.warning(
+                    "Delta of %d rows to '%s' spooled for replay", len(result.rows), table
+                )
+        return result
+
+    def _send(
+        self,
+        table: str,
+        df: pd.DataFrame,
+        timestamp_col: str,
+        symbols: list[str],
+    ) -> int:
+        """Write a batch over ILP and mirror it to the snapshot.
+
+        Raises:
+            QuestDBIngestionError: If ingestion fails.
+        """
         try:
-            with Sender(self.host, self.ilp_port) as sender:
+            with Sender.from_conf(f"tcp::addr={self.host}:{self.ilp_port};") as sender:
                 sender.dataframe(
                     df, table_name=table, at=timestamp_col, symbols=symbols
                 )
 
             rows = len(df)
             logger.info("Ingested %d rows to table '%s'", rows, table)
-            return rows
 
         except Exception as e:
             logger.error("Failed to ingest data to %s: %s", table, e)
             raise QuestDBIngestionError(f"Ingestion failed: {e}") from e
 
+        self._mirror_snapshot(table, df)
+        if self._mark_rollups_dirty(table, df, timestamp_col):
+            self._schedule_rollup_refresh()
+        return rows
+
+    def _mark_rollups_dirty(
+        self, table: str, df: pd.DataFrame, timestamp_col: str
+    ) -> bool:
+        """Record the earliest changed timestamp per key for rollup refresh.
+
+        Returns:
+            True if the table has rollups to refresh.
+        """
+        if not self.rollups_enabled or table not in ROLLUP_BASE_TABLES:
+            return False
+        with self._rollup_lock:
+            for key, since in changed_since(table, df, timestamp_col).items():
+                current = self._dirty_rollups.get((table, key))
+                if current is None or since < current:
+                    self._dirty_rollups[(table, key)] = since
+        return True
+
+    def _schedule_rollup_refresh(self) -> None:
+        """Hand dirty rollup buckets to the background refresher."""
+        with self._rollup_lock:
+            if self._rollup_refresher is None:
+                self._rollup_refresher = RollupRefresher(
+                    self.refresh_rollups, delay=self._settings.rollup_refresh_delay
+                )
+                self._rollup_refresher.start()
+        self._rollup_refresher.notify()
+
+    def _rollups_stale(self, table: str, keys: list[str]) -> bool:
+        """Return True if any key has rollup buckets awaiting refresh."""
+        with self._rollup_lock:
+            return any(
+                (table, key) in self._dirty_rollups or (table, key) in self._refreshing_rollups
+                for key in keys
+            )
+
+    def _wait_for_wal(self, table: str, timeout: float) -> None:
+        """Wait until QuestDB has applied all WAL transactions of a table.
+
+        ILP writes are acknowledged before the WAL is applied, so rollups are
+        only recomputed once the base rows are visible to SQL.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            rows = self.query(
+                "SELECT writerTxn, sequencerTxn FROM wal_tables() WHERE name = %s", [table]
+            )
+            if not rows or rows[0]["writerTxn"] >= rows[0]["sequencerTxn"]:
+                return
+            if time.monotonic() >= deadline:
+                logger.warning("WAL apply of %s still pending after %.1fs", table, timeout)
+                return
+            time.sleep(0.05)
+
+    def refresh_rollups(self, wal_timeout: float = 5.0) -> int:
+        """Recompute the rollup buckets touched since the last refresh.
+
+        Only buckets from each key's earliest changed timestamp onwards are
+        rebuilt (SAMPLE BY over the base table, upserted into the rollup).
+        Ingestion schedules this on a background thread; call it directly to
+        bring the rollups up to date synchronously.
+
+        Args:
+            wal_timeout: Seconds to wait for pending WAL transactions.
+
+        Returns:
+            Number of (table, key) pairs refreshed.
+
+        Raises:
+            QuestDBStorageError: If QuestDB rejects a refresh; the pending
+                buckets are kept for the next attempt.
+        """
+        with self._rollup_lock:
+            pending = self._dirty_rollups
+            self._dirty_rollups = {}
+            self._refreshing_rollups.update(pending)
+        if not pending:
+            return 0
+
+        try:
+            for table in sorted({table for table, _ in pending}):
+                self._wait_for_wal(table, wal_timeout)
+            for (table, key), since in pending.items():
+                for rollup in ROLLUPS:
+                    self.execute(*refresh_sql(table, rollup, key, since))
+        except QuestDBStorageError:
+            with self._rollup_lock:
+                for item, since in pending.items():
+                    current = self._dirty_rollups.get(item)
+                    if current is None or since < current:
+                        self._dirty_rollups[item] = since
+            raise
+        finally:
+            with self._rollup_lock:
+                for item in pending:
+                    self._refreshing_rollups.pop(item, None)
+
+        logger.info("Refreshed rollups for %d series", len(pending))
+        return len(pending)
+
+    def _spool_batch(
+        self,
+        spool: IngestSpool,
+        table: str,
+        df: pd.DataFrame,
+        timestamp_col: str,
+        symbols: list[str],
+        reason: str,
+    ) -> int:
+        """Persist a batch to the spool for later replay.
+
+        Returns:
+            0, since no rows reached QuestDB yet.
+
+        Raises:
+            QuestDBIngestionError: If the batch cannot be spooled either.
+        """
+        try:
+            spool.append(table, df, timestamp_col, symbols)
+        except SpoolError as e:
+            raise QuestDBIngestionError(
+                f"Ingestion {reason} and spooling failed: {e}"
+            ) from e
+        logger.warning(
+            "Ingestion %s for '%s': %d rows spooled for replay", reason, table, len(df)
+        )
+        return 0
+
+    def replay_spool(self) -> int:
+        """Replay spooled batches to QuestDB in order.
+
+        Returns:
+            Number of rows replayed (0 if no spool is configured).
+        """
+        if self.spool is None:
+            return 0
+        return self.spool.replay(self._send, self.health_check)
+
+    def start_spool_replayer(self, interval: float = 30.0) -> SpoolReplayer:
+        """Start a background thread that replays the spool when QuestDB is healthy.
+
+        Args:
+            interval: Seconds between health checks.
+
+        Returns:
+            The running replayer (call ``stop()`` on shutdown).
+
+        Raises:
+            QuestDBStorageError: If no spool is configured.
+        """
+        if self.spool is None:
+            raise QuestDBStorageError("No ingest spool configured")
+        replayer = SpoolReplayer(
+            self.spool, self.health_check, self.replay_spool, interval=interval
+        )
+        replayer.start()
+        return replayer
+
+    def _mirror_snapshot(self, table: str, df: pd.DataFrame) -> None:
+        """Upsert freshly ingested rows into the local snapshot.
+
+        Snapshot failures never fail ingestion; the snapshot is a cache.
+        """
+        if self.snapshot is None or table not in TABLE_KEYS:
+            return
+        try:
+            self.snapshot.write(table, df)
+        except SnapshotStoreError as e:
+            logger.warning("Snapshot mirror of %s failed: %s", table, e)
+
+    def _backfill_snapshot(
+        self,
+        table: str,
+        keys: list[str],
+        df: pd.DataFrame,
+        start: datetime | None,
+        end: datetime | None,
+    ) -> None:
+        """Mirror a full-range query result and mark the range as covered.
+
+        A range without an end (or ending in the future) is only covered up
+        to the latest row loaded for the key: later rows may still arrive.
+        """
+        if self.snapshot is None:
+            return
+        ends: dict[str, datetime | None] = dict.fromkeys(keys, end)
+        if end is None or naive_utc([end])[0] > naive_utc([datetime.now(UTC)])[0]:
+            latest = df.groupby(TABLE_KEYS[table], observed=True)["timestamp"].max()
+            ends = {key: latest[key] for key in keys if key in latest.index}
+        try:
+            self.snapshot.write(table, df)
+            for key, covered_end in ends.items():
+                self.snapshot.record_coverage(table, key, start, covered_end)
+        except SnapshotStoreError as e:
+            logger.warning("Snapshot backfill of %s failed: %s", table, e)
+
+    def load_frame(
+        self,
+        table: str,
+        keys: list[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+        use_snapshot: bool = True,
+    ) -> pd.DataFrame:
+        """Load long-format rows, reading the local snapshot first.
+
+        Keys whose covered snapshot range contains [start, end] are served
+        from memory-mapped Arrow files. Other keys are queried from QuestDB
+        over the requested range, backfilled into the snapshot and their
+        covered range extended. If QuestDB is unreachable, whatever the
+        snapshot holds for those keys is returned.
+
+        Args:
+            table: Table name (raw_data or liquidity_indexes).
+            keys: Series keys (series_id or index_name) to load.
+            start: Inclusive start timestamp.
+            end: Inclusive end timestamp.
+            use_snapshot: Set False to bypass the snapshot and read QuestDB.
+
+        Returns:
+            Long-format DataFrame with the table columns, sorted by timestamp.
+
+        Raises:
+            QuestDBStorageError: If QuestDB must be queried, the query fails
+                and the snapshot holds no rows for the requested keys.
+        """
+        key_column = TABLE_KEYS[table]
+        frames: list[pd.DataFrame] = []
+        missing = list(keys)
+        snapshot = self.snapshot if use_snapshot else None
+
+        if snapshot is not None:
+            hits = [key for key in keys if snapshot.covers(table, key, start, end)]
+            missing = [key for key in keys if key not in hits]
+            if hits:
+                frames.append(snapshot.read(table, hits, start, end))
+
+        if missing:
+            try:
+                fetched = self._query_frame(table, missing, start, end)
+            except QuestDBStorageError as e:
+                stale = (
+                    snapshot.read(table, missing, start, end)
+                    if snapshot is not None
+                    else pd.DataFrame()
+                )
+                if not frames and stale.empty:
+                    raise
+                logger.warning(
+                    "QuestDB unavailable, serving snapshot only for %s: %s", missing, e
+                )
+                frames.append(stale)
+            else:
+                if snapshot is not None:
+                    self._backfill_snapshot(table, missing, fetched, start, end)
+                frames.append(fetched)
+
+        columns = TABLE_COLUMNS[table]
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        df = pd.concat(frames, ignore_index=True)
+        return df.sort_values(["timestamp", key_column]).reset_index(drop=True)[columns]
+
+    def _query_frame(
+        self,
+        table: str,
+        keys: list[str],
+        start: datetime | None,
+        end: datetime | None,
+    ) -> pd.DataFrame:
+        """Query long-format rows for a set of keys from QuestDB."""
+        params: list[Any] = list(keys)
+        if start is not None:
+            params.append(bind_timestamp(start))
+        if end is not None:
+            params.append(bind_timestamp(end))
+        sql = range_sql(table, len(keys), start is not None, end is not None)
+        rows = self.query(sql, params)
+        return pd.DataFrame(rows, columns=TABLE_COLUMNS[table])
+
+    def read_series(
+        self,
+        series_ids: list[str],
+        start: datetime | None = None,
+        end: datetime | None = None,
+        freq: str | None = None,
+        fill: str | None = "ffill",
+    ) -> pd.DataFrame:
+        """Read several raw_data series as one aligned wide frame.
+
+        The time filter is pushed into QuestDB so only overlapping partitions
+        are scanned. With ``freq`` set, resampling happens server-side with
+        ``SAMPLE BY {freq} FILL(...)`` (last value per bucket) over the
+        coarsest rollup that nests in ``freq``; otherwise rows are read
+        through the local snapshot like load_frame.
+
+        Args:
+            series_ids: Series to read (one output column each, in this order).
+            start: Inclusive start timestamp.
+            end: Inclusive end timestamp.
+            freq: QuestDB SAMPLE BY interval (e.g. "1d", "1w", "1M").
+                None returns observations on their native timestamps.
+            fill: Gap handling: "ffill" carries the last value forward,
+                "null"/None leaves gaps as NaN, "linear" interpolates
+                (SAMPLE BY only).
+
+        Returns:
+            Wide DataFrame indexed by timestamp with one column per series.
+
+        Raises:
+            ValueError: If freq or fill is invalid.
+            QuestDBStorageError: If the query fails.
+        """
+        if fill not in SAMPLE_FILLS:
+            raise ValueError(f"Unsupported fill '{fill}'. Use one of {list(SAMPLE_FILLS)}")
+
+        if freq is None:
+            if fill == "linear":
+                raise ValueError("fill='linear' requires freq")
+            df = self.load_frame(RAW_DATA_TABLE, series_ids, start, end)
+        else:
+            if not SAMPLE_BY_PATTERN.match(freq):
+                raise ValueError(f"Invalid SAMPLE BY interval '{freq}'")
+            df = self._query_sampled(series_ids, start, end, freq, SAMPLE_FILLS[fill])
+
+        if df.empty:
+            return pd.DataFrame(
+                columns=series_ids,
+                index=pd.DatetimeIndex([], name="timestamp"),
+                dtype="float64",
+            )
+
+        wide = df.pivot_table(
+            index="timestamp", columns="series_id", values="value", aggfunc="last"
+        ).reindex(columns=series_ids)
+        wide.index = pd.DatetimeIndex(wide.index, name="timestamp")
+        wide.columns.name = None
+        if fill == "ffill":
+            # Aligns series sampled on different days (and FILL(PREV) leading gaps)
+            wide = wide.ffill()
+        return wide.sort_index()
+
+    def _query_sampled(
+        self,
+        series_ids: list[str],
+        start: datetime | None,
+        end: datetime | None,
+        freq: str,
+        fill_mode: str,
+    ) -> pd.DataFrame:
+        """Resample raw_data series server-side with SAMPLE BY.
+
+        Reads the coarsest rollup whose buckets nest in ``freq`` (falling back
+        to raw_data), so long ranges scan far fewer rows. Series whose rollup
+        buckets are still being refreshed are read from raw_data, so reads
+        never wait for the refresh.
+        """
+        params: list[Any] = list(series_ids)
+        conditions = [f"series_id IN ({', '.join(['%s'] * len(series_ids))})"]
+        if start is not None:
+            conditions.append("timestamp >= %s")
+            params.append(bind_timestamp(start))
+        if end is not None:
+            conditions.append("timestamp <= %s")
+            params.append(bind_timestamp(end))
+
+        def sampled(source: str, where: list[str]) -> list[dict[str, Any]]:
+            return self.query(
+                f"""
+                SELECT timestamp, series_id, last(value) AS value
+                FROM {source}
+                WHERE {' AND '.join(where)}
+                SAMPLE BY {freq} FILL({fill_mode}) ALIGN TO CALENDAR
+                """,
+                params,
+            )
+
+        rollup = select_rollup(freq) if self.rollups_enabled else None
+        if rollup is not None and self._rollups_stale(RAW_DATA_TABLE, series_ids):
+            rollup = None
+        if rollup is None:
+            rows = sampled(RAW_DATA_TABLE, conditions)
+        else:
+            # Business-day buckets are forward-filled; only PREV may read them
+            observed = conditions if fill_mode == "PREV" else [*conditions, "samples > 0"]
+            try:
+                rows = sampled(rollup.table(RAW_DATA_TABLE), observed)
+            except QuestDBStorageError as e:
+                logger.warning("Rollup %s unavailable, reading raw_data: %s", rollup.name, e)
+                rows = sampled(RAW_DATA_TABLE, conditions)
+
+        df = pd.DataFrame(rows, columns=["timestamp", "series_id", "value"])
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+        df["value"] = df["value"].astype("float64")
+        return df
+
+    def compute_net_liquidity(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        freq: str | None = None,
+        materialize: bool = False,
+    ) -> pd.DataFrame:
+        """Compute Hayes Net Liquidity inside QuestDB.
+
+        WALCL - WLRRAL - WDTGAL is evaluated server-side with ASOF JOIN, with
+        every leg converted to millions USD in SQL from its stored unit, so
+        only the final series is transferred (no client-side pivot).
+
+        Args:
+            start: Inclusive start timestamp.
+            end: Inclusive end timestamp.
+            freq: Optional SAMPLE BY interval (e.g. "1d") applied to each leg.
+            materialize: Also write the result to liquidity_indexes as
+                index_name "net_liquidity".
+
+        Returns:
+            DataFrame with timestamp, net_liquidity, unit ("millions_usd").
+
+        Raises:
+            ValueError: If freq is invalid.
+            QuestDBStorageError: If the query fails.
+        """
+        return self._compute_derived(
+            "net_liquidity", net_liquidity_sql, start, end, freq, "millions_usd", materialize
+        )
+
+    def compute_yield_spread(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        freq: str | None = None,
+        materialize: bool = False,
+    ) -> pd.DataFrame:
+        """Compute the DGS10 - DGS2 yield spread inside QuestDB.
+
+        Args:
+            start: Inclusive start timestamp.
+            end: Inclusive end timestamp.
+            freq: Optional SAMPLE BY interval applied to both legs.
+            materialize: Also write the result to liquidity_indexes as
+                index_name "yield_spread".
+
+        Returns:
+            DataFrame with timestamp, yield_spread, unit ("percent").
+
+        Raises:
+            ValueError: If freq is invalid.
+            QuestDBStorageError: If the query fails.
+        """
+        return self._compute_derived(
+            "yield_spread", yield_spread_sql, start, end, freq, "percent", materialize
+        )
+
+    def _compute_derived(
+        self,
+        name: str,
+        build_sql: Callable[
+            [datetime | None, datetime | None, str | None], tuple[str, list[Any]]
+        ],
+        start: datetime | None,
+        end: datetime | None,
+        freq: str | None,
+        unit: str,
+        materialize: bool,
+    ) -> pd.DataFrame:
+        """Run a pushdown query and optionally materialise its result."""
+        if freq is not None and not SAMPLE_BY_PATTERN.match(freq):
+            raise ValueError(f"Invalid SAMPLE BY interval '{freq}'")
+
+        rows = self.query(*build_sql(start, end, freq))
+        result = pd.DataFrame(rows, columns=["timestamp", "value"])
+        result["timestamp"] = pd.to_datetime(result["timestamp"])
+        result["value"] = result["value"].astype("float64")
+
+        if materialize and not result.empty:
+            self.ingest_dataframe(
+                LIQUIDITY_INDEXES_TABLE, result.assign(index_name=name)
+            )
+
+        logger.info("Computed %s server-side: %d points", name, len(result))
+        return pd.DataFrame(
+            {"timestamp": result["timestamp"], name: result["value"], "unit": unit}
+        )
+
     def get_latest(
         self, series_id: str, table: str = RAW_DATA_TABLE
     ) -> dict[str, Any] | None:
@@ -200,28 +929,66 @@ class QuestDBStorage:
         Useful for freshness checks and incremental updates.
 
         Args:
-            series_id: The series identifier to query.
+            series_id: The series key (series_id or index_name) to query.
             table: Table to query. Defaults to raw_data.
 
         Returns:
             Dict with latest data point, or None if not found.
+
+        Raises:
+            ValueError: If the table is unknown.
         """
-        sql = f"""
-            SELECT * FROM {table}
-            WHERE series_id = '{series_id}'
-            ORDER BY timestamp DESC
-            LIMIT 1
-        """
-        result = self.query(sql)
+        result = self.query(latest_sql(table), [series_id])
         if result and len(result) > 0:
             return result[0]
         return None
 
-    def query(self, sql: str) -> list[dict[str, Any]]:
+    def get_freshness(self, table: str = RAW_DATA_TABLE) -> dict[str, datetime]:
+        """Get the newest timestamp of every series in a table in one query.
+
+        Args:
+            table: Table to query. Defaults to raw_data.
+
+        Returns:
+            Mapping of series key -> latest timestamp.
+
+        Raises:
+            ValueError: If the table is unknown.
+            QuestDBStorageError: If the query fails.
+        """
+        sql = freshness_sql(table)
+        column = TABLE_KEYS[table]
+        return {
+            str(row[column]): pd.Timestamp(row["timestamp"]).to_pydatetime()
+            for row in self.query(sql)
+            if row["timestamp"] is not None
+        }
+
+    def execute(self, sql: str, params: list[Any] | None = None) -> None:
+        """Execute a SQL statement that returns no rows (DDL, INSERT).
+
+        Args:
+            sql: SQL statement to execute; values are passed as ``%s`` placeholders.
+            params: Optional positional bind parameters.
+
+        Raises:
+            QuestDBStorageError: If execution fails.
+        """
+        with self._pooled_connection() as conn:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(sql, params)
+            except psycopg2.Error as e:
+                logger.error("Statement failed: %s", e)
+                raise QuestDBStorageError(f"Statement failed: {e}") from e
+
+    def query(self, sql: str, params: list[Any] | None = None) -> list[dict[str, Any]]:
         """Execute a SQL query and return results as list of dicts.
 
         Args:
-            sql: SQL query to execute.
+            sql: SQL query to execute; values are passed as ``%s`` placeholders.
+            params: Optional positional bind parameters, escaped by the driver
+                (never format values into ``sql``).
 
         Returns:
             List of dictionaries, one per row.
@@ -229,20 +996,18 @@ class QuestDBStorage:
         Raises:
             QuestDBStorageError: If query fails.
         """
-        conn = self._get_pg_connection()
-        try:
-            with conn.cursor() as cur:
-                cur.execute(sql)
-                columns = (
-                    [desc[0] for desc in cur.description] if cur.description else []
-                )
-                rows = cur.fetchall()
-                return [dict(zip(columns, row, strict=False)) for row in rows]
-        except psycopg2.Error as e:
-            logger.error("Query failed: %s", e)
-            raise QuestDBStorageError(f"Query failed: {e}") from e
-        finally:
-            conn.close()
+        with self._pooled_connection() as conn:
+            try:
+                with conn.cursor() as cur:
+                    cur.execute(sql, params)
+                    columns = (
+                        [desc[0] for desc in cur.description] if cur.description else []
+                    )
+                    rows = cur.fetchall()
+                    return [dict(zip(columns, row, strict=False)) for row in rows]
+            except psycopg2.Error as e:
+                logger.error("Query failed: %s", e)
+                raise QuestDBStorageError(f"Query failed: {e}") from e
 
     def get_latest_timestamp(
         self, series_id: str, table: str = RAW_DATA_TABLE
@@ -0,0 +1,204 @@
+"""Downsampled rollup tables maintained incrementally with SAMPLE BY.
+
+Each base table (raw_data, liquidity_indexes) has three rollups:
+- bday: daily buckets forward-filled per key (FILL(PREV)) with weekends
+  dropped, so every series lines up on the same business-day grid
+- weekly: calendar weeks (Monday buckets)
+- monthly: calendar months
+
+Rollup rows hold the last value of the bucket plus min, max and sample count
+(0 for business days forward-filled without an observation). After ingests
+only the buckets touched by the batches are recomputed and upserted (DEDUP
+UPSERT KEYS) by a background refresher, so maintenance cost is proportional
+to the batches, not the history, and never delays ingestion. Reads pick the
+coarsest rollup whose buckets nest in the requested interval.
+"""
+
+import logging
+import re
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import pandas as pd
+
+from liquidity.storage.schemas import ROLLUP_INTERVALS, TABLE_KEYS, rollup_table_name
+
+logger = logging.getLogger(__name__)
+
+# QuestDB interval, e.g. "1d", "2w", "3M"
+_INTERVAL_PATTERN = re.compile(r"^(\d+)([UTsmhdwMy])$")
+
+
+@dataclass(frozen=True)
+class Rollup:
+    """A rollup granularity.
+
+    Attributes:
+        name: Rollup name (table suffix).
+        interval: SAMPLE BY interval used to build it.
+        serves: Interval units whose buckets are unions of this rollup's buckets.
+        business_days: Forward-fill daily buckets and drop weekends.
+    """
+
+    name: str
+    interval: str
+    serves: frozenset[str]
+    business_days: bool = False
+
+    def table(self, base_table: str) -> str:
+        """Return the rollup table name for a base table."""
+        return rollup_table_name(base_table, self.name)
+
+    def bucket_start(self, value: datetime | pd.Timestamp) -> pd.Timestamp:
+        """Return the start of the bucket containing a timestamp (naive UTC)."""
+        ts = pd.Timestamp(value)
+        if ts.tzinfo is not None:
+            ts = ts.tz_convert("UTC").tz_localize(None)
+        day = ts.normalize()
+        if self.interval == "1w":
+            return day - pd.Timedelta(days=day.dayofweek)
+        if self.interval == "1M":
+            return day.replace(day=1)
+        return day
+
+
+# Coarsest first: the read path returns the first rollup that can serve a query
+ROLLUPS: tuple[Rollup, ...] = (
+    Rollup("monthly", ROLLUP_INTERVALS["monthly"], frozenset({"M", "y"})),
+    Rollup("weekly", ROLLUP_INTERVALS["weekly"], frozenset({"w"})),
+    Rollup("bday", ROLLUP_INTERVALS["bday"], frozenset({"d", "w", "M", "y"}), True),
+)
+
+
+def select_rollup(freq: str) -> Rollup | None:
+    """Pick the coarsest rollup that can answer a SAMPLE BY query.
+
+    Args:
+        freq: Requested SAMPLE BY interval (e.g. "1w", "3M").
+
+    Returns:
+        The rollup to read, or None if only raw rows can serve the interval
+        (sub-daily intervals).
+    """
+    match = _INTERVAL_PATTERN.match(freq)
+    if match is None:
+        return None
+    unit = match.group(2)
+    for rollup in ROLLUPS:
+        if unit in rollup.serves:
+            return rollup
+    return None
+
+
+def refresh_sql(
+    base_table: str, rollup: Rollup, key: str, since: datetime
+) -> tuple[str, list[Any]]:
+    """Build the INSERT that recomputes one key's rollup buckets from ``since``.
+
+    Args:
+        base_table: Base table (raw_data or liquidity_indexes).
+        rollup: Rollup to refresh.
+        key: Series key whose buckets changed.
+        since: Earliest changed timestamp; recomputation starts at its bucket.
+
+    Returns:
+        INSERT ... SELECT ... SAMPLE BY statement and its parameters (the key
+        and the first bucket start).
+    """
+    key_column = TABLE_KEYS[base_table]
+    start = rollup.bucket_start(since).to_pydatetime()
+    fill = " FILL(PREV, PREV, PREV, 0)" if rollup.business_days else ""
+    sampled = (
+        f"SELECT timestamp, {key_column}, last(value) AS value, "
+        f"min(value) AS min_value, max(value) AS max_value, count() AS samples "
+        f"FROM {base_table} "
+        f"WHERE {key_column} = %s AND timestamp >= %s "
+        f"SAMPLE BY {rollup.interval}{fill} ALIGN TO CALENDAR"
+    )
+    if rollup.business_days:
+        sampled = f"SELECT * FROM ({sampled}) WHERE day_of_week(timestamp) <= 5"
+    return f"INSERT INTO {rollup.table(base_table)} {sampled}", [key, start]
+
+
+def changed_since(base_table: str, df: pd.DataFrame, timestamp_col: str) -> dict[str, datetime]:
+    """Return the earliest ingested timestamp per key in a batch.
+
+    Args:
+        base_table: Base table of the batch.
+        df: Ingested rows.
+        timestamp_col: Timestamp column.
+
+    Returns:
+        Mapping of key -> earliest timestamp.
+    """
+    key_column = TABLE_KEYS[base_table]
+    timestamps = pd.to_datetime(df[timestamp_col])
+    earliest = timestamps.groupby(df[key_column].astype(str)).min()
+    return {str(key): ts.to_pydatetime() for key, ts in earliest.items()}
+
+
+class RollupRefresher:
+    """Background thread that refreshes dirty rollup buckets after ingests.
+
+    Ingests only call ``notify()``; the refresh (which waits for the WAL to
+    be applied) runs on this thread after a short delay, so a burst of
+    ingests is folded into one refresh.
+
+    Example:
+        refresher = RollupRefresher(storage.refresh_rollups, delay=1.0)
+        refresher.start()
+        refresher.notify()
+        ...
+        refresher.stop()
+    """
+
+    def __init__(self, refresh: Callable[[], int], delay: float = 1.0) -> None:
+        """Initialize the refresher.
+
+        Args:
+            refresh: Refreshes dirty buckets, returning the series refreshed.
+            delay: Seconds to keep batching notifications before refreshing.
+        """
+        self._refresh = refresh
+        self.delay = delay
+        self._pending = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def notify(self) -> None:
+        """Request a refresh (batched with other requests within ``delay``)."""
+        self._pending.set()
+
+    def _run(self) -> None:
+        """Thread loop."""
+        while not self._stop.is_set():
+            self._pending.wait()
+            if self._stop.wait(self.delay):
+                return
+            self._pending.clear()
+            try:
+                self._refresh()
+            except Exception as e:
+                # Buckets stay dirty and are retried on the next notification
+                logger.warning("Background rollup refresh failed: %s", e)
+
+    def start(self) -> None:
+        """Start the background refresh thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="questdb-rollup-refresher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background refresh thread."""
+        self._stop.set()
+        self._pending.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -3,9 +3,14 @@
 Defines table schemas using SQL DDL statements for:
 - RAW_DATA: Raw series data from various sources (FRED, ECB, etc.)
 - LIQUIDITY_INDEXES: Calculated liquidity metrics (Net Liquidity, Global Liquidity)
+- DATA_QUALITY: Data-quality flags raised on collected series (outliers, gaps,
+  timestamp anomalies)
+
+- Rollups: downsampled copies of both tables (business-day, weekly, monthly)
 
 Schema design follows QuestDB best practices:
 - MONTH partitioning for macro data (daily/weekly updates)
+- YEAR partitioning for rollups (few rows per partition)
 - SYMBOL columns for series_id, source, unit (dictionary-encoded)
 - WAL + DEDUP UPSERT KEYS for exactly-once semantics
 """
@@ -13,6 +18,7 @@ Schema design follows QuestDB best practices:
 # Table name constants
 RAW_DATA_TABLE = "raw_data"
 LIQUIDITY_INDEXES_TABLE = "liquidity_indexes"
+DATA_QUALITY_TABLE = "data_quality"
 
 # SQL DDL for raw data table
 RAW_DATA_SCHEMA = """
@@ -41,9 +47,131 @@ CREATE TABLE IF NOT EXISTS liquidity_indexes (
   DEDUP UPSERT KEYS(timestamp, index_name);
 """
 
+# SQL DDL for data quality flags (one row per issue of a flagged observation or
+# missing print, so a later flag never overwrites another issue)
+DATA_QUALITY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS data_quality (
+    timestamp TIMESTAMP,
+    series_id SYMBOL CAPACITY 100,
+    issue SYMBOL CAPACITY 20,
+    value DOUBLE,
+    score DOUBLE
+) TIMESTAMP(timestamp)
+  PARTITION BY YEAR
+  WAL
+  DEDUP UPSERT KEYS(timestamp, series_id, issue);
+"""
+
+# Existing data_quality tables were created with (timestamp, series_id) keys
+DATA_QUALITY_DEDUP_SQL = """
+ALTER TABLE data_quality DEDUP ENABLE UPSERT KEYS(timestamp, series_id, issue);
+"""
+
+# Rollup name -> SAMPLE BY interval
+ROLLUP_INTERVALS: dict[str, str] = {
+    "bday": "1d",
+    "weekly": "1w",
+    "monthly": "1M",
+}
+
+# SQL DDL template for rollup tables (one per base table and rollup)
+ROLLUP_SCHEMA_TEMPLATE = """
+CREATE TABLE IF NOT EXISTS {table} (
+    timestamp TIMESTAMP,
+    {key} SYMBOL CAPACITY {capacity},
+    value DOUBLE,
+    min_value DOUBLE,
+    max_value DOUBLE,
+    samples LONG
+) TIMESTAMP(timestamp)
+  PARTITION BY YEAR
+  WAL
+  DEDUP UPSERT KEYS(timestamp, {key});
+"""
+
+
+def rollup_table_name(table: str, rollup: str) -> str:
+    """Return the rollup table name for a base table (e.g. raw_data_weekly)."""
+    return f"{table}_{rollup}"
+
+
+# Base tables with rollups
+ROLLUP_BASE_TABLES = (RAW_DATA_TABLE, LIQUIDITY_INDEXES_TABLE)
+
+ROLLUP_SCHEMAS = [
+    ROLLUP_SCHEMA_TEMPLATE.format(
+        table=rollup_table_name(table, rollup), key=key, capacity=capacity
+    )
+    for table, key, capacity in [
+        (RAW_DATA_TABLE, "series_id", 100),
+        (LIQUIDITY_INDEXES_TABLE, "index_name", 20),
+    ]
+    for rollup in ROLLUP_INTERVALS
+]
+
 # All schemas for initialization
-ALL_SCHEMAS = [RAW_DATA_SCHEMA, LIQUIDITY_INDEXES_SCHEMA]
+ALL_SCHEMAS = [
+    RAW_DATA_SCHEMA,
+    LIQUIDITY_INDEXES_SCHEMA,
+    DATA_QUALITY_SCHEMA,
+    DATA_QUALITY_DEDUP_SQL,
+    *ROLLUP_SCHEMAS,
+]
 
 # Symbol columns per table (for ILP ingestion)
 RAW_DATA_SYMBOLS = ["series_id", "source", "unit"]
 LIQUIDITY_INDEXES_SYMBOLS = ["index_name", "regime"]
+DATA_QUALITY_SYMBOLS = ["series_id", "issue"]
+
+# Column order per table
+RAW_DATA_COLUMNS = ["timestamp", "series_id", "source", "value", "unit"]
+LIQUIDITY_INDEXES_COLUMNS = ["timestamp", "index_name", "value", "regime"]
+DATA_QUALITY_COLUMNS = ["timestamp", "series_id", "issue", "value", "score"]
+
+# Portable SQL column types (embedded backends)
+RAW_DATA_COLUMN_TYPES = {
+    "timestamp": "TIMESTAMP",
+    "series_id": "VARCHAR",
+    "source": "VARCHAR",
+    "value": "DOUBLE",
+    "unit": "VARCHAR",
+}
+LIQUIDITY_INDEXES_COLUMN_TYPES = {
+    "timestamp": "TIMESTAMP",
+    "index_name": "VARCHAR",
+    "value": "DOUBLE",
+    "regime": "VARCHAR",
+}
+DATA_QUALITY_COLUMN_TYPES = {
+    "timestamp": "TIMESTAMP",
+    "series_id": "VARCHAR",
+    "issue": "VARCHAR",
+    "value": "DOUBLE",
+    "score": "DOUBLE",
+}
+
+TABLE_COLUMNS: dict[str, list[str]] = {
+    RAW_DATA_TABLE: RAW_DATA_COLUMNS,
+    LIQUIDITY_INDEXES_TABLE: LIQUIDITY_INDEXES_COLUMNS,
+    DATA_QUALITY_TABLE: DATA_QUALITY_COLUMNS,
+}
+
+TABLE_COLUMN_TYPES: dict[str, dict[str, str]] = {
+    RAW_DATA_TABLE: RAW_DATA_COLUMN_TYPES,
+    LIQUIDITY_INDEXES_TABLE: LIQUIDITY_INDEXES_COLUMN_TYPES,
+    DATA_QUALITY_TABLE: DATA_QUALITY_COLUMN_TYPES,
+}
+
+# Series key per table (partitioning and per-series lookups)
+TABLE_KEYS: dict[str, str] = {
+    RAW_DATA_TABLE: "series_id",
+    LIQUIDITY_INDEXES_TABLE: "index_name",
+    DATA_QUALITY_TABLE: "series_id",
+}
+
+# DEDUP UPSERT KEYS per table (a row replaces a stored row with the same keys)
+TABLE_DEDUP_KEYS: dict[str, tuple[str, ...]] = {
+    RAW_DATA_TABLE: ("timestamp", "series_id"),
+    LIQUIDITY_INDEXES_TABLE: ("timestamp", "index_name"),
+    DATA_QUALITY_TABLE: ("timestamp", "series_id", "issue"),
+}
@@ -0,0 +1,355 @@
+"""Local columnar snapshot store (read-through tier in front of QuestDB).
+
+Mirrors raw_data and liquidity_indexes as Arrow IPC files on local disk:
+- Hive-style partitions by series key and month
+  (``raw_data/series_id=WALCL/month=2024-01/data.arrow``)
+- Uncompressed Arrow IPC so reads are zero-copy memory maps
+- Incremental upserts: only partitions touched by a batch are rewritten,
+  deduplicated on the table's DEDUP UPSERT KEYS like QuestDB
+- Atomic file replacement so readers never see partial writes
+- A covered [start, end] range per key, recorded when a range is backfilled
+  from QuestDB, so reads know whether the snapshot holds the full history
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+import pandas as pd
+import pyarrow as pa
+
+from liquidity.config import Settings, get_settings
+from liquidity.frames import naive_utc
+from liquidity.storage.schemas import TABLE_COLUMNS, TABLE_DEDUP_KEYS, TABLE_KEYS
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = "data.arrow"
+COVERAGE_FILE = "coverage.json"
+
+# Covered range of a key; None bounds are open (all history / up to now)
+Coverage = tuple[pd.Timestamp | None, pd.Timestamp | None]
+
+
+class SnapshotStoreError(Exception):
+    """Error reading or writing the local snapshot store."""
+
+    pass
+
+
+def _as_naive_utc(value: datetime | str) -> pd.Timestamp:
+    """Convert a datetime-like to a tz-naive UTC timestamp."""
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    return ts
+
+
+def _month_key(value: datetime | None) -> str | None:
+    """Format a datetime-like as a YYYY-MM partition key."""
+    if value is None:
+        return None
+    return _as_naive_utc(value).strftime("%Y-%m")
+
+
+class SnapshotStore:
+    """Arrow snapshot store partitioned by series key and month.
+
+    Example:
+        store = SnapshotStore("data/snapshots")
+        store.write("raw_data", df)
+
+        # Memory-mapped read with partition pruning
+        walcl = store.read("raw_data", ["WALCL"], start=datetime(2020, 1, 1))
+    """
+
+    def __init__(
+        self,
+        root: str | Path | None = None,
+        settings: Settings | None = None,
+    ) -> None:
+        """Initialize the snapshot store.
+
+        Args:
+            root: Root directory. Defaults to the snapshot_dir setting.
+            settings: Optional settings override.
+        """
+        self._settings = settings or get_settings()
+        self.root = Path(root or self._settings.snapshot_dir)
+
+    @staticmethod
+    def _key_column(table: str) -> str:
+        """Return the partition key column of a table."""
+        try:
+            return TABLE_KEYS[table]
+        except KeyError as e:
+            raise SnapshotStoreError(f"Table '{table}' is not mirrored") from e
+
+    def _key_dir(self, table: str, key: str) -> Path:
+        """Return the directory holding all partitions of a series key."""
+        key_column = self._key_column(table)
+        return self.root / table / f"{key_column}={quote(key, safe='')}"
+
+    def _partition_path(self, table: str, key: str, month: str) -> Path:
+        """Return the file path of a (key, month) partition."""
+        return self._key_dir(table, key) / f"month={month}" / SNAPSHOT_FILE
+
+    def _normalize(self, table: str, df: pd.DataFrame) -> pd.DataFrame:
+        """Project a frame onto the table columns with canonical dtypes."""
+        columns = TABLE_COLUMNS[table]
+        normalized = pd.DataFrame(index=df.index)
+        for column in columns:
+            normalized[column] = df[column] if column in df.columns else None
+        normalized["timestamp"] = naive_utc(normalized["timestamp"])
+        normalized["value"] = normalized["value"].astype("float64")
+        for column in columns:
+            if column not in ("timestamp", "value"):
+                normalized[column] = normalized[column].astype(object)
+        return normalized
+
+    @staticmethod
+    def _read_file(path: Path) -> pa.Table:
+        """Memory-map an Arrow IPC file."""
+        with pa.memory_map(str(path), "r") as source:
+            return pa.ipc.open_file(source).read_all()
+
+    @staticmethod
+    def _write_file(path: Path, table: pa.Table) -> None:
+        """Write an Arrow IPC file atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with pa.OSFile(str(tmp_path), "wb") as sink, pa.ipc.new_file(
+            sink, table.schema
+        ) as writer:
+            writer.write_table(table)
+        os.replace(tmp_path, path)
+
+    def write(self, table: str, df: pd.DataFrame) -> int:
+        """Upsert rows into the snapshot, rewriting only touched partitions.
+
+        Args:
+            table: Mirrored table name (raw_data or liquidity_indexes).
+            df: Rows to upsert (standard table columns).
+
+        Returns:
+            Number of rows written.
+
+        Raises:
+            SnapshotStoreError: If the table is unknown or the write fails.
+        """
+        if df.empty:
+            return 0
+
+        key_column = self._key_column(table)
+        # Partitions hold one key, so the other dedup keys identify a row
+        row_keys = [column for column in TABLE_DEDUP_KEYS[table] if column != key_column]
+        batch = self._normalize(table, df)
+        months = batch["timestamp"].dt.strftime("%Y-%m")
+
+        try:
+            for (key, month), part in batch.groupby([key_column, months], sort=False):
+                path = self._partition_path(table, str(key), str(month))
+                if path.exists():
+                    existing = self._read_file(path).to_pandas()
+                    part = pd.concat([existing, part], ignore_index=True)
+                part = (
+                    part.drop_duplicates(subset=row_keys, keep="last")
+                    .sort_values("timestamp")
+                    .reset_index(drop=True)
+                )
+                self._write_file(path, pa.Table.from_pandas(part, preserve_index=False))
+        except (OSError, pa.ArrowException) as e:
+            logger.error("Snapshot write to %s failed: %s", table, e)
+            raise SnapshotStoreError(f"Snapshot write failed: {e}") from e
+
+        logger.debug("Snapshot upserted %d rows into %s", len(batch), table)
+        return len(batch)
+
+    def keys(self, table: str) -> list[str]:
+        """List series keys present in the snapshot for a table."""
+        key_column = self._key_column(table)
+        table_dir = self.root / table
+        if not table_dir.exists():
+            return []
+        prefix = f"{key_column}="
+        return sorted(
+            unquote(path.name[len(prefix) :])
+            for path in table_dir.glob(f"{prefix}*")
+            if path.is_dir()
+        )
+
+    def _partition_files(
+        self,
+        table: str,
+        keys: list[str] | None,
+        start: datetime | None,
+        end: datetime | None,
+    ) -> list[Path]:
+        """Resolve partition files overlapping the requested keys and range."""
+        first_month, last_month = _month_key(start), _month_key(end)
+        files: list[Path] = []
+        for key in keys if keys is not None else self.keys(table):
+            key_dir = self._key_dir(table, key)
+            for path in sorted(key_dir.glob(f"month=*/{SNAPSHOT_FILE}")):
+                month = path.parent.name.removeprefix("month=")
+                if first_month and month < first_month:
+                    continue
+                if last_month and month > last_month:
+                    continue
+                files.append(path)
+        return files
+
+    def read(
+        self,
+        table: str,
+        keys: list[str] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> pd.DataFrame:
+        """Read rows from the snapshot with partition pruning.
+
+        Args:
+            table: Mirrored table name.
+            keys: Series keys to read. Defaults to all keys.
+            start: Inclusive start timestamp.
+            end: Inclusive end timestamp.
+
+        Returns:
+            Long-format DataFrame with the table columns, sorted by timestamp.
+        """
+        columns = TABLE_COLUMNS[table]
+        files = self._partition_files(table, keys, start, end)
+        if not files:
+            return pd.DataFrame(columns=columns)
+
+        try:
+            combined = pa.concat_tables([self._read_file(path) for path in files])
+        except (OSError, pa.ArrowException) as e:
+            raise SnapshotStoreError(f"Snapshot read failed: {e}") from e
+
+        df: pd.DataFrame = combined.to_pandas()
+        if start is not None:
+            df = df[df["timestamp"] >= _as_naive_utc(start)]
+        if end is not None:
+            df = df[df["timestamp"] <= _as_naive_utc(end)]
+
+        key_column = self._key_column(table)
+        return df.sort_values(["timestamp", key_column]).reset_index(drop=True)[columns]
+
+    def latest_timestamp(self, table: str, key: str) -> datetime | None:
+        """Return the latest snapshot timestamp for a key (reads one partition).
+
+        Args:
+            table: Mirrored table name.
+            key: Series key.
+
+        Returns:
+            Latest timestamp, or None if the key has no snapshot.
+        """
+        files = self._partition_files(table, [key], None, None)
+        if not files:
+            return None
+        timestamps = self._read_file(files[-1]).column("timestamp").to_pandas()
+        latest: datetime = timestamps.max().to_pydatetime()
+        return latest
+
+    def coverage(self, table: str, key: str) -> Coverage | None:
+        """Return the range of a key known to be complete in the snapshot.
+
+        Rows mirrored from ingestion do not extend the covered range; only
+        backfills of a full queried range (record_coverage) do.
+
+        Args:
+            table: Mirrored table name.
+            key: Series key.
+
+        Returns:
+            (start, end) with None for an open bound, or None if nothing is covered.
+        """
+        path = self._key_dir(table, key) / COVERAGE_FILE
+        try:
+            bounds = json.loads(path.read_text())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable snapshot coverage %s: %s", path, e)
+            return None
+        start, end = bounds.get("start"), bounds.get("end")
+        return (
+            pd.Timestamp(start) if start is not None else None,
+            pd.Timestamp(end) if end is not None else None,
+        )
+
+    def covers(
+        self,
+        table: str,
+        key: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> bool:
+        """Return whether the covered range of a key contains [start, end]."""
+        covered = self.coverage(table, key)
+        if covered is None:
+            return False
+        covered_start, covered_end = covered
+        starts_inside = covered_start is None or (
+            start is not None and _as_naive_utc(start) >= covered_start
+        )
+        ends_inside = covered_end is None or (end is not None and _as_naive_utc(end) <= covered_end)
+        return starts_inside and ends_inside
+
+    def record_coverage(
+        self,
+        table: str,
+        key: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> None:
+        """Record that the snapshot holds every row of a key in [start, end].
+
+        A range overlapping the current coverage is merged into it; a
+        disjoint range replaces it (only one contiguous range is tracked).
+
+        Args:
+            table: Mirrored table name.
+            key: Series key.
+            start: Inclusive start of the backfilled range (None: all history).
+            end: Inclusive end of the backfilled range (None: open-ended, for
+                ranges no newer row can land in).
+
+        Raises:
+            SnapshotStoreError: If the coverage file cannot be written.
+        """
+        new_start = _as_naive_utc(start) if start is not None else None
+        new_end = _as_naive_utc(end) if end is not None else None
+        covered = self.coverage(table, key)
+        if covered is not None:
+            old_start, old_end = covered
+            overlaps = (new_end is None or old_start is None or old_start <= new_end) and (
+                old_end is None or new_start is None or new_start <= old_end
+            )
+            if overlaps:
+                new_start = (
+                    None if old_start is None or new_start is None else min(old_start, new_start)
+                )
+                new_end = None if old_end is None or new_end is None else max(old_end, new_end)
+
+        bounds = {
+            "start": new_start.isoformat() if new_start is not None else None,
+            "end": new_end.isoformat() if new_end is not None else None,
+        }
+        path = self._key_dir(table, key) / COVERAGE_FILE
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(bounds))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            raise SnapshotStoreError(f"Snapshot coverage write failed: {e}") from e
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"SnapshotStore(root={str(self.root)!r})"
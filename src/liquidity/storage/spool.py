@@ -0,0 +1,391 @@
+"""Durable write-ahead spool for batches QuestDB could not accept.
+
+When ILP ingestion fails, the collected batch is written to an append-only
+Arrow IPC segment instead of being dropped, and replayed in order once QuestDB
+is healthy again. Fetching and storage are decoupled, so a storage outage does
+not force collectors to refetch (and multiply upstream load).
+
+Segment layout: ``{root}/{sequence:012d}-{table}.arrow`` with the target table,
+timestamp column and ILP symbol columns stored in the Arrow schema metadata.
+The last sequence number is persisted in ``{root}/sequence``, so names are never
+reused once the spool drains. Segments that cannot be read, or that QuestDB
+keeps rejecting while healthy, are moved to ``{root}/quarantine/`` under a
+unique name so they never block the segments behind them.
+"""
+
+import json
+import logging
+import os
+import threading
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from liquidity.config import Settings, get_settings
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_SUFFIX = ".arrow"
+QUARANTINE_DIR = "quarantine"
+SEQUENCE_FILE = "sequence"
+
+# (table, df, timestamp_col, symbols) -> rows ingested
+IngestFn = Callable[[str, pd.DataFrame, str, list[str]], int]
+
+
+class SpoolError(Exception):
+    """Error writing or reading spool segments."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class SpoolSegment:
+    """A spooled batch awaiting replay."""
+
+    path: Path
+    table: str
+    timestamp_col: str
+    symbols: list[str]
+    df: pd.DataFrame
+
+
+class IngestSpool:
+    """Append-only, size-bounded spool of failed or deferred ingest batches.
+
+    Example:
+        spool = IngestSpool("data/spool")
+        spool.append("raw_data", df, "timestamp", ["series_id", "source", "unit"])
+
+        # Later, once QuestDB is healthy
+        spool.replay(storage_send_fn, storage_health_check)
+    """
+
+    def __init__(
+        self,
+        root: str | Path | None = None,
+        max_bytes: int | None = None,
+        settings: Settings | None = None,
+        max_attempts: int | None = None,
+    ) -> None:
+        """Initialize the spool.
+
+        Args:
+            root: Spool directory. Defaults to the spool_dir setting.
+            max_bytes: Disk budget. Oldest segments are dropped beyond it.
+                Defaults to the spool_max_bytes setting.
+            settings: Optional settings override.
+            max_attempts: Failed replays (while the target is healthy) after
+                which a segment is quarantined. Defaults to the
+                spool_max_attempts setting.
+        """
+        self._settings = settings or get_settings()
+        self.root = Path(root or self._settings.spool_dir)
+        self.max_bytes = max_bytes or self._settings.spool_max_bytes
+        self.max_attempts = max_attempts or self._settings.spool_max_attempts
+        self.dropped_segments = 0
+        self.quarantined_segments = 0
+        # Segment name -> replays rejected while the target was healthy
+        self._failures: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def quarantine_dir(self) -> Path:
+        """Directory holding segments taken out of the replay queue."""
+        return self.root / QUARANTINE_DIR
+
+    def segments(self) -> list[Path]:
+        """Return spooled segment paths in replay order."""
+        if not self.root.exists():
+            return []
+        return sorted(self.root.glob(f"*{SEGMENT_SUFFIX}"))
+
+    def has_pending(self) -> bool:
+        """Return True if any batch awaits replay."""
+        return bool(self.segments())
+
+    def size_bytes(self) -> int:
+        """Return total disk usage of spooled segments."""
+        return sum(path.stat().st_size for path in self.segments())
+
+    def _next_sequence(self) -> int:
+        """Reserve and persist the next segment sequence number.
+
+        The counter survives the spool draining and restarts; pending segments
+        are also taken into account in case the counter file was lost.
+        """
+        counter = self.root / SEQUENCE_FILE
+        try:
+            last = int(counter.read_text())
+        except (FileNotFoundError, ValueError):
+            last = -1
+        segments = self.segments()
+        if segments:
+            last = max(last, int(segments[-1].name.split("-", 1)[0]))
+        sequence = last + 1
+        tmp_path = counter.with_suffix(".tmp")
+        tmp_path.write_text(str(sequence))
+        os.replace(tmp_path, counter)
+        return sequence
+
+    def append(
+        self,
+        table: str,
+        df: pd.DataFrame,
+        timestamp_col: str,
+        symbols: list[str],
+    ) -> Path:
+        """Durably append a batch as a new segment.
+
+        The segment is written to a temporary file, fsynced and atomically
+        renamed, so a crash never leaves a partial segment behind.
+
+        Args:
+            table: Target QuestDB table.
+            df: Batch to spool.
+            timestamp_col: Designated timestamp column.
+            symbols: ILP symbol columns.
+
+        Returns:
+            Path of the new segment.
+
+        Raises:
+            SpoolError: If the segment cannot be written.
+        """
+        metadata = {
+            b"table": table.encode(),
+            b"timestamp_col": timestamp_col.encode(),
+            b"symbols": json.dumps(symbols).encode(),
+        }
+        try:
+            arrow_table = pa.Table.from_pandas(df, preserve_index=False)
+            arrow_table = arrow_table.replace_schema_metadata(
+                {**(arrow_table.schema.metadata or {}), **metadata}
+            )
+            with self._lock:
+                self.root.mkdir(parents=True, exist_ok=True)
+                path = self.root / f"{self._next_sequence():012d}-{table}{SEGMENT_SUFFIX}"
+                tmp_path = path.with_suffix(".tmp")
+                with open(tmp_path, "wb") as fh:
+                    with pa.ipc.new_file(fh, arrow_table.schema) as writer:
+                        writer.write_table(arrow_table)
+                    fh.flush()
+                    os.fsync(fh.fileno())
+                os.replace(tmp_path, path)
+                self._enforce_budget()
+        except (OSError, pa.ArrowException) as e:
+            logger.error("Failed to spool batch for %s: %s", table, e)
+            raise SpoolError(f"Spool append failed: {e}") from e
+
+        logger.warning("Spooled %d rows for '%s' to %s", len(df), table, path.name)
+        return path
+
+    def _enforce_budget(self) -> None:
+        """Drop the oldest segments while the spool exceeds its disk budget."""
+        segments = self.segments()
+        total = sum(path.stat().st_size for path in segments)
+        # Always keep the newest segment, even if it alone exceeds the budget
+        while total > self.max_bytes and len(segments) > 1:
+            oldest = segments.pop(0)
+            total -= oldest.stat().st_size
+            oldest.unlink()
+            self.dropped_segments += 1
+            logger.error(
+                "Spool over budget (%d bytes), dropped oldest segment %s",
+                self.max_bytes,
+                oldest.name,
+            )
+
+    @staticmethod
+    def read_segment(path: Path) -> SpoolSegment:
+        """Load a spooled segment.
+
+        Args:
+            path: Segment path.
+
+        Returns:
+            The decoded segment.
+
+        Raises:
+            SpoolError: If the segment is unreadable.
+        """
+        try:
+            with pa.memory_map(str(path), "r") as source:
+                arrow_table = pa.ipc.open_file(source).read_all()
+        except (OSError, pa.ArrowException) as e:
+            raise SpoolError(f"Corrupt spool segment {path.name}: {e}") from e
+
+        metadata = arrow_table.schema.metadata or {}
+        try:
+            return SpoolSegment(
+                path=path,
+                table=metadata[b"table"].decode(),
+                timestamp_col=metadata[b"timestamp_col"].decode(),
+                symbols=json.loads(metadata[b"symbols"]),
+                df=arrow_table.to_pandas(),
+            )
+        except (KeyError, ValueError, pa.ArrowException) as e:
+            raise SpoolError(f"Corrupt spool segment {path.name}: {e}") from e
+
+    def quarantined(self) -> list[Path]:
+        """Return quarantined segment paths."""
+        if not self.quarantine_dir.exists():
+            return []
+        return sorted(self.quarantine_dir.glob(f"*{SEGMENT_SUFFIX}"))
+
+    def _quarantine(self, path: Path, reason: str) -> Path:
+        """Move a segment out of the replay queue for manual inspection.
+
+        The quarantined copy gets a unique suffix, so it never overwrites a
+        segment quarantined earlier.
+        """
+        self.quarantine_dir.mkdir(parents=True, exist_ok=True)
+        target = self.quarantine_dir / f"{path.stem}-{uuid.uuid4().hex[:12]}{path.suffix}"
+        os.replace(path, target)
+        self._failures.pop(path.name, None)
+        self.quarantined_segments += 1
+        logger.error("Quarantined spool segment %s as %s: %s", path.name, target.name, reason)
+        return target
+
+    def replay(
+        self,
+        ingest_fn: IngestFn,
+        health_check: Callable[[], bool] | None = None,
+    ) -> int:
+        """Replay spooled segments in order.
+
+        Each segment is deleted only after ``ingest_fn`` succeeds, so a replay
+        interrupted by an outage resumes from the same segment. Unreadable
+        segments are quarantined and skipped. A segment that fails while
+        ``health_check`` reports the target healthy counts as rejected, and
+        is quarantined after ``max_attempts`` rejections; any other failure
+        pauses the replay.
+
+        Args:
+            ingest_fn: Function that writes a batch to QuestDB.
+            health_check: Returns True when the target accepts writes. Without
+                it every failure counts as a rejection.
+
+        Returns:
+            Number of rows replayed.
+
+        Raises:
+            SpoolError: If segments cannot be removed or quarantined.
+        """
+        replayed = 0
+        with self._lock:
+            try:
+                for path in self.segments():
+                    try:
+                        segment = self.read_segment(path)
+                    except SpoolError as e:
+                        self._quarantine(path, str(e))
+                        continue
+                    try:
+                        replayed += ingest_fn(
+                            segment.table,
+                            segment.df,
+                            segment.timestamp_col,
+                            segment.symbols,
+                        )
+                    except Exception as e:
+                        if health_check is not None and not health_check():
+                            logger.warning("Spool replay paused at %s: %s", path.name, e)
+                            break
+                        failures = self._failures.get(path.name, 0) + 1
+                        if failures < self.max_attempts:
+                            self._failures[path.name] = failures
+                            logger.warning(
+                                "Spool replay of %s rejected (%d/%d): %s",
+                                path.name,
+                                failures,
+                                self.max_attempts,
+                                e,
+                            )
+                            break
+                        self._quarantine(path, f"rejected {failures} times: {e}")
+                        continue
+                    self._failures.pop(path.name, None)
+                    path.unlink()
+            except OSError as e:
+                raise SpoolError(f"Spool replay failed: {e}") from e
+
+        if replayed:
+            logger.info("Replayed %d spooled rows", replayed)
+        return replayed
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"IngestSpool(root={str(self.root)!r}, max_bytes={self.max_bytes})"
+
+
+class SpoolReplayer:
+    """Background thread that drains the spool whenever QuestDB is healthy.
+
+    Example:
+        replayer = SpoolReplayer(storage.spool, storage.health_check, storage.replay_spool)
+        replayer.start()
+        ...
+        replayer.stop()
+    """
+
+    def __init__(
+        self,
+        spool: IngestSpool,
+        health_check: Callable[[], bool],
+        replay: Callable[[], int],
+        interval: float = 30.0,
+    ) -> None:
+        """Initialize the replayer.
+
+        Args:
+            spool: Spool to drain.
+            health_check: Returns True when QuestDB accepts writes.
+            replay: Replays the spool, returning rows written.
+            interval: Seconds between checks.
+        """
+        self.spool = spool
+        self._health_check = health_check
+        self._replay = replay
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self) -> int:
+        """Replay pending segments if QuestDB is healthy.
+
+        Returns:
+            Number of rows replayed.
+        """
+        if not self.spool.has_pending() or not self._health_check():
+            return 0
+        return self._replay()
+
+    def _run(self) -> None:
+        """Thread loop."""
+        while not self._stop.wait(self.interval):
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Spool replay iteration failed")
+
+    def start(self) -> None:
+        """Start the background replay thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="questdb-spool-replayer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Stop the background replay thread."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,100 @@
+"""Parameterised SQL for hot query shapes.
+
+Values are always bound, never interpolated; only identifiers are formatted
+into the text, and only after validation against the known schemas. Each
+shape therefore has one stable statement text per table, which lets the
+server reuse its parsed plan:
+- asyncpg prepares statements server-side and caches them per pooled
+  connection (``statement_cache_size``)
+- psycopg2 binds client-side, but the constant text still hits QuestDB's
+  compiled-query cache
+
+Hot shapes:
+- latest: newest row of one series
+- range: rows of a set of series within optional time bounds
+- freshness: newest timestamp of every series in a table
+"""
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Literal
+
+import pandas as pd
+
+from liquidity.storage.schemas import TABLE_KEYS
+
+# "pyformat" -> %s (psycopg2), "numeric" -> $1, $2 (asyncpg), "qmark" -> ? (DuckDB)
+ParamStyle = Literal["pyformat", "numeric", "qmark"]
+
+
+def _placeholders(style: ParamStyle, count: int) -> list[str]:
+    """Return ``count`` placeholders in the given style."""
+    if style == "numeric":
+        return [f"${i + 1}" for i in range(count)]
+    if style == "qmark":
+        return ["?"] * count
+    return ["%s"] * count
+
+
+def bind_timestamp(value: datetime | pd.Timestamp) -> datetime:
+    """Return a timestamp as a naive UTC datetime for binding.
+
+    Drivers send timezone-aware values as ``timestamptz``, which QuestDB does
+    not compare against its (UTC) ``timestamp`` columns.
+    """
+    ts = pd.Timestamp(value)
+    if ts.tzinfo is not None:
+        ts = ts.tz_convert("UTC").tz_localize(None)
+    result: datetime = ts.to_pydatetime()
+    return result
+
+
+def key_column(table: str) -> str:
+    """Return the series key column of a known table.
+
+    Raises:
+        ValueError: If the table is not a known schema (identifier whitelist).
+    """
+    try:
+        return TABLE_KEYS[table]
+    except KeyError as e:
+        raise ValueError(f"Unknown table '{table}'") from e
+
+
+@lru_cache(maxsize=32)
+def latest_sql(table: str, style: ParamStyle = "pyformat") -> str:
+    """SQL for the newest row of one series (one parameter: the key)."""
+    key = key_column(table)
+    (param,) = _placeholders(style, 1)
+    return f"SELECT * FROM {table} WHERE {key} = {param} ORDER BY timestamp DESC LIMIT 1"
+
+
+@lru_cache(maxsize=128)
+def range_sql(
+    table: str,
+    n_keys: int,
+    has_start: bool,
+    has_end: bool,
+    style: ParamStyle = "pyformat",
+) -> str:
+    """SQL for rows of ``n_keys`` series within optional time bounds.
+
+    Parameters are the keys, then start and end when present.
+    """
+    key = key_column(table)
+    params = _placeholders(style, n_keys + has_start + has_end)
+    conditions = [f"{key} IN ({', '.join(params[:n_keys])})"]
+    position = n_keys
+    if has_start:
+        conditions.append(f"timestamp >= {params[position]}")
+        position += 1
+    if has_end:
+        conditions.append(f"timestamp <= {params[position]}")
+    return f"SELECT * FROM {table} WHERE {' AND '.join(conditions)}"
+
+
+@lru_cache(maxsize=32)
+def freshness_sql(table: str) -> str:
+    """SQL for the newest timestamp of every series in a table (no parameters)."""
+    key = key_column(table)
+    return f"SELECT {key}, max(timestamp) AS timestamp FROM {table}"
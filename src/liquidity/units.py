@@ -0,0 +1,190 @@
+"""Central registry of measurement units.
+
+Every ``unit`` symbol written by a collector is registered here with its base
+dimension and its scale relative to that dimension's base unit:
+- currency amounts: dimension is the currency, base unit is millions
+  (``billions_usd`` is USD x 1000, ``100_millions_jpy`` is JPY x 100)
+- rates: dimension "percent" (``bps`` is percent x 0.01)
+- FX quotes: dimension "<quote>/<base>" with scale 1
+- plain levels: dimension "index"
+
+Conversions between units of the same dimension are a single factor.
+``convert_frame`` converts a whole long-format frame at once by mapping the
+(categorical) unit column to a float factor array, so calculations need no
+per-row Python and no hard-coded multipliers.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+class UnitError(ValueError):
+    """Unknown unit or conversion between incompatible dimensions."""
+
+    pass
+
+
+@dataclass(frozen=True)
+class Unit:
+    """A registered unit.
+
+    Attributes:
+        name: Unit symbol as stored in the ``unit`` column.
+        dimension: Base dimension (currency code, "percent", "index", FX pair).
+        scale: Multiplier converting a value to the dimension's base unit.
+    """
+
+    name: str
+    dimension: str
+    scale: float = 1.0
+
+
+UNITS: dict[str, Unit] = {
+    unit.name: unit
+    for unit in (
+        # Currency amounts (base: millions of the currency)
+        Unit("millions_usd", "USD"),
+        Unit("billions_usd", "USD", 1_000.0),
+        Unit("trillions_usd", "USD", 1_000_000.0),
+        Unit("millions_eur", "EUR"),
+        Unit("100_millions_jpy", "JPY", 100.0),
+        Unit("millions_gbp", "GBP"),
+        Unit("millions_chf", "CHF"),
+        Unit("millions_cad", "CAD"),
+        Unit("hundreds_millions_cny", "CNY", 100.0),
+        # Rates and spreads (base: percent)
+        Unit("percent", "percent"),
+        Unit("bps", "percent", 0.01),
+        # FX quotes (quote currency per base currency)
+        Unit("usd_per_eur", "USD/EUR"),
+        Unit("jpy_per_usd", "JPY/USD"),
+        Unit("usd_per_gbp", "USD/GBP"),
+        Unit("chf_per_usd", "CHF/USD"),
+        Unit("cad_per_usd", "CAD/USD"),
+        Unit("cny_per_usd", "CNY/USD"),
+        # Levels without a unit of account
+        Unit("index", "index"),
+    )
+}
+
+
+def get_unit(name: str) -> Unit:
+    """Look up a registered unit.
+
+    Raises:
+        UnitError: If the unit is not registered.
+    """
+    try:
+        return UNITS[name]
+    except KeyError as e:
+        raise UnitError(f"Unknown unit '{name}'") from e
+
+
+def factor(source: str, target: str) -> float:
+    """Return the multiplier converting values in ``source`` to ``target``.
+
+    Raises:
+        UnitError: If either unit is unknown or their dimensions differ.
+    """
+    src, dst = get_unit(source), get_unit(target)
+    if src.dimension != dst.dimension:
+        raise UnitError(
+            f"Cannot convert '{source}' ({src.dimension}) to '{target}' ({dst.dimension})"
+        )
+    return src.scale / dst.scale
+
+
+def scales_to(target: str) -> dict[str, float]:
+    """Return the factors to ``target`` of every unit sharing its dimension."""
+    dimension = get_unit(target).dimension
+    return {
+        name: factor(name, target) for name, unit in UNITS.items() if unit.dimension == dimension
+    }
+
+
+def conversion_factors(units: pd.Series, target: str) -> np.ndarray:
+    """Map a unit column to conversion factors towards ``target``.
+
+    The factor is resolved once per distinct unit (category), then broadcast
+    through the category codes.
+
+    Args:
+        units: Unit symbols, one per row (categorical or string).
+        target: Target unit.
+
+    Returns:
+        float64 array of factors aligned to ``units``.
+
+    Raises:
+        UnitError: If a unit is unknown or of another dimension.
+    """
+    return _per_unit(units, lambda name: factor(name, target))
+
+
+def base_scales(units: pd.Series) -> np.ndarray:
+    """Map a unit column to the scale towards each unit's own base unit.
+
+    Unlike ``conversion_factors`` the units may span several dimensions: a
+    billions-USD row gets 1000 (to millions USD), a bps row 0.01 (to percent).
+
+    Args:
+        units: Unit symbols, one per row (categorical or string).
+
+    Returns:
+        float64 array of scales aligned to ``units``.
+
+    Raises:
+        UnitError: If a unit is unknown or missing.
+    """
+    return _per_unit(units, lambda name: get_unit(name).scale)
+
+
+def _per_unit(units: pd.Series, resolve: Callable[[str], float]) -> np.ndarray:
+    """Resolve a float once per distinct unit and broadcast it to every row.
+
+    Only units that rows actually use are resolved: a filtered slice of a
+    categorical frame keeps every category of its parent, including units of
+    other dimensions.
+    """
+    categorical = units.astype("category")
+    categories = categorical.cat.categories
+    codes = categorical.cat.codes.to_numpy()
+    if (codes < 0).any():
+        raise UnitError("Missing unit")
+    used = np.unique(codes)
+    table = np.full(len(categories), np.nan)
+    table[used] = [resolve(str(categories[code])) for code in used]
+    result: np.ndarray = table[codes]
+    return result
+
+
+def convert_frame(
+    df: pd.DataFrame,
+    target: str,
+    value_col: str = "value",
+    unit_col: str = "unit",
+) -> pd.DataFrame:
+    """Convert a long-format frame to one unit.
+
+    Args:
+        df: Frame with value and unit columns.
+        target: Target unit.
+        value_col: Value column.
+        unit_col: Unit column.
+
+    Returns:
+        Copy of ``df`` with values converted and the unit set to ``target``.
+
+    Raises:
+        UnitError: If a unit is unknown or of another dimension.
+    """
+    factors = conversion_factors(df[unit_col], target)
+    return df.assign(
+        **{
+            value_col: df[value_col].to_numpy(dtype="float64") * factors,
+            unit_col: target,
+        }
+    )
@@ -0,0 +1,45 @@
+"""Shared pytest fixtures for the engine tests."""
+
+import pandas as pd
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run wall-clock benchmark tests (timings depend on the machine)",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    if config.getoption("--run-benchmarks"):
+        return
+    skip = pytest.mark.skip(reason="benchmark; run with --run-benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+class FakeStorage:
+    """Records ingested frames."""
+
+    def __init__(self) -> None:
+        self.ingested: list[tuple[str, pd.DataFrame]] = []
+
+    def ingest_dataframe(
+        self,
+        table: str,
+        df: pd.DataFrame,
+        _timestamp_col: str = "timestamp",
+        _symbols: list[str] | None = None,
+    ) -> int:
+        self.ingested.append((table, df))
+        return len(df)
+
+
+@pytest.fixture
+def fake_storage() -> FakeStorage:
+    """Storage stand-in that records ingested frames instead of writing them."""
+    return FakeStorage()
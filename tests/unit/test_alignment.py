@@ -0,0 +1,156 @@
+"""Unit tests for vectorized as-of alignment.
+
+Run with: uv run pytest tests/unit/test_alignment.py -v
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.calculations import align_asof, anchor_grid, asof_lookup, calendar_grid
+
+
+def _raw_frame(series_id: str, dates: list[str], values: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(dates),
+            "series_id": series_id,
+            "source": "fred",
+            "value": values,
+            "unit": "millions_usd",
+        }
+    )
+
+
+class TestAsofLookup:
+    """Unit tests for single-series as-of sampling."""
+
+    def test_latest_at_or_before(self) -> None:
+        """Grid points take the latest observation at or before them."""
+        grid = pd.DatetimeIndex(["2024-01-01", "2024-01-03", "2024-01-09", "2024-01-10"])
+
+        result = asof_lookup(
+            pd.to_datetime(["2024-01-03", "2024-01-10"]), [1.0, 2.0], grid
+        )
+
+        np.testing.assert_array_equal(result, [np.nan, 1.0, 1.0, 2.0])
+
+    def test_staleness_limit(self) -> None:
+        """Observations older than the limit are not carried forward."""
+        grid = pd.DatetimeIndex(["2024-01-05", "2024-01-20"])
+
+        result = asof_lookup(pd.to_datetime(["2024-01-03"]), [1.0], grid, "7D")
+
+        np.testing.assert_array_equal(result, [1.0, np.nan])
+
+    def test_empty_series(self) -> None:
+        """A series without observations is all NaN."""
+        result = asof_lookup([], [], calendar_grid("2024-01-01", "2024-01-05"))
+
+        assert np.isnan(result).all()
+
+
+class TestAlignAsof:
+    """Unit tests for aligning several long-format series."""
+
+    def test_mixed_frequencies(self) -> None:
+        """Weekly and monthly series align on a business-day grid without dropping rows."""
+        df = pd.concat(
+            [
+                _raw_frame("ECBASSETSW", ["2024-01-05", "2024-01-12"], [6.9, 6.8]),
+                _raw_frame("JPNASSETS", ["2024-01-01"], [7.5]),
+            ]
+        )
+        grid = calendar_grid("2024-01-08", "2024-01-12")
+
+        wide = align_asof(df, ["ECBASSETSW", "JPNASSETS"], grid=grid)
+
+        assert wide["ECBASSETSW"].tolist() == [6.9, 6.9, 6.9, 6.9, 6.8]
+        assert wide["JPNASSETS"].tolist() == [7.5] * 5
+        assert wide.index.name == "timestamp"
+
+    def test_per_series_staleness(self) -> None:
+        """Limits apply per series; unlisted series are unlimited."""
+        df = pd.concat(
+            [
+                _raw_frame("SOFR", ["2024-01-02"], [5.3]),
+                _raw_frame("WALCL", ["2024-01-03"], [7.0e6]),
+            ]
+        )
+        grid = pd.DatetimeIndex(["2024-01-31"])
+
+        wide = align_asof(df, ["SOFR", "WALCL"], grid=grid, max_staleness={"SOFR": "4D"})
+
+        assert np.isnan(wide.loc["2024-01-31", "SOFR"])
+        assert wide.loc["2024-01-31", "WALCL"] == 7.0e6
+
+    def test_default_grid_is_union(self) -> None:
+        """Without a grid, every observation timestamp becomes a row."""
+        df = pd.concat(
+            [
+                _raw_frame("DGS10", ["2024-01-02", "2024-01-03"], [4.0, 4.1]),
+                _raw_frame("DGS2", ["2024-01-04"], [4.3]),
+            ]
+        )
+
+        wide = align_asof(df, ["DGS10", "DGS2"])
+
+        assert len(wide) == 3
+        assert wide["DGS10"].tolist() == [4.0, 4.1, 4.1]
+
+    def test_unsorted_input_and_duplicates(self) -> None:
+        """Rows may arrive in any order; the last row of a duplicate timestamp wins."""
+        df = _raw_frame("WALCL", ["2024-01-10", "2024-01-03", "2024-01-10"], [2.0, 1.0, 3.0])
+
+        wide = align_asof(df, ["WALCL"], grid=pd.DatetimeIndex(["2024-01-05", "2024-01-11"]))
+
+        assert wide["WALCL"].tolist() == [1.0, 3.0]
+
+    def test_timezone_aware_timestamps(self) -> None:
+        """Aware timestamps are compared in UTC."""
+        df = _raw_frame("WALCL", ["2024-01-03"], [1.0])
+        df["timestamp"] = df["timestamp"].dt.tz_localize("UTC")
+
+        wide = align_asof(df, ["WALCL"], grid=pd.DatetimeIndex(["2024-01-03"]))
+
+        assert wide["WALCL"].tolist() == [1.0]
+
+    def test_anchor_grid(self) -> None:
+        """The anchor grid is the sorted unique timestamps of one series."""
+        df = pd.concat(
+            [
+                _raw_frame("WALCL", ["2024-01-10", "2024-01-03"], [2.0, 1.0]),
+                _raw_frame("WDTGAL", ["2024-01-04"], [0.7]),
+            ]
+        )
+
+        grid = anchor_grid(df, "WALCL")
+
+        assert grid.tolist() == [pd.Timestamp("2024-01-03"), pd.Timestamp("2024-01-10")]
+
+    @pytest.mark.benchmark
+    def test_many_series_over_decades(self) -> None:
+        """Dozens of daily series over 30 years align in well under a second."""
+        dates = pd.bdate_range("1994-01-01", "2024-01-01")
+        rng = np.random.default_rng(0)
+        series_ids = [f"S{i}" for i in range(40)]
+        df = pd.DataFrame(
+            {
+                "timestamp": np.tile(dates.values, len(series_ids)),
+                "series_id": np.repeat(series_ids, len(dates)),
+                "value": rng.normal(size=len(dates) * len(series_ids)),
+            }
+        )
+
+        started = time.perf_counter()
+        wide = align_asof(df, series_ids, grid=calendar_grid(dates[0], dates[-1]))
+        elapsed = time.perf_counter() - started
+
+        assert wide.shape == (len(dates), len(series_ids))
+        assert elapsed < 1.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,126 @@
+"""Unit tests for the async QuestDB storage facade.
+
+ILP writes are redirected to a slow recording function; no QuestDB server
+is contacted.
+
+Run with: uv run pytest tests/unit/test_async_storage.py -v
+"""
+
+import asyncio
+import socket
+import threading
+import time
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from liquidity.storage import (
+    AsyncQuestDBStorage,
+    QuestDBConnectionError,
+    QuestDBStorage,
+    SnapshotStore,
+)
+
+
+def _raw_frame(series_id: str, dates: list[str], values: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(dates),
+            "series_id": series_id,
+            "source": "fred",
+            "value": values,
+            "unit": "millions_usd",
+        }
+    )
+
+
+def _unused_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+    return port
+
+
+@pytest.fixture
+def sync_storage(tmp_path: Path) -> QuestDBStorage:
+    """Synchronous storage pointed at a closed local port."""
+    storage = QuestDBStorage(
+        host="127.0.0.1", pg_port=_unused_port(), snapshot=SnapshotStore(tmp_path)
+    )
+    storage.spool = None
+    return storage
+
+
+class TestAsyncQuestDBStorage:
+    """Unit tests for AsyncQuestDBStorage."""
+
+    async def test_ingest_does_not_block_loop(
+        self, sync_storage: QuestDBStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The ILP flush runs on the dedicated thread while the loop keeps running."""
+        threads: list[str] = []
+
+        def slow_send(_table: str, df: pd.DataFrame, _ts: str, _symbols: list[str]) -> int:
+            threads.append(threading.current_thread().name)
+            time.sleep(0.2)
+            return len(df)
+
+        monkeypatch.setattr(sync_storage, "_send", slow_send)
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        async with AsyncQuestDBStorage(sync_storage) as storage:
+            task = asyncio.create_task(ticker())
+            rows = await storage.ingest_dataframe(
+                "raw_data", _raw_frame("WALCL", ["2024-01-03"], [7.0e6])
+            )
+            task.cancel()
+
+        assert rows == 1
+        assert threads[0].startswith("questdb-ilp")
+        assert ticks >= 5
+
+    async def test_batches_flushed_in_order(
+        self, sync_storage: QuestDBStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Concurrent ingests reach ILP in submission order."""
+        sent: list[float] = []
+
+        def record(_table: str, df: pd.DataFrame, _ts: str, _symbols: list[str]) -> int:
+            sent.append(float(df["value"].iloc[0]))
+            return len(df)
+
+        monkeypatch.setattr(sync_storage, "_send", record)
+
+        async with AsyncQuestDBStorage(sync_storage) as storage:
+            await asyncio.gather(
+                *(
+                    storage.ingest_dataframe(
+                        "raw_data", _raw_frame("WALCL", ["2024-01-03"], [float(i)])
+                    )
+                    for i in range(5)
+                )
+            )
+
+        assert sent == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    async def test_query_connection_error(self, sync_storage: QuestDBStorage) -> None:
+        """An unreachable server raises QuestDBConnectionError."""
+        async with AsyncQuestDBStorage(sync_storage) as storage:
+            with pytest.raises(QuestDBConnectionError):
+                await storage.query("SELECT 1")
+
+    async def test_health_check_false_when_down(self, sync_storage: QuestDBStorage) -> None:
+        """health_check never raises."""
+        async with AsyncQuestDBStorage(sync_storage) as storage:
+            assert await storage.health_check() is False
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,125 @@
+"""Unit tests for Bank of Canada Valet parsing.
+
+Run with: uv run pytest tests/unit/test_boc.py -v
+"""
+
+import json
+import time
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.collectors.boc import BOCCollector, _series_ids, decode_valet
+
+SERIES = ["V36610", "V36624"]
+
+
+def _valet_body(dates: list[str], series: dict[str, list[str | None]]) -> bytes:
+    """Response body in the Valet observations format (values as strings)."""
+    observations: list[dict[str, Any]] = []
+    for i, date in enumerate(dates):
+        observation: dict[str, Any] = {"d": date}
+        for series_id, values in series.items():
+            if values[i] is not None:
+                observation[series_id] = {"v": values[i]}
+        observations.append(observation)
+    payload = {
+        "terms": {"url": "https://www.bankofcanada.ca/terms/"},
+        "seriesDetail": {
+            series_id: {"label": series_id, "description": "Bank of Canada balance sheet"}
+            for series_id in series
+        },
+        "observations": observations,
+    }
+    return json.dumps(payload).encode()
+
+
+@pytest.fixture
+def full_history_body() -> bytes:
+    """Full-history two-series Valet response (daily, 1990 onwards)."""
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range("1990-01-01", "2024-12-31").strftime("%Y-%m-%d").tolist()
+    levels = 100_000 + np.cumsum(rng.normal(0, 500, len(dates)))
+    return _valet_body(
+        dates,
+        {
+            "V36610": [f"{level:.1f}" for level in levels],
+            "V36624": [f"{level * 1.01:.1f}" for level in levels],
+        },
+    )
+
+
+class TestValetParsing:
+    """Unit tests for column-wise Valet parsing."""
+
+    def test_single_series(self) -> None:
+        """Dates and nested string values become a canonical frame."""
+        body = _valet_body(["2024-01-03", "2024-01-10"], {"V36610": ["250000.5", "249000"]})
+
+        df = BOCCollector()._parse_response(decode_valet(body), "V36610")
+
+        assert df["timestamp"].tolist() == [
+            pd.Timestamp("2024-01-03", tz="UTC"),
+            pd.Timestamp("2024-01-10", tz="UTC"),
+        ]
+        assert df["value"].tolist() == [250000.5, 249000.0]
+        assert set(df["series_id"]) == {"V36610"}
+        assert set(df["source"]) == {"boc"}
+        assert set(df["unit"]) == {"millions_cad"}
+
+    def test_multiple_series(self) -> None:
+        """One response carries several series, sorted by timestamp."""
+        body = _valet_body(
+            ["2024-01-03", "2024-01-10"],
+            {"V36610": ["1", "2"], "V36624": ["3", "4"]},
+        )
+
+        df = BOCCollector()._parse_response(decode_valet(body), SERIES)
+
+        assert df["series_id"].tolist() == ["V36610", "V36624", "V36610", "V36624"]
+        assert df["value"].tolist() == [1.0, 3.0, 2.0, 4.0]
+        assert df["timestamp"].is_monotonic_increasing
+
+    def test_missing_and_invalid_values_dropped(self) -> None:
+        """Absent series keys and non-numeric values are skipped."""
+        body = _valet_body(
+            ["2024-01-03", "2024-01-10", "2024-01-17"],
+            {"V36610": ["1", None, ""], "V36624": [None, "2", "3"]},
+        )
+
+        df = BOCCollector()._parse_response(decode_valet(body), SERIES)
+
+        assert list(zip(df["series_id"], df["value"], strict=True)) == [
+            ("V36610", 1.0),
+            ("V36624", 2.0),
+            ("V36624", 3.0),
+        ]
+
+    def test_no_observations(self) -> None:
+        """An empty response gives an empty frame."""
+        df = BOCCollector()._parse_response({"observations": []}, "V36610")
+
+        assert df.empty
+        assert list(df.columns) == ["timestamp", "series_id", "source", "value", "unit"]
+
+    def test_series_ids(self) -> None:
+        """Series may be given as one ID, comma-separated or as a sequence."""
+        assert _series_ids("V36610") == ["V36610"]
+        assert _series_ids("V36610, V36624") == SERIES
+        assert _series_ids(SERIES) == SERIES
+
+    @pytest.mark.benchmark
+    def test_full_history_benchmark(self, full_history_body: bytes) -> None:
+        """Thirty-five years of two daily series decode and parse in well under a second."""
+        started = time.perf_counter()
+        df = BOCCollector()._parse_response(decode_valet(full_history_body), SERIES)
+        elapsed = time.perf_counter() - started
+
+        assert len(df) == 2 * len(pd.bdate_range("1990-01-01", "2024-12-31"))
+        assert elapsed < 0.5
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -103,6 +103,23 @@ class TestNetLiquidityCalculation:
         # Second: 7,050,000 - 480,000 - 720,000 = 5,850,000
         assert result["net_liquidity"].iloc[1] == 5_850_000
 
+    def test_net_liquidity_different_release_days(self) -> None:
+        """Test RRP/TGA printed on other days are matched as-of, not dropped."""
+        data = {
+            "timestamp": ["2024-01-03", "2024-01-02", "2024-01-01", "2024-01-10"],
+            "series_id": ["WALCL", "WLRRAL", "WDTGAL", "WALCL"],
+            "value": [7_000_000, 500, 750, 7_050_000],
+            "unit": ["millions_usd", "billions_usd", "billions_usd", "millions_usd"],
+        }
+        df = pd.DataFrame(data)
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+
+        result = FredCollector.calculate_net_liquidity(df)
+
+        # 2024-01-10 is more than a week after the last RRP/TGA prints
+        assert result["timestamp"].tolist() == [pd.Timestamp("2024-01-03")]
+        assert result["net_liquidity"].iloc[0] == 5_750_000
+
     def test_net_liquidity_missing_series(self) -> None:
         """Test Net Liquidity raises error when series are missing."""
         data = {
@@ -0,0 +1,186 @@
+"""Unit tests for the online rolling correlation engine.
+
+Run with: uv run pytest tests/unit/test_correlation.py -v
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.analysis import CorrelationShift, RollingCorrelation
+
+
+def _wide(n: int = 200, seed: int = 0) -> pd.DataFrame:
+    """Three correlated random walks at liquidity-like magnitudes."""
+    rng = np.random.default_rng(seed)
+    common = rng.normal(size=n).cumsum()
+    return pd.DataFrame(
+        {
+            "BTC": 50_000 + 1_000 * (common + rng.normal(size=n).cumsum()),
+            "SPX": 5_000 + 50 * (common + 0.5 * rng.normal(size=n)),
+            "net_liquidity": 6_000_000 + 10_000 * rng.normal(size=n).cumsum(),
+        },
+        index=pd.bdate_range("2024-01-01", periods=n, name="timestamp"),
+    )
+
+
+def _pandas_corr(wide: pd.DataFrame, left: str, right: str, window: int) -> np.ndarray:
+    return wide[left].rolling(window).corr(wide[right]).to_numpy()
+
+
+class TestBatch:
+    """Unit tests for the vectorized history mode."""
+
+    def test_matches_pandas_rolling(self) -> None:
+        """Every pair and window agrees with pandas rolling().corr()."""
+        wide = _wide()
+        engine = RollingCorrelation(wide.columns, windows=(30, 90))
+
+        result = engine.batch(wide)
+
+        for (window, left, right), group in result.groupby(["window", "left", "right"]):
+            np.testing.assert_allclose(
+                group["correlation"].to_numpy(),
+                _pandas_corr(wide, str(left), str(right), int(window)),
+                atol=1e-9,
+            )
+        assert len(result) == len(wide) * 3 * 2
+
+    def test_missing_values_pairwise(self) -> None:
+        """A gap in one asset only drops that asset's pairs."""
+        wide = _wide()
+        wide.iloc[50:55, 0] = np.nan
+        engine = RollingCorrelation(wide.columns, windows=(30,), min_periods=20)
+
+        result = engine.batch(wide).set_index(["timestamp", "left", "right"])["correlation"]
+
+        at = wide.index[60]
+        assert not np.isnan(result[(at, "SPX", "net_liquidity")])
+        expected = wide["BTC"].rolling(30, min_periods=20).corr(wide["SPX"])[at]
+        assert result[(at, "BTC", "SPX")] == pytest.approx(expected)
+
+    def test_constant_series_is_nan(self) -> None:
+        """Zero variance gives NaN, not a spurious value."""
+        wide = _wide(60)
+        wide["SPX"] = 5_000.0
+        engine = RollingCorrelation(wide.columns, windows=(30,))
+
+        result = engine.batch(wide)
+
+        spx = result[(result["left"] == "BTC") & (result["right"] == "SPX")]
+        assert spx["correlation"].isna().all()
+
+
+class TestStreaming:
+    """Unit tests for per-bar updates."""
+
+    def test_streaming_matches_batch(self) -> None:
+        """Bar-by-bar updates end at the batch values, including after rebuilds."""
+        wide = _wide(250)
+        engine = RollingCorrelation(wide.columns, windows=(30, 90), threshold=2.0)
+
+        for ts, row in zip(wide.index, wide.to_numpy(), strict=True):
+            engine.update(ts, row)
+
+        batch = engine.batch(wide)
+        last = batch[batch["timestamp"] == wide.index[-1]]
+        for _, row in last.iterrows():
+            assert engine.pair(row["left"], row["right"], row["window"]) == pytest.approx(
+                row["correlation"], abs=1e-9
+            )
+
+    def test_prime_then_update(self) -> None:
+        """Priming from history continues exactly like streaming from the start."""
+        wide = _wide(150)
+        streamed = RollingCorrelation(wide.columns, threshold=2.0)
+        for ts, row in zip(wide.index, wide.to_numpy(), strict=True):
+            streamed.update(ts, row)
+
+        primed = RollingCorrelation(wide.columns, threshold=2.0)
+        primed.prime(wide.iloc[:-1])
+        primed.update(wide.index[-1], wide.iloc[-1].to_dict())
+
+        np.testing.assert_allclose(primed.matrix(90), streamed.matrix(90), atol=1e-9)
+
+    def test_matrix_is_symmetric(self) -> None:
+        """The matrix is symmetric with a unit diagonal."""
+        wide = _wide(40)
+        engine = RollingCorrelation(wide.columns, windows=(30,))
+        engine.prime(wide)
+
+        matrix = engine.matrix(30).to_numpy()
+
+        np.testing.assert_allclose(matrix, matrix.T)
+        np.testing.assert_allclose(np.diag(matrix), 1.0)
+
+    def test_shift_event(self) -> None:
+        """A correlation regime change raises one event and moves the reference."""
+        n = 60
+        x = np.sin(np.arange(n) / 3.0)
+        wide = pd.DataFrame(
+            {"BTC": x, "net_liquidity": np.where(np.arange(n) < 30, x, -x)},
+            index=pd.bdate_range("2024-01-01", periods=n),
+        )
+        engine = RollingCorrelation(wide.columns, windows=(10,), threshold=0.3)
+        received: list[list[CorrelationShift]] = []
+        engine.subscribe(received.append)
+
+        events = [
+            shift
+            for ts, row in zip(wide.index, wide.to_numpy(), strict=True)
+            for shift in engine.update(ts, row)
+        ]
+
+        assert events
+        first = events[0]
+        assert (first.left, first.right, first.window) == ("BTC", "net_liquidity", 10)
+        assert first.previous == pytest.approx(1.0)
+        assert first.change < -0.3
+        assert engine.pair("BTC", "net_liquidity", 10) == pytest.approx(-1.0)
+        assert sum(len(batch) for batch in received) == len(events)
+
+    def test_needs_two_columns(self) -> None:
+        """A single column has no pairs."""
+        with pytest.raises(ValueError, match="two columns"):
+            RollingCorrelation(["BTC"])
+
+    @pytest.mark.benchmark
+    def test_update_cost_independent_of_window(self) -> None:
+        """Twenty assets update per bar in O(N^2) regardless of window length."""
+        rng = np.random.default_rng(0)
+        columns = [f"A{i}" for i in range(20)]
+        engine = RollingCorrelation(columns, windows=(30, 90, 250))
+        bars = rng.normal(size=(500, len(columns)))
+        timestamps = pd.bdate_range("2020-01-01", periods=len(bars))
+
+        started = time.perf_counter()
+        for ts, row in zip(timestamps, bars, strict=True):
+            engine.update(ts, row)
+        elapsed = time.perf_counter() - started
+
+        assert elapsed < 2.0
+
+    @pytest.mark.benchmark
+    def test_batch_decades_is_fast(self) -> None:
+        """Ten assets over 30 years of daily bars in two windows in under a second."""
+        rng = np.random.default_rng(0)
+        dates = pd.bdate_range("1994-01-01", "2024-01-01")
+        wide = pd.DataFrame(
+            rng.normal(size=(len(dates), 10)).cumsum(axis=0),
+            index=dates,
+            columns=[f"A{i}" for i in range(10)],
+        )
+        engine = RollingCorrelation(wide.columns)
+
+        started = time.perf_counter()
+        result = engine.batch(wide)
+        elapsed = time.perf_counter() - started
+
+        assert len(result) == len(dates) * 45 * 2
+        assert elapsed < 1.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,260 @@
+"""Unit tests for the daily TGA (Treasury) and RRP (NY Fed) collectors.
+
+Each test serves canned API responses from a local stand-in HTTP server.
+
+Run with: uv run pytest tests/unit/test_daily_collectors.py -v
+"""
+
+import json
+import threading
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+import pandas as pd
+import pytest
+
+from liquidity.calculations import NetLiquidityNowcast
+from liquidity.collectors import NYFedCollector, TreasuryCollector
+from liquidity.collectors.nyfed import RRP_LATEST_PATH, RRP_SEARCH_PATH
+from liquidity.collectors.treasury import DTS_CASH_BALANCE_PATH, TGA_CLOSING_ACCOUNT
+
+Route = Callable[[dict[str, list[str]]], Any]
+
+
+class StandInServer(ThreadingHTTPServer):
+    """Local HTTP server answering GETs from per-path handlers."""
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.routes: dict[str, Route] = {}
+        self.requests: list[tuple[str, dict[str, list[str]]]] = []
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: StandInServer
+
+    def do_GET(self) -> None:  # noqa: N802
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        self.server.requests.append((url.path, query))
+        route = self.server.routes.get(url.path)
+        status, payload = (404, {"error": "not found"}) if route is None else (200, route(query))
+        if isinstance(payload, int):
+            status, payload = payload, {"error": "stand-in failure"}
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def stand_in() -> Iterator[StandInServer]:
+    """Run a stand-in server on a free local port."""
+    server = StandInServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _dts_row(record_date: str, balance: str, account: str = TGA_CLOSING_ACCOUNT) -> dict[str, str]:
+    """Operating cash balance row as the Fiscal Data API returns it (all strings)."""
+    return {"record_date": record_date, "account_type": account, "open_today_bal": balance}
+
+
+def _rrp_operation(date: str, accepted: int, operation: str = "Reverse Repo") -> dict[str, Any]:
+    return {
+        "operationId": f"RP {date}",
+        "operationDate": date,
+        "operationType": operation,
+        "totalAmtAccepted": accepted,
+    }
+
+
+class TestTreasuryCollector:
+    """Unit tests for the Daily Treasury Statement TGA collector."""
+
+    async def test_collect_tga(self, stand_in: StandInServer) -> None:
+        """Closing balances are parsed from string fields; nulls are dropped."""
+        stand_in.routes[DTS_CASH_BALANCE_PATH] = lambda _query: {
+            "data": [
+                _dts_row("2024-06-04", "745123"),
+                _dts_row("2024-06-03", "752000"),
+                _dts_row("2024-06-05", "null"),
+            ],
+            "meta": {"total-pages": 1},
+        }
+        collector = TreasuryCollector(base_url=stand_in.url)
+
+        df = await collector.collect(start_date=datetime(2024, 6, 1))
+
+        assert list(df.columns) == ["timestamp", "series_id", "source", "value", "unit"]
+        assert df["timestamp"].tolist() == [
+            pd.Timestamp("2024-06-03", tz="UTC"),
+            pd.Timestamp("2024-06-04", tz="UTC"),
+        ]
+        assert df["value"].tolist() == [752_000.0, 745_123.0]
+        assert set(df["series_id"]) == {"TGA_DAILY"}
+        assert set(df["unit"]) == {"millions_usd"}
+        _, query = stand_in.requests[0]
+        assert query["filter"] == [
+            f"account_type:eq:{TGA_CLOSING_ACCOUNT},record_date:gte:2024-06-01"
+        ]
+
+    async def test_pages_followed(self, stand_in: StandInServer) -> None:
+        """Every page of a long history is fetched."""
+        pages = {
+            "1": [_dts_row("2024-06-03", "752000")],
+            "2": [_dts_row("2024-06-04", "745123")],
+        }
+        stand_in.routes[DTS_CASH_BALANCE_PATH] = lambda query: {
+            "data": pages[query["page[number]"][0]],
+            "meta": {"total-pages": 2},
+        }
+
+        df = await TreasuryCollector(base_url=stand_in.url).collect()
+
+        assert len(stand_in.requests) == 2
+        assert df["value"].tolist() == [752_000.0, 745_123.0]
+
+    async def test_other_accounts_ignored(self, stand_in: StandInServer) -> None:
+        """Only the TGA closing balance row is kept."""
+        stand_in.routes[DTS_CASH_BALANCE_PATH] = lambda _query: {
+            "data": [
+                _dts_row("2024-06-03", "752000"),
+                _dts_row("2024-06-03", "760000", "Treasury General Account (TGA) Opening Balance"),
+            ],
+            "meta": {"total-pages": 1},
+        }
+
+        df = await TreasuryCollector(base_url=stand_in.url).collect()
+
+        assert df["value"].tolist() == [752_000.0]
+
+    async def test_empty_response(self, stand_in: StandInServer) -> None:
+        """No rows gives an empty frame with the standard columns."""
+        stand_in.routes[DTS_CASH_BALANCE_PATH] = lambda _query: {
+            "data": [],
+            "meta": {"total-pages": 0},
+        }
+
+        df = await TreasuryCollector(base_url=stand_in.url).collect()
+
+        assert df.empty
+        assert list(df.columns) == ["timestamp", "series_id", "source", "value", "unit"]
+
+    async def test_http_error(self, stand_in: StandInServer) -> None:
+        """Server errors are raised."""
+        stand_in.routes[DTS_CASH_BALANCE_PATH] = lambda _query: 500
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await TreasuryCollector(base_url=stand_in.url).collect()
+
+
+class TestNYFedCollector:
+    """Unit tests for the NY Fed ON RRP collector."""
+
+    async def test_collect_rrp(self, stand_in: StandInServer) -> None:
+        """Accepted amounts are summed per day and converted to millions USD."""
+        stand_in.routes[RRP_SEARCH_PATH] = lambda _query: {
+            "repo": {
+                "operations": [
+                    _rrp_operation("2024-06-04", 410_000_000_000),
+                    _rrp_operation("2024-06-03", 400_000_000_000),
+                    _rrp_operation("2024-06-03", 5_000_000_000),
+                    _rrp_operation("2024-06-03", 7_000_000_000, operation="Repo"),
+                ]
+            }
+        }
+        collector = NYFedCollector(base_url=stand_in.url)
+
+        df = await collector.collect(datetime(2024, 6, 1), datetime(2024, 6, 4))
+
+        assert list(df.columns) == ["timestamp", "series_id", "source", "value", "unit"]
+        assert df["timestamp"].tolist() == [
+            pd.Timestamp("2024-06-03", tz="UTC"),
+            pd.Timestamp("2024-06-04", tz="UTC"),
+        ]
+        assert df["value"].tolist() == [405_000.0, 410_000.0]
+        assert set(df["series_id"]) == {"RRP_DAILY"}
+        _, query = stand_in.requests[0]
+        assert query == {"startDate": ["2024-06-01"], "endDate": ["2024-06-04"]}
+
+    async def test_latest_without_start(self, stand_in: StandInServer) -> None:
+        """Without a start date the last two weeks are fetched."""
+        stand_in.routes[RRP_LATEST_PATH] = lambda _query: {
+            "repo": {"operations": [_rrp_operation("2024-06-04", 410_000_000_000)]}
+        }
+
+        df = await NYFedCollector(base_url=stand_in.url).collect()
+
+        assert stand_in.requests[0][0] == RRP_LATEST_PATH
+        assert df["value"].tolist() == [410_000.0]
+
+    async def test_no_operations(self, stand_in: StandInServer) -> None:
+        """No operations gives an empty frame."""
+        stand_in.routes[RRP_LATEST_PATH] = lambda _query: {"repo": {"operations": []}}
+
+        df = await NYFedCollector(base_url=stand_in.url).collect()
+
+        assert df.empty
+
+
+class TestNowcastFromCollectors:
+    """Collector output feeds the nowcast directly."""
+
+    async def test_nowcast_moves_with_daily_releases(self, stand_in: StandInServer) -> None:
+        """A Thursday TGA and RRP release moves the nowcast before the next H.4.1."""
+        stand_in.routes[DTS_CASH_BALANCE_PATH] = lambda _query: {
+            "data": [_dts_row("2024-06-05", "750000"), _dts_row("2024-06-06", "700000")],
+            "meta": {"total-pages": 1},
+        }
+        stand_in.routes[RRP_SEARCH_PATH] = lambda _query: {
+            "repo": {
+                "operations": [
+                    _rrp_operation("2024-06-05", 400_000_000_000),
+                    _rrp_operation("2024-06-06", 380_000_000_000),
+                ]
+            }
+        }
+        weekly = pd.DataFrame(
+            {
+                "timestamp": pd.Timestamp("2024-06-05"),
+                "series_id": ["WALCL", "WLRRAL", "WDTGAL"],
+                "value": [7_300_000.0, 750.0, 750.0],
+                "unit": ["millions_usd", "billions_usd", "billions_usd"],
+            }
+        )
+        start = datetime(2024, 6, 5)
+        daily = pd.concat(
+            [
+                await TreasuryCollector(base_url=stand_in.url).collect(start),
+                await NYFedCollector(base_url=stand_in.url).collect(start, datetime(2024, 6, 6)),
+            ]
+        )
+
+        result = NetLiquidityNowcast().batch(pd.concat([weekly, daily])).set_index("timestamp")
+
+        assert result.loc["2024-06-05", "value"] == pytest.approx(5_800_000.0)
+        # TGA down 50bn and RRP down 20bn; the 350bn foreign pool basis is carried
+        assert result.loc["2024-06-06", "value"] == pytest.approx(5_870_000.0)
+        assert result.loc["2024-06-06", "rrp"] == pytest.approx(730_000.0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
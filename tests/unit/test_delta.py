@@ -0,0 +1,179 @@
+"""Unit tests for delta ingestion (client-side filtering before ILP).
+
+Run with: uv run pytest tests/unit/test_delta.py -v
+"""
+
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from liquidity.storage import (
+    IngestSpool,
+    QuestDBConnectionError,
+    QuestDBIngestionError,
+    QuestDBStorage,
+    SnapshotStore,
+    compute_delta,
+)
+
+
+def _raw_frame(series_id: str, dates: list[str], values: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(dates),
+            "series_id": series_id,
+            "source": "fred",
+            "value": values,
+            "unit": "millions_usd",
+        }
+    )
+
+
+@pytest.fixture
+def sent() -> list[pd.DataFrame]:
+    """Batches that reached ILP."""
+    return []
+
+
+@pytest.fixture
+def storage(
+    tmp_path: Path, sent: list[pd.DataFrame], monkeypatch: pytest.MonkeyPatch
+) -> QuestDBStorage:
+    """Storage backed by a temporary snapshot; ILP writes are recorded."""
+    storage = QuestDBStorage(snapshot=SnapshotStore(tmp_path))
+    storage.spool = None
+
+    def record(table: str, df: pd.DataFrame, _ts: str, _symbols: list[str]) -> int:
+        sent.append(df)
+        storage._mirror_snapshot(table, df)
+        return len(df)
+
+    monkeypatch.setattr(storage, "_send", record)
+    return storage
+
+
+class TestComputeDelta:
+    """Unit tests for the delta comparison."""
+
+    def test_splits_new_revised_unchanged(self) -> None:
+        """Only new and revised rows are kept."""
+        stored = _raw_frame("WALCL", ["2024-01-03", "2024-01-10"], [7.0e6, 7.1e6])
+        incoming = _raw_frame(
+            "WALCL", ["2024-01-03", "2024-01-10", "2024-01-17"], [7.0e6, 7.15e6, 7.2e6]
+        )
+
+        result = compute_delta(incoming, stored, "series_id")
+
+        assert (result.new, result.revised, result.unchanged) == (1, 1, 1)
+        assert result.rows["value"].tolist() == [7.15e6, 7.2e6]
+        assert result.total == 3
+
+    def test_empty_store_sends_everything(self) -> None:
+        """With nothing stored, every row is new."""
+        incoming = _raw_frame("WALCL", ["2024-01-03"], [7.0e6])
+
+        result = compute_delta(incoming, pd.DataFrame(), "series_id")
+
+        assert result.new == 1
+        assert len(result.rows) == 1
+
+    def test_timezone_aware_incoming(self) -> None:
+        """Aware timestamps match naive UTC stored rows."""
+        stored = _raw_frame("WALCL", ["2024-01-03"], [7.0e6])
+        incoming = _raw_frame("WALCL", ["2024-01-03"], [7.0e6])
+        incoming["timestamp"] = incoming["timestamp"].dt.tz_localize("UTC")
+
+        result = compute_delta(incoming, stored, "series_id")
+
+        assert result.unchanged == 1
+        assert result.rows.empty
+
+    def test_same_timestamp_other_series_is_new(self) -> None:
+        """Matching is per (timestamp, key)."""
+        stored = _raw_frame("WALCL", ["2024-01-03"], [7.0e6])
+        incoming = _raw_frame("WDTGAL", ["2024-01-03"], [7.0e6])
+
+        assert compute_delta(incoming, stored, "series_id").new == 1
+
+    def test_symbol_revision_detected(self) -> None:
+        """A changed non-key column counts as a revision."""
+        stored = _raw_frame("WALCL", ["2024-01-03"], [7.0e6])
+        incoming = stored.assign(unit="billions_usd")
+
+        assert compute_delta(incoming, stored, "series_id").revised == 1
+
+
+class TestIngestDelta:
+    """Unit tests for QuestDBStorage.ingest_delta."""
+
+    def test_overlapping_refresh_sends_only_delta(
+        self, storage: QuestDBStorage, sent: list[pd.DataFrame]
+    ) -> None:
+        """A refresh window overlapping stored data sends one row."""
+        storage.ingest_dataframe(
+            "raw_data", _raw_frame("WALCL", ["2024-01-03", "2024-01-10"], [1.0, 2.0])
+        )
+
+        result = storage.ingest_delta(
+            "raw_data",
+            _raw_frame("WALCL", ["2024-01-03", "2024-01-10", "2024-01-17"], [1, 2, 3]),
+        )
+
+        assert (result.new, result.revised, result.unchanged) == (1, 0, 2)
+        assert result.sent == 1
+        assert sent[-1]["value"].tolist() == [3]
+
+    def test_nothing_changed_sends_nothing(
+        self, storage: QuestDBStorage, sent: list[pd.DataFrame]
+    ) -> None:
+        """An identical batch never reaches ILP."""
+        df = _raw_frame("WALCL", ["2024-01-03"], [1.0])
+        storage.ingest_dataframe("raw_data", df)
+
+        result = storage.ingest_delta("raw_data", df)
+
+        assert result.unchanged == 1
+        assert len(sent) == 1
+
+    def test_missing_tail_sends_full_batch(
+        self,
+        storage: QuestDBStorage,
+        sent: list[pd.DataFrame],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """If the stored tail cannot be loaded the whole batch is sent."""
+
+        def down(_sql: str, _params: list[Any] | None = None) -> list[dict[str, Any]]:
+            raise QuestDBConnectionError("connection refused")
+
+        monkeypatch.setattr(storage, "query", down)
+
+        result = storage.ingest_delta("raw_data", _raw_frame("WDTGAL", ["2024-01-03"], [750.0]))
+
+        assert result.new == 1
+        assert len(sent) == 1
+
+    def test_spooled_delta_reports_nothing_sent(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A delta spooled during an outage is not reported sent or mirrored."""
+        snapshot = SnapshotStore(tmp_path / "snapshots")
+        storage = QuestDBStorage(snapshot=snapshot, spool=IngestSpool(tmp_path / "spool"))
+
+        def down(*_args: Any) -> Any:
+            raise QuestDBIngestionError("connection refused")
+
+        monkeypatch.setattr(storage, "_send", down)
+        monkeypatch.setattr(storage, "query", down)
+
+        result = storage.ingest_delta("raw_data", _raw_frame("WDTGAL", ["2024-01-03"], [750.0]))
+
+        assert (result.new, result.sent) == (1, 0)
+        assert storage.spool is not None and storage.spool.has_pending()
+        assert snapshot.keys("raw_data") == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
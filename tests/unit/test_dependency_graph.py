@@ -0,0 +1,278 @@
+"""Unit tests for dependency-graph recomputation of derived series.
+
+Run with: uv run pytest tests/unit/test_dependency_graph.py -v
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.calculations import (
+    DERIVED_SERIES,
+    DependencyGraph,
+    DerivedSeries,
+    ExpressionError,
+    evaluate,
+)
+from liquidity.frames import normalize_frame
+from tests.conftest import FakeStorage
+
+UNITS = {
+    "WALCL": "millions_usd",
+    "WLRRAL": "billions_usd",
+    "WDTGAL": "billions_usd",
+    "DGS10": "percent",
+    "DGS2": "percent",
+}
+
+
+def _raw_frame(series_id: str, dates: list[str], values: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(dates),
+            "series_id": series_id,
+            "source": "fred",
+            "value": values,
+            "unit": UNITS.get(series_id, "percent"),
+        }
+    )
+
+
+def _history() -> pd.DataFrame:
+    """Three weekly H.4.1 prints and daily yields."""
+    weeks = ["2024-01-03", "2024-01-10", "2024-01-17"]
+    days = ["2024-01-02", "2024-01-03", "2024-01-04"]
+    return pd.concat(
+        [
+            _raw_frame("WALCL", weeks, [7_000_000, 7_010_000, 7_020_000]),
+            _raw_frame("WLRRAL", weeks, [500, 510, 520]),
+            _raw_frame("WDTGAL", weeks, [750, 760, 770]),
+            _raw_frame("DGS10", days, [4.0, 4.1, 4.2]),
+            _raw_frame("DGS2", days, [4.3, 4.3, 4.3]),
+        ],
+        ignore_index=True,
+    )
+
+
+class TestGraphStructure:
+    """Unit tests for nodes, edges and ordering."""
+
+    def test_raw_series_and_dependents(self) -> None:
+        """Edges run from raw series ids to the definitions using them."""
+        graph = DependencyGraph()
+
+        assert set(graph.raw_series) == set(UNITS)
+        assert graph.dependents("WDTGAL") == {"net_liquidity"}
+        assert graph.dependents("SOFR") == set()
+
+    def test_derived_of_derived_order(self) -> None:
+        """Definitions may use other definitions; order is topological."""
+        graph = DependencyGraph(
+            [
+                DerivedSeries("net_liquidity_bn", "net_liquidity", "billions_usd"),
+                DERIVED_SERIES["net_liquidity"],
+            ]
+        )
+
+        order = graph.order
+        assert order.index("net_liquidity") < order.index("net_liquidity_bn")
+        assert graph.dependents("WALCL") == {"net_liquidity", "net_liquidity_bn"}
+
+    def test_cycle_rejected(self) -> None:
+        """Cyclic definitions are an error."""
+        with pytest.raises(ExpressionError, match="cycle"):
+            DependencyGraph(
+                [
+                    DerivedSeries("a", "b + WALCL", "millions_usd"),
+                    DerivedSeries("b", "a - WALCL", "millions_usd"),
+                ]
+            )
+
+    def test_duplicate_rejected(self) -> None:
+        """Two definitions with one name are an error."""
+        with pytest.raises(ExpressionError, match="Duplicate"):
+            DependencyGraph([DERIVED_SERIES["yield_spread"], DERIVED_SERIES["yield_spread"]])
+
+
+class TestIncrementalRecompute:
+    """Unit tests for dirty-range recomputation."""
+
+    def test_prime_emits_nothing(self, fake_storage: FakeStorage) -> None:
+        """Priming computes history without writing."""
+        graph = DependencyGraph(storage=fake_storage)  # type: ignore[arg-type]
+
+        graph.prime(_history())
+
+        assert fake_storage.ingested == []
+        assert graph.dirty() == {}
+
+    def test_only_affected_index(self) -> None:
+        """A new yield print recomputes the yield spread, not Net Liquidity."""
+        graph = DependencyGraph()
+        graph.prime(_history())
+
+        changed = graph.ingest(
+            pd.concat(
+                [
+                    _raw_frame("DGS10", ["2024-01-05"], [4.5]),
+                    _raw_frame("DGS2", ["2024-01-05"], [4.4]),
+                ]
+            )
+        )
+
+        assert changed["index_name"].tolist() == ["yield_spread"]
+        assert changed["timestamp"].tolist() == [pd.Timestamp("2024-01-05")]
+        assert changed["value"].iloc[0] == pytest.approx(0.1)
+
+    def test_new_release_one_point(self) -> None:
+        """A new H.4.1 week yields exactly one Net Liquidity point."""
+        graph = DependencyGraph()
+        graph.prime(_history())
+
+        changed = graph.ingest(
+            pd.concat(
+                [
+                    _raw_frame("WALCL", ["2024-01-24"], [7_030_000]),
+                    _raw_frame("WLRRAL", ["2024-01-24"], [530]),
+                    _raw_frame("WDTGAL", ["2024-01-24"], [780]),
+                ]
+            )
+        )
+
+        assert changed["timestamp"].tolist() == [pd.Timestamp("2024-01-24")]
+        assert changed["value"].tolist() == [7_030_000 - 530_000 - 780_000]
+
+    def test_inputs_arriving_separately(self) -> None:
+        """Points appear once every input has been seen, in any arrival order."""
+        graph = DependencyGraph([DERIVED_SERIES["net_liquidity"]])
+
+        assert graph.ingest(_raw_frame("WALCL", ["2024-01-03"], [7_000_000])).empty
+        assert graph.ingest(_raw_frame("WLRRAL", ["2024-01-03"], [500])).empty
+        changed = graph.ingest(_raw_frame("WDTGAL", ["2024-01-03"], [750]))
+
+        assert changed["value"].tolist() == [5_750_000]
+
+    def test_revision_window(self) -> None:
+        """A revised drain changes points up to its next observation only."""
+        graph = DependencyGraph()
+        graph.prime(_history())
+
+        changed = graph.ingest(_raw_frame("WLRRAL", ["2024-01-10"], [600]))
+
+        assert changed["timestamp"].tolist() == [pd.Timestamp("2024-01-10")]
+        assert changed["value"].tolist() == [7_010_000 - 600_000 - 760_000]
+
+    def test_unchanged_rows_emit_nothing(self) -> None:
+        """Re-ingesting identical rows is a no-op."""
+        graph = DependencyGraph()
+        graph.prime(_history())
+
+        assert graph.ingest(_history()).empty
+
+    def test_derived_of_derived_propagates(self) -> None:
+        """Changes flow through derived inputs in topological order."""
+        graph = DependencyGraph(
+            [
+                DERIVED_SERIES["net_liquidity"],
+                DerivedSeries("net_liquidity_bn", "net_liquidity", "billions_usd"),
+            ]
+        )
+        graph.prime(_history())
+
+        changed = graph.ingest(_raw_frame("WALCL", ["2024-01-17"], [8_020_000]))
+
+        assert changed["index_name"].tolist() == ["net_liquidity", "net_liquidity_bn"]
+        assert changed["value"].tolist() == [6_730_000, 6_730]
+
+    def test_mark_dirty(self) -> None:
+        """Forced ranges recompute without emitting unchanged points."""
+        graph = DependencyGraph()
+        graph.prime(_history())
+
+        graph.mark_dirty("net_liquidity", pd.Timestamp("2024-01-01"))
+
+        assert "net_liquidity" in graph.dirty()
+        assert graph.recompute_dirty().empty
+
+    def test_collector_frame_slices(self) -> None:
+        """Slices of one multi-unit collector frame give the plain-frame result."""
+        frame = normalize_frame(_history())
+        h41 = frame["series_id"].isin(["WALCL", "WLRRAL", "WDTGAL"])
+        graph = DependencyGraph()
+
+        changed = pd.concat([graph.ingest(frame[h41]), graph.ingest(frame[~h41])])
+
+        expected = DependencyGraph().ingest(_history())
+        pd.testing.assert_frame_equal(
+            changed.sort_values(["index_name", "timestamp"]).reset_index(drop=True),
+            expected.sort_values(["index_name", "timestamp"]).reset_index(drop=True),
+        )
+
+    def test_persist_and_subscribers(self, fake_storage: FakeStorage) -> None:
+        """Changed points go to liquidity_indexes and to subscribers."""
+        graph = DependencyGraph(storage=fake_storage)  # type: ignore[arg-type]
+        received: list[pd.DataFrame] = []
+        graph.subscribe(received.append)
+
+        graph.ingest(_history())
+
+        table, df = fake_storage.ingested[0]
+        assert table == "liquidity_indexes"
+        assert list(df.columns) == ["timestamp", "index_name", "value"]
+        assert set(df["index_name"]) == {"net_liquidity", "yield_spread"}
+        assert len(received) == 1
+
+    def test_incremental_matches_full(self) -> None:
+        """Streaming random batches ends at the same values as one full evaluation."""
+        rng = np.random.default_rng(0)
+        weeks = pd.date_range("2020-01-01", periods=60, freq="W-WED")
+        days = pd.bdate_range("2020-01-01", weeks[-1])
+        df = pd.concat(
+            [
+                *(
+                    pd.DataFrame(
+                        {
+                            "timestamp": weeks,
+                            "series_id": series_id,
+                            "value": rng.uniform(100, 1000, len(weeks)),
+                            "unit": UNITS[series_id],
+                        }
+                    )
+                    for series_id in ["WALCL", "WLRRAL", "WDTGAL"]
+                ),
+                *(
+                    pd.DataFrame(
+                        {
+                            "timestamp": days,
+                            "series_id": series_id,
+                            "value": rng.uniform(1, 5, len(days)),
+                            "unit": "percent",
+                        }
+                    )
+                    for series_id in ["DGS10", "DGS2"]
+                ),
+            ],
+            ignore_index=True,
+        )
+        graph = DependencyGraph()
+        emitted: list[pd.DataFrame] = []
+        graph.subscribe(emitted.append)
+
+        shuffled = df.sample(frac=1.0, random_state=0)
+        for start in range(0, len(shuffled), 40):
+            graph.ingest(shuffled.iloc[start : start + 40])
+
+        latest = (
+            pd.concat(emitted)
+            .drop_duplicates(["timestamp", "index_name"], keep="last")
+            .pivot(index="timestamp", columns="index_name", values="value")
+        )
+        full = evaluate(list(DERIVED_SERIES.values()), df)
+        for name in DERIVED_SERIES:
+            expected = full[name].dropna()
+            np.testing.assert_allclose(latest[name].dropna().loc[expected.index], expected)
+            assert len(latest[name].dropna()) == len(expected)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,159 @@
+"""Unit tests for the embedded DuckDB/Parquet storage backend.
+
+Run with: uv run pytest tests/unit/test_embedded.py -v
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from liquidity.config import Settings
+from liquidity.storage import (
+    DuckDBStorage,
+    DuckDBStorageError,
+    QuestDBStorage,
+    Storage,
+    create_storage,
+)
+
+
+def _raw_frame(series_id: str, dates: list[str], values: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(dates),
+            "series_id": series_id,
+            "source": "fred",
+            "value": values,
+            "unit": "millions_usd",
+        }
+    )
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> DuckDBStorage:
+    """Create an embedded backend in a temporary directory."""
+    storage = DuckDBStorage(tmp_path)
+    storage.create_tables()
+    return storage
+
+
+class TestDuckDBStorage:
+    """Unit tests for ingestion and queries."""
+
+    def test_implements_storage_protocol(self, storage: DuckDBStorage) -> None:
+        """Both backends satisfy the Storage interface."""
+        assert isinstance(storage, Storage)
+        assert isinstance(QuestDBStorage(), Storage)
+
+    def test_empty_tables_queryable(self, storage: DuckDBStorage) -> None:
+        """Tables exist (with their schema) before any ingest."""
+        assert storage.query("SELECT * FROM raw_data") == []
+        assert storage.get_latest("WALCL") is None
+
+    def test_ingest_and_query(self, storage: DuckDBStorage) -> None:
+        """Ingested rows are visible to in-process SQL."""
+        df = _raw_frame("WALCL", ["2024-01-03", "2024-01-10"], [7.0e6, 7.1e6])
+
+        assert storage.ingest_dataframe("raw_data", df) == 2
+
+        rows = storage.query("SELECT value FROM raw_data ORDER BY timestamp")
+        assert [row["value"] for row in rows] == [7.0e6, 7.1e6]
+
+    def test_dedup_upsert(self, storage: DuckDBStorage) -> None:
+        """(timestamp, series_id) is upserted; the latest write wins."""
+        storage.ingest_dataframe("raw_data", _raw_frame("WALCL", ["2024-01-03"], [1.0]))
+        storage.ingest_dataframe(
+            "raw_data", _raw_frame("WALCL", ["2024-01-03", "2024-01-03"], [2.0, 3.0])
+        )
+        storage.ingest_dataframe("raw_data", _raw_frame("WDTGAL", ["2024-01-03"], [4.0]))
+
+        rows = storage.query("SELECT series_id, value FROM raw_data ORDER BY series_id")
+        assert rows == [
+            {"series_id": "WALCL", "value": 3.0},
+            {"series_id": "WDTGAL", "value": 4.0},
+        ]
+
+    def test_monthly_partitions(self, storage: DuckDBStorage, tmp_path: Path) -> None:
+        """Rows land in one Parquet file per month."""
+        storage.ingest_dataframe(
+            "raw_data", _raw_frame("WALCL", ["2024-01-31", "2024-02-07"], [1.0, 2.0])
+        )
+
+        files = sorted(p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*.parquet"))
+        assert files == [
+            "raw_data/month=2024-01/data.parquet",
+            "raw_data/month=2024-02/data.parquet",
+        ]
+
+    def test_timezone_aware_timestamps_stored_as_utc(self, storage: DuckDBStorage) -> None:
+        """Aware timestamps are normalized to naive UTC like QuestDB."""
+        df = _raw_frame("WALCL", ["2024-01-03 12:00"], [1.0])
+        df["timestamp"] = df["timestamp"].dt.tz_localize("America/New_York")
+        storage.ingest_dataframe("raw_data", df)
+
+        assert storage.get_latest_timestamp("WALCL") == datetime(2024, 1, 3, 17, 0)
+
+    def test_liquidity_indexes(self, storage: DuckDBStorage) -> None:
+        """liquidity_indexes is keyed on index_name."""
+        df = pd.DataFrame(
+            {
+                "timestamp": pd.to_datetime(["2024-01-03"]),
+                "index_name": ["net_liquidity"],
+                "value": [5.75e6],
+                "regime": ["EXPANSION"],
+            }
+        )
+        storage.ingest_dataframe("liquidity_indexes", df)
+
+        latest = storage.get_latest("net_liquidity", table="liquidity_indexes")
+        assert latest is not None
+        assert latest["regime"] == "EXPANSION"
+
+    def test_unknown_table(self, storage: DuckDBStorage) -> None:
+        """Only the known schemas are accepted."""
+        with pytest.raises(DuckDBStorageError, match="Unknown table"):
+            storage.ingest_dataframe("other", _raw_frame("WALCL", ["2024-01-03"], [1.0]))
+
+    def test_load_frame(self, storage: DuckDBStorage) -> None:
+        """load_frame returns long rows of the requested keys within the bounds."""
+        storage.ingest_dataframe(
+            "raw_data", _raw_frame("WALCL", ["2024-01-03", "2024-01-10"], [7.0e6, 7.1e6])
+        )
+        storage.ingest_dataframe("raw_data", _raw_frame("WDTGAL", ["2024-01-10"], [750.0]))
+
+        df = storage.load_frame("raw_data", ["WALCL", "WDTGAL"], start=datetime(2024, 1, 5))
+
+        assert df["series_id"].tolist() == ["WALCL", "WDTGAL"]
+        assert df["value"].tolist() == [7.1e6, 750.0]
+        assert storage.load_frame("raw_data", []).empty
+
+    def test_paramstyle(self, storage: DuckDBStorage) -> None:
+        """Each backend advertises the placeholders its query() binds."""
+        assert storage.paramstyle == "qmark"
+        assert QuestDBStorage.paramstyle == "pyformat"
+        assert storage.query("SELECT ? AS value", [1]) == [{"value": 1}]
+
+    def test_health_check(self, storage: DuckDBStorage) -> None:
+        """The embedded backend is always reachable."""
+        assert storage.health_check() is True
+
+
+class TestCreateStorage:
+    """Unit tests for backend selection."""
+
+    def test_duckdb_backend(self, tmp_path: Path) -> None:
+        """storage_backend=duckdb selects the embedded backend."""
+        settings = Settings(storage_backend="duckdb", duckdb_dir=str(tmp_path))
+
+        assert isinstance(create_storage(settings), DuckDBStorage)
+
+    def test_unknown_backend(self) -> None:
+        """Unknown backends are rejected."""
+        with pytest.raises(ValueError, match="Unknown storage backend"):
+            create_storage(Settings(storage_backend="sqlite"))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
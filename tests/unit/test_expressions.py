@@ -0,0 +1,205 @@
+"""Unit tests for declarative derived-series expressions.
+
+Run with: uv run pytest tests/unit/test_expressions.py -v
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.calculations import (
+    DERIVED_SERIES,
+    DerivedSeries,
+    ExpressionError,
+    compile_expression,
+    evaluate,
+)
+from liquidity.units import UnitError
+
+
+def _raw_frame(series_id: str, dates: list[str], values: list[float], unit: str) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(dates),
+            "series_id": series_id,
+            "source": "fred",
+            "value": values,
+            "unit": unit,
+        }
+    )
+
+
+class TestCompileExpression:
+    """Unit tests for parsing and validation."""
+
+    def test_inputs_and_dimension(self) -> None:
+        """Inputs are listed once in order of appearance."""
+        compiled = compile_expression("WALCL - WLRRAL - (WDTGAL + WLRRAL) / 2")
+
+        assert compiled.inputs == ("WALCL", "WLRRAL", "WDTGAL")
+        assert compiled.dimension == "USD"
+
+    def test_internal_names(self) -> None:
+        """SERIES_MAP internal names resolve to series ids."""
+        compiled = compile_expression("fed_total_assets - rrp - tga")
+
+        assert compiled.inputs == ("WALCL", "WLRRAL", "WDTGAL")
+
+    def test_unknown_series(self) -> None:
+        """Names outside the collector catalogs are rejected."""
+        with pytest.raises(ExpressionError, match="Unknown series 'NOPE'"):
+            compile_expression("WALCL - NOPE")
+
+    def test_mixed_dimensions(self) -> None:
+        """Adding amounts to rates is rejected."""
+        with pytest.raises(ExpressionError, match="Cannot add or subtract USD and percent"):
+            compile_expression("WALCL - DGS10")
+
+    def test_ratio_is_dimensionless(self) -> None:
+        """Dividing like dimensions cancels them."""
+        assert compile_expression("VIXCLS / VXVCLS").dimension is None
+
+    @pytest.mark.parametrize(
+        "expression",
+        ["__import__('os')", "WALCL.real", "WALCL ** 2", "WALCL if 1 else 0", "'x'", "WALCL -"],
+    )
+    def test_rejects_other_syntax(self, expression: str) -> None:
+        """Only arithmetic over numbers and series names is accepted."""
+        with pytest.raises(ExpressionError):
+            compile_expression(expression)
+
+    @pytest.mark.parametrize(
+        "expression",
+        ["WALCL - WLRRAL*1e3 - WDTGAL*1e3", "1000 * WALCL", "(WALCL - WDTGAL) / 1e6", "DGS10 * -100"],
+    )
+    def test_rejects_scale_factors(self, expression: str) -> None:
+        """Series are already in base units, so literal powers of ten would rescale them."""
+        with pytest.raises(ExpressionError, match="Literal scale factor"):
+            compile_expression(expression)
+
+    def test_other_constants_allowed(self) -> None:
+        """Weights that are not scale factors stay valid."""
+        assert compile_expression("WALCL * 0.5 - WDTGAL / 2").dimension == "USD"
+        assert compile_expression("VIXCLS / VXVCLS * 100").dimension is None
+
+    def test_declared_unit_must_match(self) -> None:
+        """The declared unit's dimension must match the expression's."""
+        series = DerivedSeries("bad", "DGS10 - DGS2", "millions_usd")
+
+        with pytest.raises(ExpressionError, match="declared unit"):
+            _ = series.compiled
+
+
+class TestEvaluate:
+    """Unit tests for evaluation over a shared aligned frame."""
+
+    def test_net_liquidity_in_base_units(self) -> None:
+        """Billions inputs are scaled to millions without factors in the expression."""
+        df = pd.concat(
+            [
+                _raw_frame("WALCL", ["2024-01-03"], [7_000_000], "millions_usd"),
+                _raw_frame("WLRRAL", ["2024-01-03"], [500], "billions_usd"),
+                _raw_frame("WDTGAL", ["2024-01-03"], [0.75], "trillions_usd"),
+            ]
+        )
+
+        result = DERIVED_SERIES["net_liquidity"].calculate(df)
+
+        assert result["net_liquidity"].tolist() == [5_750_000]
+        assert result["unit"].tolist() == ["millions_usd"]
+
+    def test_output_unit_scale(self) -> None:
+        """Results are expressed in the declared unit."""
+        series = DerivedSeries("net_liquidity_bn", "WALCL - WLRRAL", "billions_usd")
+        df = pd.concat(
+            [
+                _raw_frame("WALCL", ["2024-01-03"], [7_000_000], "millions_usd"),
+                _raw_frame("WLRRAL", ["2024-01-03"], [500], "billions_usd"),
+            ]
+        )
+
+        assert series.calculate(df)["net_liquidity_bn"].tolist() == [6_500]
+
+    def test_many_definitions_one_pass(self) -> None:
+        """Each definition takes values at its own anchor's timestamps."""
+        df = pd.concat(
+            [
+                _raw_frame("WALCL", ["2024-01-03"], [7_000_000], "millions_usd"),
+                _raw_frame("WLRRAL", ["2024-01-03"], [500], "billions_usd"),
+                _raw_frame("WDTGAL", ["2024-01-03"], [750], "billions_usd"),
+                _raw_frame("DGS10", ["2024-01-02", "2024-01-04"], [4.0, 4.2], "percent"),
+                _raw_frame("DGS2", ["2024-01-02", "2024-01-04"], [4.3, 4.4], "percent"),
+            ]
+        )
+
+        wide = evaluate(list(DERIVED_SERIES.values()), df)
+
+        assert list(wide.columns) == ["net_liquidity", "yield_spread"]
+        assert len(wide) == 3
+        assert wide["net_liquidity"].dropna().tolist() == [5_750_000]
+        np.testing.assert_allclose(wide["yield_spread"].dropna(), [-0.3, -0.2])
+
+    def test_explicit_grid(self) -> None:
+        """A calendar grid samples every definition at every point."""
+        df = pd.concat(
+            [
+                _raw_frame("DGS10", ["2024-01-02"], [4.0], "percent"),
+                _raw_frame("DGS2", ["2024-01-02"], [3.5], "percent"),
+            ]
+        )
+        grid = pd.DatetimeIndex(["2024-01-02", "2024-01-03"])
+
+        wide = evaluate([DERIVED_SERIES["yield_spread"]], df, grid=grid)
+
+        assert wide["yield_spread"].tolist() == [0.5, 0.5]
+
+    def test_missing_input(self) -> None:
+        """A definition without all of its inputs is an error."""
+        df = _raw_frame("DGS10", ["2024-01-02"], [4.0], "percent")
+
+        with pytest.raises(ValueError, match="Missing required series for yield_spread"):
+            evaluate([DERIVED_SERIES["yield_spread"]], df)
+
+    def test_wrong_row_unit(self) -> None:
+        """Rows whose unit contradicts the catalog dimension are rejected."""
+        df = pd.concat(
+            [
+                _raw_frame("DGS10", ["2024-01-02"], [4.0], "percent"),
+                _raw_frame("DGS2", ["2024-01-02"], [4.0], "millions_usd"),
+            ]
+        )
+
+        with pytest.raises(UnitError, match="DGS2"):
+            evaluate([DERIVED_SERIES["yield_spread"]], df)
+
+    @pytest.mark.benchmark
+    def test_many_definitions_are_fast(self) -> None:
+        """Fifty definitions over 30 years of daily data evaluate in under a second."""
+        dates = pd.bdate_range("1994-01-01", "2024-01-01")
+        rng = np.random.default_rng(0)
+        series_ids = ["DGS10", "DGS2", "SOFR", "VIXCLS", "VXVCLS"]
+        df = pd.DataFrame(
+            {
+                "timestamp": np.tile(dates.values, len(series_ids)),
+                "series_id": np.repeat(series_ids, len(dates)),
+                "value": rng.uniform(1.0, 5.0, len(dates) * len(series_ids)),
+                "unit": "percent",
+            }
+        )
+        definitions = [
+            DerivedSeries(f"m{i}", f"DGS10 - DGS2 * {i}.5 + (SOFR - VIXCLS) / 2 - VXVCLS", "percent")
+            for i in range(50)
+        ]
+
+        started = time.perf_counter()
+        wide = evaluate(definitions, df)
+        elapsed = time.perf_counter() - started
+
+        assert wide.shape == (len(dates), 50)
+        assert elapsed < 1.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
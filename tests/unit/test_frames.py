@@ -0,0 +1,195 @@
+"""Unit tests for the canonical collector frame.
+
+Run with: uv run pytest tests/unit/test_frames.py -v
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.frames import (
+    TIMESTAMP_DTYPE,
+    concat_frames,
+    empty_frame,
+    frame_columns,
+    is_normalized,
+    naive_utc,
+    naive_utc_ns,
+    normalize_frame,
+    series_frame,
+)
+from liquidity.storage import DuckDBStorage, QuestDBStorage
+from liquidity.storage.snapshot import SnapshotStore
+
+
+def _string_frame(series_ids: list[str], days: int) -> pd.DataFrame:
+    """Long frame built the pre-canonical way (repeated strings on every row)."""
+    dates = pd.date_range("1990-01-01", periods=days, freq="D")
+    return pd.DataFrame(
+        {
+            "timestamp": np.tile(dates, len(series_ids)),
+            "series_id": np.repeat(series_ids, days),
+            "source": "fred",
+            "value": np.arange(days * len(series_ids), dtype="float64"),
+            "unit": "millions_usd",
+        }
+    )
+
+
+def _assert_canonical(df: pd.DataFrame, key_column: str = "series_id") -> None:
+    assert list(df.columns[:5]) == frame_columns(key_column)
+    assert df["timestamp"].dtype == TIMESTAMP_DTYPE
+    assert df["value"].dtype == np.dtype("float64")
+    for column in (key_column, "source", "unit"):
+        assert isinstance(df[column].dtype, pd.CategoricalDtype)
+
+
+class TestSeriesFrame:
+    """Unit tests for building canonical frames."""
+
+    def test_scalar_symbols(self) -> None:
+        """Per-series constants become single-category columns."""
+        df = series_frame(["2024-01-03", "2024-01-10"], [1, 2], "WALCL", "fred", "millions_usd")
+
+        _assert_canonical(df)
+        assert is_normalized(df)
+        assert df["series_id"].cat.categories.tolist() == ["WALCL"]
+        assert df["timestamp"].tolist() == [
+            pd.Timestamp("2024-01-03", tz="UTC"),
+            pd.Timestamp("2024-01-10", tz="UTC"),
+        ]
+        assert df["value"].tolist() == [1.0, 2.0]
+
+    def test_per_row_symbols_and_key_column(self) -> None:
+        """Per-row keys are encoded; Yahoo frames use a symbol column."""
+        df = series_frame(
+            pd.to_datetime(["2024-01-02", "2024-01-02"]),
+            [4700.0, 16.5],
+            ["^GSPC", "^VIX"],
+            "yahoo",
+            "index",
+            key_column="symbol",
+        )
+
+        _assert_canonical(df, "symbol")
+        assert df["symbol"].tolist() == ["^GSPC", "^VIX"]
+
+    def test_aware_timestamps_converted_to_utc(self) -> None:
+        """Timezone-aware inputs keep their instant."""
+        ts = pd.to_datetime(["2024-01-02 09:00"]).tz_localize("America/New_York")
+        df = series_frame(ts, [1.0], "X", "test", "index")
+
+        assert df["timestamp"].iloc[0] == pd.Timestamp("2024-01-02 14:00", tz="UTC")
+
+    def test_empty_frame(self) -> None:
+        """Empty frames still carry the canonical dtypes."""
+        df = empty_frame()
+
+        assert df.empty
+        _assert_canonical(df)
+
+
+class TestNormalizeFrame:
+    """Unit tests for converting existing frames."""
+
+    def test_canonical_frame_returned_as_is(self) -> None:
+        """No copy is made of a frame that is already canonical."""
+        df = series_frame(["2024-01-03"], [1.0], "WALCL", "fred", "millions_usd")
+
+        assert normalize_frame(df) is df
+
+    def test_string_frame_converted(self) -> None:
+        """Plain string/naive frames are converted; extra columns are kept."""
+        df = _string_frame(["WALCL", "WDTGAL"], 3).assign(stale=True)
+
+        result = normalize_frame(df)
+
+        _assert_canonical(result)
+        assert list(result.columns) == [*frame_columns(), "stale"]
+        assert result["series_id"].astype(str).tolist() == df["series_id"].tolist()
+        assert (result["timestamp"].dt.tz_localize(None) == df["timestamp"]).all()
+
+    def test_concat_merges_categories(self) -> None:
+        """Frames with different categories concatenate to one categorical."""
+        fred = series_frame(["2024-01-03"], [1.0], "WALCL", "fred", "millions_usd")
+        treasury = series_frame(["2024-01-04"], [2.0], "TGA_DAILY", "treasury", "millions_usd")
+
+        df = concat_frames([fred, treasury])
+
+        _assert_canonical(df)
+        assert df["series_id"].tolist() == ["WALCL", "TGA_DAILY"]
+        assert df["source"].cat.categories.tolist() == ["fred", "treasury"]
+        _assert_canonical(concat_frames([]))
+
+    def test_backfill_memory_reduced(self) -> None:
+        """A multi-decade backfill takes at least 3x less memory than string columns."""
+        series_ids = [f"SERIES_{i:02d}" for i in range(30)]
+        strings = _string_frame(series_ids, 365 * 30)
+
+        canonical = normalize_frame(strings)
+
+        string_bytes = strings.memory_usage(deep=True).sum()
+        canonical_bytes = canonical.memory_usage(deep=True).sum()
+        assert string_bytes >= 3 * canonical_bytes
+
+    def test_engines_accept_mixed_naive_and_utc(self) -> None:
+        """Stored rows (naive UTC) and collector frames (UTC) combine in one input."""
+        stored = _string_frame(["WALCL"], 1)
+        fresh = series_frame(["1990-01-02"], [1.0], "WALCL", "fred", "millions_usd")
+
+        ns = naive_utc_ns(pd.concat([stored, fresh])["timestamp"])
+
+        assert ns.tolist() == [
+            pd.Timestamp("1990-01-01").value,
+            pd.Timestamp("1990-01-02").value,
+        ]
+
+    def test_naive_utc_converts_every_input_kind(self) -> None:
+        """Strings, naive and zoned timestamps all land on naive UTC."""
+        zoned = pd.Series(pd.to_datetime(["2024-01-02 09:00"]).tz_localize("America/New_York"))
+
+        assert naive_utc(zoned).tolist() == [pd.Timestamp("2024-01-02 14:00")]
+        assert naive_utc(["2024-01-02"]).tolist() == [pd.Timestamp("2024-01-02")]
+        assert naive_utc(pd.Series([], dtype="datetime64[ns]")).empty
+
+
+class TestStorageIngest:
+    """Canonical frames are ingested without conversion copies."""
+
+    def test_questdb_sends_frame_unchanged(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The ILP sender receives the collector's frame itself."""
+        storage = QuestDBStorage(snapshot=SnapshotStore(tmp_path))
+        storage.spool = None
+        sent: list[pd.DataFrame] = []
+
+        def _send(_table: str, df: pd.DataFrame, _timestamp_col: str, _symbols: list[str]) -> int:
+            sent.append(df)
+            return len(df)
+
+        monkeypatch.setattr(storage, "_send", _send)
+        df = series_frame(["2024-01-03", "2024-01-10"], [1.0, 2.0], "WALCL", "fred", "millions_usd")
+
+        assert storage.ingest_dataframe("raw_data", df) == 2
+        assert sent[0] is df
+
+    def test_embedded_roundtrip(self, tmp_path: Path) -> None:
+        """Categorical symbols are stored and queried as strings."""
+        storage = DuckDBStorage(tmp_path)
+        storage.create_tables()
+        df = series_frame(["2024-01-03", "2024-01-10"], [1.0, 2.0], "WALCL", "fred", "millions_usd")
+
+        assert storage.ingest_dataframe("raw_data", df) == 2
+
+        rows = storage.query("SELECT series_id, source, value FROM raw_data ORDER BY timestamp")
+        assert rows == [
+            {"series_id": "WALCL", "source": "fred", "value": 1.0},
+            {"series_id": "WALCL", "source": "fred", "value": 2.0},
+        ]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
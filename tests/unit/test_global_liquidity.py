@@ -0,0 +1,143 @@
+"""Unit tests for the Global Liquidity Index calculator.
+
+Run with: uv run pytest tests/unit/test_global_liquidity.py -v
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.calculations import GlobalLiquidityCalculator
+from tests.conftest import FakeStorage
+
+
+def _frame(series_id: str, dates: list[str], values: list[float], unit: str) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(dates),
+            "series_id": series_id,
+            "source": "fred",
+            "value": values,
+            "unit": unit,
+        }
+    )
+
+
+def _inputs() -> pd.DataFrame:
+    """Fed, ECB and BoJ on one Wednesday with rates from the day before."""
+    return pd.concat(
+        [
+            _frame("WALCL", ["2024-01-03"], [7_000_000], "millions_usd"),
+            _frame("ECBASSETSW", ["2024-01-03"], [6_000_000], "millions_eur"),
+            _frame("JPNASSETS", ["2024-01-01"], [7_500_000], "100_millions_jpy"),
+            _frame("DEXUSEU", ["2024-01-02"], [1.10], "usd_per_eur"),
+            _frame("DEXJPUS", ["2024-01-02"], [150.0], "jpy_per_usd"),
+        ],
+        ignore_index=True,
+    )
+
+
+class TestGlobalLiquidityCalculator:
+    """Unit tests for GlobalLiquidityCalculator."""
+
+    def test_usd_conversion(self) -> None:
+        """EUR is multiplied by USD/EUR; JPY (100 million units) is divided by JPY/USD."""
+        usd = GlobalLiquidityCalculator().components(_inputs())
+
+        row = usd.loc["2024-01-03"]
+        assert row["WALCL"] == pytest.approx(7_000_000)
+        assert row["ECBASSETSW"] == pytest.approx(6_600_000)
+        assert row["JPNASSETS"] == pytest.approx(7_500_000 * 100 / 150)
+
+    def test_index_is_sum(self) -> None:
+        """The index sums all banks in millions USD."""
+        result = GlobalLiquidityCalculator().calculate(_inputs())
+
+        assert result["timestamp"].tolist() == [pd.Timestamp("2024-01-03")]
+        assert result["global_liquidity"].iloc[0] == pytest.approx(
+            7_000_000 + 6_600_000 + 5_000_000
+        )
+        assert result["unit"].iloc[0] == "millions_usd"
+
+    def test_stale_fx_drops_point(self) -> None:
+        """Points without a fresh FX rate are not emitted."""
+        df = pd.concat(
+            [
+                _inputs(),
+                _frame("WALCL", ["2024-01-17"], [7_000_000], "millions_usd"),
+                _frame("ECBASSETSW", ["2024-01-17"], [6_000_000], "millions_eur"),
+            ]
+        )
+
+        result = GlobalLiquidityCalculator().calculate(df)
+
+        assert pd.Timestamp("2024-01-17") not in set(result["timestamp"])
+
+    def test_missing_fx_series(self) -> None:
+        """A bank whose FX series is absent is an error."""
+        df = _inputs()
+        df = df[df["series_id"] != "DEXJPUS"]
+
+        with pytest.raises(ValueError, match="DEXJPUS"):
+            GlobalLiquidityCalculator().calculate(df)
+
+    def test_absent_bank_not_required(self) -> None:
+        """Banks without rows are left out along with their FX needs."""
+        df = _inputs()
+        df = df[~df["series_id"].isin(["JPNASSETS", "DEXJPUS"])]
+
+        usd = GlobalLiquidityCalculator().components(df)
+
+        assert list(usd.columns) == ["WALCL", "ECBASSETSW"]
+
+    def test_persist(self, fake_storage: FakeStorage) -> None:
+        """persist=True writes the index to liquidity_indexes."""
+        calculator = GlobalLiquidityCalculator(storage=fake_storage)  # type: ignore[arg-type]
+
+        calculator.calculate(_inputs(), persist=True)
+
+        table, df = fake_storage.ingested[0]
+        assert table == "liquidity_indexes"
+        assert df["index_name"].tolist() == ["global_liquidity"]
+
+    @pytest.mark.benchmark
+    def test_multi_decade_recompute_is_fast(self) -> None:
+        """Seven banks with daily FX over 30 years recompute in under a second."""
+        days = pd.bdate_range("1994-01-01", "2024-01-01")
+        weeks = pd.date_range("1994-01-05", "2024-01-01", freq="W-WED")
+        months = pd.date_range("1994-01-01", "2024-01-01", freq="MS")
+        rng = np.random.default_rng(0)
+
+        def series(series_id: str, dates: pd.DatetimeIndex, unit: str) -> pd.DataFrame:
+            values = rng.uniform(1.0, 2.0, len(dates)).tolist()
+            return _frame(series_id, dates.strftime("%Y-%m-%d").tolist(), values, unit)
+
+        df = pd.concat(
+            [
+                series("WALCL", weeks, "millions_usd"),
+                series("ECBASSETSW", weeks, "millions_eur"),
+                series("JPNASSETS", months, "100_millions_jpy"),
+                series("BOE_TOTAL_ASSETS", weeks, "millions_gbp"),
+                series("SNB_TOTAL_ASSETS", months, "millions_chf"),
+                series("V36610", weeks, "millions_cad"),
+                series("PBOC_TOTAL_ASSETS", months, "hundreds_millions_cny"),
+                *(
+                    series(fx, days, "rate")
+                    for fx in ["DEXUSEU", "DEXJPUS", "DEXUSUK", "DEXSZUS", "DEXCAUS", "DEXCHUS"]
+                ),
+            ],
+            ignore_index=True,
+        )
+
+        started = time.perf_counter()
+        result = GlobalLiquidityCalculator().calculate(df)
+        elapsed = time.perf_counter() - started
+
+        assert len(result) > 1500
+        assert elapsed < 1.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
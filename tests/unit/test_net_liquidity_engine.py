@@ -0,0 +1,191 @@
+"""Unit tests for the incremental Net Liquidity engine.
+
+Run with: uv run pytest tests/unit/test_net_liquidity_engine.py -v
+"""
+
+from datetime import UTC, datetime
+
+import pandas as pd
+import pytest
+
+from liquidity.calculations import NetLiquidityEngine
+from liquidity.frames import normalize_frame
+from liquidity.scheduler import ReleaseEvent
+from liquidity.units import UnitError
+from tests.conftest import FakeStorage
+
+UNITS = {"WALCL": "millions_usd", "WLRRAL": "billions_usd", "WDTGAL": "billions_usd"}
+
+
+def _raw_frame(series_id: str, dates: list[str], values: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(dates),
+            "series_id": series_id,
+            "source": "fred",
+            "value": values,
+            "unit": UNITS.get(series_id, "millions_usd"),
+        }
+    )
+
+
+def _release(walcl: float, rrp: float, tga: float, date: str) -> pd.DataFrame:
+    return pd.concat(
+        [
+            _raw_frame("WALCL", [date], [walcl]),
+            _raw_frame("WLRRAL", [date], [rrp]),
+            _raw_frame("WDTGAL", [date], [tga]),
+        ],
+        ignore_index=True,
+    )
+
+
+class TestNetLiquidityEngine:
+    """Unit tests for NetLiquidityEngine."""
+
+    def test_release_emits_one_point(self) -> None:
+        """A full H.4.1 release yields one point in millions USD."""
+        engine = NetLiquidityEngine()
+
+        result = engine.update(_release(7_000_000, 500, 750, "2024-01-03"))
+
+        assert result["timestamp"].tolist() == [pd.Timestamp("2024-01-03")]
+        assert result["net_liquidity"].tolist() == [5_750_000]
+        assert result["unit"].iloc[0] == "millions_usd"
+
+    def test_only_new_points_emitted(self) -> None:
+        """The next release does not re-emit earlier history."""
+        engine = NetLiquidityEngine()
+        engine.update(_release(7_000_000, 500, 750, "2024-01-03"))
+
+        result = engine.update(_release(7_100_000, 400, 800, "2024-01-10"))
+
+        assert result["timestamp"].tolist() == [pd.Timestamp("2024-01-10")]
+        assert result["net_liquidity"].tolist() == [5_900_000]
+
+    def test_drain_update_changes_existing_point(self) -> None:
+        """A late TGA print re-emits the WALCL point it belongs to."""
+        engine = NetLiquidityEngine()
+        engine.update(_release(7_000_000, 500, 750, "2024-01-03"))
+        first = engine.update(_raw_frame("WALCL", ["2024-01-10"], [7_100_000]))
+
+        second = engine.update(
+            pd.concat(
+                [
+                    _raw_frame("WLRRAL", ["2024-01-10"], [400]),
+                    _raw_frame("WDTGAL", ["2024-01-10"], [800]),
+                ]
+            )
+        )
+
+        # First computed as-of the previous week's RRP/TGA
+        assert first["net_liquidity"].tolist() == [5_850_000]
+        assert second["net_liquidity"].tolist() == [5_900_000]
+
+    def test_unchanged_rows_emit_nothing(self) -> None:
+        """Re-sending identical data produces an empty result."""
+        engine = NetLiquidityEngine()
+        release = _release(7_000_000, 500, 750, "2024-01-03")
+        engine.update(release)
+
+        assert engine.update(release).empty
+
+    def test_revision_recomputes_following_points(self) -> None:
+        """A revised RRP value updates every WALCL point it is matched to."""
+        engine = NetLiquidityEngine()
+        engine.update(
+            pd.concat(
+                [
+                    _raw_frame("WALCL", ["2024-01-03", "2024-01-10"], [7_000_000, 7_000_000]),
+                    _raw_frame("WLRRAL", ["2024-01-03"], [500]),
+                    _raw_frame("WDTGAL", ["2024-01-03"], [750]),
+                ]
+            )
+        )
+
+        result = engine.update(_raw_frame("WLRRAL", ["2024-01-03"], [600]))
+
+        assert result["net_liquidity"].tolist() == [5_650_000, 5_650_000]
+
+    def test_matches_full_recompute(self) -> None:
+        """Streaming row by row gives the same series as a full recompute."""
+        dates = pd.date_range("2024-01-03", periods=12, freq="7D").strftime("%Y-%m-%d")
+        history = pd.concat(
+            [
+                _release(7_000_000 + i * 10_000, 500 - i, 750 + i, date)
+                for i, date in enumerate(dates)
+            ],
+            ignore_index=True,
+        ).sample(frac=1.0, random_state=0)
+
+        engine = NetLiquidityEngine()
+        streamed: dict[pd.Timestamp, float] = {}
+        for i in range(len(history)):
+            out = engine.update(history.iloc[[i]])
+            streamed.update(zip(out["timestamp"], out["net_liquidity"], strict=True))
+
+        full = engine.recompute()
+        assert dict(zip(full["timestamp"], full["net_liquidity"], strict=True)) == streamed
+        assert len(full) == 12
+
+    def test_collector_frame_slice(self) -> None:
+        """Slices of a multi-series, multi-unit collector frame are accepted."""
+        dgs10 = _raw_frame("DGS10", ["2024-01-03"], [4.2]).assign(unit="percent")
+        frame = normalize_frame(
+            pd.concat([_release(7_000_000, 500, 750, "2024-01-03"), dgs10], ignore_index=True)
+        )
+        engine = NetLiquidityEngine()
+
+        engine.update(frame[frame["series_id"] == "WALCL"])
+        result = engine.update(frame)
+
+        assert result["net_liquidity"].tolist() == [5_750_000]
+
+    def test_prime_suppresses_history(self, fake_storage: FakeStorage) -> None:
+        """Primed history is not re-emitted or written."""
+        engine = NetLiquidityEngine(storage=fake_storage)  # type: ignore[arg-type]
+        engine.prime(_release(7_000_000, 500, 750, "2024-01-03"))
+
+        result = engine.update(_release(7_000_000, 500, 750, "2024-01-03"))
+
+        assert result.empty
+        assert fake_storage.ingested == []
+
+    def test_writes_and_notifies(self, fake_storage: FakeStorage) -> None:
+        """Changed points are written to liquidity_indexes and pushed to subscribers."""
+        engine = NetLiquidityEngine(storage=fake_storage)  # type: ignore[arg-type]
+        received: list[pd.DataFrame] = []
+        engine.subscribe(received.append)
+
+        engine.update(_release(7_000_000, 500, 750, "2024-01-03"))
+
+        table, df = fake_storage.ingested[0]
+        assert table == "liquidity_indexes"
+        assert df["index_name"].tolist() == ["net_liquidity"]
+        assert df["value"].tolist() == [5_750_000]
+        assert len(received) == 1
+
+    def test_unknown_unit_rejected(self) -> None:
+        """Inputs must carry a convertible unit."""
+        engine = NetLiquidityEngine()
+        df = _raw_frame("WALCL", ["2024-01-03"], [1.0]).assign(unit="percent")
+
+        with pytest.raises(UnitError, match="Cannot convert"):
+            engine.update(df)
+
+    async def test_on_release(self) -> None:
+        """Scheduler release events feed the engine."""
+        engine = NetLiquidityEngine()
+        received: list[pd.DataFrame] = []
+        engine.subscribe(received.append)
+        now = datetime(2024, 1, 4, tzinfo=UTC)
+
+        await engine.on_release(
+            ReleaseEvent("WALCL", "fred", now, now, _release(7_000_000, 500, 750, "2024-01-03"))
+        )
+
+        assert received[0]["net_liquidity"].tolist() == [5_750_000]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,222 @@
+"""Unit tests for the daily Net Liquidity nowcast.
+
+Run with: uv run pytest tests/unit/test_nowcast.py -v
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.calculations import NetLiquidityNowcast
+from liquidity.frames import normalize_frame
+from tests.conftest import FakeStorage
+
+
+class _Truth:
+    """Daily balances and weekly H.4.1 prints drawn from them."""
+
+    def __init__(self, start: str = "2024-01-01", end: str = "2024-06-28", seed: int = 0) -> None:
+        rng = np.random.default_rng(seed)
+        self.days = pd.bdate_range(start, end)
+        self.weeks = pd.date_range(start, end, freq="W-WED")
+        n, m = len(self.days), len(self.weeks)
+        self.tga = pd.Series(750_000 + np.cumsum(rng.normal(0, 15_000, n)), index=self.days)
+        self.rrp = pd.Series(500_000 + np.cumsum(rng.normal(0, 10_000, n)), index=self.days)
+        # Foreign official repo pool: in WLRRAL, not in ON RRP results
+        self.foreign = pd.Series(350_000 + np.cumsum(rng.normal(0, 2_000, m)), index=self.weeks)
+        self.walcl = pd.Series(7_500_000 + np.cumsum(rng.normal(0, 20_000, m)), index=self.weeks)
+
+    def weekly_rows(self, weeks: pd.DatetimeIndex | None = None) -> pd.DataFrame:
+        weeks = self.weeks if weeks is None else weeks
+        wlrral = (self.rrp[weeks] + self.foreign[weeks]) / 1000
+        return pd.concat(
+            [
+                _rows("WALCL", weeks, self.walcl[weeks], "millions_usd"),
+                _rows("WLRRAL", weeks, wlrral, "billions_usd"),
+                _rows("WDTGAL", weeks, self.tga[weeks] / 1000, "billions_usd"),
+            ],
+            ignore_index=True,
+        )
+
+    def daily_rows(self, days: pd.DatetimeIndex | None = None) -> pd.DataFrame:
+        days = self.days if days is None else days
+        return pd.concat(
+            [
+                _rows("RRP_DAILY", days, self.rrp[days], "millions_usd"),
+                _rows("TGA_DAILY", days, self.tga[days], "millions_usd"),
+            ],
+            ignore_index=True,
+        )
+
+    def official(self, week: pd.Timestamp) -> float:
+        return float(self.walcl[week] - self.rrp[week] - self.foreign[week] - self.tga[week])
+
+
+def _rows(series_id: str, timestamps: pd.DatetimeIndex, values: object, unit: str) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "series_id": series_id,
+            "source": "fred" if series_id.startswith("W") else "daily",
+            "value": np.asarray(values, dtype="float64"),
+            "unit": unit,
+        }
+    )
+
+
+class TestBatch:
+    """Unit tests for the whole-history nowcast."""
+
+    def test_equals_official_on_prints(self) -> None:
+        """On H.4.1 dates the nowcast is the weekly Net Liquidity."""
+        truth = _Truth()
+        result = NetLiquidityNowcast().batch(pd.concat([truth.weekly_rows(), truth.daily_rows()]))
+
+        prints = result[result["official"]].set_index("timestamp")["value"]
+        assert prints.index.equals(pd.DatetimeIndex(truth.weeks, name="timestamp"))
+        np.testing.assert_allclose(prints, [truth.official(w) for w in truth.weeks])
+
+    def test_daily_drains_with_carried_basis(self) -> None:
+        """Between prints, daily drains move the nowcast; the RRP basis is carried."""
+        truth = _Truth()
+        result = NetLiquidityNowcast().batch(pd.concat([truth.weekly_rows(), truth.daily_rows()]))
+
+        days = result.set_index("timestamp")
+        week = truth.weeks[5]
+        for day in pd.bdate_range(week, periods=5)[1:]:
+            expected = (
+                truth.walcl[week] - truth.rrp[day] - truth.foreign[week] - truth.tga[day]
+            )
+            assert days.loc[day, "value"] == pytest.approx(expected)
+        assert len(result) == len(truth.days[truth.days >= truth.weeks[0]])
+
+    def test_weekly_only(self) -> None:
+        """Without daily data the nowcast is the weekly Net Liquidity."""
+        truth = _Truth()
+        result = NetLiquidityNowcast().batch(truth.weekly_rows())
+
+        np.testing.assert_allclose(result["value"], [truth.official(w) for w in truth.weeks])
+        assert result["official"].all()
+
+
+class TestIncremental:
+    """Unit tests for daily updates and reconciliation."""
+
+    def _stream(self, truth: _Truth, engine: NetLiquidityNowcast, start: str) -> list[pd.DataFrame]:
+        """Daily rows each day; each H.4.1 print the next day."""
+        emitted: list[pd.DataFrame] = []
+        engine.subscribe(emitted.append)
+        for day in truth.days[truth.days >= start]:
+            engine.update(truth.daily_rows(pd.DatetimeIndex([day])))
+            week = day - pd.Timedelta(days=1)
+            if week in truth.weeks:
+                engine.update(truth.weekly_rows(pd.DatetimeIndex([week])))
+        return emitted
+
+    def test_streaming_matches_batch(self) -> None:
+        """Day-by-day updates with prints a day late end at the batch nowcast."""
+        truth = _Truth()
+        history = pd.concat([truth.weekly_rows(), truth.daily_rows()])
+        engine = NetLiquidityNowcast()
+        engine.prime(history[history["timestamp"] < "2024-04-01"])
+
+        emitted = self._stream(truth, engine, "2024-04-01")
+
+        latest = pd.concat(emitted).drop_duplicates("timestamp", keep="last")
+        expected = NetLiquidityNowcast().batch(history)
+        tail = expected[expected["timestamp"] >= "2024-04-01"].reset_index(drop=True)
+        pd.testing.assert_frame_equal(latest.reset_index(drop=True), tail)
+        assert engine.value == pytest.approx(expected["value"].iloc[-1])
+
+    def test_nowcast_errors(self) -> None:
+        """Each print records the nowcast it replaces and the official value."""
+        truth = _Truth()
+        history = pd.concat([truth.weekly_rows(), truth.daily_rows()])
+        engine = NetLiquidityNowcast()
+        engine.prime(history[history["timestamp"] < "2024-04-01"])
+
+        self._stream(truth, engine, "2024-04-01")
+
+        errors = engine.errors
+        weeks = truth.weeks[truth.weeks >= "2024-04-01"]
+        assert errors["timestamp"].tolist() == list(weeks)
+        for week, row in zip(weeks, errors.itertuples(), strict=True):
+            before = week - pd.Timedelta(days=7)
+            nowcast = (
+                truth.walcl[before] - truth.rrp[week] - truth.foreign[before] - truth.tga[week]
+            )
+            assert row.nowcast == pytest.approx(nowcast)
+            assert row.official == pytest.approx(truth.official(week))
+        np.testing.assert_allclose(errors["error"], errors["official"] - errors["nowcast"])
+
+    def test_print_reconciles_from_its_wednesday(self) -> None:
+        """A weekly print recomputes the days since its Wednesday."""
+        truth = _Truth()
+        history = pd.concat([truth.weekly_rows(), truth.daily_rows()])
+        week = truth.weeks[-2]
+        engine = NetLiquidityNowcast()
+        weekly = history["series_id"].isin(["WALCL", "WLRRAL", "WDTGAL"])
+        engine.prime(history[~((history["timestamp"] == week) & weekly)])
+
+        days = engine.update(truth.weekly_rows(pd.DatetimeIndex([week])))
+
+        assert days["timestamp"].tolist() == list(truth.days[truth.days >= week])
+        assert days["official"].iloc[0]
+
+    def test_unchanged_rows_emit_nothing(self) -> None:
+        """Re-ingesting stored rows is a no-op."""
+        truth = _Truth()
+        history = pd.concat([truth.weekly_rows(), truth.daily_rows()])
+        engine = NetLiquidityNowcast()
+        engine.prime(history)
+
+        assert engine.update(history).empty
+
+    def test_collector_frame_slices(self) -> None:
+        """Per-series slices of one multi-unit collector frame end at the batch nowcast."""
+        truth = _Truth()
+        history = pd.concat([truth.weekly_rows(), truth.daily_rows()], ignore_index=True)
+        dgs10 = _rows("DGS10", truth.days, 4.2, "percent")
+        frame = normalize_frame(pd.concat([history, dgs10], ignore_index=True))
+        engine = NetLiquidityNowcast()
+
+        for series_id in frame["series_id"].cat.categories:
+            engine.update(frame[frame["series_id"] == series_id])
+
+        expected = NetLiquidityNowcast().batch(history)
+        assert engine.value == pytest.approx(expected["value"].iloc[-1])
+
+    def test_persist(self, fake_storage: FakeStorage) -> None:
+        """Recomputed days are written to liquidity_indexes."""
+        truth = _Truth()
+        engine = NetLiquidityNowcast(storage=fake_storage)  # type: ignore[arg-type]
+        engine.prime(truth.weekly_rows())
+
+        engine.update(truth.daily_rows(truth.days[-1:]))
+
+        table, written = fake_storage.ingested[0]
+        assert table == "liquidity_indexes"
+        assert list(written.columns) == ["timestamp", "index_name", "value"]
+        assert written["index_name"].tolist() == ["net_liquidity_nowcast"]
+
+    @pytest.mark.benchmark
+    def test_update_cost_independent_of_history(self) -> None:
+        """A new day costs the same after twenty years of history."""
+        truth = _Truth("2004-01-01", "2024-06-28")
+        history = pd.concat([truth.weekly_rows(), truth.daily_rows()])
+        last = history["timestamp"] == truth.days[-1]
+        engine = NetLiquidityNowcast()
+        engine.prime(history[~last])
+
+        started = time.perf_counter()
+        days = engine.update(history[last])
+        elapsed = time.perf_counter() - started
+
+        assert len(days) == 1
+        assert elapsed < 0.05
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
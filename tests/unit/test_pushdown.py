@@ -0,0 +1,131 @@
+"""Unit tests for server-side derived series (query pushdown).
+
+SQL is inspected as text and ``query`` is replaced; QuestDB is not contacted.
+
+Run with: uv run pytest tests/unit/test_pushdown.py -v
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from liquidity.storage import QuestDBStorage, SnapshotStore
+from liquidity.storage.pushdown import net_liquidity_sql, series_leg, yield_spread_sql
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> QuestDBStorage:
+    """Storage with a temporary snapshot and no spool."""
+    storage = QuestDBStorage(snapshot=SnapshotStore(tmp_path))
+    storage.spool = None
+    return storage
+
+
+class TestPushdownSQL:
+    """Unit tests for the generated SQL."""
+
+    def test_net_liquidity_uses_asof_join(self) -> None:
+        """RRP and TGA are aligned to WALCL with ASOF JOIN."""
+        sql, _params = net_liquidity_sql()
+
+        assert sql.count("ASOF JOIN") == 2
+        assert "a.walcl - b.rrp - c.tga" in sql
+
+    def test_unit_conversion_in_sql(self) -> None:
+        """Billions are converted to millions from the stored unit."""
+        sql, _params = net_liquidity_sql()
+
+        assert "WHEN 'billions_usd' THEN 1000.0" in sql
+        assert "* 1000)" not in sql
+
+    def test_time_filter_on_left_leg_only(self) -> None:
+        """The start bound prunes WALCL; right legs keep earlier rows for as-of matches."""
+        start, end = datetime(2024, 1, 1), datetime(2024, 6, 30)
+        sql, params = net_liquidity_sql(start=start, end=end)
+
+        assert sql.count("timestamp >= %s") == 1
+        assert sql.count("timestamp <= %s") == 3
+        assert params == ["WALCL", start, end, "WLRRAL", end, "WDTGAL", end]
+
+    def test_values_are_bound(self) -> None:
+        """Series ids and bounds are parameters, never part of the SQL text."""
+        sql, params = series_leg("DGS10'--", "dgs10", end=datetime(2024, 6, 30))
+
+        assert "DGS10" not in sql
+        assert "2024" not in sql
+        assert params == ["DGS10'--", datetime(2024, 6, 30)]
+
+    def test_sample_by_leg(self) -> None:
+        """freq resamples each leg with SAMPLE BY ... FILL(PREV)."""
+        leg, _params = series_leg("DGS10", "dgs10", freq="1d")
+
+        assert "last(value) AS dgs10" in leg
+        assert "SAMPLE BY 1d FILL(PREV)" in leg
+
+    def test_yield_spread(self) -> None:
+        """The spread is DGS10 minus as-of DGS2, without unit scaling."""
+        sql, params = yield_spread_sql()
+
+        assert "a.dgs10 - b.dgs2" in sql
+        assert params == ["DGS10", "DGS2"]
+        assert "CASE unit" not in sql
+
+
+class TestComputeDerived:
+    """Unit tests for QuestDBStorage pushdown methods."""
+
+    def test_net_liquidity_frame(
+        self, storage: QuestDBStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The final series comes back in one query, shaped like the collector output."""
+        queries: list[tuple[str, list[Any] | None]] = []
+
+        def fake_query(sql: str, params: list[Any] | None = None) -> list[dict[str, Any]]:
+            queries.append((sql, params))
+            return [{"timestamp": datetime(2024, 1, 3), "value": 5.75e6}]
+
+        monkeypatch.setattr(storage, "query", fake_query)
+
+        result = storage.compute_net_liquidity()
+
+        assert len(queries) == 1
+        assert queries[0][1] == ["WALCL", "WLRRAL", "WDTGAL"]
+        assert list(result.columns) == ["timestamp", "net_liquidity", "unit"]
+        assert result["net_liquidity"].tolist() == [5.75e6]
+        assert result["unit"].iloc[0] == "millions_usd"
+
+    def test_materialize_writes_indexes(
+        self, storage: QuestDBStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """materialize=True ingests the result into liquidity_indexes."""
+        sent: list[tuple[str, pd.DataFrame]] = []
+
+        def record(table: str, df: pd.DataFrame, _ts: str, _symbols: list[str]) -> int:
+            sent.append((table, df))
+            return len(df)
+
+        monkeypatch.setattr(
+            storage,
+            "query",
+            lambda _sql, _params=None: [{"timestamp": datetime(2024, 1, 3), "value": 0.4}],
+        )
+        monkeypatch.setattr(storage, "_send", record)
+
+        storage.compute_yield_spread(materialize=True)
+
+        table, df = sent[0]
+        assert table == "liquidity_indexes"
+        assert df["index_name"].tolist() == ["yield_spread"]
+        assert df["value"].tolist() == [0.4]
+
+    def test_invalid_freq(self, storage: QuestDBStorage) -> None:
+        """freq is validated before building SQL."""
+        with pytest.raises(ValueError, match="Invalid SAMPLE BY"):
+            storage.compute_net_liquidity(freq="1d'--")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,270 @@
+"""Unit tests for the streaming anomaly and gap detector.
+
+Run with: uv run pytest tests/unit/test_quality.py -v
+"""
+
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.quality import AnomalyDetector, Issue
+from liquidity.storage import DATA_QUALITY_TABLE, DuckDBStorage
+from liquidity.storage.schemas import ALL_SCHEMAS
+from liquidity.storage.snapshot import SnapshotStore
+from tests.conftest import FakeStorage
+
+NOW = datetime(2024, 6, 7, 12, 0, tzinfo=UTC)
+
+
+def _rows(series_id: str, timestamps: pd.DatetimeIndex, values: np.ndarray) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "series_id": series_id,
+            "source": "fred",
+            "value": values,
+            "unit": "millions_usd",
+        }
+    )
+
+
+def _walcl(weeks: int = 120, seed: int = 0) -> pd.DataFrame:
+    """Weekly H.4.1 Wednesdays ending before NOW."""
+    rng = np.random.default_rng(seed)
+    timestamps = pd.date_range(end="2024-06-05", periods=weeks, freq="W-WED")
+    return _rows("WALCL", timestamps, 7_000_000 + np.cumsum(rng.normal(0, 10_000, weeks)))
+
+
+def _detector(**kwargs: object) -> AnomalyDetector:
+    return AnomalyDetector(clock=lambda: NOW, **kwargs)  # type: ignore[arg-type]
+
+
+class TestOutliers:
+    """Unit tests for the jump test."""
+
+    def test_jump_flagged(self) -> None:
+        """A 3-sigma jump is flagged with its z-score."""
+        df = _walcl()
+        df.loc[100:, "value"] += 200_000
+
+        flags = _detector().audit(df)
+
+        assert flags["timestamp"].tolist() == [df["timestamp"].iloc[100]]
+        assert flags["issue"].tolist() == ["outlier"]
+        assert flags["score"].iloc[0] > 3
+
+    def test_matches_pandas(self) -> None:
+        """Scores are z-scores against the previous window of changes."""
+        df = _walcl()
+        detector = _detector(window=20, threshold=1.0)
+
+        flags = detector.audit(df).set_index("timestamp")["score"]
+
+        changes = df["value"].diff()
+        rolling = changes.rolling(20, min_periods=20)
+        expected = ((changes - rolling.mean().shift(1)) / rolling.std().shift(1)).set_axis(
+            df["timestamp"]
+        )
+        expected = expected[expected.abs() > 1.0]
+        pd.testing.assert_series_equal(
+            flags, expected, check_names=False, check_index_type=False, check_freq=False
+        )
+
+    def test_streaming_matches_audit(self) -> None:
+        """Checking release by release raises the audit's flags."""
+        df = _walcl(200)
+        df.loc[[60, 150], "value"] += 150_000
+        detector = _detector()
+
+        streamed = pd.concat([detector.check(df.iloc[[i]]) for i in range(len(df))])
+
+        audit = _detector().audit(df)
+        pd.testing.assert_frame_equal(streamed.reset_index(drop=True), audit)
+
+    def test_revisions_not_scored(self) -> None:
+        """Rows at or before the latest observation skip the jump test."""
+        df = _walcl()
+        detector = _detector()
+        detector.prime(df)
+
+        revision = df.iloc[[50]].assign(value=1.0)
+
+        assert detector.check(revision).empty
+
+
+class TestGaps:
+    """Unit tests for cadence gaps."""
+
+    def test_missing_h41_print(self) -> None:
+        """A skipped Wednesday is flagged at the missing date."""
+        df = _walcl().drop(index=[80, 81]).reset_index(drop=True)
+
+        flags = _detector().audit(df)
+
+        missing = _walcl()["timestamp"].iloc[80]
+        assert flags["timestamp"].tolist() == [missing]
+        assert flags["issue"].tolist() == ["gap"]
+        assert flags["score"].tolist() == [2.0]
+
+    def test_daily_holiday_tolerated(self) -> None:
+        """A missing business day is a holiday; a missing week is a gap."""
+        days = pd.bdate_range("2024-01-02", "2024-03-29")
+        keep = np.ones(len(days), dtype=bool)
+        keep[10] = False
+        keep[40:45] = False
+        df = _rows("SOFR", days[keep], np.full(keep.sum(), 5.3))
+
+        flags = _detector().audit(df)
+
+        assert flags["timestamp"].tolist() == [days[40]]
+        assert flags["score"].tolist() == [5.0]
+
+    def test_monthly_gap(self) -> None:
+        """A missing month of a monthly series is flagged."""
+        months = pd.date_range("2020-01-01", periods=24, freq="MS").delete(10)
+        df = _rows("JPNASSETS", months, np.linspace(6e6, 7e6, len(months)))
+
+        flags = _detector().audit(df)
+
+        assert flags["timestamp"].tolist() == [pd.Timestamp("2020-11-01")]
+
+    def test_overdue_release(self) -> None:
+        """A print the calendar expected by now is flagged as missing."""
+        detector = _detector()
+        detector.prime(_walcl().iloc[:-2])
+
+        flags = detector.overdue()
+
+        assert flags["timestamp"].tolist() == [pd.Timestamp("2024-05-29")]
+        assert flags["score"].tolist() == [2.0]
+        assert _detector().overdue().empty
+
+
+class TestTimestamps:
+    """Unit tests for timestamp anomalies."""
+
+    def test_fetch_time_flagged(self) -> None:
+        """Scraper fallbacks stamped with now() carry a time of day."""
+        df = pd.concat(
+            [
+                _rows("PBOC_TOTAL_ASSETS", pd.DatetimeIndex([datetime.now(UTC)]), [450_000.0]),
+                _rows("BOE_TOTAL_ASSETS", pd.DatetimeIndex([pd.Timestamp.now()]), [900_000.0]),
+                _rows("WALCL", pd.DatetimeIndex(["2024-06-05"], tz="America/New_York"), [7e6]),
+            ]
+        )
+
+        flags = AnomalyDetector().audit(df)
+
+        assert set(flags["series_id"]) == {"PBOC_TOTAL_ASSETS", "BOE_TOTAL_ASSETS"}
+        assert set(flags["issue"]) == {"fetch_time"}
+
+    def test_future_flagged(self) -> None:
+        """Observations dated after the check are flagged."""
+        df = _rows("^MOVE", pd.DatetimeIndex(["2024-06-07", "2024-06-10"]), [100.0, 101.0])
+
+        flags = _detector().audit(df)
+
+        assert flags["timestamp"].tolist() == [pd.Timestamp("2024-06-10")]
+        assert flags["issue"].tolist() == [Issue.FUTURE]
+
+    def test_one_row_per_issue(self) -> None:
+        """Several issues of one observation are separate rows."""
+        df = _rows("WALCL", pd.DatetimeIndex(["2024-07-03 10:15"]), [7e6])
+
+        flags = _detector().audit(df)
+
+        assert flags["issue"].tolist() == ["fetch_time", "future"]
+        assert flags["timestamp"].nunique() == 1
+
+
+class TestPersistence:
+    """Unit tests for flag output."""
+
+    def test_flags_written_and_published(self, fake_storage: FakeStorage) -> None:
+        """Flags go to data_quality and to subscribers."""
+        detector = _detector(storage=fake_storage)
+        received: list[pd.DataFrame] = []
+        detector.subscribe(received.append)
+        df = _walcl().drop(index=[80]).reset_index(drop=True)
+
+        detector.check(df)
+
+        table, written = fake_storage.ingested[0]
+        assert table == DATA_QUALITY_TABLE
+        assert list(written.columns) == ["timestamp", "series_id", "issue", "value", "score"]
+        assert len(received) == 1
+
+    def test_prime_writes_nothing(self, fake_storage: FakeStorage) -> None:
+        """Priming loads state only."""
+        _detector(storage=fake_storage).prime(_walcl().drop(index=[80]))
+
+        assert fake_storage.ingested == []
+
+    def test_embedded_table(self, tmp_path: Path) -> None:
+        """The embedded backend stores flags."""
+        storage = DuckDBStorage(tmp_path)
+        storage.create_tables()
+        flags = _detector().audit(_walcl().drop(index=[80]).reset_index(drop=True))
+
+        storage.ingest_dataframe(DATA_QUALITY_TABLE, flags)
+
+        rows = storage.query("SELECT series_id, issue, score FROM data_quality")
+        assert rows == [{"series_id": "WALCL", "issue": "gap", "score": 1.0}]
+
+    def test_issues_of_one_observation_kept(self, tmp_path: Path) -> None:
+        """Two issues at one timestamp are both stored, not upserted over each other."""
+        storage = DuckDBStorage(tmp_path)
+        storage.create_tables()
+        df = _rows("WALCL", pd.DatetimeIndex(["2024-07-03 10:15"]), [7e6])
+        flags = _detector().audit(df)
+
+        storage.ingest_dataframe(DATA_QUALITY_TABLE, flags)
+        storage.ingest_dataframe(DATA_QUALITY_TABLE, flags)
+
+        rows = storage.query("SELECT issue FROM data_quality ORDER BY issue")
+        assert [row["issue"] for row in rows] == ["fetch_time", "future"]
+
+    def test_snapshot_keeps_every_issue(self, tmp_path: Path) -> None:
+        """The snapshot mirror dedups on the same keys as the table."""
+        store = SnapshotStore(tmp_path)
+        df = _rows("WALCL", pd.DatetimeIndex(["2024-07-03 10:15"]), [7e6])
+
+        store.write(DATA_QUALITY_TABLE, _detector().audit(df))
+
+        stored = store.read(DATA_QUALITY_TABLE, ["WALCL"])
+        assert sorted(stored["issue"]) == ["fetch_time", "future"]
+
+    def test_questdb_dedup_keys_include_issue(self) -> None:
+        """The QuestDB table upserts per issue."""
+        ddl = "\n".join(ALL_SCHEMAS)
+
+        assert "UPSERT KEYS(timestamp, series_id, issue)" in ddl
+
+    @pytest.mark.benchmark
+    def test_full_audit_is_fast(self) -> None:
+        """Thirty daily series over thirty years are audited in seconds."""
+        rng = np.random.default_rng(0)
+        days = pd.bdate_range("1994-01-03", "2023-12-29")
+        df = pd.concat(
+            [
+                _rows(f"S{i}", days, np.cumsum(rng.normal(0, 1, len(days))))
+                for i in range(30)
+            ],
+            ignore_index=True,
+        )
+        detector = AnomalyDetector(schedules=[])
+
+        started = time.perf_counter()
+        flags = detector.audit(df)
+        elapsed = time.perf_counter() - started
+
+        assert not flags.empty
+        assert elapsed < 5.0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
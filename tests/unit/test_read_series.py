@@ -0,0 +1,113 @@
+"""Unit tests for QuestDBStorage.read_series (wide, aligned reads).
+
+QuestDB is not contacted: the snapshot store serves native reads and
+``query`` is replaced to capture SAMPLE BY SQL.
+
+Run with: uv run pytest tests/unit/test_read_series.py -v
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from liquidity.storage import QuestDBStorage, SnapshotStore
+
+
+def _raw_frame(series_id: str, dates: list[str], values: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(dates),
+            "series_id": series_id,
+            "source": "fred",
+            "value": values,
+            "unit": "millions_usd",
+        }
+    )
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> QuestDBStorage:
+    """Storage whose snapshot holds a weekly and a daily series."""
+    store = SnapshotStore(tmp_path)
+    store.write("raw_data", _raw_frame("WALCL", ["2024-01-03", "2024-01-10"], [7.0e6, 7.1e6]))
+    dates = ["2024-01-03", "2024-01-04", "2024-01-05"]
+    store.write("raw_data", _raw_frame("DGS10", dates, [4.0, 4.1, 4.2]))
+    for series_id in ("WALCL", "DGS10"):
+        store.record_coverage("raw_data", series_id)
+    storage = QuestDBStorage(snapshot=store)
+    storage.spool = None
+    return storage
+
+
+class TestReadSeries:
+    """Unit tests for read_series."""
+
+    def test_wide_frame_native_timestamps(self, storage: QuestDBStorage) -> None:
+        """One column per series, indexed by timestamp, forward-filled."""
+        wide = storage.read_series(["WALCL", "DGS10"])
+
+        assert list(wide.columns) == ["WALCL", "DGS10"]
+        assert wide.index.name == "timestamp"
+        assert len(wide) == 4
+        # WALCL carried forward onto the daily DGS10 dates
+        assert wide.loc["2024-01-05", "WALCL"] == 7.0e6
+
+    def test_no_fill_keeps_gaps(self, storage: QuestDBStorage) -> None:
+        """fill=None leaves unaligned observations as NaN."""
+        wide = storage.read_series(["WALCL", "DGS10"], fill=None)
+
+        assert pd.isna(wide.loc["2024-01-04", "WALCL"])
+
+    def test_time_range(self, storage: QuestDBStorage) -> None:
+        """start/end bound the returned rows."""
+        wide = storage.read_series(
+            ["DGS10"], start=datetime(2024, 1, 4), end=datetime(2024, 1, 4)
+        )
+
+        assert wide["DGS10"].tolist() == [4.1]
+
+    def test_sample_by_pushdown(
+        self, storage: QuestDBStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """freq resamples server-side with SAMPLE BY ... FILL(PREV)."""
+        queries: list[tuple[str, list[Any] | None]] = []
+
+        def fake_query(sql: str, params: list[Any] | None = None) -> list[dict[str, Any]]:
+            queries.append((sql, params))
+            return [
+                {"timestamp": datetime(2024, 1, 1), "series_id": "WALCL", "value": 7.0e6},
+                {"timestamp": datetime(2024, 1, 8), "series_id": "WALCL", "value": 7.1e6},
+            ]
+
+        monkeypatch.setattr(storage, "query", fake_query)
+
+        wide = storage.read_series(["WALCL"], start=datetime(2024, 1, 1), freq="1w")
+
+        sql, params = queries[0]
+        assert "SAMPLE BY 1w FILL(PREV)" in sql
+        assert "timestamp >= %s" in sql
+        assert params == ["WALCL", datetime(2024, 1, 1)]
+        assert wide["WALCL"].tolist() == [7.0e6, 7.1e6]
+
+    def test_missing_series_column(
+        self, storage: QuestDBStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Requested series without data still get a column."""
+        monkeypatch.setattr(storage, "query", lambda _sql, _params=None: [])
+
+        wide = storage.read_series(["WALCL", "MISSING"], end=datetime(2024, 1, 3))
+
+        assert list(wide.columns) == ["WALCL", "MISSING"]
+        assert wide["MISSING"].isna().all()
+
+    def test_invalid_freq(self, storage: QuestDBStorage) -> None:
+        """SAMPLE BY intervals are validated before building SQL."""
+        with pytest.raises(ValueError, match="Invalid SAMPLE BY"):
+            storage.read_series(["WALCL"], freq="1w; DROP TABLE raw_data")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
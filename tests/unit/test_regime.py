@@ -0,0 +1,171 @@
+"""Unit tests for the incremental regime classifier.
+
+Run with: uv run pytest tests/unit/test_regime.py -v
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.analysis import Regime, RegimeClassifier
+from tests.conftest import FakeStorage
+
+
+def _index_frame(index_name: str, values: np.ndarray) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2020-01-01", periods=len(values), freq="W-WED"),
+            "index_name": index_name,
+            "value": values,
+        }
+    )
+
+
+def _random_walk(n: int = 300, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 6_000_000 + np.cumsum(rng.normal(0, 20_000, n))
+
+
+class TestRegimeClassifier:
+    """Unit tests for RegimeClassifier."""
+
+    def test_streaming_matches_batch(self) -> None:
+        """Point-by-point classification reproduces the batch regimes."""
+        df = _index_frame("net_liquidity", _random_walk())
+        classifier = RegimeClassifier(window=20, periods=4)
+
+        transitions = pd.concat(
+            [classifier.update(df.iloc[[i]]) for i in range(len(df))], ignore_index=True
+        )
+        history = RegimeClassifier(window=20, periods=4).batch(df)
+
+        scored = history.dropna(subset=["regime"])
+        expected = scored[scored["regime"] != scored["regime"].shift()]
+        assert transitions["timestamp"].tolist() == expected["timestamp"].tolist()
+        assert [str(r) for r in transitions["regime"]] == expected["regime"].tolist()
+        np.testing.assert_allclose(
+            transitions["score"].to_numpy(dtype=float), expected["score"].to_numpy(), rtol=1e-9
+        )
+        assert classifier.current("net_liquidity") == Regime(scored["regime"].iloc[-1])
+
+    def test_batch_scores_match_pandas(self) -> None:
+        """Scores are z-scores of the period change over the rolling window."""
+        values = _random_walk(100)
+        history = RegimeClassifier(window=20, periods=4).batch(
+            _index_frame("net_liquidity", values)
+        )
+
+        change = pd.Series(values).diff(4)
+        rolling = change.rolling(20)
+        expected = ((change - rolling.mean()) / rolling.std()).to_numpy()
+        np.testing.assert_allclose(history["score"].to_numpy(), expected)
+        assert history["regime"].iloc[:23].isna().all()
+
+    def test_hysteresis(self) -> None:
+        """Entered at |z| >= enter, held down to exit, then back to neutral."""
+        classifier = RegimeClassifier(window=20, periods=1, enter=1.0, exit=0.5)
+        scores = np.array([0.0, 1.2, 0.8, 0.6, 0.4, -0.7, -1.5, -0.6, 0.9, -0.2])
+
+        assert classifier._classify(scores).tolist() == [
+            "neutral",
+            "expansionary",
+            "expansionary",
+            "expansionary",
+            "neutral",
+            "neutral",
+            "contractionary",
+            "contractionary",
+            "neutral",
+            "neutral",
+        ]
+
+    def test_expansion_detected(self) -> None:
+        """A surge after a calm year is classified expansionary at once."""
+        values = np.concatenate(
+            [
+                6_000_000 + np.cumsum(np.random.default_rng(1).normal(0, 5_000, 60)),
+                np.zeros(4),
+            ]
+        )
+        values[60:] = values[59] + np.arange(1, 5) * 100_000
+        classifier = RegimeClassifier(window=52, periods=4)
+
+        transitions = classifier.update(_index_frame("net_liquidity", values))
+
+        assert transitions["regime"].iloc[-1] == Regime.EXPANSIONARY
+        assert classifier.current("net_liquidity") == Regime.EXPANSIONARY
+
+    def test_transitions_written_to_regime_column(self, fake_storage: FakeStorage) -> None:
+        """Only transitions are written, under their own index_name."""
+        classifier = RegimeClassifier(storage=fake_storage, window=20, periods=4)  # type: ignore[arg-type]
+        df = _index_frame("net_liquidity", _random_walk())
+
+        transitions = classifier.update(df)
+
+        table, written = fake_storage.ingested[0]
+        assert table == "liquidity_indexes"
+        assert list(written.columns) == ["timestamp", "index_name", "value", "regime"]
+        assert len(written) == len(transitions)
+        # Never the (timestamp, index_name) rows NetLiquidityEngine upserts without a regime
+        assert set(written["index_name"]) == {"net_liquidity_regime"}
+        assert set(written["regime"]) <= {"expansionary", "neutral", "contractionary"}
+
+    def test_batch_persist(self, fake_storage: FakeStorage) -> None:
+        """Batch persistence writes the same transitions as streaming."""
+        df = _index_frame("net_liquidity", _random_walk())
+
+        RegimeClassifier(storage=fake_storage, window=20).batch(df, persist=True)  # type: ignore[arg-type]
+        streamed = RegimeClassifier(window=20).update(df)
+
+        _, written = fake_storage.ingested[0]
+        assert written["timestamp"].tolist() == streamed["timestamp"].tolist()
+        assert set(written["index_name"]) == {"net_liquidity_regime"}
+
+    def test_prime_then_update(self) -> None:
+        """Priming from history continues exactly like streaming from the start."""
+        df = _index_frame("net_liquidity", _random_walk())
+        streamed = RegimeClassifier(window=20)
+        streamed.update(df.iloc[:-1])
+        expected = streamed.update(df.iloc[[-1]])
+
+        primed = RegimeClassifier(window=20)
+        primed.prime(df.iloc[:-1])
+        result = primed.update(df.iloc[[-1]])
+
+        pd.testing.assert_frame_equal(result, expected)
+        assert primed.current("net_liquidity") == streamed.current("net_liquidity")
+
+    def test_wide_input_and_independent_indexes(self) -> None:
+        """Calculator output with one column per index is accepted."""
+        wide = pd.DataFrame(
+            {
+                "timestamp": pd.date_range("2020-01-01", periods=120, freq="W-WED"),
+                "net_liquidity": _random_walk(120, seed=1),
+                "global_liquidity": _random_walk(120, seed=2) * 5,
+                "unit": "millions_usd",
+            }
+        )
+
+        history = RegimeClassifier(window=20).batch(wide)
+
+        assert set(history["index_name"]) == {"net_liquidity", "global_liquidity"}
+        assert len(history) == 240
+
+    def test_revisions_skipped(self) -> None:
+        """Points not after the latest classified one are ignored."""
+        df = _index_frame("net_liquidity", _random_walk(30))
+        classifier = RegimeClassifier(window=5)
+        classifier.update(df)
+        before = classifier.current("net_liquidity")
+
+        assert classifier.update(df.iloc[[3]].assign(value=0.0)).empty
+        assert classifier.current("net_liquidity") == before
+
+    def test_invalid_thresholds(self) -> None:
+        """exit must not exceed enter."""
+        with pytest.raises(ValueError, match="exit"):
+            RegimeClassifier(enter=0.5, exit=1.0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
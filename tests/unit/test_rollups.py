@@ -0,0 +1,286 @@
+"""Unit tests for rollup tables (incremental SAMPLE BY maintenance and reads).
+
+SQL is captured by replacing ``query``/``execute``; QuestDB is not contacted.
+
+Run with: uv run pytest tests/unit/test_rollups.py -v
+"""
+
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from liquidity.config import Settings
+from liquidity.storage import QuestDBStorage, QuestDBStorageError, SnapshotStore
+from liquidity.storage.rollups import ROLLUPS, refresh_sql, select_rollup
+from liquidity.storage.schemas import ALL_SCHEMAS
+
+
+def _raw_frame(series_id: str, dates: list[str], values: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(dates),
+            "series_id": series_id,
+            "source": "fred",
+            "value": values,
+            "unit": "millions_usd",
+        }
+    )
+
+
+@pytest.fixture
+def executed() -> list[tuple[str, list[Any] | None]]:
+    """Statements (and parameters) sent through QuestDBStorage.execute."""
+    return []
+
+
+def _recorder(
+    executed: list[tuple[str, list[Any] | None]],
+) -> Callable[[str, list[Any] | None], None]:
+    """Return an execute stand-in that records its statements."""
+
+    def execute(sql: str, params: list[Any] | None = None) -> None:
+        executed.append((sql, params))
+
+    return execute
+
+
+@pytest.fixture
+def storage(
+    tmp_path: Path,
+    executed: list[tuple[str, list[Any] | None]],
+    monkeypatch: pytest.MonkeyPatch,
+) -> QuestDBStorage:
+    """Storage with WAL always applied and captured statements."""
+    storage = QuestDBStorage(snapshot=SnapshotStore(tmp_path))
+    storage.spool = None
+
+    def fake_query(sql: str, _params: list[Any] | None = None) -> list[dict[str, Any]]:
+        if "wal_tables()" in sql:
+            return [{"writerTxn": 1, "sequencerTxn": 1}]
+        return []
+
+    monkeypatch.setattr(storage, "query", fake_query)
+    monkeypatch.setattr(storage, "execute", _recorder(executed))
+    return storage
+
+
+class FakeSender:
+    """Stand-in for the ILP Sender that accepts every batch."""
+
+    @classmethod
+    def from_conf(cls, _conf: str) -> "FakeSender":
+        return cls()
+
+    def __enter__(self) -> "FakeSender":
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc: BaseException | None,
+        _tb: TracebackType | None,
+    ) -> None:
+        pass
+
+    def dataframe(self, _df: pd.DataFrame, **_kwargs: Any) -> None:
+        pass
+
+
+class TestRollupSelection:
+    """Unit tests for picking the coarsest rollup."""
+
+    @pytest.mark.parametrize(
+        ("freq", "expected"),
+        [
+            ("1M", "monthly"),
+            ("3M", "monthly"),
+            ("1y", "monthly"),
+            ("1w", "weekly"),
+            ("2w", "weekly"),
+            ("1d", "bday"),
+            ("5d", "bday"),
+            ("6h", None),
+        ],
+    )
+    def test_select_rollup(self, freq: str, expected: str | None) -> None:
+        """Rollups are only used when their buckets nest in the interval."""
+        rollup = select_rollup(freq)
+        assert (rollup.name if rollup else None) == expected
+
+    def test_rollup_tables_created(self) -> None:
+        """create_tables creates every rollup of both base tables."""
+        ddl = "\n".join(ALL_SCHEMAS)
+        for rollup in ROLLUPS:
+            assert f"raw_data_{rollup.name} (" in ddl
+            assert f"liquidity_indexes_{rollup.name} (" in ddl
+
+
+class TestRefreshSQL:
+    """Unit tests for incremental refresh statements."""
+
+    def test_weekly_starts_at_bucket(self) -> None:
+        """Recomputation starts at the Monday of the changed week."""
+        weekly = next(r for r in ROLLUPS if r.name == "weekly")
+        sql, params = refresh_sql("raw_data", weekly, "WALCL", datetime(2024, 1, 11))
+
+        assert sql.startswith("INSERT INTO raw_data_weekly")
+        assert "series_id = %s AND timestamp >= %s" in sql
+        assert params == ["WALCL", datetime(2024, 1, 8)]
+        assert "SAMPLE BY 1w" in sql
+
+    def test_business_day_fills_and_drops_weekends(self) -> None:
+        """The business-day rollup is forward-filled on a weekday grid."""
+        bday = next(r for r in ROLLUPS if r.name == "bday")
+        sql, params = refresh_sql(
+            "liquidity_indexes", bday, "net_liquidity", datetime(2024, 1, 3)
+        )
+
+        assert "index_name = %s" in sql
+        assert params == ["net_liquidity", datetime(2024, 1, 3)]
+        assert "FILL(PREV, PREV, PREV, 0)" in sql
+        assert "day_of_week(timestamp) <= 5" in sql
+
+
+class TestRollupMaintenance:
+    """Unit tests for QuestDBStorage rollup maintenance and reads."""
+
+    def test_refresh_touched_keys_only(
+        self, storage: QuestDBStorage, executed: list[tuple[str, list[Any] | None]]
+    ) -> None:
+        """Each changed key is refreshed once per rollup from its earliest change."""
+        storage._mark_rollups_dirty(
+            "raw_data", _raw_frame("WALCL", ["2024-02-07", "2024-01-31"], [1, 2]), "timestamp"
+        )
+
+        assert storage.refresh_rollups() == 1
+        assert len(executed) == len(ROLLUPS)
+        assert all(params is not None and params[0] == "WALCL" for _, params in executed)
+        monthly = next(params for sql, params in executed if "raw_data_monthly" in sql)
+        assert monthly == ["WALCL", datetime(2024, 1, 1)]
+        assert storage.refresh_rollups() == 0
+
+    def test_failed_refresh_is_retried(
+        self, storage: QuestDBStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Dirty buckets survive a failed refresh."""
+        storage._mark_rollups_dirty(
+            "raw_data", _raw_frame("WALCL", ["2024-01-03"], [1]), "timestamp"
+        )
+
+        def down(_sql: str, _params: list[Any] | None = None) -> None:
+            raise QuestDBStorageError("connection refused")
+
+        monkeypatch.setattr(storage, "execute", down)
+        with pytest.raises(QuestDBStorageError):
+            storage.refresh_rollups()
+
+        monkeypatch.setattr(storage, "execute", lambda _sql, _params=None: None)
+        assert storage.refresh_rollups() == 1
+
+    def test_read_uses_coarsest_rollup(
+        self, storage: QuestDBStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A quarterly read scans the monthly rollup."""
+        queries: list[str] = []
+
+        def fake_query(sql: str, _params: list[Any] | None = None) -> list[dict[str, Any]]:
+            queries.append(sql)
+            return [{"timestamp": datetime(2024, 1, 1), "series_id": "WALCL", "value": 1.0}]
+
+        monkeypatch.setattr(storage, "query", fake_query)
+
+        storage.read_series(["WALCL"], freq="3M")
+
+        assert "FROM raw_data_monthly" in queries[0]
+        assert "SAMPLE BY 3M" in queries[0]
+
+    def test_read_falls_back_to_raw(
+        self, storage: QuestDBStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """If a rollup cannot be read, raw_data serves the query."""
+        queries: list[str] = []
+
+        def fake_query(sql: str, _params: list[Any] | None = None) -> list[dict[str, Any]]:
+            queries.append(sql)
+            if "raw_data_weekly" in sql:
+                raise QuestDBStorageError("table does not exist")
+            return []
+
+        monkeypatch.setattr(storage, "query", fake_query)
+
+        storage.read_series(["WALCL"], freq="1w")
+
+        assert "FROM raw_data\n" in queries[-1]
+
+    @pytest.mark.parametrize(("fill", "observed_only"), [("ffill", False), ("null", True)])
+    def test_unfilled_reads_skip_filled_buckets(
+        self,
+        storage: QuestDBStorage,
+        monkeypatch: pytest.MonkeyPatch,
+        fill: str,
+        observed_only: bool,
+    ) -> None:
+        """Forward-filled business days only serve fill='ffill' reads."""
+        queries: list[str] = []
+
+        def fake_query(sql: str, _params: list[Any] | None = None) -> list[dict[str, Any]]:
+            queries.append(sql)
+            return []
+
+        monkeypatch.setattr(storage, "query", fake_query)
+
+        storage.read_series(["WALCL"], freq="1d", fill=fill)
+
+        assert "FROM raw_data_bday" in queries[0]
+        assert ("samples > 0" in queries[0]) is observed_only
+
+    def test_refresh_runs_in_background(
+        self,
+        tmp_path: Path,
+        executed: list[tuple[str, list[Any] | None]],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Ingestion returns before the refresh; stale series read raw_data meanwhile."""
+        monkeypatch.setattr("liquidity.storage.questdb.Sender", FakeSender)
+        storage = QuestDBStorage(
+            settings=Settings(rollup_refresh_delay=0.2, spool_enabled=False),
+            snapshot=SnapshotStore(tmp_path),
+        )
+        queries: list[str] = []
+
+        def fake_query(sql: str, _params: list[Any] | None = None) -> list[dict[str, Any]]:
+            if "wal_tables()" in sql:
+                return [{"writerTxn": 1, "sequencerTxn": 1}]
+            queries.append(sql)
+            return []
+
+        monkeypatch.setattr(storage, "query", fake_query)
+        monkeypatch.setattr(storage, "execute", _recorder(executed))
+        try:
+            assert storage.ingest_dataframe(
+                "raw_data", _raw_frame("WALCL", ["2024-01-03"], [1.0])
+            ) == 1
+            assert executed == []
+
+            storage.read_series(["WALCL"], freq="1w")
+            assert "FROM raw_data\n" in queries[-1]
+
+            deadline = time.monotonic() + 5.0
+            while len(executed) < len(ROLLUPS) and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert len(executed) == len(ROLLUPS)
+
+            storage.read_series(["WALCL"], freq="1w")
+            assert "FROM raw_data_weekly" in queries[-1]
+        finally:
+            storage.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,251 @@
+"""Unit tests for the release-calendar aware refresh scheduler.
+
+Run with: uv run pytest tests/unit/test_scheduler.py -v
+"""
+
+import random
+from datetime import UTC, datetime, time, timedelta
+
+import pandas as pd
+import pytest
+
+from liquidity.scheduler import (
+    RELEASE_CALENDAR,
+    Cadence,
+    RefreshScheduler,
+    ReleaseEvent,
+    ReleaseSchedule,
+)
+
+# Monday 2024-01-08 12:00 UTC
+MONDAY = datetime(2024, 1, 8, 12, 0, tzinfo=UTC)
+# H.4.1 release: Thursday 2024-01-11 16:30 ET = 21:30 UTC
+H41_RELEASE = datetime(2024, 1, 11, 21, 30, tzinfo=UTC)
+
+
+class FakeFetcher:
+    """Records calls and returns a configurable frame."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, list[str], datetime]] = []
+        self.frame = pd.DataFrame(columns=["timestamp", "series_id", "value"])
+
+    async def __call__(
+        self, collector: str, series_ids: list[str], since: datetime
+    ) -> pd.DataFrame:
+        self.calls.append((collector, series_ids, since))
+        return self.frame
+
+    def publish(self, timestamp: str, series_ids: list[str]) -> None:
+        self.frame = pd.DataFrame(
+            {
+                "timestamp": pd.to_datetime([timestamp] * len(series_ids)),
+                "series_id": series_ids,
+                "value": [1.0] * len(series_ids),
+            }
+        )
+
+
+def _h41_scheduler(fetcher: FakeFetcher) -> RefreshScheduler:
+    schedules = [RELEASE_CALENDAR[s] for s in ["WALCL", "WLRRAL", "WDTGAL"]]
+    return RefreshScheduler(
+        fetcher=fetcher,
+        schedules=schedules,
+        clock=lambda: MONDAY,
+        rng=random.Random(42),
+    )
+
+
+class TestReleaseCalendar:
+    """Unit tests for release schedule arithmetic."""
+
+    def test_weekly_next_release(self) -> None:
+        """H.4.1 series release on Thursday afternoon New York time."""
+        assert RELEASE_CALENDAR["WALCL"].next_release(MONDAY) == H41_RELEASE
+
+    def test_next_release_is_strictly_after(self) -> None:
+        """A release exactly at the reference time is not returned."""
+        nxt = RELEASE_CALENDAR["WALCL"].next_release(H41_RELEASE)
+        assert nxt == H41_RELEASE + timedelta(days=7)
+
+    def test_daily_skips_weekends(self) -> None:
+        """Daily series do not release on Saturday or Sunday."""
+        friday_evening = datetime(2024, 1, 12, 23, 0, tzinfo=UTC)
+        nxt = RELEASE_CALENDAR["SOFR"].next_release(friday_evening)
+        assert nxt.date() == datetime(2024, 1, 15).date()
+
+    def test_monthly_rolls_weekend_forward(self) -> None:
+        """Monthly releases falling on a weekend move to Monday."""
+        schedule = ReleaseSchedule(
+            series_id="TEST",
+            collector="fred",
+            cadence=Cadence.MONTHLY,
+            release_time=time(9, 0),
+            day_of_month=13,  # 2024-01-13 is a Saturday
+        )
+        nxt = schedule.next_release(datetime(2024, 1, 1, tzinfo=UTC))
+        assert nxt.date() == datetime(2024, 1, 15).date()
+
+    def test_expected_releases_in_range(self) -> None:
+        """Four weekly releases in four weeks."""
+        releases = RELEASE_CALENDAR["WALCL"].expected_releases(
+            MONDAY, MONDAY + timedelta(days=28)
+        )
+        assert len(releases) == 4
+        assert all(r.weekday() == 3 for r in releases)
+
+    def test_invalid_schedule(self) -> None:
+        """Weekly schedules require a weekday."""
+        with pytest.raises(ValueError, match="requires weekday"):
+            ReleaseSchedule(
+                series_id="TEST",
+                collector="fred",
+                cadence=Cadence.WEEKLY,
+                release_time=time(9, 0),
+            )
+
+
+class TestRefreshScheduler:
+    """Unit tests for polling and release detection."""
+
+    async def test_initial_poll_groups_by_collector(self) -> None:
+        """All H.4.1 series are fetched with a single collector call."""
+        fetcher = FakeFetcher()
+        scheduler = _h41_scheduler(fetcher)
+
+        await scheduler.poll_once()
+
+        assert len(fetcher.calls) == 1
+        assert fetcher.calls[0][0] == "fred"
+        assert sorted(fetcher.calls[0][1]) == ["WALCL", "WDTGAL", "WLRRAL"]
+
+    async def test_release_emits_event_and_sleeps_until_next(self) -> None:
+        """A detected release triggers handlers and idles until next release."""
+        fetcher = FakeFetcher()
+        fetcher.publish("2024-01-03", ["WALCL", "WLRRAL", "WDTGAL"])
+        scheduler = _h41_scheduler(fetcher)
+        received: list[ReleaseEvent] = []
+
+        async def handler(event: ReleaseEvent) -> None:
+            received.append(event)
+
+        scheduler.subscribe(handler)
+        events = await scheduler.poll_once()
+
+        assert {e.series_id for e in events} == {"WALCL", "WLRRAL", "WDTGAL"}
+        assert received == events
+        state = scheduler.states["WALCL"]
+        assert state.pending_release == H41_RELEASE
+        assert H41_RELEASE <= state.next_poll <= H41_RELEASE + timedelta(minutes=1)
+
+    async def test_no_duplicate_event_for_same_observation(self) -> None:
+        """Polling again with unchanged data emits nothing."""
+        fetcher = FakeFetcher()
+        fetcher.publish("2024-01-03", ["WALCL"])
+        scheduler = _h41_scheduler(fetcher)
+        await scheduler.poll_once()
+
+        events = await scheduler.poll_once(now=H41_RELEASE + timedelta(minutes=1))
+
+        assert events == []
+
+    async def test_dense_polling_inside_window(self) -> None:
+        """Missing data inside the release window is retried within minutes."""
+        fetcher = FakeFetcher()
+        fetcher.publish("2024-01-03", ["WALCL"])
+        scheduler = _h41_scheduler(fetcher)
+        await scheduler.poll_once()
+
+        poll_time = H41_RELEASE + timedelta(minutes=1)
+        await scheduler.poll_once(now=poll_time)
+
+        delay = scheduler.states["WALCL"].next_poll - poll_time
+        assert delay <= scheduler.dense_interval * (1 + scheduler.jitter)
+
+    async def test_backoff_after_window(self) -> None:
+        """A late release backs off exponentially."""
+        fetcher = FakeFetcher()
+        fetcher.publish("2024-01-03", ["WALCL"])
+        scheduler = _h41_scheduler(fetcher)
+        await scheduler.poll_once()
+
+        late = H41_RELEASE + timedelta(hours=3)
+        await scheduler.poll_once(now=late)
+        retry = scheduler.states["WALCL"].next_poll
+        first = retry - late
+        await scheduler.poll_once(now=retry)
+        second = scheduler.states["WALCL"].next_poll - retry
+
+        assert scheduler.states["WALCL"].misses == 2
+        assert second > first
+
+    async def test_new_release_detected_after_wait(self) -> None:
+        """Data published after the expected release is picked up."""
+        fetcher = FakeFetcher()
+        fetcher.publish("2024-01-03", ["WALCL"])
+        scheduler = _h41_scheduler(fetcher)
+        await scheduler.poll_once()
+
+        fetcher.publish("2024-01-10", ["WALCL"])
+        events = await scheduler.poll_once(now=H41_RELEASE + timedelta(minutes=5))
+
+        assert len(events) == 1
+        assert events[0].observation_time == datetime(2024, 1, 10, tzinfo=UTC)
+        assert scheduler.states["WALCL"].pending_release == H41_RELEASE + timedelta(
+            days=7
+        )
+
+    async def test_fetch_failure_does_not_raise(self) -> None:
+        """Fetch errors are logged and treated as no release."""
+
+        async def failing(
+            _collector: str, _series_ids: list[str], _since: datetime
+        ) -> pd.DataFrame:
+            raise RuntimeError("boom")
+
+        scheduler = RefreshScheduler(
+            fetcher=failing,
+            schedules=[RELEASE_CALENDAR["SOFR"]],
+            clock=lambda: MONDAY,
+        )
+
+        assert await scheduler.poll_once() == []
+        assert scheduler.states["SOFR"].next_poll > MONDAY
+
+    async def test_fallback_series_matches_schedule(self) -> None:
+        """Rows from a collector's fallback tier count as the scheduled release."""
+        fetcher = FakeFetcher()
+        fetcher.publish("2023-11-30", ["CHINA_FOREIGN_RESERVES"])
+        scheduler = RefreshScheduler(
+            fetcher=fetcher,
+            schedules=[RELEASE_CALENDAR["PBOC_TOTAL_ASSETS"]],
+            clock=lambda: MONDAY,
+        )
+
+        events = await scheduler.poll_once()
+
+        assert [event.series_id for event in events] == ["PBOC_TOTAL_ASSETS"]
+        assert events[0].data["series_id"].tolist() == ["CHINA_FOREIGN_RESERVES"]
+        assert scheduler.states["PBOC_TOTAL_ASSETS"].misses == 0
+
+    async def test_weekly_schedule_polls_far_less_than_cron(self) -> None:
+        """Polls over a quiet week are a small fraction of a 5-minute cron."""
+        fetcher = FakeFetcher()
+        scheduler = _h41_scheduler(fetcher)
+        now = MONDAY
+        observation = pd.Timestamp("2024-01-03")
+        end = MONDAY + timedelta(days=7)
+
+        while now < end:
+            if now >= H41_RELEASE + timedelta(minutes=20):
+                observation = pd.Timestamp("2024-01-10")
+            fetcher.publish(str(observation.date()), ["WALCL", "WLRRAL", "WDTGAL"])
+            await scheduler.poll_once(now=now)
+            now = scheduler.next_wakeup()
+
+        cron_calls = int(timedelta(days=7) / timedelta(minutes=5))
+        assert len(fetcher.calls) < cron_calls * 0.1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,260 @@
+"""Unit tests for the local Arrow snapshot store and read-through path.
+
+These tests use a temporary directory and never contact QuestDB.
+
+Run with: uv run pytest tests/unit/test_snapshot.py -v
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from liquidity.storage import (
+    QuestDBConnectionError,
+    QuestDBStorage,
+    SnapshotStore,
+    SnapshotStoreError,
+)
+
+
+def _raw_frame(series_id: str, dates: list[str], values: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(dates),
+            "series_id": series_id,
+            "source": "fred",
+            "value": values,
+            "unit": "millions_usd",
+        }
+    )
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> SnapshotStore:
+    """Create a snapshot store rooted in a temporary directory."""
+    return SnapshotStore(tmp_path)
+
+
+class TestSnapshotStore:
+    """Unit tests for snapshot writes and reads."""
+
+    def test_roundtrip(self, store: SnapshotStore) -> None:
+        """Rows written are read back unchanged."""
+        df = _raw_frame("WALCL", ["2024-01-03", "2024-01-10"], [7.0e6, 7.1e6])
+        store.write("raw_data", df)
+
+        result = store.read("raw_data", ["WALCL"])
+
+        assert len(result) == 2
+        assert list(result.columns) == ["timestamp", "series_id", "source", "value", "unit"]
+        assert result["value"].tolist() == [7.0e6, 7.1e6]
+
+    def test_partitioned_by_series_and_month(
+        self, store: SnapshotStore, tmp_path: Path
+    ) -> None:
+        """Files are laid out per series_id and month."""
+        store.write("raw_data", _raw_frame("WALCL", ["2024-01-31", "2024-02-07"], [1, 2]))
+
+        files = sorted(p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*.arrow"))
+
+        assert files == [
+            "raw_data/series_id=WALCL/month=2024-01/data.arrow",
+            "raw_data/series_id=WALCL/month=2024-02/data.arrow",
+        ]
+
+    def test_upsert_deduplicates_on_timestamp(self, store: SnapshotStore) -> None:
+        """Re-ingesting a timestamp replaces the value (DEDUP UPSERT semantics)."""
+        store.write("raw_data", _raw_frame("WALCL", ["2024-01-03"], [1.0]))
+        store.write("raw_data", _raw_frame("WALCL", ["2024-01-03", "2024-01-10"], [2.0, 3.0]))
+
+        result = store.read("raw_data", ["WALCL"])
+
+        assert result["value"].tolist() == [2.0, 3.0]
+
+    def test_range_read(self, store: SnapshotStore) -> None:
+        """Start/end filters prune partitions and rows."""
+        dates = ["2023-12-27", "2024-01-03", "2024-02-07", "2024-03-06"]
+        store.write("raw_data", _raw_frame("WALCL", dates, [1, 2, 3, 4]))
+
+        result = store.read(
+            "raw_data", ["WALCL"], start=datetime(2024, 1, 1), end=datetime(2024, 2, 28)
+        )
+
+        assert result["value"].tolist() == [2, 3]
+
+    def test_indexes_table(self, store: SnapshotStore) -> None:
+        """liquidity_indexes is partitioned by index_name; regime may be absent."""
+        df = pd.DataFrame(
+            {
+                "timestamp": pd.to_datetime(["2024-01-03"]),
+                "index_name": ["net_liquidity"],
+                "value": [5.75e6],
+            }
+        )
+        store.write("liquidity_indexes", df)
+
+        assert store.keys("liquidity_indexes") == ["net_liquidity"]
+        result = store.read("liquidity_indexes")
+        assert result["value"].iloc[0] == 5.75e6
+
+    def test_latest_timestamp(self, store: SnapshotStore) -> None:
+        """Latest timestamp comes from the newest partition."""
+        store.write("raw_data", _raw_frame("WALCL", ["2024-01-03", "2024-02-07"], [1, 2]))
+
+        assert store.latest_timestamp("raw_data", "WALCL") == datetime(2024, 2, 7)
+        assert store.latest_timestamp("raw_data", "MISSING") is None
+
+    def test_coverage_merges_overlapping_ranges(self, store: SnapshotStore) -> None:
+        """Recorded ranges are merged; containment honours open bounds."""
+        assert store.coverage("raw_data", "WALCL") is None
+        assert not store.covers("raw_data", "WALCL")
+
+        store.record_coverage("raw_data", "WALCL", datetime(2024, 1, 1), datetime(2024, 3, 31))
+        store.record_coverage("raw_data", "WALCL", datetime(2024, 3, 1), None)
+
+        assert store.coverage("raw_data", "WALCL") == (pd.Timestamp("2024-01-01"), None)
+        assert store.covers("raw_data", "WALCL", datetime(2024, 2, 1), None)
+        assert not store.covers("raw_data", "WALCL", datetime(2023, 12, 1), None)
+        assert not store.covers("raw_data", "WALCL")
+        assert store.keys("raw_data") == ["WALCL"]
+
+    def test_unknown_table(self, store: SnapshotStore) -> None:
+        """Only mirrored tables are accepted."""
+        with pytest.raises(SnapshotStoreError, match="not mirrored"):
+            store.write("other", _raw_frame("WALCL", ["2024-01-03"], [1]))
+
+
+class TestReadThrough:
+    """Unit tests for QuestDBStorage.load_frame read-through behaviour."""
+
+    def test_snapshot_hit_skips_questdb(
+        self, store: SnapshotStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Keys whose covered range contains the request are served without a query."""
+        store.write("raw_data", _raw_frame("WALCL", ["2024-01-03"], [7.0e6]))
+        store.record_coverage("raw_data", "WALCL")
+        storage = QuestDBStorage(snapshot=store)
+
+        def fail(_sql: str, _params: list[Any] | None = None) -> list[dict[str, Any]]:
+            raise AssertionError("QuestDB should not be queried")
+
+        monkeypatch.setattr(storage, "query", fail)
+
+        result = storage.load_frame("raw_data", ["WALCL"])
+        assert result["value"].tolist() == [7.0e6]
+
+    def test_miss_falls_back_and_backfills(
+        self, store: SnapshotStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Missing keys are queried from QuestDB and mirrored locally."""
+        storage = QuestDBStorage(snapshot=store)
+        rows = _raw_frame("WDTGAL", ["2024-01-03"], [750.0]).to_dict("records")
+        queries: list[tuple[str, list[Any] | None]] = []
+
+        def fake_query(sql: str, params: list[Any] | None = None) -> list[dict[str, Any]]:
+            queries.append((sql, params))
+            return rows
+
+        monkeypatch.setattr(storage, "query", fake_query)
+
+        result = storage.load_frame("raw_data", ["WDTGAL"])
+
+        assert len(queries) == 1
+        assert "series_id IN (%s)" in queries[0][0]
+        assert queries[0][1] == ["WDTGAL"]
+        assert result["value"].tolist() == [750.0]
+        assert store.keys("raw_data") == ["WDTGAL"]
+        assert store.coverage("raw_data", "WDTGAL") == (None, pd.Timestamp("2024-01-03"))
+
+    def test_open_ended_coverage_capped_at_latest_row(
+        self, store: SnapshotStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Rows stored after an open-ended backfill are still read from QuestDB."""
+        storage = QuestDBStorage(snapshot=store)
+        history = _raw_frame("WALCL", ["2024-01-03"], [7.0e6])
+
+        def fake_query(_sql: str, _params: list[Any] | None = None) -> list[dict[str, Any]]:
+            return history.to_dict("records")
+
+        monkeypatch.setattr(storage, "query", fake_query)
+        storage.load_frame("raw_data", ["WALCL"])
+        history = _raw_frame("WALCL", ["2024-01-03", "2024-01-10"], [7.0e6, 7.1e6])
+
+        result = storage.load_frame("raw_data", ["WALCL"])
+
+        assert result["value"].tolist() == [7.0e6, 7.1e6]
+        assert store.coverage("raw_data", "WALCL") == (None, pd.Timestamp("2024-01-10"))
+        assert store.covers("raw_data", "WALCL", end=datetime(2024, 1, 10))
+
+    def test_partial_snapshot_does_not_truncate_history(
+        self, store: SnapshotStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Rows mirrored from ingestion alone do not stand in for the full history."""
+        store.write("raw_data", _raw_frame("WALCL", ["2024-01-10"], [7.1e6]))
+        storage = QuestDBStorage(snapshot=store)
+        history = _raw_frame("WALCL", ["2024-01-03", "2024-01-10"], [7.0e6, 7.1e6])
+        queries: list[list[Any] | None] = []
+
+        def fake_query(_sql: str, params: list[Any] | None = None) -> list[dict[str, Any]]:
+            queries.append(params)
+            return history.to_dict("records")
+
+        monkeypatch.setattr(storage, "query", fake_query)
+
+        first = storage.load_frame("raw_data", ["WALCL"])
+        second = storage.load_frame(
+            "raw_data", ["WALCL"], start=datetime(2024, 1, 5), end=datetime(2024, 1, 10)
+        )
+
+        assert first["value"].tolist() == [7.0e6, 7.1e6]
+        assert second["value"].tolist() == [7.1e6]
+        # The full-range load backfilled the coverage; the second read is local
+        assert len(queries) == 1
+
+    def test_range_outside_coverage_queries_questdb(
+        self, store: SnapshotStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A request starting before the covered range goes to QuestDB."""
+        store.write("raw_data", _raw_frame("WALCL", ["2024-01-10"], [7.1e6]))
+        store.record_coverage("raw_data", "WALCL", datetime(2024, 1, 5), None)
+        storage = QuestDBStorage(snapshot=store)
+        queries: list[list[Any] | None] = []
+
+        def fake_query(_sql: str, params: list[Any] | None = None) -> list[dict[str, Any]]:
+            queries.append(params)
+            return _raw_frame("WALCL", ["2024-01-03", "2024-01-10"], [7.0e6, 7.1e6]).to_dict(
+                "records"
+            )
+
+        monkeypatch.setattr(storage, "query", fake_query)
+
+        result = storage.load_frame("raw_data", ["WALCL"], start=datetime(2024, 1, 1))
+
+        assert result["value"].tolist() == [7.0e6, 7.1e6]
+        assert len(queries) == 1
+        assert store.coverage("raw_data", "WALCL") == (pd.Timestamp("2024-01-01"), None)
+
+    def test_offline_serves_snapshot(
+        self, store: SnapshotStore, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """When QuestDB is down, cached keys are still returned."""
+        store.write("raw_data", _raw_frame("WALCL", ["2024-01-03"], [7.0e6]))
+        storage = QuestDBStorage(snapshot=store)
+
+        def down(_sql: str, _params: list[Any] | None = None) -> list[dict[str, Any]]:
+            raise QuestDBConnectionError("connection refused")
+
+        monkeypatch.setattr(storage, "query", down)
+
+        result = storage.load_frame("raw_data", ["WALCL", "WDTGAL"])
+        assert result["series_id"].tolist() == ["WALCL"]
+
+        with pytest.raises(QuestDBConnectionError):
+            storage.load_frame("raw_data", ["WDTGAL"])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
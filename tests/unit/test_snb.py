@@ -0,0 +1,157 @@
+"""Unit tests for the streaming SNB balance sheet CSV parser.
+
+Run with: uv run pytest tests/unit/test_snb.py -v
+"""
+
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterator
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pandas as pd
+import pytest
+
+from liquidity.collectors.base import CollectorFetchError
+from liquidity.collectors.snb import SNBCollector
+
+# Balance sheet items in the cube besides the total
+OTHER_ITEMS = [f"I{i:02d}" for i in range(60)]
+
+
+def _cube_csv(months: pd.PeriodIndex, items: list[str]) -> str:
+    """Balance sheet cube CSV as the SNB data portal serves it."""
+    lines = ['"CubeId";"snbbipo"', '"PublishingDate";"2024-06-28 09:00"', "", '"Date";"D0";"Value"']
+    for i, month in enumerate(months):
+        for item in items:
+            value = 800_000.0 + i if item == "T0" else float(i)
+            lines.append(f'"{month}";"{item}";"{value}"')
+    return "\n".join(lines) + "\n"
+
+
+class _CSVHandler(BaseHTTPRequestHandler):
+    body: bytes = b""
+
+    def do_GET(self) -> None:  # noqa: N802
+        self.send_response(200)
+        self.send_header("Content-Type", "text/csv")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        view = memoryview(self.body)
+        for offset in range(0, len(view), 65_536):
+            self.wfile.write(view[offset : offset + 65_536])
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def serve_csv() -> Iterator[Any]:
+    """Serve a CSV body from a local HTTP server; yields a function returning its URL."""
+    servers: list[ThreadingHTTPServer] = []
+
+    def _serve(body: bytes) -> str:
+        handler = type("Handler", (_CSVHandler,), {"body": body})
+        server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        host, port = server.server_address[:2]
+        return f"http://{host!s}:{port}/cube.csv"
+
+    yield _serve
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+class TestParseCSV:
+    """Unit tests for filtering the cube."""
+
+    def test_total_assets_only(self) -> None:
+        """Only T0 rows are kept, as a canonical frame."""
+        csv = _cube_csv(pd.period_range("2024-01", "2024-03", freq="M"), ["GFG", "T0", "T01"])
+
+        df = SNBCollector()._parse_csv(csv, None, None)
+
+        assert df["timestamp"].tolist() == [
+            pd.Timestamp(month, tz="UTC") for month in ("2024-01-01", "2024-02-01", "2024-03-01")
+        ]
+        assert df["value"].tolist() == [800_000.0, 800_001.0, 800_002.0]
+        assert set(df["series_id"]) == {"SNB_TOTAL_ASSETS"}
+        assert set(df["unit"]) == {"millions_chf"}
+
+    def test_date_range(self) -> None:
+        """Months are kept when their first day falls within the range."""
+        csv = _cube_csv(pd.period_range("2023-11", "2024-04", freq="M"), ["T0"])
+
+        df = SNBCollector()._parse_csv(csv, datetime(2023, 12, 15), datetime(2024, 3, 1))
+
+        assert [ts.strftime("%Y-%m") for ts in df["timestamp"]] == ["2024-01", "2024-02", "2024-03"]
+        from_first = SNBCollector()._parse_csv(csv, datetime(2024, 1, 1), None)
+        assert from_first["timestamp"].iloc[0] == pd.Timestamp("2024-01-01", tz="UTC")
+
+    def test_empty_range_is_not_an_error(self) -> None:
+        """A range with no months gives an empty frame."""
+        csv = _cube_csv(pd.period_range("2024-01", "2024-03", freq="M"), ["T0"])
+
+        assert SNBCollector()._parse_csv(csv, datetime(2025, 1, 1), None).empty
+
+    def test_missing_header(self) -> None:
+        """CSV without a data header is rejected."""
+        with pytest.raises(CollectorFetchError, match="data header"):
+            SNBCollector()._parse_csv('"CubeId";"snbbipo"\n', None, None)
+
+    def test_missing_item_column(self) -> None:
+        """A header without D0 is rejected."""
+        with pytest.raises(CollectorFetchError, match="D0"):
+            SNBCollector()._parse_csv('"Date";"Item";"Value"\n"2024-01";"T0";"1"\n', None, None)
+
+    def test_missing_total(self) -> None:
+        """A cube without T0 rows is rejected."""
+        csv = _cube_csv(pd.period_range("2024-01", "2024-02", freq="M"), ["GFG"])
+
+        with pytest.raises(CollectorFetchError, match="T0"):
+            SNBCollector()._parse_csv(csv, None, None)
+
+    @pytest.mark.benchmark
+    def test_full_cube_is_fast(self) -> None:
+        """Forty years of a 61-item cube filter in well under a second."""
+        csv = _cube_csv(pd.period_range("1985-01", "2024-12", freq="M"), ["T0", *OTHER_ITEMS])
+
+        started = time.perf_counter()
+        df = SNBCollector()._parse_csv(csv, datetime(2020, 1, 1), None)
+        elapsed = time.perf_counter() - started
+
+        assert len(df) == 60
+        assert elapsed < 0.5
+
+
+class TestStreaming:
+    """The collector filters the response while it streams in."""
+
+    async def test_collect_streams_response(self, serve_csv: Any) -> None:
+        """Rows come from the streamed body, with memory bounded by the rows kept."""
+        months = pd.period_range("1850-01", "2024-12", freq="M")
+        body = _cube_csv(months, ["T0", *OTHER_ITEMS]).encode()
+        collector = SNBCollector(data_url=serve_csv(body))
+        # Warm up (client and TLS setup allocate on first use)
+        small = _cube_csv(pd.period_range("2024-01", "2024-02", freq="M"), ["T0"]).encode()
+        await SNBCollector(data_url=serve_csv(small)).collect()
+
+        tracemalloc.start()
+        try:
+            df = await collector.collect(start_date=datetime(2024, 1, 1))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert len(df) == 12
+        assert df["value"].iloc[-1] == 800_000.0 + len(months) - 1
+        # The body is never held whole (let alone parsed into a frame)
+        assert peak < len(body) / 2
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
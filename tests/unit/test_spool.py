@@ -0,0 +1,276 @@
+"""Unit tests for the durable ingest spool.
+
+These tests use a temporary directory and never contact QuestDB.
+
+Run with: uv run pytest tests/unit/test_spool.py -v
+"""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from liquidity.config import Settings
+from liquidity.storage import (
+    IngestSpool,
+    QuestDBIngestionError,
+    QuestDBStorage,
+    SnapshotStore,
+    SpoolError,
+    SpoolReplayer,
+)
+
+SYMBOLS = ["series_id", "source", "unit"]
+
+
+def _raw_frame(series_id: str, dates: list[str], values: list[float]) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": pd.to_datetime(dates),
+            "series_id": series_id,
+            "source": "fred",
+            "value": values,
+            "unit": "millions_usd",
+        }
+    )
+
+
+class RecordingSender:
+    """Stand-in for QuestDBStorage._send that can be switched offline."""
+
+    def __init__(self) -> None:
+        self.online = True
+        self.batches: list[tuple[str, pd.DataFrame]] = []
+
+    def __call__(
+        self, table: str, df: pd.DataFrame, _timestamp_col: str, _symbols: list[str]
+    ) -> int:
+        if not self.online:
+            raise QuestDBIngestionError("connection refused")
+        self.batches.append((table, df))
+        return len(df)
+
+
+def _append(spool: IngestSpool, series_id: str, date: str, value: float) -> Path:
+    return spool.append(
+        "raw_data", _raw_frame(series_id, [date], [value]), "timestamp", SYMBOLS
+    )
+
+
+@pytest.fixture
+def spool(tmp_path: Path) -> IngestSpool:
+    """Create a spool rooted in a temporary directory."""
+    return IngestSpool(tmp_path / "spool")
+
+
+@pytest.fixture
+def storage(
+    tmp_path: Path, spool: IngestSpool, monkeypatch: pytest.MonkeyPatch
+) -> tuple[QuestDBStorage, RecordingSender]:
+    """Create a storage whose ILP writes go to a recording sender."""
+    storage = QuestDBStorage(snapshot=SnapshotStore(tmp_path / "snapshots"), spool=spool)
+    sender = RecordingSender()
+    monkeypatch.setattr(storage, "_send", sender)
+    return storage, sender
+
+
+class TestIngestSpool:
+    """Unit tests for spool segments and replay."""
+
+    def test_segment_roundtrip(self, spool: IngestSpool) -> None:
+        """A spooled batch is read back with its ingest parameters."""
+        df = _raw_frame("WALCL", ["2024-01-03", "2024-01-10"], [7.0e6, 7.1e6])
+        path = spool.append("raw_data", df, "timestamp", SYMBOLS)
+
+        segment = spool.read_segment(path)
+
+        assert segment.table == "raw_data"
+        assert segment.timestamp_col == "timestamp"
+        assert segment.symbols == SYMBOLS
+        pd.testing.assert_frame_equal(segment.df, df)
+
+    def test_replay_in_order_and_deletes(self, spool: IngestSpool) -> None:
+        """Segments replay in append order and are removed once written."""
+        _append(spool, "WALCL", "2024-01-03", 1.0)
+        _append(spool, "WDTGAL", "2024-01-03", 2.0)
+        sender = RecordingSender()
+
+        assert spool.replay(sender) == 2
+        assert [df["series_id"].iloc[0] for _, df in sender.batches] == ["WALCL", "WDTGAL"]
+        assert not spool.has_pending()
+
+    def test_replay_stops_at_first_failure(self, spool: IngestSpool) -> None:
+        """A failed replay keeps every segment for the next attempt."""
+        _append(spool, "WALCL", "2024-01-03", 1.0)
+        _append(spool, "WDTGAL", "2024-01-03", 2.0)
+        sender = RecordingSender()
+        sender.online = False
+
+        assert spool.replay(sender) == 0
+        assert len(spool.segments()) == 2
+
+    def test_corrupt_segment_quarantined(self, spool: IngestSpool) -> None:
+        """An unreadable segment is moved aside and replay continues past it."""
+        corrupt = _append(spool, "WALCL", "2024-01-03", 1.0)
+        corrupt.write_bytes(corrupt.read_bytes()[:64])
+        _append(spool, "WDTGAL", "2024-01-03", 2.0)
+        sender = RecordingSender()
+
+        assert spool.replay(sender) == 1
+        assert [df["series_id"].iloc[0] for _, df in sender.batches] == ["WDTGAL"]
+        assert [path.name.startswith(corrupt.stem) for path in spool.quarantined()] == [True]
+        assert not spool.has_pending()
+
+    def test_rejected_segment_quarantined(self, tmp_path: Path) -> None:
+        """A batch rejected while QuestDB is healthy stops blocking the queue."""
+        spool = IngestSpool(tmp_path, max_attempts=2)
+        poison = _append(spool, "WALCL", "2024-01-03", 1.0)
+        _append(spool, "WDTGAL", "2024-01-03", 2.0)
+        sender = RecordingSender()
+
+        def send(table: str, df: pd.DataFrame, timestamp_col: str, symbols: list[str]) -> int:
+            if df["series_id"].iloc[0] == "WALCL":
+                raise QuestDBIngestionError("bad column type")
+            return sender(table, df, timestamp_col, symbols)
+
+        assert spool.replay(send, lambda: True) == 0
+        assert len(spool.segments()) == 2
+
+        assert spool.replay(send, lambda: True) == 1
+        assert [path.name.startswith(poison.stem) for path in spool.quarantined()] == [True]
+        assert spool.quarantined_segments == 1
+        assert not spool.has_pending()
+
+    def test_segment_names_never_reused(self, tmp_path: Path) -> None:
+        """Sequence numbers keep growing after the spool drains, across instances."""
+        spool = IngestSpool(tmp_path)
+        first = _append(spool, "WALCL", "2024-01-03", 1.0)
+        assert spool.replay(RecordingSender()) == 1
+
+        second = _append(IngestSpool(tmp_path), "WALCL", "2024-01-10", 2.0)
+
+        assert second.name != first.name
+        assert second.name > first.name
+
+    def test_quarantine_keeps_earlier_segments(self, tmp_path: Path) -> None:
+        """Quarantining a segment never overwrites one quarantined before."""
+        spool = IngestSpool(tmp_path)
+        for value in (1.0, 2.0):
+            segment = _append(spool, "WALCL", "2024-01-03", value)
+            # Same name as the previous segment, as if the counter had been lost
+            segment = segment.rename(segment.with_name("000000000000-raw_data.arrow"))
+            segment.write_bytes(segment.read_bytes()[:64])
+            spool.replay(RecordingSender())
+
+        assert len(spool.quarantined()) == 2
+
+    def test_outage_never_quarantines(self, tmp_path: Path) -> None:
+        """Failures while QuestDB is unhealthy only pause the replay."""
+        spool = IngestSpool(tmp_path, max_attempts=1)
+        _append(spool, "WALCL", "2024-01-03", 1.0)
+        sender = RecordingSender()
+        sender.online = False
+
+        for _ in range(3):
+            assert spool.replay(sender, lambda: False) == 0
+
+        assert len(spool.segments()) == 1
+        assert spool.quarantined() == []
+
+    def test_budget_drops_oldest(self, tmp_path: Path) -> None:
+        """Beyond the disk budget the oldest segments are dropped."""
+        spool = IngestSpool(tmp_path, max_bytes=1)
+        first = _append(spool, "WALCL", "2024-01-03", 1.0)
+        second = _append(spool, "WALCL", "2024-01-10", 2.0)
+
+        assert spool.segments() == [second]
+        assert not first.exists()
+        assert spool.dropped_segments == 1
+
+
+class TestSpooledIngestion:
+    """Unit tests for QuestDBStorage ingestion through the spool."""
+
+    def test_failed_ingest_is_spooled(
+        self, storage: tuple[QuestDBStorage, RecordingSender]
+    ) -> None:
+        """An outage spools the batch instead of raising."""
+        qdb, sender = storage
+        sender.online = False
+
+        rows = qdb.ingest_dataframe("raw_data", _raw_frame("WALCL", ["2024-01-03"], [1.0]))
+
+        assert rows == 0
+        assert qdb.spool is not None and qdb.spool.has_pending()
+
+    def test_batches_queue_behind_spool(
+        self, storage: tuple[QuestDBStorage, RecordingSender]
+    ) -> None:
+        """Once QuestDB recovers, spooled batches land before the new one."""
+        qdb, sender = storage
+        sender.online = False
+        qdb.ingest_dataframe("raw_data", _raw_frame("WALCL", ["2024-01-03"], [1.0]))
+
+        sender.online = True
+        rows = qdb.ingest_dataframe("raw_data", _raw_frame("WALCL", ["2024-01-10"], [2.0]))
+
+        assert rows == 1
+        assert [df["value"].iloc[0] for _, df in sender.batches] == [1.0, 2.0]
+        assert qdb.spool is not None and not qdb.spool.has_pending()
+
+    def test_broken_spool_does_not_block_ingest(
+        self,
+        storage: tuple[QuestDBStorage, RecordingSender],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """New batches are still sent when the spool cannot be replayed."""
+        qdb, sender = storage
+        sender.online = False
+        qdb.ingest_dataframe("raw_data", _raw_frame("WALCL", ["2024-01-03"], [1.0]))
+        assert qdb.spool is not None
+
+        def broken(*_args: object) -> int:
+            raise SpoolError("disk unavailable")
+
+        monkeypatch.setattr(qdb.spool, "replay", broken)
+        monkeypatch.setattr(qdb.spool, "has_pending", lambda: True)
+        sender.online = True
+
+        rows = qdb.ingest_dataframe("raw_data", _raw_frame("WALCL", ["2024-01-10"], [2.0]))
+
+        assert rows == 1
+        assert [df["value"].iloc[0] for _, df in sender.batches] == [2.0]
+
+    def test_no_spool_raises(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Spooling is opt-in: by default ingestion errors propagate."""
+        qdb = QuestDBStorage(settings=Settings(), snapshot=SnapshotStore(tmp_path))
+        assert qdb.spool is None
+        sender = RecordingSender()
+        sender.online = False
+        monkeypatch.setattr(qdb, "_send", sender)
+
+        with pytest.raises(QuestDBIngestionError):
+            qdb.ingest_dataframe("raw_data", _raw_frame("WALCL", ["2024-01-03"], [1.0]))
+
+    def test_replayer_waits_for_health(
+        self, storage: tuple[QuestDBStorage, RecordingSender]
+    ) -> None:
+        """The background replayer only drains when QuestDB is healthy."""
+        qdb, sender = storage
+        sender.online = False
+        qdb.ingest_dataframe("raw_data", _raw_frame("WALCL", ["2024-01-03"], [1.0]))
+        assert qdb.spool is not None
+        healthy = False
+        replayer = SpoolReplayer(qdb.spool, lambda: healthy, qdb.replay_spool)
+
+        assert replayer.run_once() == 0
+        assert qdb.spool.has_pending()
+
+        healthy = True
+        sender.online = True
+        assert replayer.run_once() == 1
+        assert not qdb.spool.has_pending()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
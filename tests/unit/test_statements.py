@@ -0,0 +1,191 @@
+"""Unit tests for parameterised hot-shape queries and PGWire pooling.
+
+``query`` and the connection pool are replaced; QuestDB is not contacted.
+
+Run with: uv run pytest tests/unit/test_statements.py -v
+"""
+
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from liquidity.storage import AsyncQuestDBStorage, QuestDBStorage, SnapshotStore
+from liquidity.storage.statements import (
+    bind_timestamp,
+    freshness_sql,
+    latest_sql,
+    range_sql,
+)
+
+
+class FakeConnection:
+    """Minimal psycopg2 connection stand-in."""
+
+    def __init__(self) -> None:
+        self.autocommit = False
+        self.closed = 0
+
+
+class FakePool:
+    """Records connections handed out and returned."""
+
+    def __init__(self) -> None:
+        self.returned: list[tuple[FakeConnection, bool]] = []
+
+    def getconn(self) -> FakeConnection:
+        return FakeConnection()
+
+    def putconn(self, conn: FakeConnection, close: bool = False) -> None:
+        self.returned.append((conn, close))
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> QuestDBStorage:
+    """Storage with a temporary snapshot and no spool."""
+    storage = QuestDBStorage(snapshot=SnapshotStore(tmp_path))
+    storage.spool = None
+    return storage
+
+
+class TestStatementSQL:
+    """Unit tests for the hot-shape statement texts."""
+
+    def test_latest_placeholder_styles(self) -> None:
+        """The key is a placeholder in both driver styles."""
+        assert "WHERE series_id = %s" in latest_sql("raw_data")
+        assert "WHERE index_name = $1" in latest_sql("liquidity_indexes", "numeric")
+
+    def test_range_parameters_in_order(self) -> None:
+        """Keys come first, then start and end."""
+        sql = range_sql("raw_data", 2, True, True, "numeric")
+
+        assert "series_id IN ($1, $2)" in sql
+        assert "timestamp >= $3 AND timestamp <= $4" in sql
+
+    def test_range_text_is_stable(self) -> None:
+        """Calls with the same shape reuse one statement text."""
+        assert range_sql("raw_data", 1, True, False) is range_sql("raw_data", 1, True, False)
+
+    def test_unknown_table_rejected(self) -> None:
+        """Identifiers are whitelisted against the known schemas."""
+        with pytest.raises(ValueError, match="Unknown table"):
+            latest_sql("raw_data; DROP TABLE raw_data")
+        with pytest.raises(ValueError, match="Unknown table"):
+            freshness_sql("other")
+
+    def test_bind_timestamp_naive_utc(self) -> None:
+        """Aware timestamps are converted to naive UTC."""
+        value = datetime(2024, 1, 3, 12, tzinfo=UTC)
+
+        assert bind_timestamp(value) == datetime(2024, 1, 3, 12)
+        assert bind_timestamp(value).tzinfo is None
+
+
+class TestBoundQueries:
+    """Unit tests for QuestDBStorage queries with bind parameters."""
+
+    def test_get_latest_binds_key(
+        self, storage: QuestDBStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A quote in the key is bound, not spliced into SQL."""
+        calls: list[tuple[str, list[Any] | None]] = []
+
+        def fake_query(sql: str, params: list[Any] | None = None) -> list[dict[str, Any]]:
+            calls.append((sql, params))
+            return []
+
+        monkeypatch.setattr(storage, "query", fake_query)
+
+        assert storage.get_latest("x' OR '1'='1") is None
+        sql, params = calls[0]
+        assert "'" not in sql
+        assert params == ["x' OR '1'='1"]
+
+    def test_get_latest_indexes_key_column(
+        self, storage: QuestDBStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """liquidity_indexes is keyed by index_name."""
+        calls: list[str] = []
+
+        def fake_query(sql: str, _params: list[Any] | None = None) -> list[dict[str, Any]]:
+            calls.append(sql)
+            return [{"index_name": "net_liquidity", "value": 1.0}]
+
+        monkeypatch.setattr(storage, "query", fake_query)
+
+        assert storage.get_latest("net_liquidity", "liquidity_indexes") is not None
+        assert "index_name = %s" in calls[0]
+
+    def test_get_freshness(
+        self, storage: QuestDBStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """One query returns the newest timestamp of every series."""
+        monkeypatch.setattr(
+            storage,
+            "query",
+            lambda _sql, _params=None: [
+                {"series_id": "WALCL", "timestamp": datetime(2024, 1, 3)},
+                {"series_id": "EMPTY", "timestamp": None},
+            ],
+        )
+
+        assert storage.get_freshness() == {"WALCL": datetime(2024, 1, 3)}
+
+
+class TestConnectionPool:
+    """Unit tests for pooled PGWire connections."""
+
+    def test_connection_returned_to_pool(self, storage: QuestDBStorage) -> None:
+        """Healthy connections go back to the pool in autocommit mode."""
+        pool = FakePool()
+        storage._pg_pool = pool  # type: ignore[assignment]
+
+        with storage._pooled_connection() as conn:
+            assert conn.autocommit is True
+
+        assert pool.returned == [(conn, False)]
+
+    def test_closed_connection_discarded(self, storage: QuestDBStorage) -> None:
+        """Connections closed while in use are not reused."""
+        pool = FakePool()
+        storage._pg_pool = pool  # type: ignore[assignment]
+
+        with pytest.raises(RuntimeError), storage._pooled_connection() as conn:
+            conn.closed = 2
+            raise RuntimeError("server went away")
+
+        assert pool.returned == [(conn, True)]
+
+
+class TestAsyncStatements:
+    """Unit tests for AsyncQuestDBStorage hot shapes."""
+
+    async def test_read_range_numeric_params(
+        self, storage: QuestDBStorage, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Range reads use $n placeholders with bound values."""
+        calls: list[tuple[str, tuple[Any, ...]]] = []
+
+        async def fake_query(sql: str, *args: Any) -> list[dict[str, Any]]:
+            calls.append((sql, args))
+            return []
+
+        async with AsyncQuestDBStorage(storage) as async_storage:
+            monkeypatch.setattr(async_storage, "query", fake_query)
+            await async_storage.read_range(["WALCL"], start=datetime(2024, 1, 1))
+
+        sql, args = calls[0]
+        assert "series_id IN ($1) AND timestamp >= $2" in sql
+        assert args == ("WALCL", datetime(2024, 1, 1))
+
+    def test_statement_cache_size_from_settings(self, storage: QuestDBStorage) -> None:
+        """Each pooled connection caches the configured number of statements."""
+        async_storage = AsyncQuestDBStorage(storage)
+
+        assert async_storage.statement_cache_size == 16
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,264 @@
+"""Unit tests for the vectorized Stealth QE score engine.
+
+Run with: uv run pytest tests/unit/test_stealth_qe.py -v
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.calculations import StealthQEEngine, VolSignal
+from liquidity.frames import normalize_frame
+from tests.conftest import FakeStorage
+
+UNITS = {"WALCL": "millions_usd", "WLRRAL": "billions_usd", "WDTGAL": "billions_usd"}
+
+
+def _rows(key: str, timestamps: pd.DatetimeIndex, values: np.ndarray) -> pd.DataFrame:
+    """Collector rows: FRED keyed by series_id, Yahoo by symbol."""
+    column = "symbol" if key.startswith("^") else "series_id"
+    return pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            column: key,
+            "source": "yahoo" if column == "symbol" else "fred",
+            "value": values,
+            "unit": UNITS.get(key, "percent" if column == "series_id" else "index"),
+        }
+    )
+
+
+def _history(start: str = "2022-01-03", end: str = "2023-12-29", seed: int = 0) -> pd.DataFrame:
+    """Daily volatility and weekly H.4.1 rows, FRED and Yahoo concatenated."""
+    rng = np.random.default_rng(seed)
+    days = pd.bdate_range(start, end)
+    weeks = pd.date_range(start, end, freq="W-WED")
+    n, m = len(days), len(weeks)
+    return pd.concat(
+        [
+            _rows("VIXCLS", days, 20 + np.cumsum(rng.normal(0, 1, n)).clip(-8, 30)),
+            _rows("VXVCLS", days, 22 + np.cumsum(rng.normal(0, 0.8, n)).clip(-8, 25)),
+            _rows("^MOVE", days[::2], 100 + np.cumsum(rng.normal(0, 3, len(days[::2])))),
+            _rows("WALCL", weeks, 8_000_000 + np.cumsum(rng.normal(0, 40_000, m))),
+            _rows("WLRRAL", weeks, np.abs(1_500 + np.cumsum(rng.normal(-20, 120, m)))),
+            _rows("WDTGAL", weeks, 700 + np.cumsum(rng.normal(0, 80, m))),
+        ],
+        ignore_index=True,
+    )
+
+
+def _script_zscore(values: list[float | None], idx: int, min_required: float) -> float | None:
+    """calculateZScore from the Apps Script, cell by cell."""
+    if idx < 20:
+        return None
+    window = [v for v in values[idx - 20 : idx] if v is not None]
+    if len(window) < min_required:
+        return None
+    mean = sum(window) / len(window)
+    std = (sum((v - mean) ** 2 for v in window) / len(window)) ** 0.5
+    if std == 0:
+        return 0.0
+    current = values[idx]
+    return None if current is None else (current - mean) / std
+
+
+def _script_scores(fed: list[float], rrp: list[float], tga: list[float]) -> list[float]:
+    """Daily score of calculateRMPMetrics, cell by cell (billions USD inputs)."""
+    scores, previous = [], 0.0
+    for idx in range(len(fed)):
+        comp1 = comp2 = comp3 = 0.0
+        if idx >= 7:
+            prior = rrp[idx - 7]
+            velocity = None
+            if prior > 0.5:
+                velocity = (rrp[idx] - prior) / prior * 100
+            elif rrp[idx] < 0.5:
+                velocity = 0.0
+            if velocity is not None and velocity < 0:
+                comp1 = min(100, abs(velocity) / 20 * 100)
+            spending = -(tga[idx] - tga[idx - 7])
+            if spending > 0:
+                comp2 = min(100, spending / 200 * 100)
+            change = fed[idx] - fed[idx - 7]
+            if change > 0:
+                comp3 = min(100, change / 100 * 100)
+        raw = comp1 * 0.4 + comp2 * 0.4 + comp3 * 0.2
+        if idx > 7 and previous > 0:
+            raw = max(previous - 25, min(previous + 25, raw))
+        previous = max(0.0, min(100.0, raw))
+        scores.append(previous)
+    return scores
+
+
+class TestBatch:
+    """Unit tests for the whole-history computation."""
+
+    def test_volatility_matches_script(self) -> None:
+        """Deltas and z-scores reproduce the spreadsheet cell formulas."""
+        result = StealthQEEngine().batch(_history())
+        vix = result["vix"].tolist()
+        move = [None if np.isnan(v) else v for v in result["move"]]
+
+        for idx in range(len(result)):
+            expected_z = _script_zscore(vix, idx, 16)
+            actual_z = result["vix_z"].iloc[idx]
+            if expected_z is None:
+                assert np.isnan(actual_z)
+            else:
+                assert actual_z == pytest.approx(expected_z, abs=1e-9)
+            move_z = _script_zscore(move, idx, 6)
+            assert (move_z is None) == np.isnan(result["move_z"].iloc[idx])
+            if idx >= 14:
+                assert result["vix_d14"].iloc[idx] == pytest.approx(vix[idx] - vix[idx - 14])
+        np.testing.assert_allclose(result["vix_ratio"], result["vix"] / result["vix3m"])
+
+    def test_score_matches_script(self) -> None:
+        """The weighted, rate-limited score reproduces calculateRMPMetrics."""
+        frame = _history()
+        result = StealthQEEngine().batch(frame)
+
+        levels = {
+            series_id: frame[frame["series_id"] == series_id].set_index("timestamp")["value"]
+            for series_id in ("WALCL", "WLRRAL", "WDTGAL")
+        }
+        start = levels["WALCL"].index[0]
+        valid = int(np.searchsorted(result["timestamp"], start))
+        grid = result["timestamp"].iloc[valid:]
+        fed, rrp, tga = (
+            levels[series_id].reindex(grid, method="ffill").tolist() for series_id in levels
+        )
+        fed = [value / 1000 for value in fed]
+
+        np.testing.assert_allclose(
+            result["score"].iloc[valid:].to_numpy(), _script_scores(fed, rrp, tga), atol=1e-9
+        )
+        assert result["score"].between(0, 100).all()
+
+    def test_score_rate_limited(self) -> None:
+        """A positive score moves at most 25 points per bar."""
+        score = StealthQEEngine().batch(_history())["score"]
+
+        jumps = score.diff().abs()[score.shift() > 0]
+        assert jumps.max() <= 25 + 1e-9
+
+    def test_vol_signal(self) -> None:
+        """Thresholds map to the script's volatility signals."""
+        days = pd.bdate_range("2024-01-01", periods=30)
+        frame = pd.concat(
+            [
+                _rows("VIXCLS", days, np.r_[np.full(25, 16.0), [35.0, 26.0, 16.0, 16.0, 16.0]]),
+                _rows("VXVCLS", days, np.r_[np.full(28, 18.0), [10.0, 18.0]]),
+            ]
+        )
+
+        signal = StealthQEEngine().batch(frame)["vol_signal"].tolist()
+
+        assert signal[25] == VolSignal.HIGH_FEAR
+        assert signal[26] == VolSignal.HIGH_FEAR  # z-score above 2 after a flat month
+        assert signal[28] == VolSignal.CAUTION  # backwardation
+        assert signal[29] == VolSignal.RISK_ON
+
+    @pytest.mark.benchmark
+    def test_backfill_is_fast(self) -> None:
+        """Thirty years of daily bars are scored in milliseconds."""
+        frame = _history("1994-01-03", "2023-12-29")
+        engine = StealthQEEngine()
+
+        started = time.perf_counter()
+        result = engine.batch(frame)
+        elapsed = time.perf_counter() - started
+
+        assert len(result) == len(pd.bdate_range("1994-01-03", "2023-12-29"))
+        assert elapsed < 0.5
+
+
+class TestStreaming:
+    """Unit tests for bar-by-bar updates."""
+
+    def test_streaming_matches_batch(self) -> None:
+        """Daily batches, with weekly prints a day late, end at the batch values."""
+        frame = _history("2023-01-02", "2023-06-30")
+        delayed = frame["timestamp"] + pd.to_timedelta(
+            frame["series_id"].isin(["WALCL", "WLRRAL", "WDTGAL"]).astype(int), unit="D"
+        )
+        engine = StealthQEEngine()
+        emitted: list[pd.DataFrame] = []
+        engine.subscribe(emitted.append)
+
+        for day in sorted(delayed.unique()):
+            engine.update(frame[delayed == day])
+
+        latest = pd.concat(emitted).drop_duplicates("timestamp", keep="last")
+        expected = StealthQEEngine().batch(frame)
+        pd.testing.assert_frame_equal(
+            latest.reset_index(drop=True), expected, check_exact=False, atol=1e-9
+        )
+        assert engine.score == pytest.approx(expected["score"].iloc[-1])
+
+    def test_late_print_recomputes_tail_only(self) -> None:
+        """A late H.4.1 print recomputes the bars since its timestamp."""
+        frame = _history("2023-01-02", "2023-06-30")
+        cutoff = pd.Timestamp("2023-06-28")
+        engine = StealthQEEngine()
+        engine.prime(frame[~((frame["timestamp"] == cutoff) & frame["series_id"].isin(UNITS))])
+
+        bars = engine.update(frame[(frame["timestamp"] == cutoff) & frame["series_id"].isin(UNITS)])
+
+        assert bars["timestamp"].tolist() == list(pd.bdate_range(cutoff, "2023-06-30"))
+
+    def test_unchanged_rows_emit_nothing(self) -> None:
+        """Re-ingesting stored rows is a no-op."""
+        frame = _history("2023-01-02", "2023-03-31")
+        engine = StealthQEEngine()
+        engine.prime(frame)
+
+        assert engine.update(frame).empty
+
+    def test_collector_frame_slices(self) -> None:
+        """Slices of one multi-unit collector frame end at the batch score."""
+        history = _history()
+        fred = normalize_frame(history[history["series_id"].notna()].drop(columns="symbol"))
+        yahoo = history[history["symbol"].notna()].drop(columns="series_id")
+        h41 = fred["series_id"].isin(["WALCL", "WLRRAL", "WDTGAL"])
+        engine = StealthQEEngine()
+
+        engine.update(fred[h41])
+        engine.update(fred[~h41])
+        engine.update(normalize_frame(yahoo, key_column="symbol"))
+
+        expected = StealthQEEngine().batch(history)
+        assert engine.score == pytest.approx(expected["score"].iloc[-1])
+
+    def test_persist(self, fake_storage: FakeStorage) -> None:
+        """Recomputed scores are written to liquidity_indexes."""
+        engine = StealthQEEngine(storage=fake_storage)  # type: ignore[arg-type]
+        frame = _history("2023-01-02", "2023-03-31")
+        engine.prime(frame[frame["timestamp"] < "2023-03-31"])
+
+        engine.update(frame[frame["timestamp"] == "2023-03-31"])
+
+        table, written = fake_storage.ingested[0]
+        assert table == "liquidity_indexes"
+        assert list(written.columns) == ["timestamp", "index_name", "value"]
+        assert written["index_name"].tolist() == ["stealth_qe"]
+
+    @pytest.mark.benchmark
+    def test_update_cost_independent_of_history(self) -> None:
+        """A new bar costs the same after thirty years of history."""
+        frame = _history("1994-01-03", "2024-01-31")
+        last = frame["timestamp"] == frame["timestamp"].max()
+        engine = StealthQEEngine()
+        engine.prime(frame[~last])
+
+        started = time.perf_counter()
+        bars = engine.update(frame[last])
+        elapsed = time.perf_counter() - started
+
+        assert len(bars) == 1
+        assert elapsed < 0.05
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
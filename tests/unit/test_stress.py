@@ -0,0 +1,226 @@
+"""Unit tests for the single-pass stress indicator engine.
+
+Run with: uv run pytest tests/unit/test_stress.py -v
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.calculations import (
+    STRESS_INDICATORS,
+    DerivedSeries,
+    StressEngine,
+    StressIndicator,
+)
+from tests.conftest import FakeStorage
+
+UNITS = {"BAMLH0A0HYM2": "bps", "BAMLC0A0CM": "bps"}
+
+
+def _rows(series_id: str, timestamps: pd.DatetimeIndex, values: np.ndarray) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "series_id": series_id,
+            "source": "fred",
+            "value": values,
+            "unit": UNITS.get(series_id, "percent"),
+        }
+    )
+
+
+def _history(start: str = "2020-01-02", end: str = "2023-12-29", seed: int = 0) -> pd.DataFrame:
+    """Daily FRED rates and spreads; DGS2 misses some days DGS10 has."""
+    rng = np.random.default_rng(seed)
+    days = pd.bdate_range(start, end)
+    n = len(days)
+
+    def walk(level: float, scale: float) -> np.ndarray:
+        return level + np.cumsum(rng.normal(0, scale, n))
+
+    return pd.concat(
+        [
+            _rows("SOFR", days, walk(2.0, 0.02)),
+            _rows("DGS2", days, walk(2.5, 0.05))[rng.random(n) > 0.05],
+            _rows("DGS10", days, walk(2.8, 0.05)),
+            _rows("BAMLH0A0HYM2", days, np.abs(walk(420, 8))),
+            _rows("BAMLC0A0CM", days, np.abs(walk(120, 2))),
+        ],
+        ignore_index=True,
+    )
+
+
+def _sorted(df: pd.DataFrame) -> pd.DataFrame:
+    return df.sort_values(["indicator", "timestamp"]).reset_index(drop=True)
+
+
+class TestBatch:
+    """Unit tests for the whole-history panel."""
+
+    def test_values_match_definitions(self) -> None:
+        """Levels and spreads equal their series evaluated alone."""
+        frame = _history()
+        panel = StressEngine().batch(frame).set_index(["indicator", "timestamp"])["value"]
+
+        for name, indicator in STRESS_INDICATORS.items():
+            expected = indicator.series.calculate(frame).set_index("timestamp")[name]
+            np.testing.assert_allclose(panel[name].to_numpy(), expected.to_numpy())
+            assert panel[name].index.equals(expected.index)
+
+    def test_percentiles_match_pandas(self) -> None:
+        """Percentiles are the rolling rank of each value in its window."""
+        panel = StressEngine(window=60, min_periods=10).batch(_history())
+
+        for _, group in panel.groupby("indicator"):
+            rank = group["value"].rolling(60, min_periods=10).rank(method="max", pct=True) * 100
+            np.testing.assert_allclose(group["percentile"], rank)
+
+    def test_breaches(self) -> None:
+        """Breaches follow each threshold and its direction."""
+        panel = StressEngine().batch(_history())
+
+        hy = panel[panel["indicator"] == "hy_oas"]
+        curve = panel[panel["indicator"] == "yield_spread"]
+        sofr = panel[panel["indicator"] == "sofr"]
+        assert (hy["breach"] == (hy["value"] > 500)).all()
+        assert (curve["breach"] == (curve["value"] < 0)).all()
+        assert curve["breach"].any()
+        assert not sofr["breach"].any()
+
+    def test_missing_inputs_skipped(self) -> None:
+        """Indicators without their inputs are left out of the panel."""
+        frame = _history()
+
+        panel = StressEngine().batch(frame[frame["series_id"] == "SOFR"])
+
+        assert set(panel["indicator"]) == {"sofr"}
+
+    def test_new_indicator_is_a_definition(self) -> None:
+        """A new spread needs only a definition."""
+        engine = StressEngine(
+            [StressIndicator(DerivedSeries("sofr_dgs2", "SOFR - DGS2", "bps"), threshold=0.0)]
+        )
+
+        panel = engine.batch(_history())
+
+        assert set(panel["indicator"]) == {"sofr_dgs2"}
+        assert panel["value"].abs().max() > 10
+
+    @pytest.mark.benchmark
+    def test_backfill_is_fast(self) -> None:
+        """Thirty years of the daily panel are computed in well under a second."""
+        frame = _history("1994-01-03", "2023-12-29")
+        engine = StressEngine()
+
+        started = time.perf_counter()
+        panel = engine.batch(frame)
+        elapsed = time.perf_counter() - started
+
+        assert len(panel) > 5 * 7_000
+        assert elapsed < 1.0
+
+    def test_invalid_min_periods(self) -> None:
+        """min_periods must fit in the window."""
+        with pytest.raises(ValueError, match="min_periods"):
+            StressEngine(window=20, min_periods=30)
+
+
+class TestIncremental:
+    """Unit tests for incremental updates and lookup."""
+
+    def test_streaming_matches_batch(self) -> None:
+        """Day-by-day updates end at the batch panel."""
+        frame = _history("2023-01-02", "2023-06-30")
+        engine = StressEngine(window=40, min_periods=10)
+        engine.prime(frame[frame["timestamp"] < "2023-05-01"])
+        emitted: list[pd.DataFrame] = []
+        engine.subscribe(emitted.append)
+
+        for day in sorted(frame.loc[frame["timestamp"] >= "2023-05-01", "timestamp"].unique()):
+            engine.update(frame[frame["timestamp"] == day])
+
+        expected = StressEngine(window=40, min_periods=10).batch(frame)
+        latest = pd.concat(emitted).drop_duplicates(["indicator", "timestamp"], keep="last")
+        tail = expected[expected["timestamp"] >= "2023-05-01"]
+        pd.testing.assert_frame_equal(_sorted(latest), _sorted(tail))
+
+    def test_revision_reranks_window(self) -> None:
+        """A revised point re-ranks the points whose window contains it."""
+        frame = _history("2023-01-02", "2023-06-30")
+        engine = StressEngine(window=40, min_periods=10)
+        engine.prime(frame)
+        day = pd.Timestamp("2023-06-01")
+        revision = frame[(frame["series_id"] == "BAMLH0A0HYM2") & (frame["timestamp"] == day)]
+
+        changed = engine.update(revision.assign(value=900.0))
+
+        assert set(changed["indicator"]) == {"hy_oas", "hy_ig_spread"}
+        hy = changed[changed["indicator"] == "hy_oas"]
+        assert hy["timestamp"].iloc[0] == day
+        assert hy["timestamp"].iloc[-1] == frame["timestamp"].max()
+        assert hy["breach"].tolist() == [True] + [False] * (len(hy) - 1)
+
+    def test_unchanged_rows_emit_nothing(self) -> None:
+        """Re-ingesting stored rows is a no-op."""
+        frame = _history("2023-01-02", "2023-03-31")
+        engine = StressEngine()
+        engine.prime(frame)
+
+        assert engine.update(frame).empty
+
+    def test_lookup(self) -> None:
+        """The latest panel is served from memory."""
+        frame = _history("2023-01-02", "2023-06-30")
+        engine = StressEngine(window=40, min_periods=10)
+        assert engine.lookup().empty
+        engine.prime(frame)
+
+        panel = engine.lookup().set_index("indicator")
+
+        expected = StressEngine(window=40, min_periods=10).batch(frame)
+        last = expected.groupby("indicator").tail(1).set_index("indicator")
+        pd.testing.assert_frame_equal(panel.sort_index(), last.sort_index())
+
+    def test_persist(self, fake_storage: FakeStorage) -> None:
+        """Values, percentiles and breach states are written as separate indexes."""
+        engine = StressEngine(storage=fake_storage, window=40, min_periods=10)  # type: ignore[arg-type]
+        frame = _history("2023-01-02", "2023-03-31")
+        engine.prime(frame[frame["timestamp"] < "2023-03-31"])
+
+        engine.update(frame[frame["timestamp"] == "2023-03-31"])
+
+        table, written = fake_storage.ingested[0]
+        assert table == "liquidity_indexes"
+        assert list(written.columns) == ["timestamp", "index_name", "value"]
+        thresholded = [
+            name for name, indicator in STRESS_INDICATORS.items() if indicator.threshold is not None
+        ]
+        assert set(written["index_name"]) == {
+            *STRESS_INDICATORS,
+            *(f"{name}_percentile" for name in STRESS_INDICATORS),
+            *(f"{name}_breach" for name in thresholded),
+        }
+        breach = written[written["index_name"].str.endswith("_breach")]
+        assert set(breach["value"]) <= {0.0, 1.0}
+
+    @pytest.mark.benchmark
+    def test_update_cost_independent_of_history(self) -> None:
+        """A new day costs the same after thirty years of history."""
+        frame = _history("1994-01-03", "2024-01-31")
+        last = frame["timestamp"] == frame["timestamp"].max()
+        engine = StressEngine()
+        engine.prime(frame[~last])
+
+        started = time.perf_counter()
+        changed = engine.update(frame[last])
+        elapsed = time.perf_counter() - started
+
+        assert len(changed) == len(STRESS_INDICATORS)
+        assert elapsed < 0.25
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,108 @@
+"""Unit tests for the central unit registry.
+
+Run with: uv run pytest tests/unit/test_units.py -v
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from liquidity.units import (
+    UNITS,
+    UnitError,
+    conversion_factors,
+    convert_frame,
+    factor,
+    scales_to,
+)
+
+
+class TestUnitRegistry:
+    """Unit tests for unit lookup and factors."""
+
+    def test_factor_within_dimension(self) -> None:
+        """Factors are ratios of scales within a dimension."""
+        assert factor("billions_usd", "millions_usd") == 1_000.0
+        assert factor("millions_usd", "trillions_usd") == 1e-6
+        assert factor("bps", "percent") == 0.01
+
+    def test_incompatible_dimensions(self) -> None:
+        """Currencies and rates never convert into each other."""
+        with pytest.raises(UnitError, match="Cannot convert"):
+            factor("millions_eur", "millions_usd")
+        with pytest.raises(UnitError, match="Cannot convert"):
+            factor("percent", "millions_usd")
+
+    def test_unknown_unit(self) -> None:
+        """Unregistered symbols are rejected."""
+        with pytest.raises(UnitError, match="Unknown unit"):
+            factor("unknown", "millions_usd")
+
+    def test_scales_to(self) -> None:
+        """scales_to lists every unit of the target's dimension."""
+        assert scales_to("millions_usd") == {
+            "millions_usd": 1.0,
+            "billions_usd": 1_000.0,
+            "trillions_usd": 1_000_000.0,
+        }
+
+    def test_collector_units_registered(self) -> None:
+        """Every unit a collector declares is in the registry."""
+        from liquidity.collectors.boc import UNIT_MAP as BOC_UNITS
+        from liquidity.collectors.fred import UNIT_MAP as FRED_UNITS
+        from liquidity.collectors.pboc import UNIT_MAP as PBOC_UNITS
+
+        declared = {*BOC_UNITS.values(), *FRED_UNITS.values(), *PBOC_UNITS.values()}
+        declared |= {"millions_gbp", "millions_chf", "index"}  # BoE, SNB, Yahoo
+
+        assert declared <= set(UNITS)
+
+
+class TestFrameConversion:
+    """Unit tests for whole-frame conversion."""
+
+    def test_convert_frame(self) -> None:
+        """Mixed units convert in one pass and the unit column is replaced."""
+        df = pd.DataFrame(
+            {
+                "series_id": ["WALCL", "WLRRAL", "WDTGAL"],
+                "value": [7_000_000.0, 500.0, 750.0],
+                "unit": ["millions_usd", "billions_usd", "billions_usd"],
+            }
+        )
+
+        result = convert_frame(df, "millions_usd")
+
+        assert result["value"].tolist() == [7_000_000.0, 500_000.0, 750_000.0]
+        assert set(result["unit"]) == {"millions_usd"}
+        assert df["unit"].iloc[1] == "billions_usd"
+
+    def test_categorical_units(self) -> None:
+        """Categorical unit columns map through their codes."""
+        units = pd.Series(["bps", "percent", "bps"], dtype="category")
+
+        np.testing.assert_array_equal(conversion_factors(units, "percent"), [0.01, 1.0, 0.01])
+
+    def test_unused_categories_ignored(self) -> None:
+        """A slice of a mixed-unit categorical frame converts only the units it holds."""
+        df = pd.DataFrame(
+            {
+                "series_id": ["WALCL", "WLRRAL", "DGS10"],
+                "value": [7_000_000.0, 500.0, 4.2],
+                "unit": pd.Categorical(["millions_usd", "billions_usd", "percent"]),
+            }
+        )
+        usd = df[df["series_id"] != "DGS10"]
+
+        np.testing.assert_array_equal(conversion_factors(usd["unit"], "millions_usd"), [1, 1000])
+        with pytest.raises(UnitError, match="percent"):
+            conversion_factors(df["unit"], "millions_usd")
+
+    def test_missing_unit(self) -> None:
+        """Rows without a unit cannot be converted."""
+        with pytest.raises(UnitError, match="Missing unit"):
+            conversion_factors(pd.Series(["percent", None]), "percent")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])